@@ -19,7 +19,7 @@ import pkgutil
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 from core.config.settings import get_config
 
@@ -34,9 +34,15 @@ class QualityCheckSeverity(enum.Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityCheckResult:
-    """Result of a quality check."""
+    """
+    Result of a quality check.
+    
+    Results use slots instead of an instance dictionary, and their check ID,
+    file path and source are interned, so the many results of a full run
+    share these strings.
+    """
     check_id: str
     severity: QualityCheckSeverity
     message: str
@@ -48,6 +54,47 @@ class QualityCheckResult:
     fix_available: bool = False
     fix_command: Optional[str] = None
     
+    def __post_init__(self) -> None:
+        """Intern the strings repeated across results."""
+        self.check_id = sys.intern(self.check_id)
+        if self.file_path is not None:
+            self.file_path = sys.intern(self.file_path)
+        if self.source is not None:
+            self.source = sys.intern(self.source)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result into a JSON-serializable dictionary.
+        
+        Returns:
+            Dictionary with the severity as its string value.
+        """
+        return {
+            "check_id": self.check_id,
+            "severity": self.severity.value,
+            "message": self.message,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "column": self.column,
+            "source": self.source,
+            "details": self.details,
+            "fix_available": self.fix_available,
+            "fix_command": self.fix_command
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QualityCheckResult":
+        """
+        Restore a result from its dictionary form (see to_dict).
+        
+        Args:
+            data: Dictionary form of the result.
+            
+        Returns:
+            A new QualityCheckResult.
+        """
+        return cls(**{**data, "severity": QualityCheckSeverity(data["severity"])})
+    
     def __str__(self) -> str:
         """String representation of the result."""
         location = ""
@@ -104,6 +151,46 @@ class QualityCheck(abc.ABC):
         )
         return QualityCheckSeverity(severity_str)
     
+    @property
+    def depends_on(self) -> List[str]:
+        """IDs of checks that must finish before this check starts."""
+        config = get_config()
+        quality_config = config.get("quality", {})
+        checks_config = quality_config.get("checks", {})
+        check_config = checks_config.get(self.id, {})
+        return check_config.get("depends_on", [])
+    
+    @property
+    def tool(self) -> Optional[str]:
+        """Executable of the external tool run by this check, if any."""
+        return None
+    
+    @property
+    def uses_subprocess(self) -> bool:
+        """
+        Whether the check spends its time in an external tool subprocess.
+        
+        Such checks are run on threads by the CheckScheduler; other checks
+        may be run in worker processes.
+        """
+        return self.tool is not None
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        """Languages of the files this check looks at (see FileInventory)."""
+        return ()
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        """
+        How results of this check can be cached per file (see ResultCache).
+        
+        "file" if the results for a file depend only on its content, "imports"
+        if they also depend on the local modules it imports, None if the check
+        is not cacheable.
+        """
+        return None
+    
     @abc.abstractmethod
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
@@ -184,6 +271,9 @@ class QualityComponent(abc.ABC):
         """
         Run all enabled checks for this component.
         
+        The checks run concurrently (see CheckScheduler); results are returned
+        in the order of the checks.
+        
         Args:
             file_paths: Optional list of file paths to check. If None, check all relevant files.
             **kwargs: Additional arguments for the checks.
@@ -191,19 +281,17 @@ class QualityComponent(abc.ABC):
         Returns:
             List of QualityCheckResult objects.
         """
+        # Import here to avoid circular imports
+        from core.quality.components.scheduler import CheckScheduler
+        
+        checks = self.get_enabled_checks()
+        results_by_check: Dict[int, List[QualityCheckResult]] = {}
+        for check, check_results in CheckScheduler().run([(self.name, check) for check in checks], file_paths, **kwargs):
+            results_by_check[id(check)] = check_results
+        
         results = []
-        for check in self.get_enabled_checks():
-            try:
-                check_results = check.run(file_paths, **kwargs)
-                results.extend(check_results)
-            except Exception as e:
-                logger.exception(f"Error running check {check.id}: {e}")
-                results.append(QualityCheckResult(
-                    check_id=check.id,
-                    severity=QualityCheckSeverity.ERROR,
-                    message=f"Error running check: {str(e)}",
-                    source=self.name
-                ))
+        for check in checks:
+            results.extend(results_by_check[id(check)])
         return results
     
     def fix_issues(self, results: List[QualityCheckResult]) -> List[QualityCheckResult]:
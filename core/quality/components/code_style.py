@@ -9,8 +9,6 @@ This module provides quality checks for code style, including:
 These checks ensure that code follows consistent formatting standards.
 """
 
-import os
-import subprocess
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -20,6 +18,8 @@ from core.quality.components.base import (
     QualityCheckSeverity,
     QualityComponent
 )
+from core.quality.components.inventory import get_inventory, TEXT_LANGUAGES
+from core.quality.components.sharding import merge_results, run_sharded
 
 
 class BlackCheck(QualityCheck):
@@ -37,6 +37,18 @@ class BlackCheck(QualityCheck):
     def description(self) -> str:
         return "Checks Python code formatting using Black."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "black"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def can_fix(self) -> bool:
         return True
     
@@ -56,7 +68,7 @@ class BlackCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -64,24 +76,24 @@ class BlackCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run Black in check mode
-        cmd = ["black", "--check"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run Black in check mode, on shards of the files in parallel
+        processes = run_sharded("black", ["--check"], file_paths)
+        output_lines = [line for process in processes if process.returncode != 0
+                        for line in process.stderr.splitlines() + process.stdout.splitlines()]
         
-        if process.returncode != 0:
-            # Parse Black output to extract file paths and line numbers
-            for line in process.stderr.splitlines() + process.stdout.splitlines():
-                if "would reformat" in line:
-                    file_path = line.split("would reformat", 1)[1].strip()
-                    results.append(QualityCheckResult(
-                        check_id=self.id,
-                        severity=self.severity,
-                        message="File needs reformatting with Black",
-                        file_path=file_path,
-                        source=self.name,
-                        fix_available=True,
-                        fix_command=f"black {file_path}"
-                    ))
+        # Parse Black output to extract file paths
+        for line in output_lines:
+            if "would reformat" in line:
+                file_path = line.split("would reformat", 1)[1].strip()
+                results.append(QualityCheckResult(
+                    check_id=self.id,
+                    severity=self.severity,
+                    message="File needs reformatting with Black",
+                    file_path=file_path,
+                    source=self.name,
+                    fix_available=True,
+                    fix_command=f"black {file_path}"
+                ))
         
         return results
     
@@ -106,17 +118,17 @@ class BlackCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run Black to fix formatting
-        cmd = ["black"] + list(file_paths)
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run Black to fix formatting, on shards of the files in parallel
+        processes = run_sharded("black", [], sorted(file_paths))
         
-        if process.returncode != 0:
+        if any(process.returncode != 0 for process in processes):
             # If Black failed, return all results as unfixed
             return results
         
         # Check which files were actually fixed
         fixed_files = set()
-        for line in process.stderr.splitlines() + process.stdout.splitlines():
+        for line in (line for process in processes
+                     for line in process.stderr.splitlines() + process.stdout.splitlines()):
             if "reformatted" in line:
                 file_path = line.split("reformatted", 1)[1].strip()
                 fixed_files.add(file_path)
@@ -127,17 +139,6 @@ class BlackCheck(QualityCheck):
                 unfixed.append(result)
         
         return unfixed
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 
 
 class IsortCheck(QualityCheck):
@@ -155,6 +156,18 @@ class IsortCheck(QualityCheck):
     def description(self) -> str:
         return "Checks Python import sorting using isort."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "isort"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def can_fix(self) -> bool:
         return True
     
@@ -174,7 +187,7 @@ class IsortCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -182,28 +195,27 @@ class IsortCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run isort in check mode
-        cmd = ["isort", "--check-only"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run isort in check mode, on shards of the files in parallel
+        processes = run_sharded("isort", ["--check-only", "--diff"], file_paths)
+        output_lines = [line for process in processes if process.returncode != 0
+                        for line in process.stderr.splitlines() + process.stdout.splitlines()]
         
-        if process.returncode != 0:
-            # Parse isort output to extract file paths
-            for line in process.stderr.splitlines() + process.stdout.splitlines():
-                if "ERROR" in line and ".py" in line:
-                    parts = line.split("ERROR", 1)[1].strip().split(" ", 1)
-                    if len(parts) > 0:
-                        file_path = parts[0].strip()
-                        results.append(QualityCheckResult(
-                            check_id=self.id,
-                            severity=self.severity,
-                            message="Imports need sorting with isort",
-                            file_path=file_path,
-                            source=self.name,
-                            fix_available=True,
-                            fix_command=f"isort {file_path}"
-                        ))
+        # Parse isort output to extract file paths (diff lines never start with ERROR)
+        for line in output_lines:
+            if line.startswith("ERROR") and ".py" in line:
+                file_path = line.split("ERROR", 1)[1].lstrip(": ").split(" ", 1)[0].strip()
+                results.append(QualityCheckResult(
+                    check_id=self.id,
+                    severity=self.severity,
+                    message="Imports need sorting with isort",
+                    file_path=file_path,
+                    source=self.name,
+                    fix_available=True,
+                    fix_command=f"isort {file_path}"
+                ))
         
-        return results
+        # Shards may report the same issue
+        return merge_results([results])
     
     def fix(self, results: List[QualityCheckResult]) -> List[QualityCheckResult]:
         """
@@ -226,27 +238,15 @@ class IsortCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run isort to fix import sorting
-        cmd = ["isort"] + list(file_paths)
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run isort to fix import sorting, on shards of the files in parallel
+        processes = run_sharded("isort", [], sorted(file_paths))
         
-        if process.returncode != 0:
+        if any(process.returncode != 0 for process in processes):
             # If isort failed, return all results as unfixed
             return results
         
         # Assume all files were fixed if isort succeeded
         return []
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 
 
 class LineEndingCheck(QualityCheck):
@@ -264,6 +264,14 @@ class LineEndingCheck(QualityCheck):
     def description(self) -> str:
         return "Checks for consistent line endings (CRLF vs LF)."
     
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return TEXT_LANGUAGES
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Check for consistent line endings.
@@ -280,7 +288,7 @@ class LineEndingCheck(QualityCheck):
         
         # If no file paths provided, find all text files
         if not file_paths:
-            file_paths = self._find_text_files()
+            file_paths = get_inventory(kwargs).get_files(*TEXT_LANGUAGES)
         
         if not file_paths:
             return results
@@ -312,18 +320,6 @@ class LineEndingCheck(QualityCheck):
                 ))
         
         return results
-    
-    def _find_text_files(self) -> List[str]:
-        """Find all text files in the project."""
-        text_extensions = ['.py', '.js', '.ts', '.html', '.css', '.md', '.txt', '.json', '.yml', '.yaml', '.sh']
-        text_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if any(file.endswith(ext) for ext in text_extensions):
-                    text_files.append(os.path.join(root, file))
-        return text_files
 
 
 class CodeStyleComponent(QualityComponent):
@@ -14,7 +14,7 @@ follows consistent standards.
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from core.quality.components.base import (
     QualityCheck,
@@ -22,6 +22,8 @@ from core.quality.components.base import (
     QualityCheckSeverity,
     QualityComponent
 )
+from core.quality.components.inventory import get_inventory
+from core.quality.components.parsed_modules import get_parsed_module
 
 
 class DocstringCheck(QualityCheck):
@@ -39,6 +41,14 @@ class DocstringCheck(QualityCheck):
     def description(self) -> str:
         return "Checks for presence and completeness of docstrings in Python files."
     
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Check for presence and completeness of docstrings.
@@ -55,7 +65,7 @@ class DocstringCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -65,11 +75,10 @@ class DocstringCheck(QualityCheck):
         
         for file_path in file_paths:
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
+                module = get_parsed_module(file_path)
                 
                 # Check for module docstring
-                if not self._has_module_docstring(content):
+                if not module.docstring:
                     results.append(QualityCheckResult(
                         check_id=self.id,
                         severity=self.severity,
@@ -79,43 +88,26 @@ class DocstringCheck(QualityCheck):
                         source=self.name
                     ))
                 
-                # Check for class and function docstrings
-                class_matches = re.finditer(r'class\s+(\w+)\s*(?:\([^)]*\))?\s*:', content)
-                for match in class_matches:
-                    class_name = match.group(1)
-                    class_start = match.start()
-                    line_number = content[:class_start].count('\n') + 1
-                    
-                    if not self._has_docstring_after(content, match.end()):
-                        results.append(QualityCheckResult(
-                            check_id=self.id,
-                            severity=self.severity,
-                            message=f"Missing docstring for class {class_name}",
-                            file_path=file_path,
-                            line_number=line_number,
-                            source=self.name
-                        ))
-                
-                # Check for function docstrings (both regular and methods)
-                func_matches = re.finditer(r'def\s+(\w+)\s*\([^)]*\)\s*(?:->.*?)?\s*:', content)
-                for match in func_matches:
-                    func_name = match.group(1)
-                    func_start = match.start()
-                    line_number = content[:func_start].count('\n') + 1
+                for definition in module.definitions:
+                    if definition.docstring:
+                        continue
                     
-                    # Skip dunder methods and private methods
-                    if func_name.startswith('__') or (func_name.startswith('_') and not func_name.startswith('__')):
+                    if definition.kind == "class":
+                        message = f"Missing docstring for class {definition.name}"
+                    elif definition.is_private:
+                        # Skip dunder methods and private functions
                         continue
+                    else:
+                        message = f"Missing docstring for function/method {definition.name}"
                     
-                    if not self._has_docstring_after(content, match.end()):
-                        results.append(QualityCheckResult(
-                            check_id=self.id,
-                            severity=self.severity,
-                            message=f"Missing docstring for function/method {func_name}",
-                            file_path=file_path,
-                            line_number=line_number,
-                            source=self.name
-                        ))
+                    results.append(QualityCheckResult(
+                        check_id=self.id,
+                        severity=self.severity,
+                        message=message,
+                        file_path=file_path,
+                        line_number=definition.line_number,
+                        source=self.name
+                    ))
             
             except Exception as e:
                 results.append(QualityCheckResult(
@@ -127,38 +119,6 @@ class DocstringCheck(QualityCheck):
                 ))
         
         return results
-    
-    def _has_module_docstring(self, content: str) -> bool:
-        """Check if a module has a docstring."""
-        # Skip any shebang or encoding declarations
-        content = re.sub(r'^#!.*?\n', '', content)
-        content = re.sub(r'^#.*?coding[:=].*?\n', '', content)
-        content = content.lstrip()
-        
-        # Check for triple-quoted string at the beginning
-        return bool(re.match(r'(\'\'\'|""").*?(\'\'\'|""")', content, re.DOTALL))
-    
-    def _has_docstring_after(self, content: str, pos: int) -> bool:
-        """Check if there's a docstring after the given position."""
-        # Find the next non-whitespace character
-        match = re.search(r'\S', content[pos:])
-        if not match:
-            return False
-        
-        # Check if it's the start of a triple-quoted string
-        start_pos = pos + match.start()
-        return bool(re.match(r'(\'\'\'|""").*?(\'\'\'|""")', content[start_pos:], re.DOTALL))
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 
 
 class ReadmeCheck(QualityCheck):
@@ -300,14 +260,11 @@ class DocumentationCoverageCheck(QualityCheck):
                     dirs_to_check.add(path)
                 else:
                     dirs_to_check.add(os.path.dirname(path))
+            dirs_to_check = {d for d in dirs_to_check if self._is_code_directory(d)}
         else:
-            dirs_to_check = self._find_code_directories()
+            dirs_to_check = get_inventory(kwargs).get_code_directories()
         
         for dir_path in dirs_to_check:
-            # Skip if it's not a code directory
-            if not self._is_code_directory(dir_path):
-                continue
-            
             # Check if documentation exists for this directory
             doc_exists = self._has_documentation(dir_path)
             
@@ -322,19 +279,6 @@ class DocumentationCoverageCheck(QualityCheck):
         
         return results
     
-    def _find_code_directories(self) -> Set[str]:
-        """Find directories containing code."""
-        code_dirs = set()
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            
-            # Check if directory contains code files
-            if any(f.endswith((".py", ".js", ".ts", ".java", ".c", ".cpp", ".h", ".hpp")) for f in files):
-                code_dirs.add(root)
-        
-        return code_dirs
-    
     def _is_code_directory(self, dir_path: str) -> bool:
         """Check if a directory contains code files."""
         for _, _, files in os.walk(dir_path):
@@ -29,6 +29,8 @@ from core.quality.components.base import (
     QualityCheckSeverity,
     QualityComponent
 )
+from core.quality.components.inventory import get_inventory
+from core.quality.components.parsed_modules import get_parsed_module
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +113,7 @@ class EnhancedDocumentationCoverageCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -236,16 +238,12 @@ class EnhancedDocumentationCoverageCheck(QualityCheck):
         Returns:
             Dictionary containing documentation coverage metrics for the file.
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Parse the Python file
-        tree = ast.parse(content)
+        module = get_parsed_module(file_path)
         
         # Initialize metrics
         metrics = {
-            "has_module_docstring": bool(ast.get_docstring(tree)),
-            "documented_modules": 1 if ast.get_docstring(tree) else 0,
+            "has_module_docstring": bool(module.docstring),
+            "documented_modules": 1 if module.docstring else 0,
             "total_modules": 1,
             "documented_classes": 0,
             "total_classes": 0,
@@ -261,79 +259,46 @@ class EnhancedDocumentationCoverageCheck(QualityCheck):
             "undocumented_returns": []
         }
         
-        # Analyze classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
+        for definition in module.definitions:
+            # Analyze classes
+            if definition.kind == "class":
                 metrics["total_classes"] += 1
-                class_docstring = ast.get_docstring(node)
                 
-                if class_docstring:
+                if definition.docstring:
                     metrics["documented_classes"] += 1
                 else:
-                    metrics["undocumented_classes"].append(node.name)
-                
-                # Analyze methods
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef):
-                        metrics["total_functions"] += 1
-                        method_docstring = ast.get_docstring(item)
-                        
-                        if method_docstring:
-                            metrics["documented_functions"] += 1
-                            
-                            # Analyze parameter documentation
-                            param_metrics = self._analyze_parameter_docs(item, method_docstring)
-                            metrics["documented_parameters"] += param_metrics["documented"]
-                            metrics["total_parameters"] += param_metrics["total"]
-                            
-                            if param_metrics["undocumented"]:
-                                metrics["undocumented_parameters"].append({
-                                    "function": f"{node.name}.{item.name}",
-                                    "parameters": param_metrics["undocumented"]
-                                })
-                            
-                            # Analyze return documentation
-                            return_metrics = self._analyze_return_docs(item, method_docstring)
-                            metrics["documented_returns"] += return_metrics["documented"]
-                            metrics["total_returns"] += return_metrics["total"]
-                            
-                            if not return_metrics["documented"] and return_metrics["total"] > 0:
-                                metrics["undocumented_returns"].append(f"{node.name}.{item.name}")
-                        else:
-                            metrics["undocumented_functions"].append(f"{node.name}.{item.name}")
+                    metrics["undocumented_classes"].append(definition.name)
+                continue
             
-            # Analyze top-level functions - check if it's not inside a class
-            elif isinstance(node, ast.FunctionDef) and not any(
-                isinstance(parent, ast.ClassDef)
-                for parent in ast.walk(tree)
-                if hasattr(parent, 'body') and node in parent.body
-            ):
-                metrics["total_functions"] += 1
-                function_docstring = ast.get_docstring(node)
-                
-                if function_docstring:
-                    metrics["documented_functions"] += 1
-                    
-                    # Analyze parameter documentation
-                    param_metrics = self._analyze_parameter_docs(node, function_docstring)
-                    metrics["documented_parameters"] += param_metrics["documented"]
-                    metrics["total_parameters"] += param_metrics["total"]
-                    
-                    if param_metrics["undocumented"]:
-                        metrics["undocumented_parameters"].append({
-                            "function": node.name,
-                            "parameters": param_metrics["undocumented"]
-                        })
-                    
-                    # Analyze return documentation
-                    return_metrics = self._analyze_return_docs(node, function_docstring)
-                    metrics["documented_returns"] += return_metrics["documented"]
-                    metrics["total_returns"] += return_metrics["total"]
-                    
-                    if not return_metrics["documented"] and return_metrics["total"] > 0:
-                        metrics["undocumented_returns"].append(node.name)
-                else:
-                    metrics["undocumented_functions"].append(node.name)
+            # Analyze methods and functions
+            name = f"{definition.parent_class}.{definition.name}" if definition.parent_class else definition.name
+            metrics["total_functions"] += 1
+            
+            if not definition.docstring:
+                metrics["undocumented_functions"].append(name)
+                continue
+            
+            metrics["documented_functions"] += 1
+            
+            # Analyze parameter documentation
+            param_metrics = self._analyze_parameter_docs(definition.node, definition.docstring)
+            metrics["documented_parameters"] += param_metrics["documented"]
+            metrics["total_parameters"] += param_metrics["total"]
+            
+            if param_metrics["undocumented"]:
+                metrics["undocumented_parameters"].append({
+                    "function": name,
+                    "parameters": param_metrics["undocumented"]
+                })
+            
+            # Analyze return documentation
+            return_metrics = self._analyze_return_docs(definition.node, definition.docstring,
+                                                       definition.returns_value)
+            metrics["documented_returns"] += return_metrics["documented"]
+            metrics["total_returns"] += return_metrics["total"]
+            
+            if not return_metrics["documented"] and return_metrics["total"] > 0:
+                metrics["undocumented_returns"].append(name)
         
         return metrics
     
@@ -381,23 +346,23 @@ class EnhancedDocumentationCoverageCheck(QualityCheck):
             "undocumented": undocumented_params
         }
     
-    def _analyze_return_docs(self, func_node: ast.FunctionDef, docstring: str) -> Dict[str, Any]:
+    def _analyze_return_docs(self, func_node: ast.FunctionDef, docstring: str,
+                             has_return: Optional[bool] = None) -> Dict[str, Any]:
         """
         Analyze return value documentation in a function docstring.
         
         Args:
             func_node: AST node for the function.
             docstring: Function docstring.
+            has_return: Whether the function returns a value, if already known.
             
         Returns:
             Dictionary containing return documentation metrics.
         """
         # Check if function has a return value
-        has_return = False
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Return) and node.value is not None:
-                has_return = True
-                break
+        if has_return is None:
+            has_return = any(isinstance(node, ast.Return) and node.value is not None
+                             for node in ast.walk(func_node))
         
         # Check if function has a return type annotation
         has_return_annotation = func_node.returns is not None
@@ -660,14 +625,3 @@ class EnhancedDocumentationCoverageCheck(QualityCheck):
                 ))
         
         return results
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""
+Fix Pipeline
+
+This module provides the FixPipeline class, which applies the fixes of many
+quality check results at once instead of one check and one file at a time:
+- Results are grouped per file, and every file is backed up once
+- In-Python fixes (generated docstrings, line endings) are applied to each
+  file in a single read-modify-write; edits that overlap an earlier edit
+  are left unfixed for a later run
+- Tool-based fixes (black, isort, autopep8, ...) run once per component
+  for all files
+- Changed files are re-checked in one pass per component, components in
+  parallel, and files whose fixes introduced issues are restored from
+  their backup
+
+The pipeline is configured through the ``quality.fix_pipeline`` section:
+``max_workers`` (default: CPU count).
+"""
+
+import ast
+import io
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.config.settings import get_config
+from core.quality.components.base import QualityCheckResult
+from core.quality.components.fixes.documentation import DocumentationFixes
+from core.quality.components.parsed_modules import ParsedModule
+from core.quality.components.verification import FixVerification
+
+logger = logging.getLogger(__name__)
+
+FixOutcome = Tuple[List[QualityCheckResult], List[QualityCheckResult]]
+
+
+@dataclass
+class TextEdit:
+    """Replacement of whole lines of a file by an in-Python fix."""
+    line: int  # 1-based line the edit starts at; insertions go before it
+    delete: int  # number of lines replaced
+    lines: List[str]  # new lines, including line endings
+    result: QualityCheckResult
+
+    def conflicts_with(self, other: "TextEdit") -> bool:
+        """Whether two edits touch the same lines or insert at the same position."""
+        if self.line == other.line:
+            return True
+        first, second = (self, other) if self.line < other.line else (other, self)
+        return first.line + first.delete > second.line
+
+
+def _docstring_edit(module: ParsedModule, lines: List[str], result: QualityCheckResult) -> Optional[TextEdit]:
+    """Insert a generated docstring for a missing function, class or module docstring."""
+    if "module docstring" in result.message.lower():
+        if module.docstring is not None:
+            return None
+        # Keep the shebang and encoding lines first
+        line = 1
+        while line <= len(lines) and lines[line - 1].startswith("#") and line <= 2:
+            line += 1
+        docstring = DocumentationFixes.generate_module_docstring(module.path)
+        return TextEdit(line, 0, docstring.splitlines(keepends=True), result)
+
+    for definition in module.definitions:
+        if definition.line_number == result.line_number:
+            node = definition.node
+            break
+    else:
+        return None
+    if definition.docstring is not None or node.body[0].lineno == node.lineno:
+        return None
+
+    # The docstring goes before the first statement of the body, at its indentation
+    body_line = node.body[0].lineno
+    if isinstance(node.body[0], (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.body[0].decorator_list:
+        body_line = node.body[0].decorator_list[0].lineno
+    indent = DocumentationFixes._get_indent(lines[body_line - 1])
+    docstring = DocumentationFixes._generate_docstring_from_node(node)
+    return TextEdit(body_line, 0, DocumentationFixes.format_docstring(docstring, indent), result)
+
+
+# In-Python fixes producing line edits, by check ID
+TEXT_FIXERS: Dict[str, Callable[[ParsedModule, List[str], QualityCheckResult], Optional[TextEdit]]] = {
+    "docstrings": _docstring_edit
+}
+
+# In-Python fixes transforming the whole content, applied after the line edits
+CONTENT_FIXERS: Dict[str, Callable[[str], str]] = {
+    "line_endings": lambda content: content.replace("\r\n", "\n")
+}
+
+
+def apply_text_fixes(file_path: str, results: List[QualityCheckResult]) -> FixOutcome:
+    """
+    Apply the in-Python fixes of a file in a single read-modify-write.
+
+    Args:
+        file_path: Path to the file.
+        results: Results of the file with a check ID in TEXT_FIXERS or CONTENT_FIXERS.
+
+    Returns:
+        Tuple of (fixed_results, unfixed_results)
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Cannot read {file_path} for fixing: {e}")
+        return [], list(results)
+
+    fixed: List[QualityCheckResult] = []
+    unfixed: List[QualityCheckResult] = []
+    edits: List[TextEdit] = []
+    line_results = [result for result in results if result.check_id in TEXT_FIXERS]
+    if line_results:
+        # Split like the tokenizer does, so line numbers match the AST
+        lines = io.StringIO(content, newline="").readlines()
+        newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+        try:
+            module = ParsedModule.parse(content, file_path)
+        except SyntaxError:
+            module = None
+        for result in line_results:
+            edit = TEXT_FIXERS[result.check_id](module, lines, result) if module else None
+            if edit is None or any(edit.conflicts_with(other) for other in edits):
+                unfixed.append(result)
+            else:
+                edits.append(edit)
+
+        # Apply bottom-up, so the line numbers of the remaining edits stay valid
+        for edit in sorted(edits, key=lambda edit: edit.line, reverse=True):
+            lines[edit.line - 1:edit.line - 1 + edit.delete] = [
+                line[:-1] + newline if line.endswith("\n") else line for line in edit.lines
+            ]
+        fixed.extend(edit.result for edit in edits)
+        new_content = "".join(lines)
+    else:
+        new_content = content
+
+    for result in results:
+        if result.check_id in CONTENT_FIXERS:
+            new_content = CONTENT_FIXERS[result.check_id](new_content)
+            fixed.append(result)
+
+    if new_content != content:
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            f.write(new_content)
+    return fixed, unfixed
+
+
+def _get_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """Size and modification time of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class FixPipeline:
+    """Applies fixes grouped per file and verifies them in one re-check pass."""
+
+    def __init__(self, apply_fixes: Callable[[str, List[QualityCheckResult]], FixOutcome],
+                 run_checks: Callable[[str, List[str]], List[QualityCheckResult]],
+                 get_component: Callable[[str], Optional[str]], max_workers: Optional[int] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            apply_fixes: Function applying the tool-based fixes of a component,
+                given the component name and results.
+            run_checks: Function running the checks of a component on files.
+            get_component: Function returning the component of a check ID.
+            max_workers: Maximum number of files processed at once. Defaults to the CPU count.
+        """
+        self.apply_fixes = apply_fixes
+        self.run_checks = run_checks
+        self.get_component = get_component
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @classmethod
+    def from_config(cls, apply_fixes: Callable[[str, List[QualityCheckResult]], FixOutcome],
+                    run_checks: Callable[[str, List[str]], List[QualityCheckResult]],
+                    get_component: Callable[[str], Optional[str]]) -> "FixPipeline":
+        """
+        Create a pipeline configured by the ``quality.fix_pipeline`` section.
+
+        Args:
+            apply_fixes: See __init__.
+            run_checks: See __init__.
+            get_component: See __init__.
+
+        Returns:
+            A new FixPipeline.
+        """
+        config = get_config()
+        pipeline_config = config.get("quality", {}).get("fix_pipeline", {})
+        return cls(apply_fixes, run_checks, get_component, pipeline_config.get("max_workers"))
+
+    def run(self, results: List[QualityCheckResult]) -> FixOutcome:
+        """
+        Fix the issues of quality check results and verify the fixes.
+
+        Args:
+            results: List of QualityCheckResult objects to fix.
+
+        Returns:
+            Tuple of (fixed_results, unfixed_results)
+        """
+        results_by_file: Dict[str, List[QualityCheckResult]] = defaultdict(list)
+        unfixed: List[QualityCheckResult] = []
+        for result in results:
+            if result.file_path and self.get_component(result.check_id):
+                results_by_file[result.file_path].append(result)
+            else:
+                unfixed.append(result)
+
+        verification = FixVerification()
+        outcomes: Dict[str, Tuple[List[QualityCheckResult], List[QualityCheckResult]]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Back up every file once
+                file_paths = list(results_by_file)
+                signatures = dict(zip(file_paths, executor.map(_get_signature, file_paths)))
+                backed_up = dict(zip(file_paths, executor.map(verification.backup_file, file_paths)))
+                for file_path in file_paths:
+                    if not backed_up[file_path]:
+                        unfixed.extend(results_by_file.pop(file_path))
+
+                # In-Python fixes, one read-modify-write per file
+                text_results = {
+                    file_path: [r for r in file_results if r.check_id in TEXT_FIXERS or r.check_id in CONTENT_FIXERS]
+                    for file_path, file_results in results_by_file.items()
+                }
+                text_files = [file_path for file_path, file_results in text_results.items() if file_results]
+                for file_path, outcome in zip(text_files, executor.map(
+                        lambda path: apply_text_fixes(path, text_results[path]), text_files)):
+                    outcomes[file_path] = outcome
+
+            # Tool-based fixes, one batch per component; components change
+            # the same files, so they run one after the other
+            results_by_component: Dict[str, List[QualityCheckResult]] = defaultdict(list)
+            for file_path, file_results in results_by_file.items():
+                outcomes.setdefault(file_path, ([], []))
+                for result in file_results:
+                    if result.check_id not in TEXT_FIXERS and result.check_id not in CONTENT_FIXERS:
+                        results_by_component[self.get_component(result.check_id)].append(result)
+            for component_name, component_results in results_by_component.items():
+                try:
+                    fixed, component_unfixed = self.apply_fixes(component_name, component_results)
+                except Exception as e:
+                    logger.error(f"Error applying fixes for component {component_name}: {e}")
+                    fixed, component_unfixed = [], component_results
+                for result in fixed:
+                    outcomes[result.file_path][0].append(result)
+                for result in component_unfixed:
+                    outcomes.setdefault(result.file_path, ([], []))[1].append(result)
+
+            # Files the fixes did not change keep all their issues
+            changed = []
+            for file_path, (fixed, file_unfixed) in outcomes.items():
+                if file_path not in results_by_file:
+                    continue
+                if _get_signature(file_path) == signatures[file_path]:
+                    file_unfixed.extend(fixed)
+                    fixed.clear()
+                else:
+                    changed.append(file_path)
+
+            if changed:
+                self._verify(verification, changed, results_by_file, outcomes)
+        finally:
+            verification.cleanup_backups()
+
+        fixed_results = [result for fixed, _ in outcomes.values() for result in fixed]
+        unfixed.extend(result for _, file_unfixed in outcomes.values() for result in file_unfixed)
+        return fixed_results, unfixed
+
+    def _verify(self, verification: FixVerification, changed: List[str],
+                results_by_file: Dict[str, List[QualityCheckResult]],
+                outcomes: Dict[str, Tuple[List[QualityCheckResult], List[QualityCheckResult]]]) -> None:
+        """Re-check changed files once per component and restore files with new issues."""
+        files_by_component: Dict[str, List[str]] = defaultdict(list)
+        for file_path in changed:
+            for component_name in dict.fromkeys(self.get_component(r.check_id) for r in results_by_file[file_path]):
+                files_by_component[component_name].append(file_path)
+
+        new_results_by_file: Dict[str, List[QualityCheckResult]] = defaultdict(list)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(files_by_component))) as executor:
+            futures = {
+                component_name: executor.submit(self.run_checks, component_name, file_paths)
+                for component_name, file_paths in files_by_component.items()
+            }
+            for future in futures.values():
+                for result in future.result():
+                    new_results_by_file[result.file_path].append(result)
+
+        for file_path in changed:
+            fixed, file_unfixed = outcomes[file_path]
+            success, fixed_results, unfixed_results = verification.evaluate_fixes(
+                file_path, results_by_file[file_path], fixed, file_unfixed, new_results_by_file[file_path]
+            )
+            if not success:
+                logger.info(f"Fixes for {file_path} introduced new issues and were rolled back")
+            outcomes[file_path] = (fixed_results, unfixed_results)
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.tool_daemons import run_tool
 
 
 class CodeStyleFixes:
@@ -40,8 +41,7 @@ class CodeStyleFixes:
         error_files = []
 
         # Run Black to fix formatting
-        cmd = ["black"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        process = run_tool("black", file_paths)
 
         if process.returncode != 0:
             # If Black failed, return all files as errors
@@ -68,10 +68,7 @@ class DocumentationFixes:
 
             # Insert the docstring
             indent = DocumentationFixes._get_indent(lines[insert_line - 1])
-            docstring_lines = [f"{indent}\"\"\"" + docstring.split("\n")[0] + "\n"]
-            for line in docstring.split("\n")[1:-1]:
-                docstring_lines.append(f"{indent}{line}\n")
-            docstring_lines.append(f"{indent}\"\"\"\n")
+            docstring_lines = DocumentationFixes.format_docstring(docstring, indent)
 
             lines = lines[:insert_line] + docstring_lines + lines[insert_line:]
 
@@ -117,6 +114,38 @@ class DocumentationFixes:
         else:
             return "Description.\n"
 
+    @staticmethod
+    def format_docstring(docstring: str, indent: str) -> List[str]:
+        """
+        Format a generated docstring as source lines.
+
+        Args:
+            docstring: Docstring text, e.g. from _generate_docstring_from_node.
+            indent: Indentation of the body the docstring is inserted into.
+
+        Returns:
+            The lines of the docstring, including line endings.
+        """
+        docstring_lines = [f"{indent}\"\"\"" + docstring.split("\n")[0] + "\n"]
+        for line in docstring.split("\n")[1:-1]:
+            docstring_lines.append(f"{indent}{line}\n")
+        docstring_lines.append(f"{indent}\"\"\"\n")
+        return docstring_lines
+
+    @staticmethod
+    def generate_module_docstring(file_path: str) -> str:
+        """
+        Generate a module docstring for a Python file.
+
+        Args:
+            file_path: Path to the Python file.
+
+        Returns:
+            The docstring, followed by a blank line.
+        """
+        module_name = os.path.basename(file_path).replace(".py", "")
+        return f'"""\n{module_name.replace("_", " ").title()} Module\n\nDescription of the module functionality.\n"""\n\n'
+
     @staticmethod
     def _get_indent(line: str) -> str:
         """
@@ -154,8 +183,7 @@ class DocumentationFixes:
                 return False, "Module already has a docstring"
 
             # Generate a module docstring
-            module_name = os.path.basename(file_path).replace(".py", "")
-            docstring = f'"""\n{module_name.replace("_", " ").title()} Module\n\nDescription of the module functionality.\n"""\n\n'
+            docstring = DocumentationFixes.generate_module_docstring(file_path)
 
             # Add the docstring to the beginning of the file
             with open(file_path, "w", encoding="utf-8") as f:
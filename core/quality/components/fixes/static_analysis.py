@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.tool_daemons import run_tool
 
 
 class StaticAnalysisFixes:
@@ -36,8 +37,7 @@ class StaticAnalysisFixes:
         """
         try:
             # First, get the list of flake8 issues
-            cmd = ["flake8", file_path]
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool("flake8", [file_path])
             
             if process.returncode == 0:
                 # No issues found
@@ -57,8 +57,7 @@ class StaticAnalysisFixes:
                 return False, [], issues
             
             # Check which issues were fixed
-            cmd = ["flake8", file_path]
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool("flake8", [file_path])
             
             if process.returncode == 0:
                 # All issues fixed
@@ -89,8 +88,7 @@ class StaticAnalysisFixes:
         """
         try:
             # First, get the list of pylint issues
-            cmd = ["pylint", "--output-format=text", file_path]
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool("pylint", ["--output-format=text", file_path])
             
             if "Your code has been rated at 10.00/10" in process.stdout:
                 # No issues found
@@ -131,8 +129,7 @@ class StaticAnalysisFixes:
                 fixed_issues.append("Fixed PEP8 issues with autopep8")
             
             # Check which issues were fixed
-            cmd = ["pylint", "--output-format=text", file_path]
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            process = run_tool("pylint", ["--output-format=text", file_path])
             
             remaining_issues = []
             for line in process.stdout.splitlines():
@@ -0,0 +1,280 @@
+"""
+File Inventory for Quality Checks
+
+This module provides the FileInventory class, which lists the files of the
+project once per quality run and hands each check the files it is
+interested in:
+- The tree is walked once (or listed with ``git ls-files``), skipping
+  ignored directories such as .git, virtual environments and backups
+- Files are classified by language based on their extension
+- Checks ask for filtered views, e.g. all Python files or all shell scripts
+"""
+
+import fnmatch
+import logging
+import os
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from core.config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+# Language of a file by extension
+LANGUAGES = {
+    ".py": "python",
+    ".sh": "shell",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".hpp": "cpp",
+    ".html": "html",
+    ".css": "css",
+    ".md": "markdown",
+    ".txt": "text",
+    ".json": "json",
+    ".yml": "yaml",
+    ".yaml": "yaml"
+}
+
+# Languages of source code files
+CODE_LANGUAGES = ("python", "javascript", "typescript", "java", "c", "cpp")
+
+# Languages of text files checked for consistent line endings
+TEXT_LANGUAGES = ("python", "javascript", "typescript", "html", "css", "markdown", "text", "json", "yaml", "shell")
+
+# Directory and file names never included in the inventory
+DEFAULT_IGNORE = [
+    ".git", "venv", ".venv", "node_modules", "__pycache__", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache", ".tox", ".nox", ".quality_cache", "*.egg-info", "backup_*", "backups"
+]
+
+
+class FileInventory:
+    """
+    Inventory of the project files shared by all checks of a run.
+
+    The inventory is configured through the ``quality.inventory`` section:
+    ``ignore`` (additional name patterns to skip) and ``source`` ("walk" to
+    walk the tree, "git" to list files with ``git ls-files``).
+    """
+
+    def __init__(self, root: str = ".", ignore: Optional[List[str]] = None, use_git: bool = False):
+        """
+        Initialize the inventory. Files are listed on first use.
+
+        Args:
+            root: Root directory of the project
+            ignore: Glob patterns of directory and file names to skip;
+                patterns containing "/" are matched against the relative path
+            use_git: Whether to list files with ``git ls-files`` instead of
+                walking the tree (falls back to walking outside a git repository)
+        """
+        self.root = root
+        self.ignore = DEFAULT_IGNORE + list(ignore or [])
+        self.use_git = use_git
+        self._files: Optional[List[str]] = None
+        self._by_language: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, root: str = ".") -> "FileInventory":
+        """
+        Create an inventory configured by the ``quality.inventory`` section.
+
+        Args:
+            root: Root directory of the project
+
+        Returns:
+            A new FileInventory.
+        """
+        config = get_config()
+        inventory_config = config.get("quality", {}).get("inventory", {})
+        return cls(
+            root=root,
+            ignore=inventory_config.get("ignore", []),
+            use_git=inventory_config.get("source", "walk") == "git"
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the lock so that the inventory can be sent to worker processes."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the inventory in a worker process."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def files(self) -> List[str]:
+        """All files of the project, listed on first access."""
+        if self._files is None:
+            with self._lock:
+                if self._files is None:
+                    self._files = self._list_files()
+        return self._files
+
+    def scan(self) -> "FileInventory":
+        """
+        List the files now rather than on first use.
+
+        Returns:
+            The inventory itself.
+        """
+        self.files
+        return self
+
+    def get_files(self, *languages: str) -> List[str]:
+        """
+        Get the files of the given languages.
+
+        Args:
+            *languages: Languages as classified by extension (see LANGUAGES).
+                If none are given, return all files.
+
+        Returns:
+            List of file paths.
+        """
+        if not languages:
+            return list(self.files)
+
+        if len(languages) == 1:
+            return list(self._get_language(languages[0]))
+
+        wanted = set(languages)
+        return [path for path in self.files if self.get_language(path) in wanted]
+
+    def get_code_directories(self) -> Set[str]:
+        """
+        Get the directories that directly contain source code files.
+
+        Returns:
+            Set of directory paths.
+        """
+        return {os.path.dirname(path) for path in self.get_files(*CODE_LANGUAGES)}
+
+    @staticmethod
+    def get_language(file_path: str) -> Optional[str]:
+        """
+        Get the language of a file from its extension.
+
+        Args:
+            file_path: Path of the file.
+
+        Returns:
+            The language, or None for unknown extensions.
+        """
+        return LANGUAGES.get(os.path.splitext(file_path)[1])
+
+    def _get_language(self, language: str) -> List[str]:
+        """Get the files of one language, classifying each file once."""
+        if language not in self._by_language:
+            self._by_language[language] = [path for path in self.files if self.get_language(path) == language]
+        return self._by_language[language]
+
+    def _is_ignored(self, name: str, rel_path: str) -> bool:
+        """Check whether a directory or file is ignored."""
+        for pattern in self.ignore:
+            if fnmatch.fnmatch(rel_path if "/" in pattern else name, pattern):
+                return True
+        return False
+
+    def _list_files(self) -> List[str]:
+        """List the files of the project."""
+        if self.use_git:
+            files = self._list_git_files()
+            if files is not None:
+                return files
+        return self._walk_files()
+
+    def _walk_files(self) -> List[str]:
+        """List files by walking the tree once, pruning ignored directories."""
+        files = []
+        for root, dirs, names in os.walk(self.root):
+            rel_root = os.path.relpath(root, self.root)
+            rel_root = "" if rel_root == "." else rel_root + "/"
+            dirs[:] = [d for d in dirs if not self._is_ignored(d, rel_root + d)]
+            for name in names:
+                if not self._is_ignored(name, rel_root + name):
+                    files.append(os.path.join(root, name))
+        logger.debug(f"File inventory: {len(files)} files found under {self.root}")
+        return files
+
+    def _list_git_files(self) -> Optional[List[str]]:
+        """List tracked and untracked, not ignored files with git ls-files."""
+        try:
+            process = subprocess.run(
+                ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"],
+                cwd=self.root, capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"git ls-files failed, walking the tree instead: {e}")
+            return None
+
+        files = []
+        for rel_path in process.stdout.split("\0"):
+            if not rel_path:
+                continue
+            parts = rel_path.split("/")
+            if any(self._is_ignored(part, "/".join(parts[:i + 1])) for i, part in enumerate(parts)):
+                continue
+            path = os.path.join(self.root, rel_path)
+            # Deleted files are still listed until the deletion is staged
+            if os.path.isfile(path):
+                files.append(path)
+        logger.debug(f"File inventory: {len(files)} files listed by git under {self.root}")
+        return files
+
+
+def get_changed_files(revision: str, root: str = ".") -> List[str]:
+    """
+    List the files changed since a git revision, including uncommitted and untracked files.
+
+    Args:
+        revision: Git revision to compare against, e.g. "HEAD~1" or "origin/main".
+        root: Root directory of the repository.
+
+    Returns:
+        Paths of changed files that still exist, in the same form as FileInventory paths.
+
+    Raises:
+        ValueError: If git cannot compare against the revision.
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--relative", "-z", revision],
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"]
+    ]
+    changed = []
+    for command in commands:
+        try:
+            process = subprocess.run(command, cwd=root, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, "stderr", "") or str(e)
+            raise ValueError(f"Cannot list files changed since {revision}: {stderr.strip()}")
+        changed.extend(rel_path for rel_path in process.stdout.split("\0") if rel_path)
+
+    files = []
+    for rel_path in sorted(set(changed)):
+        path = os.path.join(root, rel_path)
+        if os.path.isfile(path):
+            files.append(path)
+    return files
+
+
+def get_inventory(kwargs: Dict[str, Any]) -> FileInventory:
+    """
+    Get the inventory passed to a check, or a new one if the check runs on its own.
+
+    Args:
+        kwargs: Keyword arguments of QualityCheck.run
+
+    Returns:
+        The shared FileInventory of the run, or a new one.
+    """
+    return kwargs.get("inventory") or FileInventory.from_config()
@@ -0,0 +1,150 @@
+"""
+Line Index for Source Files
+
+This module provides the LineIndex class, which maps between character
+offsets, line numbers and source segments of a text:
+- The offsets of all line starts are computed once per text
+- Offsets are mapped to lines by binary search
+- The source of AST nodes is sliced without splitting the text again
+"""
+
+import ast
+import bisect
+from typing import List, Optional, Tuple
+
+
+class LineIndex:
+    """
+    Index of the line starts of a text.
+
+    Line numbers are 1-based and columns are 0-based, as in the ast module.
+    """
+
+    def __init__(self, text: str):
+        """
+        Index a text.
+
+        Args:
+            text: The text, e.g. the content of a source file.
+        """
+        self.text = text
+        starts = [0]
+        position = text.find("\n")
+        while position != -1:
+            starts.append(position + 1)
+            position = text.find("\n", position + 1)
+        self._starts: List[int] = starts
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines; a trailing newline does not start a new line."""
+        count = len(self._starts)
+        return count - 1 if self.text.endswith("\n") else count
+
+    def line_number(self, offset: int) -> int:
+        """
+        Get the line of a character offset.
+
+        Args:
+            offset: Offset into the text, e.g. ``match.start()``.
+
+        Returns:
+            The 1-based line number.
+        """
+        return bisect.bisect_right(self._starts, offset)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """
+        Get the line and column of a character offset.
+
+        Args:
+            offset: Offset into the text.
+
+        Returns:
+            (line, column) tuple.
+        """
+        line = self.line_number(offset)
+        return line, offset - self._starts[line - 1]
+
+    def offset(self, line: int, column: int = 0) -> int:
+        """
+        Get the character offset of a line and column.
+
+        Args:
+            line: 1-based line number.
+            column: 0-based character column.
+
+        Returns:
+            The offset into the text.
+
+        Raises:
+            IndexError: If the line does not exist.
+        """
+        if not 1 <= line <= len(self._starts):
+            raise IndexError(f"Line {line} out of range")
+        return self._starts[line - 1] + column
+
+    def get_line(self, line: int) -> str:
+        """
+        Get a line without its line ending.
+
+        Args:
+            line: 1-based line number.
+
+        Returns:
+            The text of the line.
+
+        Raises:
+            IndexError: If the line does not exist.
+        """
+        start = self.offset(line)
+        end = self._starts[line] if line < len(self._starts) else len(self.text)
+        return self.text[start:end].rstrip("\r\n")
+
+    def get_segment(self, line: int, column: int, end_line: int, end_column: int) -> str:
+        """
+        Get the text between two positions.
+
+        Args:
+            line: 1-based start line.
+            column: 0-based character column on the start line.
+            end_line: 1-based end line.
+            end_column: 0-based character column on the end line (exclusive).
+
+        Returns:
+            The text between the positions.
+
+        Raises:
+            IndexError: If a line does not exist.
+        """
+        return self.text[self.offset(line, column):self.offset(end_line, end_column)]
+
+    def get_node_source(self, node: ast.AST) -> Optional[str]:
+        """
+        Get the source of an AST node parsed from the text.
+
+        Args:
+            node: The node; must carry position information.
+
+        Returns:
+            The source of the node, or None if it has no (valid) position.
+        """
+        try:
+            line, end_line = node.lineno, node.end_lineno
+            column, end_column = node.col_offset, node.end_col_offset
+        except AttributeError:
+            return None
+        if end_line is None or end_column is None or end_line > self.line_count:
+            return None
+
+        # The ast module reports columns as UTF-8 byte offsets
+        column = self._to_character_column(line, column)
+        end_column = self._to_character_column(end_line, end_column)
+        return self.get_segment(line, column, end_line, end_column)
+
+    def _to_character_column(self, line: int, byte_column: int) -> int:
+        """Convert a UTF-8 byte column into a character column."""
+        text = self.get_line(line)
+        if text.isascii():
+            return byte_column
+        return len(text.encode("utf-8")[:byte_column].decode("utf-8", errors="ignore"))
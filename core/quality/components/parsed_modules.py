@@ -0,0 +1,374 @@
+"""
+Parsed Python Modules for Quality Checks
+
+This module provides the ParsedModule class, which parses a Python file once
+and collects the facts the quality checks and reports need in a single
+traversal of the syntax tree:
+- Parent links of all nodes
+- Classes and functions with their qualified names, docstrings and naming style
+- Cyclomatic and cognitive complexity, and whether functions return a value
+- Imports and assignments
+- Source segments of nodes (see LineIndex)
+
+Parsed modules are kept in a process-wide cache (see get_parsed_module), so
+checks running in the same process share one parse per file.
+"""
+
+import ast
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.config.settings import get_config
+from core.quality.components.line_index import LineIndex
+
+logger = logging.getLogger(__name__)
+
+DefinitionNode = Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]
+
+# Statements that add a branch to the control flow
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor)
+
+# Statements that increase the nesting for cognitive complexity
+_NESTING_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.Try)
+
+_NAMING_STYLES = [
+    ("UPPER_CASE", re.compile(r"^_*[A-Z][A-Z0-9_]*$")),
+    ("snake_case", re.compile(r"^_*[a-z][a-z0-9_]*$")),
+    ("PascalCase", re.compile(r"^_*[A-Z][a-zA-Z0-9]*$")),
+    ("camelCase", re.compile(r"^_*[a-z][a-zA-Z0-9]*$"))
+]
+
+
+def get_naming_style(name: str) -> str:
+    """
+    Classify the naming style of an identifier.
+
+    Args:
+        name: The identifier.
+
+    Returns:
+        "UPPER_CASE", "snake_case", "PascalCase", "camelCase" or "other".
+        Dunder names count as snake_case.
+    """
+    for style, pattern in _NAMING_STYLES:
+        if pattern.match(name):
+            return style
+    return "other"
+
+
+@dataclass
+class Definition:
+    """A class or function defined in a module."""
+    node: DefinitionNode
+    name: str
+    qualname: str
+    kind: str  # "class", "method" or "function"
+    docstring: Optional[str]
+    parent_class: Optional[str] = None
+    naming_style: str = "other"
+    # Complexity of functions and methods; classes keep the defaults
+    complexity: int = 1
+    cognitive_complexity: int = 0
+    returns_value: bool = False
+
+    @property
+    def line_number(self) -> int:
+        """Line of the class or def statement."""
+        return self.node.lineno
+
+    @property
+    def is_private(self) -> bool:
+        """Whether the name starts with an underscore (including dunder names)."""
+        return self.name.startswith("_")
+
+
+@dataclass
+class ParsedModule:
+    """A parsed Python file and the facts collected from its syntax tree."""
+    path: str
+    source: str
+    tree: ast.Module
+    docstring: Optional[str] = None
+    definitions: List[Definition] = field(default_factory=list)
+    imports: List[Union[ast.Import, ast.ImportFrom]] = field(default_factory=list)
+    assignments: List[Tuple[str, ast.AST]] = field(default_factory=list)
+    complexity: int = 1
+    cognitive_complexity: int = 0
+    parents: Dict[ast.AST, ast.AST] = field(default_factory=dict, repr=False)
+    _lines: Optional[LineIndex] = field(default=None, repr=False)
+
+    @classmethod
+    def parse(cls, source: str, path: str = "<unknown>") -> "ParsedModule":
+        """
+        Parse Python source and collect its facts in one traversal.
+
+        Args:
+            source: Python source code.
+            path: Path of the file, used in error messages.
+
+        Returns:
+            A new ParsedModule.
+
+        Raises:
+            SyntaxError: If the source is not valid Python.
+        """
+        module = cls(path=path, source=source, tree=ast.parse(source, filename=path))
+        _ModuleVisitor(module).visit_module()
+        return module
+
+    @property
+    def lines(self) -> LineIndex:
+        """Line index of the source, built on first use."""
+        if self._lines is None:
+            self._lines = LineIndex(self.source)
+        return self._lines
+
+    def get_source(self, node: ast.AST) -> Optional[str]:
+        """
+        Get the source of a node.
+
+        Args:
+            node: A node of the tree.
+
+        Returns:
+            The source of the node, or None if it has no position.
+        """
+        return self.lines.get_node_source(node)
+
+    @property
+    def classes(self) -> List[Definition]:
+        """All classes, including nested ones."""
+        return [definition for definition in self.definitions if definition.kind == "class"]
+
+    @property
+    def functions(self) -> List[Definition]:
+        """All functions and methods."""
+        return [definition for definition in self.definitions if definition.kind != "class"]
+
+    def get_parent(self, node: ast.AST) -> Optional[ast.AST]:
+        """
+        Get the parent of a node.
+
+        Args:
+            node: A node of the tree.
+
+        Returns:
+            The parent node, or None for the module itself.
+        """
+        return self.parents.get(node)
+
+    def get_enclosing_class(self, node: ast.AST) -> Optional[ast.ClassDef]:
+        """
+        Get the class a node is directly defined in.
+
+        Functions in between end the search, so the body of a nested
+        function does not belong to the class of the outer method.
+
+        Args:
+            node: A node of the tree.
+
+        Returns:
+            The enclosing class, or None.
+        """
+        parent = self.parents.get(node)
+        while parent is not None:
+            if isinstance(parent, ast.ClassDef):
+                return parent
+            if isinstance(parent, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                return None
+            parent = self.parents.get(parent)
+        return None
+
+
+class _ModuleVisitor:
+    """
+    Single traversal of a module's syntax tree filling in a ParsedModule.
+
+    Complexity is attributed to every enclosing function, so the complexity
+    of a function includes that of the functions nested in it.
+    """
+
+    def __init__(self, module: ParsedModule):
+        self.module = module
+
+    def visit_module(self) -> None:
+        """Visit all nodes of the module, parents before children."""
+        module = self.module
+        module.docstring = ast.get_docstring(module.tree)
+
+        # (node, qualified name prefix, enclosing class, enclosing definitions, nesting level)
+        stack: List[Tuple[ast.AST, str, Optional[str], Tuple[Definition, ...], int]] = [
+            (module.tree, "", None, (), 0)
+        ]
+        while stack:
+            node, prefix, class_name, enclosing, nesting = stack.pop()
+            child_prefix, child_class, child_enclosing = prefix, class_name, enclosing
+
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                definition = self._add_definition(node, prefix, class_name)
+                child_prefix = f"{definition.qualname}."
+                child_class = node.name if isinstance(node, ast.ClassDef) else None
+                if not isinstance(node, ast.ClassDef):
+                    child_enclosing = enclosing + (definition,)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                module.imports.append(node)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                module.assignments.extend((target.id, node) for target in targets if isinstance(target, ast.Name))
+            elif isinstance(node, ast.Return) and node.value is not None:
+                for definition in enclosing:
+                    definition.returns_value = True
+            elif isinstance(node, ast.Lambda):
+                child_class = None
+
+            branches = self._count_branches(node)
+            if branches:
+                module.complexity += branches
+                for definition in enclosing:
+                    definition.complexity += branches
+
+            if isinstance(node, _NESTING_NODES):
+                module.cognitive_complexity += nesting + 1
+                for definition in enclosing:
+                    definition.cognitive_complexity += nesting + 1
+
+            children = list(ast.iter_child_nodes(node))
+            for child in reversed(children):
+                module.parents[child] = node
+                level = nesting + 1 if isinstance(child, _NESTING_NODES) else nesting
+                stack.append((child, child_prefix, child_class, child_enclosing, level))
+
+        # Definitions in source order
+        module.definitions.sort(key=lambda definition: (definition.node.lineno, definition.node.col_offset))
+
+    def _add_definition(self, node: DefinitionNode, prefix: str, class_name: Optional[str]) -> Definition:
+        """Record a class or function."""
+        if isinstance(node, ast.ClassDef):
+            kind = "class"
+        else:
+            kind = "method" if class_name else "function"
+        definition = Definition(
+            node=node,
+            name=node.name,
+            qualname=prefix + node.name,
+            kind=kind,
+            docstring=ast.get_docstring(node),
+            parent_class=class_name if kind == "method" else None,
+            naming_style=get_naming_style(node.name)
+        )
+        self.module.definitions.append(definition)
+        return definition
+
+    @staticmethod
+    def _count_branches(node: ast.AST) -> int:
+        """Count the branches a node adds to the cyclomatic complexity."""
+        if isinstance(node, _BRANCH_NODES):
+            return 1
+        if isinstance(node, ast.BoolOp):
+            return len(node.values) - 1
+        if isinstance(node, ast.Try):
+            return len(node.handlers)
+        return 0
+
+
+class ModuleCache:
+    """
+    Cache of parsed modules, keyed by path and validated by size and modification time.
+
+    The cache is configured through the ``quality.parsed_modules`` section:
+    ``max_modules`` (default: 1024), the number of modules kept in memory.
+    """
+
+    def __init__(self, max_modules: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_modules: Number of modules kept; the least recently used are dropped.
+        """
+        self.max_modules = max_modules
+        self._modules: "OrderedDict[str, Tuple[Tuple[int, int], ParsedModule]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ModuleCache":
+        """
+        Create a cache configured by the ``quality.parsed_modules`` section.
+
+        Returns:
+            A new ModuleCache.
+        """
+        config = get_config()
+        cache_config = config.get("quality", {}).get("parsed_modules", {})
+        return cls(cache_config.get("max_modules", 1024))
+
+    def get(self, file_path: str) -> ParsedModule:
+        """
+        Get the parsed module of a file, parsing it if it is not cached or changed.
+
+        Args:
+            file_path: Path of the Python file.
+
+        Returns:
+            The parsed module.
+
+        Raises:
+            OSError: If the file cannot be read.
+            SyntaxError: If the file is not valid Python.
+        """
+        key = os.path.normpath(file_path)
+        stat = os.stat(key)
+        version = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            entry = self._modules.get(key)
+            if entry is not None and entry[0] == version:
+                self._modules.move_to_end(key)
+                return entry[1]
+
+        # Parse outside the lock; two threads may parse the same file once each
+        with open(key, "r", encoding="utf-8") as f:
+            module = ParsedModule.parse(f.read(), file_path)
+
+        with self._lock:
+            self._modules[key] = (version, module)
+            self._modules.move_to_end(key)
+            while len(self._modules) > self.max_modules:
+                self._modules.popitem(last=False)
+        return module
+
+    def clear(self) -> None:
+        """Drop all cached modules."""
+        with self._lock:
+            self._modules.clear()
+
+
+_cache: Optional[ModuleCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parsed_module(file_path: str) -> ParsedModule:
+    """
+    Get the parsed module of a file from the process-wide cache.
+
+    Args:
+        file_path: Path of the Python file.
+
+    Returns:
+        The parsed module.
+
+    Raises:
+        OSError: If the file cannot be read.
+        SyntaxError: If the file is not valid Python.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ModuleCache.from_config()
+    return _cache.get(file_path)
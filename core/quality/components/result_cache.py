@@ -0,0 +1,373 @@
+"""
+Result Cache for Incremental Quality Checks
+
+This module provides the ResultCache class, which stores the results of
+quality checks per file so that unchanged files are not checked again:
+- Results are keyed by check ID, check/tool version, configuration hash and
+  the content hash of the file
+- Checks whose results also depend on other files (e.g. mypy) include the
+  content hashes of the local modules a file imports, directly or through
+  other local modules, in the key
+- Content hashes are kept with the file's size and modification time, so
+  unchanged files are not read again
+
+Only checks that declare a ``cache_scope`` (see QualityCheck) are cached.
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from core.config.settings import get_config
+from core.quality.components.base import QualityCheck, QualityCheckResult
+from core.quality.components.inventory import FileInventory
+
+logger = logging.getLogger(__name__)
+
+# Configuration files read by external tools
+TOOL_CONFIG_FILES = {
+    "black": ["pyproject.toml"],
+    "isort": ["pyproject.toml", "setup.cfg", ".isort.cfg"],
+    "flake8": ["setup.cfg", "tox.ini", ".flake8"],
+    "mypy": ["pyproject.toml", "setup.cfg", "mypy.ini", ".mypy.ini"],
+    "pylint": ["pyproject.toml", "setup.cfg", "pylintrc", ".pylintrc"],
+    "shellcheck": [".shellcheckrc"]
+}
+
+# Versions of external tools, looked up once per process
+_tool_versions: Dict[str, str] = {}
+
+
+def get_tool_version(tool: str) -> str:
+    """
+    Get the version of an external tool.
+
+    Args:
+        tool: Executable name of the tool.
+
+    Returns:
+        The output of ``<tool> --version``, or "unavailable".
+    """
+    if tool not in _tool_versions:
+        try:
+            process = subprocess.run([tool, "--version"], capture_output=True, text=True, timeout=30)
+            _tool_versions[tool] = (process.stdout or process.stderr).strip()
+        except (OSError, subprocess.SubprocessError):
+            _tool_versions[tool] = "unavailable"
+    return _tool_versions[tool]
+
+
+def normalize_path(file_path: str) -> str:
+    """
+    Normalize a file path reported by a check or a tool.
+
+    Args:
+        file_path: Relative or absolute path.
+
+    Returns:
+        The normalized path relative to the working directory.
+    """
+    if os.path.isabs(file_path):
+        file_path = os.path.relpath(file_path)
+    return os.path.normpath(file_path)
+
+
+def _hash(*parts: str) -> str:
+    """Hash strings into a hex digest."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheLookup:
+    """Outcome of looking up the results of a check."""
+    cached: List[QualityCheckResult] = field(default_factory=list)
+    stale: List[str] = field(default_factory=list)
+    keys: Dict[str, str] = field(default_factory=dict)
+    cached_files: Set[str] = field(default_factory=set)
+
+
+class ResultCache:
+    """
+    Persistent per-file cache of quality check results.
+
+    The cache is configured through the ``quality.cache`` section: ``path``
+    (default: .quality_cache/results.db).
+    """
+
+    def __init__(self, path: str = ".quality_cache/results.db"):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path of the cache database.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(check_id TEXT NOT NULL, file_path TEXT NOT NULL, key TEXT NOT NULL, results TEXT NOT NULL, "
+            "PRIMARY KEY (check_id, file_path));"
+            "CREATE TABLE IF NOT EXISTS file_hashes "
+            "(file_path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, hash TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS file_imports (hash TEXT PRIMARY KEY, imports TEXT NOT NULL);"
+        )
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._check_keys: Dict[str, str] = {}
+        self._modules: Optional[Dict[str, List[str]]] = None
+        self._local_imports: Dict[str, Set[str]] = {}
+        self._inventory: Optional[FileInventory] = None
+
+    @classmethod
+    def from_config(cls) -> "ResultCache":
+        """
+        Create a cache configured by the ``quality.cache`` section.
+
+        Returns:
+            A new ResultCache.
+        """
+        config = get_config()
+        cache_config = config.get("quality", {}).get("cache", {})
+        return cls(cache_config.get("path", ".quality_cache/results.db"))
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self._connection.commit()
+        self._connection.close()
+
+    def lookup(self, check: QualityCheck, file_paths: Optional[List[str]], kwargs: Dict[str, Any]) -> CacheLookup:
+        """
+        Look up the cached results of a check.
+
+        Args:
+            check: The check; must declare a cache_scope.
+            file_paths: File paths the check is run on, or None for all files.
+            kwargs: Additional arguments of the check run.
+
+        Returns:
+            The cached results and the files that must be checked again.
+        """
+        inventory = kwargs.get("inventory")
+        if inventory is not None:
+            self._inventory = inventory
+        if file_paths:
+            targets = [path for path in file_paths if FileInventory.get_language(path) in check.languages]
+        else:
+            targets = self._get_inventory().get_files(*check.languages)
+
+        lookup = CacheLookup()
+        check_key = self._get_check_key(check, kwargs)
+        for file_path in targets:
+            key = self._get_file_key(check, check_key, file_path)
+            row = None
+            if key is not None:
+                row = self._connection.execute(
+                    "SELECT results FROM results WHERE check_id = ? AND file_path = ? AND key = ?",
+                    (check.id, normalize_path(file_path), key)
+                ).fetchone()
+            if row is None:
+                lookup.stale.append(file_path)
+                if key is not None:
+                    lookup.keys[file_path] = key
+            else:
+                lookup.cached.extend(QualityCheckResult.from_dict(data) for data in json.loads(row[0]))
+                lookup.cached_files.add(normalize_path(file_path))
+        return lookup
+
+    def store(self, check: QualityCheck, lookup: CacheLookup, results: List[QualityCheckResult]) -> List[QualityCheckResult]:
+        """
+        Store the results of running a check on the stale files of a lookup.
+
+        Args:
+            check: The check.
+            lookup: The lookup that determined the stale files.
+            results: Results of running the check on the stale files.
+
+        Returns:
+            The cached and the new results together.
+        """
+        results_by_file: Dict[str, List[Dict[str, Any]]] = {normalize_path(path): [] for path in lookup.keys}
+        new_results = []
+        for result in results:
+            path = normalize_path(result.file_path) if result.file_path else None
+            # Tools following imports may report on files whose results came from the cache
+            if path in lookup.cached_files:
+                continue
+            if path in results_by_file:
+                results_by_file[path].append(result.to_dict())
+            new_results.append(result)
+
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO results (check_id, file_path, key, results) VALUES (?, ?, ?, ?)",
+            [(check.id, normalize_path(path), key, json.dumps(results_by_file[normalize_path(path)]))
+             for path, key in lookup.keys.items()]
+        )
+        self._connection.commit()
+        return lookup.cached + new_results
+
+    def _get_inventory(self) -> FileInventory:
+        """Get the inventory of the run, creating one if none was passed."""
+        if self._inventory is None:
+            self._inventory = FileInventory.from_config()
+        return self._inventory
+
+    def _get_check_key(self, check: QualityCheck, kwargs: Dict[str, Any]) -> str:
+        """Hash the version and configuration of a check."""
+        if check.id not in self._check_keys:
+            # Code of the check itself, so that changes to it invalidate its results
+            try:
+                with open(inspect.getsourcefile(type(check)), "rb") as f:
+                    version = hashlib.sha256(f.read()).hexdigest()
+            except (OSError, TypeError):
+                version = type(check).__qualname__
+            if check.tool:
+                version += get_tool_version(check.tool)
+
+            quality_config = get_config().get("quality", {})
+            check_config = quality_config.get("checks", {}).get(check.id, {})
+            arguments = {name: value for name, value in kwargs.items() if name != "inventory"}
+            config_files = [self._hash_file(path) or "" for path in TOOL_CONFIG_FILES.get(check.tool, [])]
+
+            self._check_keys[check.id] = _hash(
+                check.id, version,
+                json.dumps(check_config, sort_keys=True, default=str),
+                json.dumps(arguments, sort_keys=True, default=str),
+                *config_files
+            )
+        return self._check_keys[check.id]
+
+    def _get_file_key(self, check: QualityCheck, check_key: str, file_path: str) -> Optional[str]:
+        """Hash the check key with the content of a file and, for the imports scope, its local dependencies."""
+        content_hash = self._hash_file(file_path)
+        if content_hash is None:
+            return None
+        if check.cache_scope != "imports":
+            return _hash(check_key, content_hash)
+
+        dependency_hashes = sorted(
+            f"{path}:{self._hash_file(path)}" for path in self._get_dependencies(file_path, content_hash)
+        )
+        return _hash(check_key, content_hash, *dependency_hashes)
+
+    def _get_dependencies(self, file_path: str, content_hash: str) -> Set[str]:
+        """Get the project files a Python file imports, directly or through other project files."""
+        path = normalize_path(file_path)
+        dependencies: Set[str] = set()
+        pending = [(path, content_hash)]
+        while pending:
+            current, current_hash = pending.pop()
+            for imported in self._get_local_imports(current, current_hash):
+                if imported == path or imported in dependencies:
+                    continue
+                dependencies.add(imported)
+                imported_hash = self._hash_file(imported)
+                if imported_hash is not None:
+                    pending.append((imported, imported_hash))
+        return dependencies
+
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        """Get the content hash of a file, rehashing only if its size or modification time changed."""
+        path = normalize_path(file_path)
+        if path in self._hashes:
+            return self._hashes[path]
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._hashes[path] = None
+            return None
+
+        row = self._connection.execute(
+            "SELECT hash FROM file_hashes WHERE file_path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)
+        ).fetchone()
+        if row is not None:
+            content_hash = row[0]
+        else:
+            with open(path, "rb") as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO file_hashes (file_path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, content_hash)
+            )
+        self._hashes[path] = content_hash
+        return content_hash
+
+    def _get_local_imports(self, file_path: str, content_hash: str) -> Set[str]:
+        """Get the project files a Python file imports directly."""
+        path = normalize_path(file_path)
+        if path in self._local_imports:
+            return self._local_imports[path]
+
+        row = self._connection.execute("SELECT imports FROM file_imports WHERE hash = ?", (content_hash,)).fetchone()
+        if row is not None:
+            imported = json.loads(row[0])
+        else:
+            imported = self._parse_imports(file_path)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO file_imports (hash, imports) VALUES (?, ?)",
+                (content_hash, json.dumps(imported))
+            )
+
+        modules = self._get_modules()
+        package = os.path.dirname(path).replace(os.sep, ".")
+        files = set()
+        for name in imported:
+            if name.startswith("."):
+                # Resolve relative imports against the package of the file
+                level = len(name) - len(name.lstrip("."))
+                base = package.split(".")[:len(package.split(".")) - (level - 1)] if package else []
+                name = ".".join(base + [name.lstrip(".")]).strip(".")
+            files.update(modules.get(name, []))
+        files.discard(path)
+        self._local_imports[path] = files
+        return files
+
+    @staticmethod
+    def _parse_imports(file_path: str) -> List[str]:
+        """List the module names imported by a Python file, including "from x import y" as x.y."""
+        try:
+            with open(file_path, "rb") as f:
+                tree = ast.parse(f.read())
+        except (OSError, SyntaxError, ValueError):
+            return []
+
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                module = "." * node.level + (node.module or "")
+                names.add(module)
+                separator = "" if module.endswith(".") else "."
+                names.update(f"{module}{separator}{alias.name}" for alias in node.names if alias.name != "*")
+        return sorted(names)
+
+    def _get_modules(self) -> Dict[str, List[str]]:
+        """
+        Map module names to the project files defining them.
+
+        Every dotted suffix of a file's path is indexed, so that modules of
+        source roots below the project root (e.g. services/x/src) resolve.
+        """
+        if self._modules is None:
+            self._modules = {}
+            for file_path in self._get_inventory().get_files("python"):
+                path = normalize_path(file_path)
+                parts = path[:-len(".py")].split(os.sep)
+                if parts[-1] == "__init__":
+                    parts = parts[:-1]
+                for i in range(len(parts)):
+                    self._modules.setdefault(".".join(parts[i:]), []).append(path)
+        return self._modules
@@ -0,0 +1,158 @@
+"""
+Streaming Result Sink for Quality Checks
+
+This module writes quality check results as they are produced, instead of
+collecting all results of a run in memory first:
+- ResultSink appends results to a JSON Lines file, one result per line, and
+  keeps running counts per severity and check
+- read_results streams the results of a JSON Lines file back as a generator
+- write_report streams results into the JSON report read by the dashboard
+  and the knowledge graph update
+
+The sink is configured through the ``quality.results`` section: ``path``
+(default: data/reports/quality_results.jsonl).
+"""
+
+import datetime
+import json
+import logging
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator
+
+from core.config.settings import get_config
+from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink:
+    """
+    JSON Lines file receiving the results of a run.
+
+    Results are written to a temporary file that replaces the previous run's
+    file when the sink is closed, so readers never see a partial run.
+    """
+
+    def __init__(self, path: str = "data/reports/quality_results.jsonl"):
+        """
+        Initialize the sink and open its temporary file.
+
+        Args:
+            path: Path of the JSON Lines file.
+        """
+        self.path = path
+        self.severity_counts: Counter = Counter()
+        self.check_counts: Counter = Counter()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._temp_path = f"{path}.tmp"
+        self._file = open(self._temp_path, "w", encoding="utf-8")
+
+    @classmethod
+    def from_config(cls) -> "ResultSink":
+        """
+        Create a sink configured by the ``quality.results`` section.
+
+        Returns:
+            A new ResultSink.
+        """
+        config = get_config()
+        results_config = config.get("quality", {}).get("results", {})
+        return cls(results_config.get("path", "data/reports/quality_results.jsonl"))
+
+    @property
+    def total(self) -> int:
+        """Number of results written."""
+        return sum(self.severity_counts.values())
+
+    def write(self, result: QualityCheckResult) -> None:
+        """
+        Write one result.
+
+        Args:
+            result: The result.
+        """
+        self._file.write(json.dumps(result.to_dict(), default=str))
+        self._file.write("\n")
+        self.severity_counts[result.severity] += 1
+        self.check_counts[result.check_id] += 1
+
+    def write_all(self, results: Iterable[QualityCheckResult]) -> None:
+        """
+        Write several results.
+
+        Args:
+            results: The results.
+        """
+        for result in results:
+            self.write(result)
+
+    def close(self) -> None:
+        """Finish the run, replacing the previous file."""
+        if not self._file.closed:
+            self._file.close()
+            os.replace(self._temp_path, self.path)
+
+    def discard(self) -> None:
+        """Abandon the run, keeping the previous file."""
+        if not self._file.closed:
+            self._file.close()
+            os.unlink(self._temp_path)
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def read_results(path: str) -> Iterator[QualityCheckResult]:
+    """
+    Read the results of a JSON Lines file one at a time.
+
+    Args:
+        path: Path of the file written by a ResultSink.
+
+    Yields:
+        The results in the order they were written.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield QualityCheckResult.from_dict(json.loads(line))
+
+
+def write_report(path: str, results: Iterable[QualityCheckResult]) -> Dict[str, Any]:
+    """
+    Write results into a JSON report without holding them in memory.
+
+    The report has the keys ``timestamp``, ``results`` and ``summary``;
+    INFO results count as passed and all other results as failed.
+
+    Args:
+        path: Path of the report.
+        results: The results, e.g. from read_results.
+
+    Returns:
+        The summary of the report, with the number of results per severity.
+    """
+    severity_counts: Counter = Counter()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'{{\n  "timestamp": {json.dumps(datetime.datetime.now().isoformat())},\n  "results": [')
+        separator = "\n    "
+        for result in results:
+            f.write(separator)
+            f.write(json.dumps(result.to_dict(), default=str))
+            separator = ",\n    "
+            severity_counts[result.severity] += 1
+
+        total = sum(severity_counts.values())
+        passed = severity_counts[QualityCheckSeverity.INFO]
+        summary = {"total_checks": total, "passed": passed, "failed": total - passed}
+        f.write(f'\n  ],\n  "summary": {json.dumps(summary)}\n}}\n')
+
+    summary["by_severity"] = {severity.value: severity_counts[severity] for severity in QualityCheckSeverity}
+    return summary
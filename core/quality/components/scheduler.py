@@ -0,0 +1,258 @@
+"""
+Check Scheduler for Quality Components
+
+This module provides the CheckScheduler class, which runs independent quality
+checks concurrently:
+- Checks that run external tools (black, mypy, pylint, ...) run on threads,
+  so their subprocesses execute in parallel
+- In-Python checks run in a process pool, so they are not serialized by the GIL
+- A global worker limit caps the number of checks running at once, and a
+  process-wide budget of the same size caps the processes they start
+  (tool invocations, shards and worker processes; see process_slot)
+- Declared dependencies between checks are respected
+- Results are streamed as each check finishes
+- The project files are listed once and shared by all checks (see FileInventory)
+- With a ResultCache, checks only run on files whose cached results are stale
+"""
+
+import contextlib
+import logging
+import os
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.config.settings import get_config
+from core.quality.components.base import (
+    QualityCheck,
+    QualityCheckResult,
+    QualityCheckSeverity
+)
+from core.quality.components.inventory import FileInventory
+from core.quality.components.result_cache import CacheLookup, ResultCache
+
+logger = logging.getLogger(__name__)
+
+
+_process_budget: Optional[threading.BoundedSemaphore] = None
+_process_budget_lock = threading.Lock()
+
+
+def get_process_budget() -> threading.BoundedSemaphore:
+    """
+    Get the process-wide budget of processes working on quality checks.
+
+    The budget is sized by ``quality.scheduler.max_workers`` (default: CPU count).
+
+    Returns:
+        The semaphore holding one slot per process.
+    """
+    global _process_budget
+    if _process_budget is None:
+        with _process_budget_lock:
+            if _process_budget is None:
+                config = get_config()
+                scheduler_config = config.get("quality", {}).get("scheduler", {})
+                size = scheduler_config.get("max_workers") or os.cpu_count() or 1
+                _process_budget = threading.BoundedSemaphore(size)
+    return _process_budget
+
+
+@contextlib.contextmanager
+def process_slot() -> Iterator[None]:
+    """
+    Hold a slot of the process budget while running a process.
+
+    Checks running external tools take a slot for each tool invocation (e.g.
+    each shard), so concurrent checks fanning out into shards never run more
+    processes than the configured worker limit.
+    """
+    budget = get_process_budget()
+    budget.acquire()
+    try:
+        yield
+    finally:
+        budget.release()
+
+
+def _run_check(check: QualityCheck, file_paths: Optional[List[str]], kwargs: Dict[str, Any]) -> List[QualityCheckResult]:
+    """Run a check; used as the work item of both pools."""
+    return check.run(file_paths, **kwargs)
+
+
+def _run_check_in_process(process_pool: ProcessPoolExecutor, check: QualityCheck, file_paths: Optional[List[str]],
+                          kwargs: Dict[str, Any]) -> List[QualityCheckResult]:
+    """Run a check in the process pool while holding a slot of the process budget."""
+    with process_slot():
+        return process_pool.submit(_run_check, check, file_paths, kwargs).result()
+
+
+class CheckScheduler:
+    """
+    Runs quality checks concurrently.
+
+    The scheduler is configured through the ``quality.scheduler`` section:
+    ``max_workers`` (default: CPU count) and ``use_processes`` (default: True).
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, use_processes: Optional[bool] = None,
+                 cache: Optional[ResultCache] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of checks running at once.
+                If None, use the configured value or the CPU count.
+            use_processes: Whether to run in-Python checks in worker processes.
+                If None, use the configured value.
+            cache: Optional result cache for incremental runs. Cacheable checks
+                reuse the cached results of unchanged files.
+        """
+        config = get_config()
+        scheduler_config = config.get("quality", {}).get("scheduler", {})
+
+        self.max_workers = max_workers or scheduler_config.get("max_workers") or os.cpu_count() or 1
+        if use_processes is None:
+            use_processes = scheduler_config.get("use_processes", True)
+        self.use_processes = use_processes
+        self.cache = cache
+
+    def run(self, checks: Sequence[Tuple[str, QualityCheck]], file_paths: Optional[List[str]] = None,
+            **kwargs) -> Iterator[Tuple[QualityCheck, List[QualityCheckResult]]]:
+        """
+        Run checks concurrently, yielding their results as they finish.
+
+        A check starts once all checks it depends on (see
+        ``QualityCheck.depends_on``) have finished. Dependencies on checks
+        that are not scheduled are ignored. A failing check yields a single
+        error result instead of raising.
+
+        When no file paths are given, the project files are listed once up
+        front and passed to every check as the ``inventory`` argument.
+
+        Args:
+            checks: (source, check) pairs; source names the component and is
+                used for error results.
+            file_paths: Optional list of file paths to check.
+                If None, check all relevant files.
+            **kwargs: Additional arguments for the checks.
+
+        Yields:
+            (check, results) tuples in completion order.
+
+        Raises:
+            ValueError: If the dependencies between the checks are circular.
+        """
+        # Number of scheduled checks per ID, so that a dependency is met once all of them finish
+        unfinished: Dict[str, int] = {}
+        for _, check in checks:
+            unfinished[check.id] = unfinished.get(check.id, 0) + 1
+
+        dependencies = {
+            id(check): [dep for dep in check.depends_on if dep in unfinished and dep != check.id]
+            for _, check in checks
+        }
+        self._check_for_cycles(checks, dependencies)
+
+        if not file_paths and "inventory" not in kwargs:
+            kwargs["inventory"] = FileInventory.from_config().scan()
+
+        pending = list(checks)
+        running: Dict[Future, Tuple[str, QualityCheck, Optional[CacheLookup]]] = {}
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quality-check")
+        process_pool: Optional[ProcessPoolExecutor] = None
+
+        try:
+            while pending or running:
+                # Start every ready check while below the worker limit
+                for entry in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    source, check = entry
+                    if any(unfinished[dep] for dep in dependencies[id(check)]):
+                        continue
+
+                    pending.remove(entry)
+                    check_paths = file_paths
+                    lookup = None
+                    if self.cache is not None and check.cache_scope:
+                        lookup = self.cache.lookup(check, file_paths, kwargs)
+                        if not lookup.stale:
+                            # Nothing changed; dependents can start on the next pass
+                            unfinished[check.id] -= 1
+                            yield check, lookup.cached
+                            continue
+                        check_paths = lookup.stale
+
+                    if self._runs_in_process(check, check_paths, kwargs):
+                        if process_pool is None:
+                            process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                        future = thread_pool.submit(_run_check_in_process, process_pool, check, check_paths, kwargs)
+                    else:
+                        future = thread_pool.submit(_run_check, check, check_paths, kwargs)
+                    running[future] = (source, check, lookup)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source, check, lookup = running.pop(future)
+                    unfinished[check.id] -= 1
+                    results, failed = self._get_results(future, source, check)
+                    if lookup is not None:
+                        # Results of failed runs are not cached
+                        results = lookup.cached + results if failed else self.cache.store(check, lookup, results)
+                    yield check, results
+        finally:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _runs_in_process(self, check: QualityCheck, file_paths: Optional[List[str]], kwargs: Dict[str, Any]) -> bool:
+        """
+        Determine whether a check runs in the process pool.
+
+        Checks running external tools stay on threads, as do checks whose
+        arguments cannot be sent to another process.
+        """
+        if not self.use_processes or check.uses_subprocess:
+            return False
+        try:
+            pickle.dumps((check, file_paths, kwargs))
+        except Exception:
+            logger.debug(f"Check {check.id} cannot be pickled, running it on a thread")
+            return False
+        return True
+
+    def _get_results(self, future: Future, source: str, check: QualityCheck) -> Tuple[List[QualityCheckResult], bool]:
+        """Get the results of a finished check and whether it failed, converting errors into an error result."""
+        try:
+            return future.result(), False
+        except Exception as e:
+            logger.exception(f"Error running check {check.id}: {e}")
+            return [QualityCheckResult(
+                check_id=check.id,
+                severity=QualityCheckSeverity.ERROR,
+                message=f"Error running check: {str(e)}",
+                source=source
+            )], True
+
+    @staticmethod
+    def _check_for_cycles(checks: Sequence[Tuple[str, QualityCheck]], dependencies: Dict[int, List[str]]) -> None:
+        """
+        Make sure the checks can be ordered by their dependencies.
+
+        Raises:
+            ValueError: If the dependencies are circular.
+        """
+        remaining = {id(check): check for _, check in checks}
+        while remaining:
+            remaining_ids = {check.id for check in remaining.values()}
+            ready = [key for key, check in remaining.items()
+                     if not any(dep in remaining_ids for dep in dependencies[key])]
+            if not ready:
+                cycle = sorted(remaining_ids)
+                raise ValueError(f"Circular dependencies between checks: {', '.join(cycle)}")
+            for key in ready:
+                del remaining[key]
@@ -0,0 +1,304 @@
+"""
+Sharded Execution of External Quality Tools
+
+This module provides the ShardedToolRunner class, which runs an external
+tool (black, flake8, pylint, ...) on a large list of files as several
+parallel invocations:
+- Files are split into shards of balanced expected runtime, using the
+  runtime measured in earlier runs and the file size for new files
+- Shards are kept below a command line size limit, so long file lists
+  never exceed the operating system's argument limit
+- Shards run in parallel on threads; the tools run in subprocesses, each
+  holding a slot of the process budget shared with the check scheduler
+- The results of all shards are merged and deduplicated (see merge_results)
+
+Sharding is configured through the ``quality.sharding`` section:
+``max_shards`` (default: CPU count), ``min_files_per_shard`` (default: 16),
+``max_arg_bytes`` (default: 131072) and ``history_path`` (default:
+.quality_cache/runtimes.json).
+"""
+
+import heapq
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from core.config.settings import get_config
+from core.quality.components.base import QualityCheckResult
+from core.quality.components.result_cache import normalize_path
+from core.quality.components.scheduler import process_slot
+from core.quality.components.tool_daemons import daemons_enabled, run_tool
+
+logger = logging.getLogger(__name__)
+
+
+class RuntimeHistory:
+    """
+    Expected runtime of a tool per file, learned from earlier runs.
+
+    The runtime of a shard is attributed to its files in proportion to their size.
+    """
+
+    def __init__(self, path: Optional[str] = ".quality_cache/runtimes.json"):
+        """
+        Initialize the history, loading earlier runtimes.
+
+        Args:
+            path: Path of the history file, or None to keep the history in memory only.
+        """
+        self.path = path
+        self._runtimes: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._runtimes = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable runtime history {path}: {e}")
+
+    def get(self, tool: str, file_path: str) -> Optional[float]:
+        """
+        Get the expected runtime of a tool on a file.
+
+        Args:
+            tool: Name of the tool.
+            file_path: Path of the file.
+
+        Returns:
+            Runtime in seconds, or None if the tool never ran on the file.
+        """
+        return self._runtimes.get(tool, {}).get(normalize_path(file_path))
+
+    def record(self, tool: str, file_paths: Sequence[str], seconds: float) -> None:
+        """
+        Record the runtime of one invocation of a tool.
+
+        Args:
+            tool: Name of the tool.
+            file_paths: Files the tool ran on.
+            seconds: Wall time of the invocation.
+        """
+        sizes = {file_path: _get_size(file_path) for file_path in file_paths}
+        total = sum(sizes.values()) or 1
+        with self._lock:
+            runtimes = self._runtimes.setdefault(tool, {})
+            for file_path, size in sizes.items():
+                key = normalize_path(file_path)
+                runtime = seconds * size / total
+                # Smooth out noise between runs
+                previous = runtimes.get(key)
+                runtimes[key] = runtime if previous is None else (previous + runtime) / 2
+
+    def save(self) -> None:
+        """Write the history file."""
+        if not self.path:
+            return
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._runtimes, f)
+            except OSError as e:
+                logger.warning(f"Could not write runtime history {self.path}: {e}")
+
+
+def _get_size(file_path: str) -> int:
+    """Size of a file, at least 1 so every file has some weight."""
+    try:
+        return max(os.path.getsize(file_path), 1)
+    except OSError:
+        return 1
+
+
+def split_into_shards(file_paths: Sequence[str], shard_count: int,
+                      weights: Dict[str, float]) -> List[List[str]]:
+    """
+    Split files into shards of balanced total weight.
+
+    Files are assigned heaviest first to the lightest shard, which keeps the
+    heaviest shard within 4/3 of the optimum.
+
+    Args:
+        file_paths: Files to split.
+        shard_count: Number of shards.
+        weights: Weight (expected runtime) of each file.
+
+    Returns:
+        Non-empty shards, each in the order of file_paths.
+    """
+    if shard_count <= 1 or len(file_paths) <= 1:
+        return [list(file_paths)] if file_paths else []
+
+    order = {file_path: index for index, file_path in enumerate(file_paths)}
+    heap = [(0.0, shard) for shard in range(min(shard_count, len(file_paths)))]
+    shards: List[List[str]] = [[] for _ in heap]
+    for file_path in sorted(file_paths, key=lambda path: (-weights[path], order[path])):
+        load, shard = heapq.heappop(heap)
+        shards[shard].append(file_path)
+        heapq.heappush(heap, (load + weights[file_path], shard))
+
+    return [sorted(shard, key=order.__getitem__) for shard in shards if shard]
+
+
+def merge_results(result_lists: Iterable[List[QualityCheckResult]]) -> List[QualityCheckResult]:
+    """
+    Merge the results of several shards, dropping duplicates.
+
+    Tools that follow imports (e.g. pylint) can report the same issue from
+    more than one shard.
+
+    Args:
+        result_lists: Results of each shard.
+
+    Returns:
+        The merged results, in order of first occurrence.
+    """
+    merged = []
+    seen = set()
+    for results in result_lists:
+        for result in results:
+            key = (result.check_id, result.file_path, result.line_number, result.column, result.message)
+            if key not in seen:
+                seen.add(key)
+                merged.append(result)
+    return merged
+
+
+class ShardedToolRunner:
+    """Runs external tools on shards of a file list in parallel."""
+
+    def __init__(self, max_shards: Optional[int] = None, min_files_per_shard: int = 16,
+                 max_arg_bytes: int = 131072, history: Optional[RuntimeHistory] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            max_shards: Maximum number of shards running at once. Defaults to the CPU count.
+            min_files_per_shard: Smallest shard worth the startup of another process.
+            max_arg_bytes: Maximum size of the file arguments of one invocation.
+            history: Runtime history used to balance shards. Defaults to an in-memory history.
+        """
+        self.max_shards = max_shards or os.cpu_count() or 1
+        self.min_files_per_shard = max(min_files_per_shard, 1)
+        self.max_arg_bytes = max_arg_bytes
+        self.history = history or RuntimeHistory(None)
+
+    @classmethod
+    def from_config(cls) -> "ShardedToolRunner":
+        """
+        Create a runner configured by the ``quality.sharding`` section.
+
+        Returns:
+            A new ShardedToolRunner.
+        """
+        config = get_config()
+        sharding_config = config.get("quality", {}).get("sharding", {})
+        return cls(
+            max_shards=sharding_config.get("max_shards"),
+            min_files_per_shard=sharding_config.get("min_files_per_shard", 16),
+            max_arg_bytes=sharding_config.get("max_arg_bytes", 131072),
+            history=RuntimeHistory(sharding_config.get("history_path", ".quality_cache/runtimes.json"))
+        )
+
+    def plan(self, tool: str, file_paths: Sequence[str]) -> List[List[str]]:
+        """
+        Split files into the shards a tool runs on.
+
+        Args:
+            tool: Name of the tool.
+            file_paths: Files to check.
+
+        Returns:
+            The shards.
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        # Requests to a daemon are served one at a time, so parallel shards would only queue
+        shard_count = 1 if daemons_enabled() else min(
+            self.max_shards, -(-len(file_paths) // self.min_files_per_shard)
+        )
+
+        # Unknown files are weighted by size at the average runtime per byte of known files
+        known = {path: self.history.get(tool, path) for path in file_paths}
+        sizes = {path: _get_size(path) for path in file_paths}
+        known_sizes = sum(sizes[path] for path, runtime in known.items() if runtime is not None)
+        rate = sum(runtime for runtime in known.values() if runtime is not None) / known_sizes if known_sizes else 1.0
+        weights = {path: runtime if runtime is not None else sizes[path] * rate for path, runtime in known.items()}
+
+        shards = []
+        for shard in split_into_shards(file_paths, shard_count, weights):
+            shards.extend(self._limit_arg_bytes(shard))
+        return shards
+
+    def _limit_arg_bytes(self, shard: List[str]) -> List[List[str]]:
+        """Split a shard whose file arguments exceed max_arg_bytes."""
+        parts: List[List[str]] = [[]]
+        size = 0
+        for file_path in shard:
+            arg_size = len(os.fsencode(file_path)) + 1
+            if parts[-1] and size + arg_size > self.max_arg_bytes:
+                parts.append([])
+                size = 0
+            parts[-1].append(file_path)
+            size += arg_size
+        return parts
+
+    def run(self, tool: str, args: Sequence[str], file_paths: Sequence[str]) -> List[subprocess.CompletedProcess]:
+        """
+        Run a tool on shards of a file list.
+
+        Args:
+            tool: Name of the tool's command.
+            args: Arguments preceding the file paths.
+            file_paths: Files to check.
+
+        Returns:
+            The result of each shard, in shard order.
+        """
+        shards = self.plan(tool, file_paths)
+        if not shards:
+            return []
+
+        def run_shard(shard: List[str]) -> subprocess.CompletedProcess:
+            with process_slot():
+                start = time.monotonic()
+                process = run_tool(tool, [*args, *shard])
+                self.history.record(tool, shard, time.monotonic() - start)
+            return process
+
+        if len(shards) == 1:
+            processes = [run_shard(shards[0])]
+        else:
+            logger.debug(f"Running {tool} on {len(file_paths)} files in {len(shards)} shards")
+            with ThreadPoolExecutor(max_workers=min(self.max_shards, len(shards))) as executor:
+                processes = list(executor.map(run_shard, shards))
+        self.history.save()
+        return processes
+
+
+_runner: Optional[ShardedToolRunner] = None
+_runner_lock = threading.Lock()
+
+
+def run_sharded(tool: str, args: Sequence[str], file_paths: Sequence[str]) -> List[subprocess.CompletedProcess]:
+    """
+    Run a tool on shards of a file list with the process-wide runner.
+
+    Args:
+        tool: Name of the tool's command.
+        args: Arguments preceding the file paths.
+        file_paths: Files to check.
+
+    Returns:
+        The result of each shard, in shard order.
+    """
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = ShardedToolRunner.from_config()
+    return _runner.run(tool, args, file_paths)
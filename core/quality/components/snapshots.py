@@ -0,0 +1,315 @@
+"""
+File Snapshots for Fix Verification
+
+This module provides the SnapshotStore class, which keeps the original
+content of files while fixes are applied, so that a failed fix can be
+rolled back:
+- Where the filesystem supports it, a snapshot is a reflink (copy-on-write
+  clone) of the file, taken without copying any data
+- Otherwise the snapshot is a hard link to the original file, and the file
+  itself is replaced by a copy, so fixers writing in place cannot change
+  the snapshot
+- As a fallback (e.g. the store is on another filesystem), snapshots are
+  kept in a content-addressed blob store, where identical files are stored
+  once
+- Restoring a snapshot renames it over the file, which takes constant time
+  on the same filesystem
+
+Each store keeps its snapshots in a directory of its own, which is removed
+when the store is closed or garbage collected; directories left behind by
+processes that no longer exist are removed when a new store is created.
+
+The store is configured through the ``quality.snapshots`` section: ``path``
+(default: .quality_cache/snapshots), ``reflinks`` (default: True) and
+``hard_links`` (default: True).
+"""
+
+import hashlib
+import itertools
+import logging
+import os
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from core.config.settings import get_config
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# ioctl request cloning a file on Linux (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+_RUN_DIRECTORY_PATTERN = re.compile(r"run-(\d+)-")
+
+
+@dataclass
+class Snapshot:
+    """Original content of a file."""
+    path: str  # real path of the file
+    kind: str  # "reflink", "link" or "blob"
+    snapshot_path: str
+    mode: int
+    atime_ns: int
+    mtime_ns: int
+    digest: Optional[str] = None  # blob snapshots only
+    in_place: bool = False  # the file has other hard links and must keep its inode
+
+
+def _is_process_alive(pid: int) -> bool:
+    """Whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def _remove_stale_runs(root: str) -> None:
+    """Remove the run directories of processes that no longer exist."""
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return
+    for name in names:
+        match = _RUN_DIRECTORY_PATTERN.match(name)
+        if match and int(match.group(1)) != os.getpid() and not _is_process_alive(int(match.group(1))):
+            logger.debug(f"Removing stale snapshots {name}")
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def _replace_with_copy(source: str, path: str, in_place: bool = False) -> None:
+    """
+    Replace a file with a copy of another file.
+
+    The copy is written next to the file and renamed over it, so the file
+    is never seen half-written.
+    """
+    if in_place:
+        with open(source, "rb") as src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp",
+                                     dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as dst, open(source, "rb") as src:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(source, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SnapshotStore:
+    """Snapshots of files, taken as cheaply as the filesystem allows."""
+
+    def __init__(self, root: str = ".quality_cache/snapshots", reflinks: bool = True, hard_links: bool = True):
+        """
+        Initialize the store and create its directory.
+
+        Args:
+            root: Directory holding the directories of all stores. Snapshots of
+                files on another filesystem are copied into the blob store.
+            reflinks: Whether to try reflinks.
+            hard_links: Whether to try hard links.
+        """
+        os.makedirs(root, exist_ok=True)
+        _remove_stale_runs(root)
+        self.root = root
+        self.reflinks = reflinks and fcntl is not None
+        self.hard_links = hard_links
+        self.directory = tempfile.mkdtemp(prefix=f"run-{os.getpid()}-", dir=root)
+        self._blob_directory = os.path.join(self.directory, "blobs")
+        os.mkdir(self._blob_directory)
+        self._device = os.stat(self.directory).st_dev
+        self._blob_references: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    @classmethod
+    def from_config(cls) -> "SnapshotStore":
+        """
+        Create a store configured by the ``quality.snapshots`` section.
+
+        Returns:
+            A new SnapshotStore.
+        """
+        config = get_config()
+        snapshots_config = config.get("quality", {}).get("snapshots", {})
+        return cls(
+            root=snapshots_config.get("path", ".quality_cache/snapshots"),
+            reflinks=snapshots_config.get("reflinks", True),
+            hard_links=snapshots_config.get("hard_links", True)
+        )
+
+    def snapshot(self, file_path: str) -> Snapshot:
+        """
+        Take a snapshot of a file.
+
+        Args:
+            file_path: Path to the file. Symbolic links are followed.
+
+        Returns:
+            The snapshot.
+
+        Raises:
+            OSError: If the file cannot be read or is not a regular file.
+        """
+        path = os.path.realpath(file_path)
+        file_stat = os.stat(path)
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise OSError(f"Not a regular file: {file_path}")
+
+        in_place = file_stat.st_nlink > 1
+        snapshot_path = os.path.join(self.directory, f"{next(self._counter)}-{os.path.basename(path)}")
+        snapshot = Snapshot(path, "blob", snapshot_path, stat.S_IMODE(file_stat.st_mode),
+                            file_stat.st_atime_ns, file_stat.st_mtime_ns, in_place=in_place)
+        # Renaming a snapshot over the file needs both on the same filesystem,
+        # and would detach the file from its other hard links
+        if file_stat.st_dev == self._device and not in_place:
+            if self.reflinks and self._reflink(path, snapshot_path):
+                snapshot.kind = "reflink"
+                return snapshot
+            if self.hard_links and self._link(path, snapshot_path):
+                snapshot.kind = "link"
+                return snapshot
+
+        snapshot.digest = self._store_blob(path)
+        snapshot.snapshot_path = os.path.join(self._blob_directory, snapshot.digest)
+        return snapshot
+
+    def _reflink(self, path: str, snapshot_path: str) -> bool:
+        """Clone a file; turns reflinks off if the filesystem does not support them."""
+        try:
+            with open(path, "rb") as src, open(snapshot_path, "xb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            logger.debug(f"Reflinks are not available for {self.directory}: {e}")
+            self.reflinks = False
+            try:
+                os.unlink(snapshot_path)
+            except OSError:
+                pass
+            return False
+
+    def _link(self, path: str, snapshot_path: str) -> bool:
+        """Keep the original file as the snapshot and give the path a copy of it."""
+        try:
+            os.link(path, snapshot_path)
+        except OSError as e:
+            logger.debug(f"Hard links are not available for {self.directory}: {e}")
+            self.hard_links = False
+            return False
+        try:
+            _replace_with_copy(snapshot_path, path)
+            return True
+        except OSError as e:
+            logger.debug(f"Cannot replace {path} with a copy: {e}")
+            os.unlink(snapshot_path)
+            return False
+
+    def _store_blob(self, path: str) -> str:
+        """Add the content of a file to the blob store, returning its digest."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+
+        with self._lock:
+            if digest in self._blob_references:
+                self._blob_references[digest] += 1
+                return digest
+
+        fd, temp_path = tempfile.mkstemp(dir=self._blob_directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst, open(path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            with self._lock:
+                if digest in self._blob_references:
+                    # Stored by another thread in the meantime
+                    os.unlink(temp_path)
+                else:
+                    os.replace(temp_path, os.path.join(self._blob_directory, digest))
+                self._blob_references[digest] = self._blob_references.get(digest, 0) + 1
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    def _release_blob(self, digest: str) -> bool:
+        """Drop a reference to a blob, returning whether it was the last one."""
+        with self._lock:
+            self._blob_references[digest] -= 1
+            if self._blob_references[digest]:
+                return False
+            del self._blob_references[digest]
+            return True
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        Restore a file from a snapshot, which is used up.
+
+        Args:
+            snapshot: The snapshot.
+
+        Raises:
+            OSError: If the file cannot be restored.
+        """
+        if snapshot.kind != "blob":
+            os.replace(snapshot.snapshot_path, snapshot.path)
+        elif not self._release_blob(snapshot.digest):
+            # The blob is shared with other snapshots
+            _replace_with_copy(snapshot.snapshot_path, snapshot.path, snapshot.in_place)
+        elif snapshot.in_place:
+            _replace_with_copy(snapshot.snapshot_path, snapshot.path, in_place=True)
+            os.unlink(snapshot.snapshot_path)
+        else:
+            try:
+                os.replace(snapshot.snapshot_path, snapshot.path)
+            except OSError:
+                # The file is on another filesystem
+                _replace_with_copy(snapshot.snapshot_path, snapshot.path)
+                os.unlink(snapshot.snapshot_path)
+
+        os.chmod(snapshot.path, snapshot.mode)
+        os.utime(snapshot.path, ns=(snapshot.atime_ns, snapshot.mtime_ns))
+
+    def discard(self, snapshot: Snapshot) -> None:
+        """
+        Delete a snapshot that is no longer needed.
+
+        Args:
+            snapshot: The snapshot.
+        """
+        if snapshot.kind == "blob" and not self._release_blob(snapshot.digest):
+            return
+        try:
+            os.unlink(snapshot.snapshot_path)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Delete the store and all its snapshots."""
+        self._finalizer()
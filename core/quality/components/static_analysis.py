@@ -10,9 +10,7 @@ These checks help identify potential bugs, code smells, and other issues
 through static analysis of the code.
 """
 
-import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -22,6 +20,10 @@ from core.quality.components.base import (
     QualityCheckSeverity,
     QualityComponent
 )
+from core.quality.components.inventory import get_inventory
+from core.quality.components.scheduler import process_slot
+from core.quality.components.sharding import merge_results, run_sharded
+from core.quality.components.tool_daemons import run_tool
 
 
 class MypyCheck(QualityCheck):
@@ -39,6 +41,18 @@ class MypyCheck(QualityCheck):
     def description(self) -> str:
         return "Checks Python type annotations using mypy."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "mypy"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "imports"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Run mypy to check Python type annotations.
@@ -55,7 +69,7 @@ class MypyCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -64,8 +78,8 @@ class MypyCheck(QualityCheck):
             return results
         
         # Run mypy
-        cmd = ["mypy"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        with process_slot():
+            process = run_tool("mypy", file_paths)
         
         # Parse mypy output
         for line in process.stdout.splitlines():
@@ -91,17 +105,6 @@ class MypyCheck(QualityCheck):
                 ))
         
         return results
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 
 
 class PylintCheck(QualityCheck):
@@ -119,6 +122,18 @@ class PylintCheck(QualityCheck):
     def description(self) -> str:
         return "Checks Python code quality using pylint."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "pylint"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "imports"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Run pylint to check Python code quality.
@@ -135,7 +150,7 @@ class PylintCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -143,12 +158,11 @@ class PylintCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run pylint
-        cmd = ["pylint", "--output-format=text"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run pylint on shards of the files in parallel
+        processes = run_sharded("pylint", ["--output-format=text"], file_paths)
         
         # Parse pylint output
-        for line in process.stdout.splitlines():
+        for line in (line for process in processes for line in process.stdout.splitlines()):
             # pylint output format: file:line:column: [message_type/message_id] message
             match = re.match(r'(.+?):(\d+):(\d+): \[(\w+)/(\w+)\] (.+)', line)
             if match:
@@ -172,18 +186,8 @@ class PylintCheck(QualityCheck):
                     details={"message_type": msg_type, "message_id": msg_id}
                 ))
         
-        return results
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
+        # Shards may report the same issue
+        return merge_results([results])
 
 
 class Flake8Check(QualityCheck):
@@ -201,6 +205,18 @@ class Flake8Check(QualityCheck):
     def description(self) -> str:
         return "Checks Python code style using flake8."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "flake8"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Run flake8 to check Python code style.
@@ -217,7 +233,7 @@ class Flake8Check(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -225,12 +241,11 @@ class Flake8Check(QualityCheck):
         if not file_paths:
             return results
         
-        # Run flake8
-        cmd = ["flake8"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run flake8 on shards of the files in parallel
+        processes = run_sharded("flake8", [], file_paths)
         
         # Parse flake8 output
-        for line in process.stdout.splitlines():
+        for line in (line for process in processes for line in process.stdout.splitlines()):
             # flake8 output format: file:line:column: error_code message
             match = re.match(r'(.+?):(\d+):(\d+): (\w+) (.+)', line)
             if match:
@@ -256,18 +271,8 @@ class Flake8Check(QualityCheck):
                     details={"error_code": error_code}
                 ))
         
-        return results
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
+        # Shards may report the same issue
+        return merge_results([results])
 
 
 class ShellcheckCheck(QualityCheck):
@@ -285,6 +290,18 @@ class ShellcheckCheck(QualityCheck):
     def description(self) -> str:
         return "Checks shell scripts using shellcheck."
     
+    @property
+    def tool(self) -> Optional[str]:
+        return "shellcheck"
+    
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("shell",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Run shellcheck to check shell scripts.
@@ -301,7 +318,7 @@ class ShellcheckCheck(QualityCheck):
         
         # If no file paths provided, use all shell scripts
         if not file_paths:
-            file_paths = self._find_shell_scripts()
+            file_paths = get_inventory(kwargs).get_files("shell")
         else:
             # Filter for shell scripts
             file_paths = [f for f in file_paths if f.endswith('.sh')]
@@ -309,12 +326,11 @@ class ShellcheckCheck(QualityCheck):
         if not file_paths:
             return results
         
-        # Run shellcheck
-        cmd = ["shellcheck", "--format=gcc"] + file_paths
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        # Run shellcheck on shards of the files in parallel
+        processes = run_sharded("shellcheck", ["--format=gcc"], file_paths)
         
         # Parse shellcheck output
-        for line in process.stderr.splitlines():
+        for line in (line for process in processes for line in process.stdout.splitlines()):
             # shellcheck output format: file:line:column: [severity]: message [SC####]
             match = re.match(r'(.+?):(\d+):(\d+): (\w+): (.+) \[SC(\d+)\]', line)
             if match:
@@ -340,18 +356,8 @@ class ShellcheckCheck(QualityCheck):
                     details={"sc_code": sc_code}
                 ))
         
-        return results
-    
-    def _find_shell_scripts(self) -> List[str]:
-        """Find all shell scripts in the project."""
-        shell_scripts = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".sh"):
-                    shell_scripts.append(os.path.join(root, file))
-        return shell_scripts
+        # Shards may report the same issue
+        return merge_results([results])
 
 
 class StaticAnalysisComponent(QualityComponent):
@@ -23,6 +23,7 @@ from core.quality.components.base import (
     QualityCheckSeverity,
     QualityComponent
 )
+from core.quality.components.inventory import get_inventory
 from core.quality.components.fixes.file_structure_validator import FileStructureValidator
 
 
@@ -136,7 +137,7 @@ class FileNamingCheck(QualityCheck):
         
         # If no file paths provided, find all files
         if not file_paths:
-            file_paths = self._find_all_files()
+            file_paths = get_inventory(kwargs).get_files()
         
         # Define naming conventions for different file types
         conventions = {
@@ -166,16 +167,6 @@ class FileNamingCheck(QualityCheck):
                     ))
         
         return results
-    
-    def _find_all_files(self) -> List[str]:
-        """Find all files in the project."""
-        all_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                all_files.append(os.path.join(root, file))
-        return all_files
 
 
 class ImportOrganizationCheck(QualityCheck):
@@ -193,6 +184,14 @@ class ImportOrganizationCheck(QualityCheck):
     def description(self) -> str:
         return "Checks for proper organization of imports in Python files."
     
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return ("python",)
+    
+    @property
+    def cache_scope(self) -> Optional[str]:
+        return "file"
+    
     def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Check for proper organization of imports in Python files.
@@ -209,7 +208,7 @@ class ImportOrganizationCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -335,17 +334,6 @@ class ImportOrganizationCheck(QualityCheck):
             "pathlib", "random", "re", "shutil", "subprocess", "sys", "tempfile", "time",
             "typing", "unittest", "uuid", "warnings", "xml", "zipfile"
         }
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 
 
 class CircularDependencyCheck(QualityCheck):
@@ -379,7 +367,7 @@ class CircularDependencyCheck(QualityCheck):
         
         # If no file paths provided, use all Python files
         if not file_paths:
-            file_paths = self._find_python_files()
+            file_paths = get_inventory(kwargs).get_files("python")
         else:
             # Filter for Python files
             file_paths = [f for f in file_paths if f.endswith('.py')]
@@ -501,17 +489,6 @@ class CircularDependencyCheck(QualityCheck):
             module_name = module_name[:-9]
         
         return module_name
-    
-    def _find_python_files(self) -> List[str]:
-        """Find all Python files in the project."""
-        python_files = []
-        for root, _, files in os.walk("."):
-            if any(excluded in root for excluded in ["/venv/", "/.git/", "/node_modules/"]):
-                continue
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
 class FileStructureCheck(QualityCheck):
     """Check for comprehensive file structure standardization."""
     
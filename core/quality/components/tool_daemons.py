@@ -0,0 +1,616 @@
+"""
+Persistent Daemons for External Quality Tools
+
+This module runs black, flake8, mypy and pylint in long-lived worker
+processes, so fix previews and pre-commit runs do not pay the interpreter
+and plugin startup of the tools on every invocation:
+- One worker per tool, listening on a Unix socket private to the user and project
+- Workers keep the imported tool (and, for mypy, a dmypy server) between runs
+- Workers are restarted when the tool version or its configuration changes
+- Idle workers shut themselves down
+
+Callers use run_tool, which has the same result as running the tool's command
+line and falls back to a subprocess whenever a worker cannot be used.
+Daemons are configured through the ``quality.daemons`` section: ``enabled``
+(default: False), ``idle_timeout`` (seconds, default: 1800) and
+``start_timeout`` (seconds, default: 20).
+
+A worker can also be started and stopped by hand:
+    python -m core.quality.components.tool_daemons stop
+"""
+
+import abc
+import argparse
+import contextlib
+import dataclasses
+import hashlib
+import importlib.metadata
+import io
+import logging
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.config.settings import get_config
+from core.quality.components.result_cache import TOOL_CONFIG_FILES
+
+logger = logging.getLogger(__name__)
+
+DAEMON_TOOLS = ("black", "flake8", "mypy", "pylint")
+
+# Root of the repository, so workers can import this module from any directory
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+class UnsupportedArguments(Exception):
+    """Raised by a worker for arguments it cannot handle; the caller falls back to the CLI."""
+
+
+def _check_private(path: str, st: os.stat_result, is_dir: bool) -> None:
+    """
+    Refuse a runtime directory or key file another user could have planted.
+
+    Raises:
+        PermissionError: If the path is a symbolic link, of the wrong type, not
+            owned by the current user or accessible by other users.
+    """
+    if not (stat.S_ISDIR(st.st_mode) if is_dir else stat.S_ISREG(st.st_mode)):
+        raise PermissionError(f"Refusing daemon runtime path {path}: not a {'directory' if is_dir else 'file'}")
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"Refusing daemon runtime path {path}: owned by uid {st.st_uid}")
+    if st.st_mode & 0o077:
+        raise PermissionError(f"Refusing daemon runtime path {path}: mode {stat.S_IMODE(st.st_mode):o}")
+
+
+def get_runtime_dir(project_dir: Optional[str] = None) -> str:
+    """
+    Get the directory holding the sockets and key of the daemons of a project.
+
+    The directory is created in ``$XDG_RUNTIME_DIR`` if it is set, and in the
+    temporary directory otherwise. As the name of the directory is
+    predictable, an existing directory is only used if it is private to the
+    current user.
+
+    Args:
+        project_dir: Directory the tools run in. Defaults to the working directory.
+
+    Returns:
+        Path of the directory, private to the current user.
+
+    Raises:
+        PermissionError: If the directory exists but is not private to the current user.
+    """
+    project_dir = os.path.abspath(project_dir or os.getcwd())
+    digest = hashlib.sha256(project_dir.encode("utf-8")).hexdigest()[:12]
+    xdg_runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime_dir and os.path.isdir(xdg_runtime_dir):
+        runtime_dir = os.path.join(xdg_runtime_dir, f"quality-daemons-{digest}")
+    else:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f"quality-daemons-{os.getuid()}-{digest}")
+    try:
+        os.mkdir(runtime_dir, 0o700)
+    except FileExistsError:
+        pass
+    _check_private(runtime_dir, os.lstat(runtime_dir), is_dir=True)
+    return runtime_dir
+
+
+def _get_authkey(runtime_dir: str) -> bytes:
+    """Read the key authenticating clients of the daemons, creating it on first use."""
+    path = os.path.join(runtime_dir, "authkey")
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+    except FileExistsError:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd, "rb") as f:
+            _check_private(path, os.fstat(f.fileno()), is_dir=False)
+            return f.read()
+    key = os.urandom(32)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def get_tool_signature(tool: str) -> Optional[str]:
+    """
+    Hash everything a worker's results depend on besides the checked files.
+
+    Args:
+        tool: Name of the tool.
+
+    Returns:
+        Hash of the tool version, its configuration files and this module,
+        or None if the tool is not installed for this interpreter.
+    """
+    try:
+        version = importlib.metadata.version(tool)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+    digest = hashlib.sha256(f"{tool}\0{version}\0{sys.version}".encode("utf-8"))
+    for path in TOOL_CONFIG_FILES.get(tool, []) + [__file__]:
+        digest.update(b"\0")
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+class ToolDaemonClient:
+    """Client of the worker of one tool, starting the worker when needed."""
+
+    def __init__(self, tool: str, idle_timeout: int = 1800, start_timeout: float = 20):
+        """
+        Initialize the client.
+
+        Args:
+            tool: Name of the tool, one of DAEMON_TOOLS.
+            idle_timeout: Seconds after which an unused worker exits.
+            start_timeout: Seconds to wait for a new worker to listen.
+        """
+        self.tool = tool
+        self.idle_timeout = idle_timeout
+        self.start_timeout = start_timeout
+        self.runtime_dir = get_runtime_dir()
+        self.address = os.path.join(self.runtime_dir, f"{tool}.sock")
+        self._authkey = _get_authkey(self.runtime_dir)
+        self._lock = threading.Lock()
+
+    def run(self, args: Sequence[str]) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run the tool in its worker.
+
+        Args:
+            args: Command line arguments of the tool.
+
+        Returns:
+            The result, or None if the worker cannot run these arguments.
+        """
+        signature = get_tool_signature(self.tool)
+        if signature is None:
+            return None
+
+        request = {"args": list(args), "cwd": os.getcwd(), "signature": signature}
+        for attempt in range(2):
+            try:
+                response = self._request(request)
+            except (OSError, EOFError, AuthenticationError):
+                # No worker (or a stale socket): start one and try again
+                if attempt or not self._start(signature):
+                    return None
+                continue
+
+            if response.get("restart"):
+                # The worker was started for another version or configuration and exited
+                logger.info(f"Restarting {self.tool} daemon after a configuration change")
+                if attempt or not self._start(signature):
+                    return None
+                continue
+            if "error" in response:
+                logger.debug(f"{self.tool} daemon cannot run {list(args)}: {response['error']}")
+                return None
+            return subprocess.CompletedProcess(
+                [self.tool, *args], response["returncode"], response["stdout"], response["stderr"]
+            )
+        return None
+
+    def stop(self) -> bool:
+        """
+        Stop the worker.
+
+        Returns:
+            True if a worker was running.
+        """
+        try:
+            self._request({"command": "stop"})
+        except (OSError, EOFError, AuthenticationError):
+            return False
+        return True
+
+    def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to the worker and wait for its response."""
+        with Client(self.address, family="AF_UNIX", authkey=self._authkey) as connection:
+            connection.send(request)
+            return connection.recv()
+
+    def _is_listening(self) -> bool:
+        """Whether a worker accepts connections."""
+        try:
+            with Client(self.address, family="AF_UNIX", authkey=self._authkey):
+                return True
+        except (OSError, EOFError, AuthenticationError):
+            return False
+
+    def _start(self, signature: str) -> bool:
+        """Start a worker and wait until it listens."""
+        with self._lock:
+            # Another thread may have started the worker meanwhile
+            if self._is_listening():
+                return True
+
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.address)
+
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PROJECT_ROOT), env.get("PYTHONPATH")]))
+            command = [
+                sys.executable, "-m", "core.quality.components.tool_daemons", "serve", self.tool,
+                "--signature", signature, "--idle-timeout", str(self.idle_timeout)
+            ]
+            try:
+                process = subprocess.Popen(
+                    command, cwd=os.getcwd(), env=env, start_new_session=True,
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                logger.warning(f"Could not start {self.tool} daemon: {e}")
+                return False
+
+            deadline = time.monotonic() + self.start_timeout
+            while time.monotonic() < deadline:
+                if self._is_listening():
+                    return True
+                if process.poll() is not None:
+                    break
+                time.sleep(0.05)
+            logger.warning(f"{self.tool} daemon did not start, running the tool directly")
+            return False
+
+
+_clients: Dict[str, ToolDaemonClient] = {}
+_clients_lock = threading.Lock()
+_enabled: Optional[bool] = None
+
+
+def enable_daemons(enabled: Optional[bool] = True) -> None:
+    """
+    Enable or disable the daemons for this process, overriding the configuration.
+
+    Args:
+        enabled: Whether run_tool uses the daemons; None restores the configured default.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def daemons_enabled() -> bool:
+    """Whether run_tool uses the daemons."""
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    if _enabled is not None:
+        return _enabled
+    config = get_config()
+    return bool(config.get("quality", {}).get("daemons", {}).get("enabled", False))
+
+
+def _get_client(tool: str) -> ToolDaemonClient:
+    """Get the client of a tool's worker."""
+    with _clients_lock:
+        if tool not in _clients:
+            config = get_config()
+            daemon_config = config.get("quality", {}).get("daemons", {})
+            _clients[tool] = ToolDaemonClient(
+                tool,
+                idle_timeout=daemon_config.get("idle_timeout", 1800),
+                start_timeout=daemon_config.get("start_timeout", 20)
+            )
+        return _clients[tool]
+
+
+def run_tool(tool: str, args: Sequence[str]) -> subprocess.CompletedProcess:
+    """
+    Run an external quality tool, in its daemon if daemons are enabled.
+
+    Args:
+        tool: Name of the tool's command.
+        args: Command line arguments of the tool.
+
+    Returns:
+        The result of the run, with text stdout and stderr.
+
+    Raises:
+        FileNotFoundError: If the tool has to run as a command and is not installed.
+    """
+    if tool in DAEMON_TOOLS and daemons_enabled():
+        try:
+            result = _get_client(tool).run(args)
+        except OSError as e:
+            logger.warning(f"{tool} daemon failed: {e}")
+            result = None
+        if result is not None:
+            return result
+    return subprocess.run([tool, *args], capture_output=True, text=True)
+
+
+def stop_daemons() -> List[str]:
+    """
+    Stop the daemons of the project in the working directory.
+
+    Returns:
+        Names of the tools whose daemon was running.
+    """
+    return [tool for tool in DAEMON_TOOLS if _get_client(tool).stop()]
+
+
+# Worker side
+
+
+class _ToolWorker(abc.ABC):
+    """A tool imported into the worker process."""
+
+    def __init__(self, runtime_dir: str):
+        self.runtime_dir = runtime_dir
+
+    @abc.abstractmethod
+    def run(self, args: List[str]) -> Tuple[int, str, str]:
+        """
+        Run the tool.
+
+        Args:
+            args: Command line arguments of the tool.
+
+        Returns:
+            (return code, stdout, stderr) as the command line would produce them.
+
+        Raises:
+            UnsupportedArguments: If the worker cannot handle the arguments.
+        """
+        pass
+
+    def close(self) -> None:
+        """Release the resources of the worker."""
+
+    @staticmethod
+    def _run_captured(function, *args, **kwargs) -> Tuple[Any, str, str]:
+        """Call a function with stdout and stderr captured."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                value = function(*args, **kwargs)
+            except SystemExit as e:
+                value = e
+        return value, stdout.getvalue(), stderr.getvalue()
+
+
+class _BlackWorker(_ToolWorker):
+    """Black, formatting in-process with the project's configured mode."""
+
+    def __init__(self, runtime_dir: str):
+        super().__init__(runtime_dir)
+        import black
+        self._black = black
+        self.mode = self._load_mode()
+
+    def _load_mode(self):
+        """Build the formatting mode from pyproject.toml."""
+        black = self._black
+        config = black.parse_pyproject_toml("pyproject.toml") if os.path.isfile("pyproject.toml") else {}
+        return black.Mode(
+            target_versions={black.TargetVersion[v.upper()] for v in config.get("target_version", [])},
+            line_length=config.get("line_length", black.DEFAULT_LINE_LENGTH),
+            string_normalization=not config.get("skip_string_normalization", False),
+            magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+            preview=config.get("preview", False)
+        )
+
+    def run(self, args: List[str]) -> Tuple[int, str, str]:
+        check = "--check" in args
+        file_paths = [arg for arg in args if arg != "--check"]
+        if not file_paths or any(arg.startswith("-") or not os.path.isfile(arg) for arg in file_paths):
+            raise UnsupportedArguments("only --check and file paths are supported")
+
+        # Black's own report writes the same messages and summary as the command line
+        report = self._black.Report(check=check)
+        _, stdout, stderr = self._run_captured(self._format_files, file_paths, report)
+        return report.return_code, stdout, stderr
+
+    def _format_files(self, file_paths: List[str], report) -> None:
+        """Format files, recording the outcome of each in the report."""
+        black = self._black
+        for file_path in file_paths:
+            try:
+                with open(file_path, "rb") as f:
+                    source, encoding, newline = black.decode_bytes(f.read(), self.mode)
+                mode = self.mode
+                if file_path.endswith(".pyi"):
+                    mode = dataclasses.replace(mode, is_pyi=True)
+                formatted = black.format_file_contents(source, fast=False, mode=mode)
+            except black.NothingChanged:
+                report.done(Path(file_path), black.Changed.NO)
+                continue
+            except Exception as e:
+                report.failed(Path(file_path), e)
+                continue
+
+            if not report.check:
+                with open(file_path, "w", encoding=encoding, newline=newline) as f:
+                    f.write(formatted)
+            report.done(Path(file_path), black.Changed.YES)
+
+        if report.change_count or report.failure_count:
+            black.out()
+        black.out("Oh no! 💥 💔 💥" if report.return_code else "All done! ✨ 🍰 ✨")
+        black.err(str(report))
+
+
+class _Flake8Worker(_ToolWorker):
+    """flake8, with plugins loaded once."""
+
+    def __init__(self, runtime_dir: str):
+        super().__init__(runtime_dir)
+        from flake8.main.application import Application
+        self._application = Application
+
+    def run(self, args: List[str]) -> Tuple[int, str, str]:
+        if any(arg.startswith("--output-file") for arg in args):
+            raise UnsupportedArguments("--output-file is used by the daemon")
+
+        fd, output_path = tempfile.mkstemp(suffix=".txt", dir=self.runtime_dir)
+        os.close(fd)
+        try:
+            app = self._application()
+            _, stdout, stderr = self._run_captured(app.run, [*args, f"--output-file={output_path}"])
+            with open(output_path, "r", encoding="utf-8") as f:
+                stdout += f.read()
+            return app.exit_code(), stdout, stderr
+        finally:
+            os.unlink(output_path)
+
+
+class _PylintWorker(_ToolWorker):
+    """pylint, reusing the parsed modules of installed packages between runs."""
+
+    def __init__(self, runtime_dir: str):
+        super().__init__(runtime_dir)
+        import astroid
+        from pylint.lint import Run
+        self._manager = astroid.MANAGER
+        self._run = Run
+
+    def run(self, args: List[str]) -> Tuple[int, str, str]:
+        if any(arg.startswith("--output=") or arg == "--output" for arg in args):
+            raise UnsupportedArguments("--output is used by the daemon")
+
+        # Project files may have changed since the last run; installed packages have not
+        project_dir = os.getcwd() + os.sep
+        cache = self._manager.astroid_cache
+        for name, module in list(cache.items()):
+            path = getattr(module, "file", None) or ""
+            if path.startswith(project_dir) and "site-packages" not in path:
+                del cache[name]
+
+        fd, output_path = tempfile.mkstemp(suffix=".txt", dir=self.runtime_dir)
+        os.close(fd)
+        try:
+            run, stdout, stderr = self._run_captured(self._run, [*args, f"--output={output_path}"], exit=False)
+            with open(output_path, "r", encoding="utf-8") as f:
+                stdout += f.read()
+            if isinstance(run, SystemExit):
+                return run.code if isinstance(run.code, int) else 32, stdout, stderr
+            return run.linter.msg_status, stdout, stderr
+        finally:
+            os.unlink(output_path)
+
+
+class _MypyWorker(_ToolWorker):
+    """mypy, delegating to a dmypy server that keeps the type information in memory."""
+
+    def __init__(self, runtime_dir: str):
+        super().__init__(runtime_dir)
+        from mypy import api
+        self._api = api
+        self.status_file = os.path.join(runtime_dir, "dmypy.json")
+
+    def run(self, args: List[str]) -> Tuple[int, str, str]:
+        stdout, stderr, returncode = self._api.run_dmypy(["--status-file", self.status_file, "run", "--", *args])
+        return returncode, stdout, stderr
+
+    def close(self) -> None:
+        self._api.run_dmypy(["--status-file", self.status_file, "stop"])
+
+
+_WORKERS = {
+    "black": _BlackWorker,
+    "flake8": _Flake8Worker,
+    "mypy": _MypyWorker,
+    "pylint": _PylintWorker
+}
+
+
+def serve(tool: str, signature: str, idle_timeout: int) -> None:
+    """
+    Run the worker of a tool until it is stopped, idle or outdated.
+
+    Args:
+        tool: Name of the tool, one of DAEMON_TOOLS.
+        signature: Signature the worker was started for (see get_tool_signature).
+        idle_timeout: Seconds after which the worker exits when unused.
+    """
+    runtime_dir = get_runtime_dir()
+    address = os.path.join(runtime_dir, f"{tool}.sock")
+    worker = _WORKERS[tool](runtime_dir)
+    listener = Listener(address, family="AF_UNIX", authkey=_get_authkey(runtime_dir))
+    state = {"last_used": time.monotonic(), "busy": False}
+
+    def shutdown_when_idle() -> None:
+        # accept() cannot be interrupted portably, so the watchdog ends the process
+        while True:
+            time.sleep(min(idle_timeout, 60))
+            if not state["busy"] and time.monotonic() - state["last_used"] > idle_timeout:
+                with contextlib.suppress(Exception):
+                    worker.close()
+                with contextlib.suppress(OSError):
+                    os.unlink(address)
+                os._exit(0)
+
+    threading.Thread(target=shutdown_when_idle, daemon=True).start()
+
+    try:
+        while True:
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+
+            with connection:
+                state["busy"] = True
+                try:
+                    request = connection.recv()
+                    if request.get("command") == "stop" or request.get("signature") != signature:
+                        # Shut down before replying, so clients do not reach the exiting worker
+                        listener.close()
+                        worker.close()
+                        connection.send({"stopped": True} if request.get("command") == "stop" else {"restart": True})
+                        return
+                    if request.get("cwd") != os.getcwd():
+                        connection.send({"error": "the daemon serves another directory"})
+                        continue
+                    try:
+                        returncode, stdout, stderr = worker.run(request["args"])
+                    except UnsupportedArguments as e:
+                        connection.send({"error": str(e)})
+                    except Exception as e:
+                        connection.send({"error": f"{type(e).__name__}: {e}"})
+                    else:
+                        connection.send({"returncode": returncode, "stdout": stdout, "stderr": stderr})
+                except (OSError, EOFError):
+                    pass
+                finally:
+                    state["busy"] = False
+                    state["last_used"] = time.monotonic()
+    except BaseException:
+        listener.close()
+        worker.close()
+        raise
+
+
+def main() -> None:
+    """Serve a worker, or stop the workers of the working directory."""
+    parser = argparse.ArgumentParser(description="Persistent daemons for external quality tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Run the worker of a tool")
+    serve_parser.add_argument("tool", choices=DAEMON_TOOLS)
+    serve_parser.add_argument("--signature", required=True)
+    serve_parser.add_argument("--idle-timeout", type=int, default=1800)
+    subparsers.add_parser("stop", help="Stop the workers of the working directory")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.tool, args.signature, args.idle_timeout)
+    else:
+        stopped = stop_daemons()
+        print(f"Stopped: {', '.join(stopped) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
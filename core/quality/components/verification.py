@@ -11,20 +11,38 @@ This ensures that fixes are safe and effective.
 """
 
 import os
-import shutil
-import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.snapshots import Snapshot, SnapshotStore
 
 
 class FixVerification:
     """Provides functionality for verifying fixes."""
 
-    def __init__(self):
-        """Initialize the fix verification."""
-        self.backup_files: Dict[str, str] = {}
+    def __init__(self, store: Optional[SnapshotStore] = None):
+        """
+        Initialize the fix verification.
+
+        Args:
+            store: Store keeping the backups. Defaults to a store configured by
+                the ``quality.snapshots`` section, created on the first backup.
+        """
+        self.backup_files: Dict[str, Snapshot] = {}
+        self._store = store
+        self._owns_store = store is None
+        self._store_lock = threading.Lock()
+
+    @property
+    def store(self) -> SnapshotStore:
+        """Store keeping the backups."""
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = SnapshotStore.from_config()
+        return self._store
 
     def backup_file(self, file_path: str) -> bool:
         """
@@ -40,11 +58,7 @@ class FixVerification:
             return False
 
         try:
-            # Create a temporary file for the backup
-            with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-                with open(file_path, "r", encoding="utf-8", errors="replace") as original_file:
-                    temp_file.write(original_file.read())
-                self.backup_files[file_path] = temp_file.name
+            self.backup_files[file_path] = self.store.snapshot(file_path)
             return True
         except Exception:
             return False
@@ -63,22 +77,19 @@ class FixVerification:
             return False
 
         try:
-            backup_path = self.backup_files[file_path]
-            shutil.copy2(backup_path, file_path)
-            os.unlink(backup_path)
-            del self.backup_files[file_path]
+            self.store.restore(self.backup_files.pop(file_path))
             return True
         except Exception:
             return False
 
     def cleanup_backups(self) -> None:
         """Clean up all backup files."""
-        for file_path, backup_path in self.backup_files.items():
-            try:
-                os.unlink(backup_path)
-            except Exception:
-                pass
+        for snapshot in self.backup_files.values():
+            self.store.discard(snapshot)
         self.backup_files.clear()
+        if self._owns_store and self._store is not None:
+            self._store.close()
+            self._store = None
 
     def verify_fixes(self, file_path: str, original_results: List[QualityCheckResult], 
                     run_checks_func: callable) -> Tuple[bool, List[QualityCheckResult]]:
@@ -182,22 +193,12 @@ class FixVerification:
             # Apply fixes
             fixed_results, unfixed_results = apply_fixes_func(results)
 
-            # Verify fixes
-            verification_success, new_issues = self.verify_fixes(file_path, results, run_checks_func)
-            if not verification_success:
-                # Rollback if verification fails
-                self.restore_file(file_path)
-                return False, [], results
-
-            # Validate fix results
-            validation_success, remaining_issues = self.validate_fix_results(file_path, fixed_results, run_checks_func)
-            if not validation_success:
-                # Some issues weren't fixed properly
-                # We'll keep the changes but report the issues that weren't fixed
-                unfixed_results.extend(remaining_issues)
-                return True, [r for r in fixed_results if r not in remaining_issues], unfixed_results
-
-            return True, fixed_results, unfixed_results
+            # Verify and validate the fixes against a single re-check of the file
+            new_results = run_checks_func([file_path])
+            success, fixed_results, unfixed_results = self.evaluate_fixes(
+                file_path, results, fixed_results, unfixed_results, new_results
+            )
+            return success, fixed_results, unfixed_results
         except Exception as e:
             # Rollback if an exception occurs
             self.restore_file(file_path)
@@ -206,6 +207,44 @@ class FixVerification:
             # Clean up the backup
             self.cleanup_backups()
 
+    def evaluate_fixes(self, file_path: str, results: List[QualityCheckResult],
+                       fixed_results: List[QualityCheckResult], unfixed_results: List[QualityCheckResult],
+                       new_results: List[QualityCheckResult]) -> Tuple[bool, List[QualityCheckResult], List[QualityCheckResult]]:
+        """
+        Evaluate applied fixes against the results of re-checking the file.
+
+        The file is restored from its backup if the fixes introduced new issues.
+
+        Args:
+            file_path: Path to the file.
+            results: QualityCheckResult objects before the fixes.
+            fixed_results: QualityCheckResult objects reported as fixed.
+            unfixed_results: QualityCheckResult objects reported as not fixed.
+            new_results: QualityCheckResult objects of the re-check.
+
+        Returns:
+            Tuple of (success, fixed_results, unfixed_results)
+        """
+        def recheck(file_paths: List[str]) -> List[QualityCheckResult]:
+            return new_results
+
+        # Verify fixes
+        verification_success, new_issues = self.verify_fixes(file_path, results, recheck)
+        if not verification_success:
+            # Rollback if verification fails
+            self.restore_file(file_path)
+            return False, [], list(results)
+
+        # Validate fix results
+        validation_success, remaining_issues = self.validate_fix_results(file_path, fixed_results, recheck)
+        if not validation_success:
+            # Some issues weren't fixed properly
+            # We'll keep the changes but report the issues that weren't fixed
+            unfixed_results = unfixed_results + remaining_issues
+            return True, [r for r in fixed_results if r not in remaining_issues], unfixed_results
+
+        return True, fixed_results, unfixed_results
+
 
 def verify_and_apply_fixes(file_path: str, results: List[QualityCheckResult], 
                          apply_fixes_func: callable, run_checks_func: callable) -> Tuple[bool, List[QualityCheckResult], List[QualityCheckResult]]:
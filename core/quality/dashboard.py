@@ -19,6 +19,7 @@ import numpy as np
 from flask import Flask, render_template, jsonify, request, send_from_directory
 
 from core.config.settings import get_config
+from core.quality.components.result_sink import read_results
 from core.quality.enforcer import QualityEnforcer
 
 logger = logging.getLogger(__name__)
@@ -90,8 +91,9 @@ class QualityMetricsDashboard:
         def run_checks():
             """Run quality checks and update metrics."""
             try:
-                results = self.enforcer.run_all_checks()
-                self.enforcer.update_knowledge_graph(results)
+                # Stream the results through a JSON Lines file instead of holding them in memory
+                sink = self.enforcer.stream_all_checks(incremental=True)
+                self.enforcer.update_knowledge_graph(read_results(sink.path))
                 return jsonify({"status": "success", "message": "Quality checks completed successfully"})
             except Exception as e:
                 logger.error(f"Error running quality checks: {e}")
@@ -8,20 +8,24 @@ the existing hooks while leveraging the new component-based architecture.
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, Callable
 
 from core.config.settings import get_config
 from core.quality.components.fixes.code_style import CodeStyleFixes
 from core.quality.components.fixes.documentation import DocumentationFixes
 from core.quality.components.fixes.static_analysis import StaticAnalysisFixes
 from core.quality.components.fixes.structure import StructureFixes
+from core.quality.components.fix_pipeline import FixPipeline
 from core.quality.components.interactive import run_interactive_fix
 from core.quality.components.preview import generate_fix_preview, compare_fix_options
-from core.quality.components.verification import verify_and_apply_fixes
+from core.quality.components.inventory import get_changed_files
+from core.quality.components.result_cache import ResultCache
+from core.quality.components.result_sink import ResultSink, write_report
+from core.quality.components.scheduler import CheckScheduler, process_slot
 
 from core.config.settings import get_config
 from core.quality.components.base import (
+    QualityCheck,
     QualityCheckRegistry,
     QualityCheckResult,
     QualityCheckSeverity,
@@ -35,6 +39,41 @@ from core.quality.components.structure import StructureComponent
 logger = logging.getLogger(__name__)
 
 
+class _ComponentChecks(QualityCheck):
+    """
+    Adapter scheduling a component with its own run_checks as a single check.
+    
+    Components that override QualityComponent.run_checks decide themselves how
+    their checks run, so the scheduler runs them as one unit.
+    """
+    
+    def __init__(self, component: QualityComponent):
+        self._component = component
+    
+    @property
+    def id(self) -> str:
+        return f"component:{self._component.name}"
+    
+    @property
+    def name(self) -> str:
+        return self._component.name
+    
+    @property
+    def description(self) -> str:
+        return self._component.description
+    
+    @property
+    def depends_on(self) -> List[str]:
+        return []
+    
+    @property
+    def uses_subprocess(self) -> bool:
+        return True
+    
+    def run(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
+        return self._component.run_checks(file_paths, **kwargs)
+
+
 class QualityEnforcer:
     """
     Facade for the quality enforcement system.
@@ -88,26 +127,125 @@ class QualityEnforcer:
         """
         return self._components.copy()
     
-    def run_all_checks(self, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
+    def run_all_checks(self, file_paths: Optional[List[str]] = None, incremental: bool = False,
+                       **kwargs) -> List[QualityCheckResult]:
         """
         Run all quality checks.
         
+        The checks of all components run concurrently; results are returned
+        in the order of the components and their checks.
+        
         Args:
             file_paths: Optional list of file paths to check.
                 If None, check all relevant files.
+            incremental: Whether to reuse cached results for unchanged files
+                (see ResultCache).
             **kwargs: Additional arguments for the checks.
             
         Returns:
             List of QualityCheckResult objects.
         """
-        results = []
+        checks = self._get_scheduled_checks()
+        results_by_check: Dict[int, List[QualityCheckResult]] = {}
+        cache = ResultCache.from_config() if incremental else None
+        try:
+            for check, check_results in CheckScheduler(cache=cache).run(checks, file_paths, **kwargs):
+                results_by_check[id(check)] = check_results
+        finally:
+            if cache is not None:
+                cache.close()
         
-        for component in self._components.values():
-            component_results = component.run_checks(file_paths, **kwargs)
-            results.extend(component_results)
+        results = []
+        for _, check in checks:
+            results.extend(results_by_check[id(check)])
         
         return results
     
+    def iter_all_checks(self, file_paths: Optional[List[str]] = None, incremental: bool = False,
+                        **kwargs) -> Iterator[Tuple[str, List[QualityCheckResult]]]:
+        """
+        Run all quality checks, yielding results as each check finishes.
+        
+        Args:
+            file_paths: Optional list of file paths to check.
+                If None, check all relevant files.
+            incremental: Whether to reuse cached results for unchanged files.
+            **kwargs: Additional arguments for the checks.
+            
+        Yields:
+            (check_id, results) tuples in completion order.
+        """
+        cache = ResultCache.from_config() if incremental else None
+        try:
+            for check, check_results in CheckScheduler(cache=cache).run(self._get_scheduled_checks(), file_paths, **kwargs):
+                yield check.id, check_results
+        finally:
+            if cache is not None:
+                cache.close()
+    
+    def stream_all_checks(self, file_paths: Optional[List[str]] = None, incremental: bool = False,
+                          sink: Optional[ResultSink] = None, **kwargs) -> ResultSink:
+        """
+        Run all quality checks, writing results to a sink as each check finishes.
+        
+        Unlike run_all_checks, the results of finished checks are not kept in
+        memory; read them back with read_results(sink.path).
+        
+        Args:
+            file_paths: Optional list of file paths to check.
+                If None, check all relevant files.
+            incremental: Whether to reuse cached results for unchanged files.
+            sink: Sink receiving the results. If None, use the configured sink.
+            **kwargs: Additional arguments for the checks.
+            
+        Returns:
+            The closed sink, with the number of results per severity and check.
+        """
+        sink = sink or ResultSink.from_config()
+        with sink:
+            for _, check_results in self.iter_all_checks(file_paths, incremental, **kwargs):
+                sink.write_all(check_results)
+        logger.info(f"Wrote {sink.total} results to {sink.path}")
+        return sink
+    
+    def run_changed_checks(self, revision: str, **kwargs) -> List[QualityCheckResult]:
+        """
+        Run all quality checks incrementally on the files changed since a git revision.
+        
+        Args:
+            revision: Git revision to compare against, e.g. "HEAD" or "origin/main".
+            **kwargs: Additional arguments for the checks.
+            
+        Returns:
+            List of QualityCheckResult objects.
+            
+        Raises:
+            ValueError: If the changed files cannot be determined.
+        """
+        file_paths = get_changed_files(revision)
+        if not file_paths:
+            logger.info(f"No files changed since {revision}")
+            return []
+        
+        logger.info(f"Checking {len(file_paths)} files changed since {revision}")
+        return self.run_all_checks(file_paths, incremental=True, **kwargs)
+    
+    def _get_scheduled_checks(self) -> List[Tuple[str, QualityCheck]]:
+        """
+        Get the (source, check) pairs to schedule for all components.
+        
+        Returns:
+            The enabled checks of every component, or a single unit for
+            components with their own run_checks.
+        """
+        checks = []
+        for component in self._components.values():
+            if type(component).run_checks is not QualityComponent.run_checks:
+                checks.append((component.name, _ComponentChecks(component)))
+            else:
+                checks.extend((component.name, check) for check in component.get_enabled_checks())
+        return checks
+    
     def run_component_checks(self, component_name: str, file_paths: Optional[List[str]] = None, **kwargs) -> List[QualityCheckResult]:
         """
         Run checks for a specific component.
@@ -167,6 +305,14 @@ class QualityEnforcer:
             fixed_results, unfixed_results = run_interactive_fix(results)
             return unfixed_results
         
+        if verify:
+            # Apply the fixes of all files at once, re-checking each changed file once
+            pipeline = FixPipeline.from_config(
+                self._apply_component_fixes, self.run_component_checks, self._get_component_for_check
+            )
+            fixed_results, unfixed_results = pipeline.run(results)
+            return unfixed_results
+        
         # Group results by component
         results_by_component: Dict[str, List[QualityCheckResult]] = {}
         for result in results:
@@ -176,40 +322,13 @@ class QualityEnforcer:
                     results_by_component[component_name] = []
                 results_by_component[component_name].append(result)
         
-        # Fix issues for each component
+        # Apply fixes without verification for each component
         remaining_results = []
         for component_name, component_results in results_by_component.items():
             component = self._components.get(component_name)
             if component:
-                if verify:
-                    # Group results by file
-                    results_by_file: Dict[str, List[QualityCheckResult]] = {}
-                    for result in component_results:
-                        if result.file_path:
-                            if result.file_path not in results_by_file:
-                                results_by_file[result.file_path] = []
-                            results_by_file[result.file_path].append(result)
-                    
-                    # Apply fixes with verification for each file
-                    for file_path, file_results in results_by_file.items():
-                        # Create a function to apply fixes
-                        def apply_fixes_func(results: List[QualityCheckResult]) -> Tuple[List[QualityCheckResult], List[QualityCheckResult]]:
-                            return self._apply_component_fixes(component_name, results)
-                        
-                        # Create a function to run checks
-                        def run_checks_func(file_paths: List[str]) -> List[QualityCheckResult]:
-                            return self.run_component_checks(component_name, file_paths)
-                        
-                        # Apply fixes with verification
-                        success, fixed, unfixed = verify_and_apply_fixes(
-                            file_path, file_results, apply_fixes_func, run_checks_func
-                        )
-                        
-                        remaining_results.extend(unfixed)
-                else:
-                    # Apply fixes without verification
-                    unfixed = component.fix_issues(component_results)
-                    remaining_results.extend(unfixed)
+                unfixed = component.fix_issues(component_results)
+                remaining_results.extend(unfixed)
             else:
                 remaining_results.extend(component_results)
         
@@ -559,45 +678,42 @@ class QualityEnforcer:
         Returns:
             List of QualityCheckResult objects.
         """
-        import subprocess
-        import shlex
+        from core.quality.components.sharding import merge_results, run_sharded
+        from core.quality.components.tool_daemons import run_tool
         
         logger.info(f"Running external tool: {tool_name}")
         
-        # Prepare file paths argument
-        files_arg = " ".join(file_paths) if file_paths else "."
-        
-        # Map tool names to commands
-        tool_commands = {
-            "black": f"black --check {files_arg}",
-            "mypy": f"mypy {files_arg}",
-            "pylint": f"pylint {files_arg}",
-            "flake8": f"flake8 {files_arg}",
-            "shellcheck": f"shellcheck --format=gcc {files_arg}"
+        # Map tool names to the arguments preceding the file paths
+        tool_arguments = {
+            "black": ["--check"],
+            "mypy": [],
+            "pylint": [],
+            "flake8": [],
+            "shellcheck": ["--format=gcc"]
         }
         
-        if tool_name not in tool_commands:
+        if tool_name not in tool_arguments:
             logger.warning(f"Unknown external tool: {tool_name}")
             return []
         
-        command = tool_commands[tool_name]
-        logger.info(f"Running command: {command}")
+        arguments = tool_arguments[tool_name]
+        logger.info(f"Running command: {' '.join([tool_name] + arguments)} ({len(file_paths or [])} files)")
         
         try:
-            # Run the command
-            process = subprocess.run(
-                shlex.split(command),
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            # Run the tool on shards of the files in parallel. mypy checks the
+            # files together, since its results depend on the modules they import.
+            if file_paths and tool_name != "mypy":
+                processes = run_sharded(tool_name, arguments, file_paths)
+            else:
+                with process_slot():
+                    processes = [run_tool(tool_name, arguments + (file_paths or ["."]))]
             
             # Parse the output
             results = []
-            if process.returncode != 0:
+            output_lines = [line for process in processes if process.returncode != 0
+                            for line in process.stdout.splitlines() + process.stderr.splitlines()]
+            if output_lines:
                 # Tool found issues
-                output_lines = process.stdout.splitlines() + process.stderr.splitlines()
-                
                 for line in output_lines:
                     # Parse the line based on the tool
                     if tool_name == "black":
@@ -699,6 +815,7 @@ class QualityEnforcer:
                                 details={"sc_code": sc_code}
                             ))
             
+            results = merge_results([results])
             logger.info(f"External tool {tool_name} found {len(results)} issues")
             return results
         
@@ -710,68 +827,22 @@ class QualityEnforcer:
                 message=f"Error running tool: {str(e)}"
             )]
     
-    def update_knowledge_graph(self, results: List[QualityCheckResult]) -> None:
+    def update_knowledge_graph(self, results: Iterable[QualityCheckResult]) -> None:
         """
         Update the knowledge graph with quality check results.
         
         This method exports quality check results to a JSON file that can be
-        processed by the knowledge graph update script.
+        processed by the knowledge graph update script. The results are
+        streamed into the file, so they can come from a generator such as
+        read_results.
         
         Args:
-            results: List of QualityCheckResult objects.
+            results: Iterable of QualityCheckResult objects.
         """
-        import json
-        import os
         import datetime
         from pathlib import Path
         
-        logger.info(f"Updating knowledge graph with {len(results)} quality check results")
-        
-        # Group results by severity
-        results_by_severity = {
-            QualityCheckSeverity.INFO: [],
-            QualityCheckSeverity.WARNING: [],
-            QualityCheckSeverity.ERROR: [],
-            QualityCheckSeverity.CRITICAL: []
-        }
-        
-        for result in results:
-            results_by_severity[result.severity].append(result)
-        
-        # Log summary
-        logger.info(f"Quality check summary:")
-        logger.info(f"  INFO: {len(results_by_severity[QualityCheckSeverity.INFO])}")
-        logger.info(f"  WARNING: {len(results_by_severity[QualityCheckSeverity.WARNING])}")
-        logger.info(f"  ERROR: {len(results_by_severity[QualityCheckSeverity.ERROR])}")
-        logger.info(f"  CRITICAL: {len(results_by_severity[QualityCheckSeverity.CRITICAL])}")
-        
-        # Prepare data for export
-        serializable_results = []
-        for result in results:
-            serializable_result = {
-                "check_id": result.check_id,
-                "severity": result.severity.value,
-                "message": result.message,
-                "file_path": result.file_path,
-                "line_number": result.line_number,
-                "column": result.column,
-                "source": result.source,
-                "details": result.details,
-                "fix_available": result.fix_available,
-                "fix_command": result.fix_command
-            }
-            serializable_results.append(serializable_result)
-        
-        # Create report data
-        report_data = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "results": serializable_results,
-            "summary": {
-                "total_checks": len(results),
-                "passed": len([r for r in results if r.severity in [QualityCheckSeverity.INFO]]),
-                "failed": len([r for r in results if r.severity in [QualityCheckSeverity.WARNING, QualityCheckSeverity.ERROR, QualityCheckSeverity.CRITICAL]])
-            }
-        }
+        logger.info("Updating knowledge graph with quality check results")
         
         # Ensure reports directory exists
         reports_dir = Path("data/reports")
@@ -782,8 +853,12 @@ class QualityEnforcer:
         report_path = reports_dir / f"code_quality_report_{timestamp}.json"
         
         # Write report to file
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        summary = write_report(str(report_path), results)
+        
+        # Log summary
+        logger.info(f"Quality check summary:")
+        for severity, count in summary["by_severity"].items():
+            logger.info(f"  {severity.upper()}: {count}")
         
         logger.info(f"Quality report written to {report_path}")
         
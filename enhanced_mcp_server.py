@@ -11,13 +11,13 @@ This version includes:
 
 import logging
 import time
-import json
 import os
 import subprocess
-from typing import Dict, Any, Optional, List, Union
-from fastapi import FastAPI, HTTPException, Request, Response
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, List, Union
+from fastapi import FastAPI, HTTPException, Request
+from pydantic import BaseModel
 import uuid
+from jsonrpc_transport import JsonRpcEndpoint
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,30 +26,6 @@ logger = logging.getLogger("enhanced_mcp_server")
 # Create FastAPI app
 app = FastAPI(title="Enhanced MCP Server")
 
-# Define JSON-RPC models
-class JsonRpcRequest(BaseModel):
-    jsonrpc: str = Field("2.0", description="JSON-RPC version")
-    id: Optional[str] = Field(None, description="Request ID")
-    method: str = Field(..., description="Method to call")
-    params: Dict[str, Any] = Field({}, description="Method parameters")
-
-    @validator('jsonrpc')
-    def validate_jsonrpc_version(cls, v):
-        if v != "2.0":
-            raise ValueError("Only JSON-RPC 2.0 is supported")
-        return v
-
-class JsonRpcResponse(BaseModel):
-    jsonrpc: str = "2.0"
-    id: Optional[str] = None
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
-
-class JsonRpcError(BaseModel):
-    code: int
-    message: str
-    data: Optional[Any] = None
-
 # Define tool models
 class ToolRequest(BaseModel):
     tool_name: str
@@ -132,159 +108,6 @@ resources = {
     "file://code_templates/java.java": "public class Main {\n    public static void main(String[] args) {\n        System.out.println(\"Hello, World!\");\n    }\n}"
 }
 
-# Helper functions for JSON-RPC
-def create_jsonrpc_response(request_id: Optional[str], result: Any) -> Dict[str, Any]:
-    """Create a JSON-RPC response."""
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "result": result
-    }
-
-def create_jsonrpc_error(request_id: Optional[str], code: int, message: str, data: Any = None) -> Dict[str, Any]:
-    """Create a JSON-RPC error response."""
-    error = {
-        "code": code,
-        "message": message
-    }
-    if data is not None:
-        error["data"] = data
-    
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "error": error
-    }
-
-# Middleware to handle JSON-RPC requests
-@app.middleware("http")
-async def jsonrpc_middleware(request: Request, call_next):
-    """Middleware to handle JSON-RPC requests."""
-    # Only process POST requests to /jsonrpc endpoint
-    if request.method == "POST" and request.url.path == "/jsonrpc":
-        try:
-            # Parse request body
-            body = await request.json()
-            
-            # Validate JSON-RPC request
-            try:
-                jsonrpc_request = JsonRpcRequest(**body)
-            except Exception as e:
-                error_response = create_jsonrpc_error(
-                    body.get("id"), 
-                    -32600, 
-                    "Invalid Request",
-                    str(e)
-                )
-                return Response(
-                    content=json.dumps(error_response),
-                    media_type="application/json"
-                )
-            
-            # Extract request details
-            request_id = jsonrpc_request.id
-            method = jsonrpc_request.method
-            params = jsonrpc_request.params
-            
-            # Process the request based on method
-            if method == "tools/list":
-                result = {"tools": list(tools.keys())}
-                response_body = create_jsonrpc_response(request_id, result)
-            elif method == "tools/get":
-                tool_name = params.get("name")
-                if tool_name not in tools:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Tool '{tool_name}' not found"
-                    )
-                else:
-                    result = tools[tool_name]
-                    response_body = create_jsonrpc_response(request_id, result)
-            elif method == "tools/execute":
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                if tool_name not in tools:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Tool '{tool_name}' not found"
-                    )
-                else:
-                    # Execute the tool
-                    if tool_name == "shell_command":
-                        command = arguments.get("command", "")
-                        result = {
-                            "output": f"Simulated output for command: {command}",
-                            "exit_code": 0
-                        }
-                    elif tool_name == "mintycoder":
-                        prompt = arguments.get("prompt", "")
-                        language = arguments.get("language", "python")
-                        result = {
-                            "code": f"# Generated {language} code based on: {prompt}\ndef solution():\n    # Implementation based on the prompt\n    return 'Solution'\n",
-                            "explanation": f"This code implements a solution for: {prompt}"
-                        }
-                    elif tool_name == "code_analyzer":
-                        code = arguments.get("code", "")
-                        language = arguments.get("language", "python")
-                        result = {
-                            "issues": [
-                                {"line": 1, "message": "Missing docstring"},
-                                {"line": 3, "message": "Unused variable"}
-                            ],
-                            "quality_score": 75,
-                            "suggestions": [
-                                "Add proper docstrings",
-                                "Remove unused variables",
-                                "Add type hints"
-                            ]
-                        }
-                    else:
-                        result = {"error": "Tool execution not implemented"}
-                    
-                    response_body = create_jsonrpc_response(request_id, result)
-            elif method == "resources/list":
-                result = {"resources": list(resources.keys())}
-                response_body = create_jsonrpc_response(request_id, result)
-            elif method == "resources/get":
-                uri = params.get("uri")
-                if uri not in resources:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Resource '{uri}' not found"
-                    )
-                else:
-                    result = {"content": resources[uri]}
-                    response_body = create_jsonrpc_response(request_id, result)
-            else:
-                response_body = create_jsonrpc_error(
-                    request_id, 
-                    -32601, 
-                    f"Method '{method}' not found"
-                )
-            
-            return Response(
-                content=json.dumps(response_body),
-                media_type="application/json"
-            )
-        except Exception as e:
-            error_response = create_jsonrpc_error(
-                None, 
-                -32603, 
-                "Internal error",
-                str(e)
-            )
-            return Response(
-                content=json.dumps(error_response),
-                media_type="application/json"
-            )
-    
-    # For non-JSON-RPC requests, proceed with normal processing
-    return await call_next(request)
-
 # MCP endpoints (RESTful API for backward compatibility)
 @app.get("/mcp/capabilities")
 async def get_capabilities():
@@ -294,7 +117,7 @@ async def get_capabilities():
         "resources": True,
         "subscriptions": False,
         "prompts": False,
-        "batch": False,
+        "batch": True,
         "progress": False
     }
 
@@ -363,11 +186,12 @@ async def get_resource(resource_uri: str):
     return {"content": resources[uri]}
 
 # JSON-RPC endpoint
+jsonrpc = JsonRpcEndpoint(tools, resources, execute_tool)
+
 @app.post("/jsonrpc")
 async def jsonrpc_endpoint(request: Request):
-    """JSON-RPC endpoint."""
-    # This endpoint is handled by the middleware
-    pass
+    """JSON-RPC endpoint, accepting single requests and batches."""
+    return await jsonrpc.handle_request(request)
 
 # Debug endpoints
 @app.get("/debug/health")
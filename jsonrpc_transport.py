@@ -0,0 +1,219 @@
+"""
+JSON-RPC transport shared by the standalone MCP servers.
+
+This module includes:
+1. The JSON-RPC envelope models and response helpers
+2. Dispatch of the tools/* and resources/* methods
+3. Batch arrays, dispatched concurrently and optionally streamed as NDJSON
+4. gzip-encoded requests (with a decompressed size limit) and responses
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, validator
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC transport limits
+JSONRPC_MAX_BATCH_SIZE = int(os.environ.get("JSONRPC_MAX_BATCH_SIZE", "50"))
+JSONRPC_GZIP_MIN_BYTES = int(os.environ.get("JSONRPC_GZIP_MIN_BYTES", "1024"))
+JSONRPC_MAX_BODY_BYTES = int(os.environ.get("JSONRPC_MAX_BODY_BYTES", str(10 * 1024 * 1024)))
+
+# Define JSON-RPC models
+class JsonRpcRequest(BaseModel):
+    jsonrpc: str = Field("2.0", description="JSON-RPC version")
+    id: Optional[str] = Field(None, description="Request ID")
+    method: str = Field(..., description="Method to call")
+    params: Dict[str, Any] = Field({}, description="Method parameters")
+
+    @validator('jsonrpc')
+    def validate_jsonrpc_version(cls, v):
+        if v != "2.0":
+            raise ValueError("Only JSON-RPC 2.0 is supported")
+        return v
+
+class JsonRpcResponse(BaseModel):
+    jsonrpc: str = "2.0"
+    id: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[Dict[str, Any]] = None
+
+class JsonRpcError(BaseModel):
+    code: int
+    message: str
+    data: Optional[Any] = None
+
+# Helper functions for JSON-RPC
+def create_jsonrpc_response(request_id: Optional[str], result: Any) -> Dict[str, Any]:
+    """Create a JSON-RPC response."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": result
+    }
+
+def create_jsonrpc_error(request_id: Optional[str], code: int, message: str, data: Any = None) -> Dict[str, Any]:
+    """Create a JSON-RPC error response."""
+    error = {
+        "code": code,
+        "message": message
+    }
+    if data is not None:
+        error["data"] = data
+
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": error
+    }
+
+def _is_notification(message: Any) -> bool:
+    """JSON-RPC notifications carry no id and get no response."""
+    return isinstance(message, dict) and "id" not in message
+
+def decompress_body(body: bytes, max_size: int) -> bytes:
+    """Decompress a gzip-encoded request body, refusing to inflate it beyond max_size bytes."""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    content = decompressor.decompress(body, max_size)
+    if decompressor.unconsumed_tail or (not decompressor.eof and decompressor.decompress(b"", 1)):
+        raise ValueError(f"Decompressed body exceeds the limit of {max_size} bytes")
+    if not decompressor.eof:
+        raise ValueError("Truncated gzip body")
+    return content
+
+def jsonrpc_reply(payload: Any, request: Request) -> Response:
+    """Serialize a JSON-RPC reply compactly, gzip-compressed if the client accepts it."""
+    content = json.dumps(payload, separators=(",", ":")).encode()
+    headers = {}
+    if len(content) >= JSONRPC_GZIP_MIN_BYTES and "gzip" in request.headers.get("accept-encoding", ""):
+        content = gzip.compress(content, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+class JsonRpcEndpoint:
+    """Serves the JSON-RPC methods of an MCP server over HTTP."""
+
+    def __init__(self, tools: Dict[str, Any], resources: Dict[str, Any],
+                 execute_tool: Callable[[str, Dict[str, Any]], Awaitable[Any]]):
+        """
+        Initialize the endpoint.
+
+        Args:
+            tools: Tool descriptions by name, looked up on every request.
+            resources: Resource contents by URI, looked up on every request.
+            execute_tool: Coroutine function running a known tool, given its
+                name and arguments.
+        """
+        self.tools = tools
+        self.resources = resources
+        self.execute_tool = execute_tool
+
+    async def dispatch(self, request_id: Optional[str], method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one JSON-RPC method and build its response."""
+        if method == "tools/list":
+            return create_jsonrpc_response(request_id, {"tools": list(self.tools.keys())})
+        if method in ("tools/get", "tools/execute"):
+            tool_name = params.get("name")
+            if tool_name not in self.tools:
+                return create_jsonrpc_error(request_id, -32602, f"Tool '{tool_name}' not found")
+            if method == "tools/get":
+                return create_jsonrpc_response(request_id, self.tools[tool_name])
+            result = await self.execute_tool(tool_name, params.get("arguments", {}))
+            return create_jsonrpc_response(request_id, result)
+        if method == "resources/list":
+            return create_jsonrpc_response(request_id, {"resources": list(self.resources.keys())})
+        if method == "resources/get":
+            uri = params.get("uri")
+            if uri not in self.resources:
+                return create_jsonrpc_error(request_id, -32602, f"Resource '{uri}' not found")
+            return create_jsonrpc_response(request_id, {"content": self.resources[uri]})
+        return create_jsonrpc_error(request_id, -32601, f"Method '{method}' not found")
+
+    async def handle_message(self, message: Any) -> Dict[str, Any]:
+        """Validate and dispatch one JSON-RPC request object."""
+        if not isinstance(message, dict):
+            return create_jsonrpc_error(None, -32600, "Invalid Request", "Request must be a JSON object")
+
+        # Validate JSON-RPC request
+        try:
+            jsonrpc_request = JsonRpcRequest(**message)
+        except Exception as e:
+            return create_jsonrpc_error(message.get("id"), -32600, "Invalid Request", str(e))
+
+        try:
+            return await self.dispatch(jsonrpc_request.id, jsonrpc_request.method, jsonrpc_request.params)
+        except Exception as e:
+            logger.error(f"Error handling JSON-RPC method {jsonrpc_request.method}: {e}")
+            return create_jsonrpc_error(jsonrpc_request.id, -32603, "Internal error", str(e))
+
+    async def stream_batch(self, batch: List[Any]):
+        """Yield batch responses as NDJSON lines in completion order."""
+        tasks = [
+            asyncio.ensure_future(self.handle_message(message))
+            for message in batch
+            if not _is_notification(message)
+        ]
+        # Notifications run too, but produce no output
+        notifications = [asyncio.ensure_future(self.handle_message(message)) for message in batch if _is_notification(message)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                response = await next_done
+                yield json.dumps(response, separators=(",", ":")) + "\n"
+            await asyncio.gather(*notifications)
+        finally:
+            # The client may disconnect before the batch is complete
+            for task in tasks + notifications:
+                task.cancel()
+
+    async def handle_request(self, request: Request) -> Response:
+        """
+        Answer an HTTP request to the JSON-RPC endpoint.
+
+        Accepts a single request object or a batch array (optionally gzip-encoded).
+        The body is decoded once and the requests of a batch are dispatched
+        concurrently. Batch results are returned as one JSON array, or streamed as
+        NDJSON in completion order when the client sends
+        ``Accept: application/x-ndjson``.
+        """
+        body = await request.body()
+        try:
+            if request.headers.get("content-encoding", "").lower() == "gzip":
+                body = decompress_body(body, JSONRPC_MAX_BODY_BYTES)
+            elif len(body) > JSONRPC_MAX_BODY_BYTES:
+                raise ValueError(f"Body exceeds the limit of {JSONRPC_MAX_BODY_BYTES} bytes")
+            payload = json.loads(body)
+        except Exception as e:
+            return jsonrpc_reply(create_jsonrpc_error(None, -32700, "Parse error", str(e)), request)
+
+        if not isinstance(payload, list):
+            response = await self.handle_message(payload)
+            if _is_notification(payload):
+                # A notification gets no response body
+                return Response(status_code=204)
+            return jsonrpc_reply(response, request)
+
+        if not payload:
+            return jsonrpc_reply(create_jsonrpc_error(None, -32600, "Invalid Request", "Empty batch"), request)
+        if len(payload) > JSONRPC_MAX_BATCH_SIZE:
+            return jsonrpc_reply(create_jsonrpc_error(
+                None, -32600, "Invalid Request",
+                f"Batch of {len(payload)} requests exceeds the limit of {JSONRPC_MAX_BATCH_SIZE}"
+            ), request)
+
+        if "application/x-ndjson" in request.headers.get("accept", ""):
+            return StreamingResponse(self.stream_batch(payload), media_type="application/x-ndjson")
+
+        responses = await asyncio.gather(*(self.handle_message(message) for message in payload))
+        responses = [response for message, response in zip(payload, responses) if not _is_notification(message)]
+        if not responses:
+            # A batch of notifications gets no response body
+            return Response(status_code=204)
+        return jsonrpc_reply(responses, request)
@@ -5,8 +5,11 @@ This adapter translates between LibreChat's plugin API and our MCP server's JSON
 It acts as a bridge between LibreChat and the MCP server using the official MCP SDK.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import time
 import uuid
 import requests
 import logging
@@ -26,6 +29,21 @@ app = FastAPI(title="LibreChat MCP Adapter")
 MCP_SERVER_URL = os.environ.get("MCP_SERVER_URL", "http://mcp-server:8000")
 mcp_client = MCPClient(server_url=MCP_SERVER_URL)
 
+# Manifest assembly: tool details are fetched concurrently, and the finished
+# manifest is cached until the tool list changes
+MANIFEST_CONCURRENCY = int(os.environ.get("MANIFEST_CONCURRENCY", "8"))
+# Seconds during which a cached manifest is served without re-checking the tool list
+MANIFEST_RECHECK_INTERVAL = float(os.environ.get("MANIFEST_RECHECK_INTERVAL", "5"))
+
+_manifest_cache: Dict[str, Any] = {
+    "tools_key": None,   # Fingerprint of the tool list the manifest was built from
+    "manifest": None,
+    "body": None,        # Serialized manifest
+    "etag": None,
+    "checked_at": 0.0
+}
+_manifest_lock: Optional[asyncio.Lock] = None
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     logger.info(f"Received request: {request.method} {request.url}")
@@ -56,41 +74,102 @@ async def root():
     """Root endpoint."""
     return {"message": "LibreChat MCP Adapter", "version": "2.0.0", "protocol": "MCP 2025-03-26"}
 
-@app.get("/api/manifest")
-async def get_manifest():
-    """Get the plugin manifest."""
-    try:
+def _tools_key(tools: List[str]) -> str:
+    """Fingerprint a tool list, independent of order."""
+    return hashlib.sha256(json.dumps(sorted(tools)).encode()).hexdigest()
+
+async def _build_manifest(tools: List[str]) -> Dict[str, Any]:
+    """Fetch tool details concurrently and assemble the manifest."""
+    semaphore = asyncio.Semaphore(MANIFEST_CONCURRENCY)
+    
+    async def fetch(tool_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            tool_info = await mcp_client.get_tool_details(tool_name)
+        
+        # Convert MCP tool schema to LibreChat tool schema
+        return {
+            "name": tool_info.get("name", ""),
+            "description": tool_info.get("description", ""),
+            "input_schema": tool_info.get("input_schema", {}),
+            "output_schema": tool_info.get("output_schema", {})
+        }
+    
+    # gather keeps the order of the tool list
+    tool_details = await asyncio.gather(*(fetch(tool_name) for tool_name in tools))
+    
+    return {
+        "name": "MCP Tools",
+        "description": "Access to MCP tools and resources via Model Context Protocol",
+        "logo": "/plugins/mcp-logo.png",
+        "contact": "admin@example.com",
+        "protocol": "MCP 2025-03-26",
+        "tools": list(tool_details)
+    }
+
+async def _get_cached_manifest() -> Dict[str, Any]:
+    """Return the cached manifest, rebuilding it if the tool list changed."""
+    global _manifest_lock
+    if _manifest_lock is None:
+        _manifest_lock = asyncio.Lock()
+    
+    if _manifest_cache["manifest"] is not None and \
+            time.monotonic() - _manifest_cache["checked_at"] < MANIFEST_RECHECK_INTERVAL:
+        return _manifest_cache
+    
+    # One rebuild at a time; concurrent requests wait and reuse its result
+    async with _manifest_lock:
+        if _manifest_cache["manifest"] is not None and \
+                time.monotonic() - _manifest_cache["checked_at"] < MANIFEST_RECHECK_INTERVAL:
+            return _manifest_cache
+        
         # Get the list of tools from the MCP server using the SDK
         tools = await mcp_client.list_tools()
+        tools_key = _tools_key(tools)
         
-        # Get details for each tool
-        tool_details = []
-        for tool_name in tools:
-            tool_info = await mcp_client.get_tool_details(tool_name)
-            
-            # Convert MCP tool schema to LibreChat tool schema
-            tool_details.append({
-                "name": tool_info.get("name", ""),
-                "description": tool_info.get("description", ""),
-                "input_schema": tool_info.get("input_schema", {}),
-                "output_schema": tool_info.get("output_schema", {})
+        if tools_key != _manifest_cache["tools_key"] or _manifest_cache["manifest"] is None:
+            logger.info(f"Tool list changed, rebuilding manifest for {len(tools)} tools")
+            manifest = await _build_manifest(tools)
+            body = json.dumps(manifest, sort_keys=True)
+            _manifest_cache.update({
+                "tools_key": tools_key,
+                "manifest": manifest,
+                "body": body,
+                "etag": f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
             })
         
-        # Create the manifest
-        manifest = {
-            "name": "MCP Tools",
-            "description": "Access to MCP tools and resources via Model Context Protocol",
-            "logo": "/plugins/mcp-logo.png",
-            "contact": "admin@example.com",
-            "protocol": "MCP 2025-03-26",
-            "tools": tool_details
-        }
+        _manifest_cache["checked_at"] = time.monotonic()
+        return _manifest_cache
+
+def invalidate_manifest() -> None:
+    """Drop the cached manifest so the next request rebuilds it."""
+    _manifest_cache.update({"tools_key": None, "manifest": None, "body": None, "etag": None, "checked_at": 0.0})
+
+@app.get("/api/manifest")
+async def get_manifest(request: Request):
+    """Get the plugin manifest.
+    
+    The manifest is served with an ETag; a request whose If-None-Match matches
+    the current manifest gets an empty 304 response.
+    """
+    try:
+        cached = await _get_cached_manifest()
+        headers = {"ETag": cached["etag"], "Cache-Control": "no-cache"}
+        
+        if_none_match = request.headers.get("if-none-match", "")
+        if cached["etag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
         
-        return manifest
+        return Response(content=cached["body"], media_type="application/json", headers=headers)
     except Exception as e:
         logger.error(f"Error getting manifest: {e}")
         raise HTTPException(status_code=500, detail=f"Error getting manifest: {str(e)}")
 
+@app.post("/api/manifest/invalidate")
+async def invalidate_manifest_endpoint():
+    """Invalidate the cached manifest, e.g. after tools were registered or removed."""
+    invalidate_manifest()
+    return {"success": True}
+
 @app.post("/api/tools/{tool_name}")
 async def execute_tool(tool_name: str, request: Request):
     """Execute a tool."""
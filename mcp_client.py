@@ -8,13 +8,23 @@ It can be used as a foundation for integrating with LibreChat.
 import json
 import uuid
 import requests
-from typing import Dict, Any, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-class MCPClient:
+try:
+    import httpx
+except ImportError:  # httpx is only needed for AsyncMCPClient
+    httpx = None
+
+# Default number of pooled keep-alive connections to the MCP server
+DEFAULT_POOL_SIZE = 10
+
+# Default request timeout in seconds
+DEFAULT_TIMEOUT = 30.0
+
+class _MCPClientBase:
     """
-    Simple MCP Client for connecting to our MCP server.
-    
-    This client follows the MCP protocol and uses JSON-RPC for communication.
+    Request building and response handling shared by the sync and async clients.
     """
     
     def __init__(self, server_url: str = "http://localhost:8000"):
@@ -56,6 +66,76 @@ class MCPClient:
             "params": params
         }
     
+    def _order_batch_responses(self, requests_sent: List[Dict[str, Any]],
+                               responses: Union[List[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Match batch responses to their requests.
+        
+        JSON-RPC servers may answer a batch in any order, so responses are
+        matched by ID.
+        
+        Args:
+            requests_sent: The JSON-RPC requests in the batch
+            responses: The JSON-RPC responses returned by the server
+            
+        Returns:
+            List[Dict[str, Any]]: One response per request, in request order
+        """
+        if isinstance(responses, dict):
+            # The server rejected the batch as a whole (or returned a single response)
+            if "error" in responses and responses.get("id") is None:
+                return [{"jsonrpc": "2.0", "id": request["id"], "error": responses["error"]}
+                        for request in requests_sent]
+            responses = [responses]
+        
+        by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        return [
+            by_id.get(request["id"], {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32603, "message": "No response for request in batch"}
+            })
+            for request in requests_sent
+        ]
+
+
+class MCPClient(_MCPClientBase):
+    """
+    Simple MCP Client for connecting to our MCP server.
+    
+    This client follows the MCP protocol and uses JSON-RPC for communication.
+    All requests go through one pooled HTTP session, so connections are kept
+    alive and reused instead of being opened per call.
+    """
+    
+    def __init__(self, server_url: str = "http://localhost:8000", pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize the MCP client.
+        
+        Args:
+            server_url: URL of the MCP server
+            pool_size: Maximum number of keep-alive connections kept open to the server
+            timeout: Request timeout in seconds
+        """
+        super().__init__(server_url)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "MCPClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _send_jsonrpc_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send a JSON-RPC request to the server.
@@ -68,13 +148,33 @@ class MCPClient:
             Dict[str, Any]: JSON-RPC response
         """
         request = self._create_jsonrpc_request(method, params)
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/jsonrpc",
             json=request,
-            headers={"Content-Type": "application/json"}
+            timeout=self.timeout
         )
         return response.json()
     
+    def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC calls in a single HTTP POST.
+        
+        Args:
+            calls: List of (method, params) tuples
+            
+        Returns:
+            List[Dict[str, Any]]: JSON-RPC responses, in the order of ``calls``
+        """
+        if not calls:
+            return []
+        batch = [self._create_jsonrpc_request(method, params) for method, params in calls]
+        response = self.session.post(
+            f"{self.server_url}/jsonrpc",
+            json=batch,
+            timeout=self.timeout
+        )
+        return self._order_batch_responses(batch, response.json())
+    
     def get_capabilities(self) -> Dict[str, bool]:
         """
         Get server capabilities.
@@ -82,7 +182,7 @@ class MCPClient:
         Returns:
             Dict[str, bool]: Server capabilities
         """
-        response = requests.get(f"{self.server_url}/mcp/capabilities")
+        response = self.session.get(f"{self.server_url}/mcp/capabilities", timeout=self.timeout)
         return response.json()
     
     def list_tools(self) -> List[str]:
@@ -108,6 +208,19 @@ class MCPClient:
         response = self._send_jsonrpc_request("tools/get", {"name": tool_name})
         return response.get("result", {})
     
+    def get_tools_details(self, tool_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details about several tools in one batched request.
+        
+        Args:
+            tool_names: Names of the tools
+            
+        Returns:
+            List[Dict[str, Any]]: Tool details, in the order of ``tool_names``
+        """
+        responses = self.send_batch([("tools/get", {"name": tool_name}) for tool_name in tool_names])
+        return [response.get("result", {}) for response in responses]
+    
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a tool.
@@ -151,6 +264,167 @@ class MCPClient:
         response = self._send_jsonrpc_request("resources/get", {"uri": uri})
         return response.get("result", {}).get("content")
 
+
+class AsyncMCPClient(_MCPClientBase):
+    """
+    Async variant of MCPClient with the same interface.
+    
+    Requests share one pooled httpx.AsyncClient; every method is a coroutine.
+    """
+    
+    def __init__(self, server_url: str = "http://localhost:8000", pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize the async MCP client.
+        
+        Args:
+            server_url: URL of the MCP server
+            pool_size: Maximum number of connections kept open to the server
+            timeout: Request timeout in seconds
+            
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("AsyncMCPClient requires httpx")
+        super().__init__(server_url)
+        self.client = httpx.AsyncClient(
+            base_url=server_url,
+            timeout=timeout,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+    
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def _send_jsonrpc_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request to the server.
+        
+        Args:
+            method: Method to call
+            params: Method parameters
+            
+        Returns:
+            Dict[str, Any]: JSON-RPC response
+        """
+        request = self._create_jsonrpc_request(method, params)
+        response = await self.client.post("/jsonrpc", json=request)
+        return response.json()
+    
+    async def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC calls in a single HTTP POST.
+        
+        Args:
+            calls: List of (method, params) tuples
+            
+        Returns:
+            List[Dict[str, Any]]: JSON-RPC responses, in the order of ``calls``
+        """
+        if not calls:
+            return []
+        batch = [self._create_jsonrpc_request(method, params) for method, params in calls]
+        response = await self.client.post("/jsonrpc", json=batch)
+        return self._order_batch_responses(batch, response.json())
+    
+    async def get_capabilities(self) -> Dict[str, bool]:
+        """
+        Get server capabilities.
+        
+        Returns:
+            Dict[str, bool]: Server capabilities
+        """
+        response = await self.client.get("/mcp/capabilities")
+        return response.json()
+    
+    async def list_tools(self) -> List[str]:
+        """
+        List available tools.
+        
+        Returns:
+            List[str]: List of available tools
+        """
+        response = await self._send_jsonrpc_request("tools/list", {})
+        return response.get("result", {}).get("tools", [])
+    
+    async def get_tool_details(self, tool_name: str) -> Dict[str, Any]:
+        """
+        Get details about a tool.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            Dict[str, Any]: Tool details
+        """
+        response = await self._send_jsonrpc_request("tools/get", {"name": tool_name})
+        return response.get("result", {})
+    
+    async def get_tools_details(self, tool_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details about several tools in one batched request.
+        
+        Args:
+            tool_names: Names of the tools
+            
+        Returns:
+            List[Dict[str, Any]]: Tool details, in the order of ``tool_names``
+        """
+        responses = await self.send_batch([("tools/get", {"name": tool_name}) for tool_name in tool_names])
+        return [response.get("result", {}) for response in responses]
+    
+    async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a tool.
+        
+        Args:
+            tool_name: Name of the tool
+            arguments: Tool arguments
+            
+        Returns:
+            Dict[str, Any]: Tool execution result
+        """
+        response = await self._send_jsonrpc_request(
+            "tools/execute",
+            {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        )
+        return response.get("result", {})
+    
+    async def list_resources(self) -> List[str]:
+        """
+        List available resources.
+        
+        Returns:
+            List[str]: List of available resources
+        """
+        response = await self._send_jsonrpc_request("resources/list", {})
+        return response.get("result", {}).get("resources", [])
+    
+    async def get_resource(self, uri: str) -> Any:
+        """
+        Get a resource.
+        
+        Args:
+            uri: Resource URI
+            
+        Returns:
+            Any: Resource content
+        """
+        response = await self._send_jsonrpc_request("resources/get", {"uri": uri})
+        return response.get("result", {}).get("content")
+
 # Example usage
 if __name__ == "__main__":
     client = MCPClient()
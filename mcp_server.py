@@ -8,18 +8,29 @@ This version includes:
 4. Additional file resources
 5. Proper JSON-RPC envelope validation
 """
+import asyncio
+import contextvars
+import importlib
 import logging
 import time
 import json
 import os
-import subprocess
-import requests
-from typing import Dict, Any, Optional, List, Union
-from fastapi import FastAPI, HTTPException, Request, Response
-from pydantic import BaseModel, Field, validator
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union
+from fastapi import FastAPI, HTTPException, Request
+from pydantic import BaseModel
 import uuid
+from jsonrpc_transport import JsonRpcEndpoint
 from mcp_sdk import MCPServer, Tool, Resource, Capability
-import uuid
+
+# Reuse the MCP server services
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "services", "mcp-server", "src"))
+from services.llm_scheduler import LLMScheduler
+from services.response_cache import ResponseCache
+from server.tools.shell.streaming import run_command_streaming
+
+if TYPE_CHECKING:
+    import httpx
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,30 +48,35 @@ app = mcp_server.create_fastapi_app()
 
 # Ollama API URL
 OLLAMA_API_URL = os.environ.get("OLLAMA_API_HOST", "http://localhost:11434")
-
-# Define JSON-RPC models
-class JsonRpcRequest(BaseModel):
-    jsonrpc: str = Field("2.0", description="JSON-RPC version")
-    id: Optional[str] = Field(None, description="Request ID")
-    method: str = Field(..., description="Method to call")
-    params: Dict[str, Any] = Field({}, description="Method parameters")
-
-    @validator('jsonrpc')
-    def validate_jsonrpc_version(cls, v):
-        if v != "2.0":
-            raise ValueError("Only JSON-RPC 2.0 is supported")
-        return v
-
-class JsonRpcResponse(BaseModel):
-    jsonrpc: str = "2.0"
-    id: Optional[str] = None
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
-
-class JsonRpcError(BaseModel):
-    code: int
-    message: str
-    data: Optional[Any] = None
+OLLAMA_TIMEOUT = float(os.environ.get("OLLAMA_TIMEOUT", "120"))
+OLLAMA_MAX_CONNECTIONS = int(os.environ.get("OLLAMA_MAX_CONNECTIONS", "20"))
+OLLAMA_MAX_CONCURRENCY_PER_MODEL = int(os.environ.get("OLLAMA_MAX_CONCURRENCY_PER_MODEL", "2"))
+
+# Pooled connection to the Ollama API and the scheduler queueing generations in front of it
+_ollama_client: Optional["httpx.AsyncClient"] = None
+_ollama_scheduler: Optional[LLMScheduler] = None
+
+# Client of the HTTP request being handled, used for fair scheduling between clients
+_request_client: contextvars.ContextVar[str] = contextvars.ContextVar("request_client", default="anonymous")
+
+# Response cache for repeated prompts (OLLAMA_CACHE_PATH enables the SQLite backing store)
+OLLAMA_CACHE_ENABLED = os.environ.get("OLLAMA_CACHE_ENABLED", "true").lower() == "true"
+OLLAMA_CACHE_MAX_ENTRIES = int(os.environ.get("OLLAMA_CACHE_MAX_ENTRIES", "1000"))
+OLLAMA_CACHE_TTL = int(os.environ.get("OLLAMA_CACHE_TTL", "3600"))
+OLLAMA_CACHE_PATH = os.environ.get("OLLAMA_CACHE_PATH")
+
+# Background warm-up after startup (OLLAMA_PREWARM_MODEL also loads that model into Ollama)
+STARTUP_PREWARM = os.environ.get("STARTUP_PREWARM", "true").lower() == "true"
+STARTUP_PREWARM_DELAY = float(os.environ.get("STARTUP_PREWARM_DELAY", "0"))
+OLLAMA_PREWARM_MODEL = os.environ.get("OLLAMA_PREWARM_MODEL")
+
+# Shell command limits
+SHELL_COMMAND_TIMEOUT = int(os.environ.get("SHELL_COMMAND_TIMEOUT", "30"))
+SHELL_MAX_OUTPUT_BYTES = int(os.environ.get("SHELL_MAX_OUTPUT_BYTES", str(1024 * 1024)))
+SHELL_MAX_CONCURRENT = int(os.environ.get("SHELL_MAX_CONCURRENT", "2"))
+SHELL_JOB_CPU_SECONDS = int(os.environ.get("SHELL_JOB_CPU_SECONDS", "60"))
+SHELL_JOB_MEMORY_MB = int(os.environ.get("SHELL_JOB_MEMORY_MB", "1024"))
+SHELL_JOB_LIMITS = {"cpu_seconds": SHELL_JOB_CPU_SECONDS, "memory_mb": SHELL_JOB_MEMORY_MB}
 
 # Define tool models
 class ToolRequest(BaseModel):
@@ -204,70 +220,197 @@ mcp_server.register_resource(python_template)
 mcp_server.register_resource(javascript_template)
 mcp_server.register_resource(java_template)
 
-# Helper functions for JSON-RPC
-def create_jsonrpc_response(request_id: Optional[str], result: Any) -> Dict[str, Any]:
-    """Create a JSON-RPC response."""
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "result": result
+# Tool descriptions and resource contents served by the REST and JSON-RPC endpoints
+tools = {
+    tool.name: {
+        "name": tool.name,
+        "description": tool.description,
+        "input_schema": tool.input_schema,
+        "output_schema": tool.output_schema
     }
+    for tool in (shell_command_tool, mintycoder_tool, code_analyzer_tool)
+}
+resources = {
+    resource.uri: resource.content
+    for resource in (example_resource, python_template, javascript_template, java_template)
+}
+
+def _get_ollama_client() -> "httpx.AsyncClient":
+    """Get the shared Ollama HTTP client, creating it on first use."""
+    global _ollama_client
+    import httpx
+    
+    if _ollama_client is None or _ollama_client.is_closed:
+        _ollama_client = httpx.AsyncClient(
+            base_url=OLLAMA_API_URL,
+            timeout=httpx.Timeout(OLLAMA_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_CONNECTIONS
+            )
+        )
+    return _ollama_client
 
-def create_jsonrpc_error(request_id: Optional[str], code: int, message: str, data: Any = None) -> Dict[str, Any]:
-    """Create a JSON-RPC error response."""
-    error = {
-        "code": code,
-        "message": message
-    }
-    if data is not None:
-        error["data"] = data
+_ollama_cache: Optional[ResponseCache] = None
+
+def _get_ollama_cache() -> Optional[ResponseCache]:
+    """Get the response cache, opening its SQLite store on first use (None when disabled)."""
+    global _ollama_cache
+    if _ollama_cache is None and OLLAMA_CACHE_ENABLED:
+        _ollama_cache = ResponseCache(logger, OLLAMA_CACHE_MAX_ENTRIES, OLLAMA_CACHE_TTL, OLLAMA_CACHE_PATH)
+    return _ollama_cache
+
+class OllamaBackend:
+    """LLMScheduler backend generating through the pooled Ollama API client."""
     
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "error": error
-    }
+    model = "default"
+    
+    async def generate(self, prompt: str, model: Optional[str] = None,
+                       options: Optional[Dict[str, Any]] = None) -> str:
+        payload = {"model": model or self.model, "prompt": prompt, "stream": False}
+        if options:
+            payload["options"] = options
+        response = await _get_ollama_client().post("/api/generate", json=payload)
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+def _get_ollama_scheduler() -> LLMScheduler:
+    """Get the scheduler queueing Ollama generations, creating it on first use."""
+    global _ollama_scheduler
+    if _ollama_scheduler is None:
+        _ollama_scheduler = LLMScheduler(
+            OllamaBackend(),
+            logger,
+            max_concurrency_per_model=OLLAMA_MAX_CONCURRENCY_PER_MODEL
+        )
+    return _ollama_scheduler
+
+@app.middleware("http")
+async def track_request_client(request: Request, call_next):
+    """Record the requesting client so its Ollama generations are scheduled fairly."""
+    token = _request_client.set(request.client.host if request.client else "anonymous")
+    try:
+        return await call_next(request)
+    finally:
+        _request_client.reset(token)
+
+async def _generate_ollama(model: str, prompt: str, priority: str = "interactive") -> str:
+    """Queue one upstream generation in the scheduler for the current client."""
+    return await _get_ollama_scheduler().submit(
+        prompt, model=model, client_id=_request_client.get(), priority=priority
+    )
 
 # Helper function to call Ollama API
-async def call_ollama_api(model: str, prompt: str) -> str:
-    """Call Ollama API to generate text."""
+async def call_ollama_api(model: str, prompt: str, priority: str = "interactive") -> str:
+    """Call Ollama API to generate text without blocking the event loop.
+    
+    Identical prompts are answered from the response cache, and concurrent
+    identical prompts share a single upstream generation. Generations are
+    queued in the LLM scheduler: ``priority`` is "interactive" or "batch",
+    queued interactive requests always go first, and clients are served
+    round-robin within a class.
+    """
     try:
-        response = requests.post(
-            f"{OLLAMA_API_URL}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False
-            }
-        )
-        response.raise_for_status()
-        return response.json().get("response", "")
+        ollama_cache = _get_ollama_cache()
+        if ollama_cache is None:
+            return await _generate_ollama(model, prompt, priority)
+        
+        return await ollama_cache.get_or_generate(model, prompt, lambda: _generate_ollama(model, prompt, priority))
     except Exception as e:
         logger.error(f"Error calling Ollama API: {e}")
         return f"Error calling Ollama API: {str(e)}"
 
-# Define tool execution handlers
-@shell_command_tool.handler
-async def execute_shell_command(command: str) -> Dict[str, Any]:
-    """Execute a shell command."""
+# State of the background warm-up, reported by the health check
+_prewarm_state = {"state": "pending"}
+
+async def _prewarm() -> None:
+    """Do first-use initialization in the background so the first requests don't pay for it."""
+    # Yield first so that startup completes and the server starts accepting connections
+    await asyncio.sleep(STARTUP_PREWARM_DELAY)
+    _prewarm_state["state"] = "running"
+    started = time.perf_counter()
     try:
-        process = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        return {
-            "output": process.stdout + process.stderr,
-            "exit_code": process.returncode
-        }
+        # Import on a worker thread, then build the pool and open the cache on the loop
+        await asyncio.to_thread(importlib.import_module, "httpx")
+        client = _get_ollama_client()
+        _get_ollama_cache()
+        if OLLAMA_PREWARM_MODEL:
+            # A generate request without a prompt only loads the model
+            response = await client.post("/api/generate", json={"model": OLLAMA_PREWARM_MODEL, "stream": False})
+            response.raise_for_status()
+        logger.info(f"Pre-warm completed in {time.perf_counter() - started:.3f}s")
     except Exception as e:
-        logger.error(f"Error executing shell command: {e}")
+        logger.warning(f"Pre-warm failed: {e}")
+    finally:
+        _prewarm_state["state"] = "done"
+
+@app.on_event("startup")
+async def start_prewarm():
+    """Start the background warm-up without delaying startup."""
+    if STARTUP_PREWARM:
+        asyncio.get_running_loop().create_task(_prewarm())
+
+@app.on_event("shutdown")
+async def close_ollama_client():
+    """Stop the scheduler and release pooled Ollama API connections and the response cache store."""
+    if _ollama_scheduler is not None:
+        await _ollama_scheduler.close()
+    if _ollama_client is not None:
+        await _ollama_client.aclose()
+    if _ollama_cache is not None:
+        _ollama_cache.close()
+
+# Worker slots for shell commands, created on first use inside the event loop
+_shell_slots: Optional[asyncio.Semaphore] = None
+
+async def run_shell_command(command: str, timeout: int = SHELL_COMMAND_TIMEOUT,
+                            max_output_bytes: int = SHELL_MAX_OUTPUT_BYTES) -> Dict[str, Any]:
+    """Run a shell command without blocking the event loop.
+    
+    stdout and stderr are read incrementally; output beyond ``max_output_bytes``
+    is discarded as it arrives, and the whole process group is killed on
+    timeout or cancellation. At most ``SHELL_MAX_CONCURRENT`` commands run at
+    once, each with CPU time and address space rlimits.
+    """
+    global _shell_slots
+    if _shell_slots is None:
+        _shell_slots = asyncio.Semaphore(SHELL_MAX_CONCURRENT)
+    # Retained output in arrival order, stdout and stderr interleaved
+    chunks: List[str] = []
+    async with _shell_slots:
+        try:
+            result = await run_command_streaming(
+                command,
+                timeout=timeout,
+                max_output_bytes=max_output_bytes,
+                on_output=lambda stream, text: chunks.append(text),
+                resource_limits=SHELL_JOB_LIMITS
+            )
+        except Exception as e:
+            logger.error(f"Error executing shell command: {e}")
+            return {
+                "output": f"Error executing command: {str(e)}",
+                "exit_code": 1
+            }
+    
+    text = "".join(chunks)
+    if result["timed_out"]:
         return {
-            "output": f"Error executing command: {str(e)}",
-            "exit_code": 1
+            "output": text + f"\n[Command timed out after {timeout} seconds]",
+            "exit_code": -1
         }
+    if result["truncated"]:
+        text += f"\n[Output truncated at {max_output_bytes} bytes]"
+    return {
+        "output": text,
+        "exit_code": result["exit_code"]
+    }
+
+# Define tool execution handlers
+@shell_command_tool.handler
+async def execute_shell_command(command: str) -> Dict[str, Any]:
+    """Execute a shell command."""
+    return await run_shell_command(command)
 
 @mintycoder_tool.handler
 async def execute_mintycoder(prompt: str, language: str = "python") -> Dict[str, Any]:
@@ -348,7 +491,7 @@ async def execute_code_analyzer(code: str, language: str = "python") -> Dict[str
         """
         
         # Call DeepSeek Coder through Ollama for analysis
-        response = await call_ollama_api("deepseek-coder:6.7b", analysis_prompt)
+        response = await call_ollama_api("deepseek-coder:6.7b", analysis_prompt, priority="batch")
         
         # Try to parse the JSON response
         try:
@@ -395,231 +538,10 @@ async def execute_code_analyzer(code: str, language: str = "python") -> Dict[str
             "resources": True,
             "subscriptions": False,
             "prompts": False,
-            "batch": False,
+            "batch": True,
             "progress": False
         })
         
-        # Middleware to handle JSON-RPC requests
-@app.middleware("http")
-async def jsonrpc_middleware(request: Request, call_next):
-    """Middleware to handle JSON-RPC requests."""
-    # Only process POST requests to /jsonrpc endpoint
-    if request.method == "POST" and request.url.path == "/jsonrpc":
-        try:
-            # Parse request body
-            body = await request.json()
-            
-            # Validate JSON-RPC request
-            try:
-                jsonrpc_request = JsonRpcRequest(**body)
-            except Exception as e:
-                error_response = create_jsonrpc_error(
-                    body.get("id"), 
-                    -32600, 
-                    "Invalid Request",
-                    str(e)
-                )
-                return Response(
-                    content=json.dumps(error_response),
-                    media_type="application/json"
-                )
-            
-            # Extract request details
-            request_id = jsonrpc_request.id
-            method = jsonrpc_request.method
-            params = jsonrpc_request.params
-            
-            # Process the request based on method
-            if method == "tools/list":
-                result = {"tools": list(tools.keys())}
-                response_body = create_jsonrpc_response(request_id, result)
-            elif method == "tools/get":
-                tool_name = params.get("name")
-                if tool_name not in tools:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Tool '{tool_name}' not found"
-                    )
-                else:
-                    result = tools[tool_name]
-                    response_body = create_jsonrpc_response(request_id, result)
-            elif method == "tools/execute":
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                if tool_name not in tools:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Tool '{tool_name}' not found"
-                    )
-                else:
-                    # Execute the tool
-                    if tool_name == "shell_command":
-                        command = arguments.get("command", "")
-                        try:
-                            process = subprocess.run(
-                                command,
-                                shell=True,
-                                capture_output=True,
-                                text=True,
-                                timeout=30
-                            )
-                            result = {
-                                "output": process.stdout + process.stderr,
-                                "exit_code": process.returncode
-                            }
-                        except Exception as e:
-                            result = {
-                                "output": f"Error executing command: {str(e)}",
-                                "exit_code": 1
-                            }
-                    elif tool_name == "mintycoder":
-                        prompt = arguments.get("prompt", "")
-                        language = arguments.get("language", "python")
-                        
-                        # Create a prompt for DeepSeek Coder
-                        deepseek_prompt = f"""
-                        You are MINTYcoder, an expert code generator.
-                        
-                        Task: {prompt}
-                        
-                        Programming Language: {language}
-                        
-                        Please generate high-quality, well-documented code that solves this task.
-                        Include comments explaining the key parts of your solution.
-                        
-                        After the code, provide a brief explanation of how your solution works.
-                        """
-                        
-                        # Call DeepSeek Coder through Ollama
-                        response = await call_ollama_api("deepseek-coder:6.7b", deepseek_prompt)
-                        
-                        # Extract code and explanation
-                        code_parts = response.split("```")
-                        if len(code_parts) >= 3:
-                            # Extract code from the first code block
-                            code = code_parts[1]
-                            if code.startswith(language):
-                                code = code[len(language):].strip()
-                            
-                            # Extract explanation from after the code block
-                            explanation = code_parts[2].strip()
-                        else:
-                            # Fallback if code blocks aren't properly formatted
-                            code = response
-                            explanation = "Code generated based on the prompt."
-                        
-                        result = {
-                            "code": code,
-                            "explanation": explanation
-                        }
-                    elif tool_name == "code_analyzer":
-                        code = arguments.get("code", "")
-                        language = arguments.get("language", "python")
-                        
-                        # Create a prompt for code analysis
-                        analysis_prompt = f"""
-                        You are a code quality analyzer. Analyze the following {language} code:
-                        
-                        ```{language}
-                        {code}
-                        ```
-                        
-                        Provide a detailed analysis including:
-                        1. A list of issues (with line numbers)
-                        2. A quality score from 0-100
-                        3. Specific suggestions for improvement
-                        
-                        Format your response as JSON with the following structure:
-                        {{
-                          "issues": [
-                            {{"line": <line_number>, "message": "<issue_description>"}},
-                            ...
-                          ],
-                          "quality_score": <score>,
-                          "suggestions": [
-                            "<suggestion_1>",
-                            ...
-                          ]
-                        }}
-                        """
-                        
-                        # Call DeepSeek Coder through Ollama for analysis
-                        response = await call_ollama_api("deepseek-coder:6.7b", analysis_prompt)
-                        
-                        # Try to parse the JSON response
-                        try:
-                            # Extract JSON from the response
-                            json_str = response
-                            if "```json" in response:
-                                json_parts = response.split("```json")
-                                if len(json_parts) > 1:
-                                    json_str = json_parts[1].split("```")[0].strip()
-                            elif "```" in response:
-                                json_parts = response.split("```")
-                                if len(json_parts) > 1:
-                                    json_str = json_parts[1].strip()
-                            
-                            result = json.loads(json_str)
-                        except Exception as e:
-                            logger.error(f"Error parsing code analysis response: {e}")
-                            # Fallback to a simple analysis
-                            result = {
-                                "issues": [
-                                    {"line": 1, "message": "Could not perform detailed analysis"}
-                                ],
-                                "quality_score": 50,
-                                "suggestions": [
-                                    "Consider running a linter on this code",
-                                    "Review for best practices in " + language
-                                ]
-                            }
-                    else:
-                        result = {"error": "Tool execution not implemented"}
-                    
-                    response_body = create_jsonrpc_response(request_id, result)
-            elif method == "resources/list":
-                result = {"resources": list(resources.keys())}
-                response_body = create_jsonrpc_response(request_id, result)
-            elif method == "resources/get":
-                uri = params.get("uri")
-                if uri not in resources:
-                    response_body = create_jsonrpc_error(
-                        request_id, 
-                        -32602, 
-                        f"Resource '{uri}' not found"
-                    )
-                else:
-                    result = {"content": resources[uri]}
-                    response_body = create_jsonrpc_response(request_id, result)
-            else:
-                response_body = create_jsonrpc_error(
-                    request_id, 
-                    -32601, 
-                    f"Method '{method}' not found"
-                )
-            
-            return Response(
-                content=json.dumps(response_body),
-                media_type="application/json"
-            )
-        except Exception as e:
-            error_response = create_jsonrpc_error(
-                None, 
-                -32603, 
-                "Internal error",
-                str(e)
-            )
-            return Response(
-                content=json.dumps(error_response),
-                media_type="application/json"
-            )
-    
-    # For non-JSON-RPC requests, proceed with normal processing
-    return await call_next(request)
-
 # MCP endpoints (RESTful API for backward compatibility)
 @app.get("/mcp/capabilities")
 async def get_capabilities():
@@ -629,7 +551,7 @@ async def get_capabilities():
         "resources": True,
         "subscriptions": False,
         "prompts": False,
-        "batch": False,
+        "batch": True,
         "progress": False
     }
 
@@ -655,23 +577,7 @@ async def execute_tool(tool_name: str, request: Dict[str, Any]):
     
     if tool_name == "shell_command":
         command = request.get("command", "")
-        try:
-            process = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return {
-                "output": process.stdout + process.stderr,
-                "exit_code": process.returncode
-            }
-        except Exception as e:
-            return {
-                "output": f"Error executing command: {str(e)}",
-                "exit_code": 1
-            }
+        return await run_shell_command(command)
     elif tool_name == "mintycoder":
         prompt = request.get("prompt", "")
         language = request.get("language", "python")
@@ -744,7 +650,7 @@ async def execute_tool(tool_name: str, request: Dict[str, Any]):
         """
         
         # Call DeepSeek Coder through Ollama for analysis
-        response = await call_ollama_api("deepseek-coder:6.7b", analysis_prompt)
+        response = await call_ollama_api("deepseek-coder:6.7b", analysis_prompt, priority="batch")
         
         # Try to parse the JSON response
         try:
@@ -790,20 +696,35 @@ async def get_resource(resource_uri: str):
     return {"content": resources[uri]}
 
 # JSON-RPC endpoint
+jsonrpc = JsonRpcEndpoint(tools, resources, execute_tool)
+
 @app.post("/jsonrpc")
 async def jsonrpc_endpoint(request: Request):
-    """JSON-RPC endpoint."""
-    # This endpoint is handled by the middleware
-    pass
+    """JSON-RPC endpoint, accepting single requests and batches."""
+    return await jsonrpc.handle_request(request)
 
 # Debug endpoints
+@app.get("/debug/ollama-cache-stats")
+async def ollama_cache_stats():
+    """Report Ollama response cache hit rates."""
+    ollama_cache = _get_ollama_cache()
+    if ollama_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **ollama_cache.get_stats()}
+
+@app.get("/debug/ollama-scheduler-stats")
+async def ollama_scheduler_stats():
+    """Report Ollama request queue depths and dispatch counters."""
+    return _get_ollama_scheduler().get_stats()
+
 @app.get("/debug/health")
 async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "prewarm": _prewarm_state["state"]
     }
 
 if __name__ == "__main__":
@@ -40,6 +40,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from core.logging.config import configure_logger
+from core.quality.components.parsed_modules import get_parsed_module
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
@@ -383,9 +384,6 @@ class CodeQualityAnalyzer:
         )
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                
             # Count lines
             total_lines, code_lines, comment_lines, blank_lines = self._count_lines(file_path)
             metrics.lines_total = total_lines
@@ -393,44 +391,34 @@ class CodeQualityAnalyzer:
             metrics.lines_comment = comment_lines
             metrics.lines_blank = blank_lines
             
-            # Parse the AST
+            # Parse the AST (shared with the quality checks)
             try:
-                tree = ast.parse(content)
+                module = get_parsed_module(file_path)
                 
                 # Count functions and classes
-                function_nodes = []
-                class_nodes = []
+                function_nodes = [definition.node for definition in module.functions]
                 docstring_lines = 0
                 
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        function_nodes.append(node)
-                        # Check for docstring
-                        if (node.body and isinstance(node.body[0], ast.Expr) and 
-                            isinstance(node.body[0].value, ast.Str)):
-                            metrics.documented_functions += 1
-                            docstring_lines += len(node.body[0].value.s.splitlines())
-                            
-                    elif isinstance(node, ast.ClassDef):
-                        class_nodes.append(node)
-                        # Check for docstring
-                        if (node.body and isinstance(node.body[0], ast.Expr) and 
-                            isinstance(node.body[0].value, ast.Str)):
-                            metrics.documented_classes += 1
-                            docstring_lines += len(node.body[0].value.s.splitlines())
+                for definition in module.definitions:
+                    if not definition.docstring:
+                        continue
+                    if definition.kind == "class":
+                        metrics.documented_classes += 1
+                    else:
+                        metrics.documented_functions += 1
+                    docstring_lines += len(ast.get_docstring(definition.node, clean=False).splitlines())
                 
                 # Check for module docstring
-                if (tree.body and isinstance(tree.body[0], ast.Expr) and 
-                    isinstance(tree.body[0].value, ast.Str)):
-                    docstring_lines += len(tree.body[0].value.s.splitlines())
+                if module.docstring:
+                    docstring_lines += len(ast.get_docstring(module.tree, clean=False).splitlines())
                 
                 metrics.lines_docstring = docstring_lines
                 metrics.functions_count = len(function_nodes)
-                metrics.classes_count = len(class_nodes)
+                metrics.classes_count = len(module.classes)
                 
-                # Calculate complexity metrics
-                metrics.complexity_cyclomatic = self._calculate_cyclomatic_complexity(tree)
-                metrics.complexity_cognitive = self._calculate_cognitive_complexity(tree)
+                # Complexity metrics are collected while parsing
+                metrics.complexity_cyclomatic = module.complexity
+                metrics.complexity_cognitive = module.cognitive_complexity
                 
                 # Check type hints
                 if function_nodes:
@@ -463,45 +451,6 @@ class CodeQualityAnalyzer:
             
         return metrics
 
-    def _calculate_cyclomatic_complexity(self, node: ast.AST) -> int:
-        """Calculate cyclomatic complexity for an AST node."""
-        complexity = 1  # Base complexity
-        
-        for child in ast.walk(node):
-            # Statements that increase complexity
-            if isinstance(child, (ast.If, ast.While, ast.For)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp) and isinstance(child.op, ast.And):
-                complexity += len(child.values) - 1
-            elif isinstance(child, ast.BoolOp) and isinstance(child.op, ast.Or):
-                complexity += len(child.values) - 1
-            elif isinstance(child, ast.Try):
-                complexity += len(child.handlers)  # Each except block
-                
-        return complexity
-
-    def _calculate_cognitive_complexity(self, node: ast.AST) -> int:
-        """Calculate cognitive complexity for an AST node."""
-        complexity = 0
-        nesting_level = 0
-        
-        def process_node(node, level):
-            nonlocal complexity
-            
-            # Increment for control flow structures
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.Try)):
-                complexity += level + 1
-                
-            # Recursively process children with increased nesting level
-            for child in ast.iter_child_nodes(node):
-                if isinstance(child, (ast.If, ast.While, ast.For, ast.Try)):
-                    process_node(child, level + 1)
-                else:
-                    process_node(child, level)
-        
-        process_node(node, nesting_level)
-        return complexity
-
     def analyze_file(self, file_path: str) -> Optional[FileMetrics]:
         """Analyze a file for metrics."""
         ext = Path(file_path).suffix.lower()
@@ -28,6 +28,11 @@ from typing import Dict, List, Optional, Any, Tuple, Set, Union
 import datetime
 import logging
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from core.quality.components.line_index import LineIndex
+
 # Initialize logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -220,6 +225,7 @@ class CodeAnalyzer:
             
             # Parse the Python file
             tree = ast.parse(content)
+            lines = LineIndex(content)
             
             # Extract file structure
             file_structure = {
@@ -289,20 +295,20 @@ class CodeAnalyzer:
                     # Check for class docstring pattern
                     if "python" in self.code_patterns and "class_definition" in self.code_patterns["python"]:
                         pattern = self.code_patterns["python"]["class_definition"]["validation_regex"]
-                        class_def = self._get_node_source(node, content)
+                        class_def = self._get_node_source(node, lines)
                         class_info["has_proper_docstring"] = bool(re.search(pattern, class_def, re.MULTILINE))
                     
                     # Extract methods and attributes
                     for item in node.body:
                         if isinstance(item, ast.FunctionDef):
-                            method_info = self._extract_function_info(item, content)
+                            method_info = self._extract_function_info(item, lines)
                             class_info["methods"].append(method_info)
                         elif isinstance(item, ast.Assign):
                             for target in item.targets:
                                 if isinstance(target, ast.Name):
                                     class_info["attributes"].append({
                                         "name": target.id,
-                                        "value": self._get_node_source(item.value, content)
+                                        "value": self._get_node_source(item.value, lines)
                                     })
                     
                     file_structure["classes"].append(class_info)
@@ -314,7 +320,7 @@ class CodeAnalyzer:
                     for cls in file_structure["classes"] 
                     for method in cls["methods"]
                 ):
-                    function_info = self._extract_function_info(node, content)
+                    function_info = self._extract_function_info(node, lines)
                     file_structure["functions"].append(function_info)
             
             # Extract constants
@@ -324,7 +330,7 @@ class CodeAnalyzer:
                         if isinstance(target, ast.Name) and target.id.isupper():
                             file_structure["constants"].append({
                                 "name": target.id,
-                                "value": self._get_node_source(node.value, content)
+                                "value": self._get_node_source(node.value, lines)
                             })
             
             # Store file structure in report
@@ -352,13 +358,13 @@ class CodeAnalyzer:
             self.report["summary"]["files_with_issues"] += 1
             self.report["summary"]["total_issues"] += 1
     
-    def _extract_function_info(self, node: ast.FunctionDef, content: str) -> Dict[str, Any]:
+    def _extract_function_info(self, node: ast.FunctionDef, lines: LineIndex) -> Dict[str, Any]:
         """
         Extract information about a function or method.
         
         Args:
             node: The AST node representing the function
-            content: The source code content
+            lines: Line index of the source code content
             
         Returns:
             A dictionary containing information about the function
@@ -375,20 +381,20 @@ class CodeAnalyzer:
         # Check for function docstring pattern
         if "python" in self.code_patterns and "function_definition" in self.code_patterns["python"]:
             pattern = self.code_patterns["python"]["function_definition"]["validation_regex"]
-            func_def = self._get_node_source(node, content)
+            func_def = self._get_node_source(node, lines)
             function_info["has_proper_docstring"] = bool(re.search(pattern, func_def, re.MULTILINE))
         
         # Extract arguments
         for arg in node.args.args:
             arg_info = {
                 "name": arg.arg,
-                "annotation": self._get_annotation(arg.annotation, content) if arg.annotation else None
+                "annotation": self._get_annotation(arg.annotation, lines) if arg.annotation else None
             }
             function_info["args"].append(arg_info)
         
         # Extract return type
         if node.returns:
-            function_info["returns"] = self._get_annotation(node.returns, content)
+            function_info["returns"] = self._get_annotation(node.returns, lines)
             function_info["has_type_hints"] = True
         
         # Check if all arguments have type hints
@@ -397,18 +403,18 @@ class CodeAnalyzer:
         
         return function_info
     
-    def _get_annotation(self, node: ast.AST, content: str) -> str:
+    def _get_annotation(self, node: ast.AST, lines: LineIndex) -> str:
         """
         Get the string representation of a type annotation.
         
         Args:
             node: The AST node representing the annotation
-            content: The source code content
+            lines: Line index of the source code content
             
         Returns:
             The string representation of the annotation
         """
-        return self._get_node_source(node, content)
+        return self._get_node_source(node, lines)
     
     def _get_base_name(self, node: ast.AST) -> str:
         """
@@ -427,36 +433,19 @@ class CodeAnalyzer:
         else:
             return str(node)
     
-    def _get_node_source(self, node: ast.AST, content: str) -> str:
+    def _get_node_source(self, node: ast.AST, lines: LineIndex) -> str:
         """
         Get the source code for an AST node.
         
         Args:
             node: The AST node
-            content: The source code content
+            lines: Line index of the source code content
             
         Returns:
             The source code for the node
         """
-        if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
-            lines = content.splitlines()
-            if node.end_lineno > len(lines):
-                return "<<source not available>>"
-            
-            if node.lineno == node.end_lineno:
-                line = lines[node.lineno - 1]
-                return line[node.col_offset:node.end_col_offset]
-            else:
-                result = []
-                for i in range(node.lineno - 1, node.end_lineno):
-                    if i == node.lineno - 1:
-                        result.append(lines[i][node.col_offset:])
-                    elif i == node.end_lineno - 1:
-                        result.append(lines[i][:node.end_col_offset])
-                    else:
-                        result.append(lines[i])
-                return '\n'.join(result)
-        return "<<source not available>>"
+        source = lines.get_node_source(node)
+        return "<<source not available>>" if source is None else source
     
     def _check_python_naming_conventions(self, file_structure: Dict[str, Any]) -> None:
         """
@@ -31,6 +31,12 @@ import datetime
 import logging
 import importlib.util
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from core.quality.components.line_index import LineIndex
+from core.quality.components.parsed_modules import Definition, get_parsed_module
+
 # Initialize logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -278,16 +284,16 @@ class CodeStructureAnalyzer:
         abs_path = os.path.join(self.project_dir, file_path)
         
         try:
-            with open(abs_path, 'r') as f:
-                content = f.read()
-            
-            # Parse the Python file
-            tree = ast.parse(content)
+            # Parse the Python file (shared with the quality checks)
+            parsed = get_parsed_module(abs_path)
+            content = parsed.source
+            lines = parsed.lines
+            definitions = {definition.node: definition for definition in parsed.definitions}
             
             # Extract file structure
             file_structure = {
                 "path": file_path,
-                "module_docstring": ast.get_docstring(tree),
+                "module_docstring": parsed.docstring,
                 "imports": [],
                 "classes": [],
                 "functions": [],
@@ -320,7 +326,7 @@ class CodeStructureAnalyzer:
                 file_structure["has_logging"] = bool(re.search(pattern, content, re.MULTILINE))
             
             # Extract imports
-            for node in ast.walk(tree):
+            for node in parsed.imports:
                 if isinstance(node, ast.Import):
                     for name in node.names:
                         file_structure["imports"].append({
@@ -339,57 +345,51 @@ class CodeStructureAnalyzer:
                         })
             
             # Extract classes
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_info = {
-                        "name": node.name,
-                        "docstring": ast.get_docstring(node),
-                        "bases": [self._get_base_name(base) for base in node.bases],
-                        "methods": [],
-                        "attributes": [],
-                        "has_proper_docstring": False
-                    }
-                    
-                    # Check for class docstring pattern
-                    if "python" in self.code_patterns and "class_definition" in self.code_patterns["python"]:
-                        pattern = self.code_patterns["python"]["class_definition"]["validation_regex"]
-                        class_def = self._get_node_source(node, content)
-                        class_info["has_proper_docstring"] = bool(re.search(pattern, class_def, re.MULTILINE))
-                    
-                    # Extract methods and attributes
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef):
-                            method_info = self._extract_function_info(item, content)
-                            class_info["methods"].append(method_info)
-                        elif isinstance(item, ast.Assign):
-                            for target in item.targets:
-                                if isinstance(target, ast.Name):
-                                    class_info["attributes"].append({
-                                        "name": target.id,
-                                        "value": self._get_node_source(item.value, content)
-                                    })
-                    
-                    file_structure["classes"].append(class_info)
+            for class_definition in parsed.classes:
+                node = class_definition.node
+                class_info = {
+                    "name": node.name,
+                    "docstring": class_definition.docstring,
+                    "bases": [self._get_base_name(base) for base in node.bases],
+                    "methods": [],
+                    "attributes": [],
+                    "has_proper_docstring": False
+                }
+                
+                # Check for class docstring pattern
+                if "python" in self.code_patterns and "class_definition" in self.code_patterns["python"]:
+                    pattern = self.code_patterns["python"]["class_definition"]["validation_regex"]
+                    class_def = self._get_node_source(node, lines)
+                    class_info["has_proper_docstring"] = bool(re.search(pattern, class_def, re.MULTILINE))
+                
+                # Extract methods and attributes
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef):
+                        method_info = self._extract_function_info(definitions[item], lines)
+                        class_info["methods"].append(method_info)
+                    elif isinstance(item, ast.Assign):
+                        for target in item.targets:
+                            if isinstance(target, ast.Name):
+                                class_info["attributes"].append({
+                                    "name": target.id,
+                                    "value": self._get_node_source(item.value, lines)
+                                })
+                
+                file_structure["classes"].append(class_info)
             
             # Extract functions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and not any(
-                    node.name == method["name"]
-                    for cls in file_structure["classes"]
-                    for method in cls["methods"]
-                ):
-                    function_info = self._extract_function_info(node, content)
+            for definition in parsed.functions:
+                if definition.kind == "function" and isinstance(definition.node, ast.FunctionDef):
+                    function_info = self._extract_function_info(definition, lines)
                     file_structure["functions"].append(function_info)
             
             # Extract constants
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id.isupper():
-                            file_structure["constants"].append({
-                                "name": target.id,
-                                "value": self._get_node_source(node.value, content)
-                            })
+            for name, node in parsed.assignments:
+                if isinstance(node, ast.Assign) and name.isupper():
+                    file_structure["constants"].append({
+                        "name": name,
+                        "value": self._get_node_source(node.value, lines)
+                    })
             
             # Store file structure in report
             self.report["python_analysis"]["files"][file_path] = file_structure
@@ -419,45 +419,46 @@ class CodeStructureAnalyzer:
             self.report["summary"]["files_with_issues"] += 1
             self.report["summary"]["total_issues"] += 1
     
-    def _extract_function_info(self, node: ast.FunctionDef, content: str) -> Dict[str, Any]:
+    def _extract_function_info(self, definition: Definition, lines: LineIndex) -> Dict[str, Any]:
         """
         Extract information about a function or method.
         
         Args:
-            node: The AST node representing the function
-            content: The source code content
+            definition: The parsed function definition
+            lines: Line index of the source code content
             
         Returns:
             A dictionary containing information about the function
         """
+        node = definition.node
         function_info = {
             "name": node.name,
-            "docstring": ast.get_docstring(node),
+            "docstring": definition.docstring,
             "args": [],
             "returns": None,
             "has_proper_docstring": False,
             "has_type_hints": False,
             "body_lines": len(node.body),
-            "complexity": self._calculate_function_complexity(node)
+            "complexity": definition.complexity
         }
         
         # Check for function docstring pattern
         if "python" in self.code_patterns and "function_definition" in self.code_patterns["python"]:
             pattern = self.code_patterns["python"]["function_definition"]["validation_regex"]
-            func_def = self._get_node_source(node, content)
+            func_def = self._get_node_source(node, lines)
             function_info["has_proper_docstring"] = bool(re.search(pattern, func_def, re.MULTILINE))
         
         # Extract arguments
         for arg in node.args.args:
             arg_info = {
                 "name": arg.arg,
-                "annotation": self._get_annotation(arg.annotation, content) if arg.annotation else None
+                "annotation": self._get_annotation(arg.annotation, lines) if arg.annotation else None
             }
             function_info["args"].append(arg_info)
         
         # Extract return type
         if node.returns:
-            function_info["returns"] = self._get_annotation(node.returns, content)
+            function_info["returns"] = self._get_annotation(node.returns, lines)
             function_info["has_type_hints"] = True
         
         # Check if all arguments have type hints
@@ -466,41 +467,18 @@ class CodeStructureAnalyzer:
         
         return function_info
     
-    def _calculate_function_complexity(self, node: ast.FunctionDef) -> int:
-        """
-        Calculate the cyclomatic complexity of a function.
-        
-        Args:
-            node: The AST node representing the function
-            
-        Returns:
-            The cyclomatic complexity of the function
-        """
-        complexity = 1  # Base complexity
-        
-        # Count branches
-        for sub_node in ast.walk(node):
-            if isinstance(sub_node, (ast.If, ast.While, ast.For)):
-                complexity += 1
-            elif isinstance(sub_node, ast.BoolOp) and isinstance(sub_node.op, ast.And):
-                complexity += len(sub_node.values) - 1
-            elif isinstance(sub_node, ast.BoolOp) and isinstance(sub_node.op, ast.Or):
-                complexity += len(sub_node.values) - 1
-        
-        return complexity
-    
-    def _get_annotation(self, node: ast.AST, content: str) -> str:
+    def _get_annotation(self, node: ast.AST, lines: LineIndex) -> str:
         """
         Get the string representation of a type annotation.
         
         Args:
             node: The AST node representing the annotation
-            content: The source code content
+            lines: Line index of the source code content
             
         Returns:
             The string representation of the annotation
         """
-        return self._get_node_source(node, content)
+        return self._get_node_source(node, lines)
     
     def _get_base_name(self, node: ast.AST) -> str:
         """
@@ -519,36 +497,19 @@ class CodeStructureAnalyzer:
         else:
             return str(node)
     
-    def _get_node_source(self, node: ast.AST, content: str) -> str:
+    def _get_node_source(self, node: ast.AST, lines: LineIndex) -> str:
         """
         Get the source code for an AST node.
         
         Args:
             node: The AST node
-            content: The source code content
+            lines: Line index of the source code content
             
         Returns:
             The source code for the node
         """
-        if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
-            lines = content.splitlines()
-            if node.end_lineno > len(lines):
-                return "<<source not available>>"
-            
-            if node.lineno == node.end_lineno:
-                line = lines[node.lineno - 1]
-                return line[node.col_offset:node.end_col_offset]
-            else:
-                result = []
-                for i in range(node.lineno - 1, node.end_lineno):
-                    if i == node.lineno - 1:
-                        result.append(lines[i][node.col_offset:])
-                    elif i == node.end_lineno - 1:
-                        result.append(lines[i][:node.end_col_offset])
-                    else:
-                        result.append(lines[i])
-                return '\n'.join(result)
-        return "<<source not available>>"
+        source = lines.get_node_source(node)
+        return "<<source not available>>" if source is None else source
     
     def _get_expected_structure(self, file_path: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Persistence Benchmark Script
+
+This script measures insert and lookup throughput of the MCP persistence layer
+for the Session and Consent tables. It compares the default SQLite profile
+against the "performance" profile (WAL, synchronous=NORMAL, mmap, single
+writer connection and a separate read-only pool).
+
+Usage:
+    python benchmark_persistence.py
+    python benchmark_persistence.py --rows 5000 --threads 8
+    python benchmark_persistence.py --profile performance --json
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add the MCP server sources to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "services" / "mcp-server" / "src"))
+
+from persistence import database  # noqa: E402
+from persistence.models import Client, Consent, ConsentLevelEnum, Server, Session  # noqa: E402
+
+
+def _run_threaded(func: Callable[[int], None], total: int, threads: int) -> float:
+    """
+    Run ``func`` for ``total`` items split across ``threads`` worker threads.
+
+    Args:
+        func: Function called with the item index
+        total: Total number of items
+        threads: Number of worker threads
+
+    Returns:
+        float: Elapsed wall-clock time in seconds
+    """
+    def worker(offset: int) -> None:
+        for i in range(offset, total, threads):
+            func(i)
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_benchmark(profile: str, rows: int, threads: int, lookups: int) -> Dict[str, Any]:
+    """
+    Benchmark one database profile against a fresh SQLite file.
+
+    Args:
+        profile: Database profile name ("default" or "performance")
+        rows: Number of Session and Consent rows to insert
+        threads: Number of concurrent worker threads
+        lookups: Number of lookups per table
+
+    Returns:
+        Dict[str, Any]: Throughput figures in operations per second
+    """
+    work_dir = tempfile.mkdtemp(prefix="mcp_persistence_bench_")
+    db_path = os.path.join(work_dir, "bench.db")
+
+    try:
+        database.init_db({
+            "database": {
+                "type": "sqlite",
+                "path": db_path,
+                "profile": profile,
+                "pool_size": threads,
+                "read_pool_size": threads
+            }
+        })
+
+        # Seed the parent rows referenced by sessions and consents
+        with database.db_session() as session:
+            client = Client(client_id="bench-client", name="Benchmark Client")
+            server = Server(server_id="bench-server", name="Benchmark Server")
+            session.add_all([client, server])
+            session.flush()
+            client_pk, server_pk = client.id, server.id
+
+        session_ids = [f"session-{uuid.uuid4()}" for _ in range(rows)]
+        consent_ids = [f"consent-{uuid.uuid4()}" for _ in range(rows)]
+        expiration = datetime.utcnow() + timedelta(hours=1)
+
+        def insert_session(i: int) -> None:
+            with database.db_session() as session:
+                session.add(Session(
+                    session_id=session_ids[i],
+                    client_id=client_pk,
+                    username=f"user-{i}",
+                    token=uuid.uuid4().hex,
+                    expiration=expiration
+                ))
+
+        def insert_consent(i: int) -> None:
+            with database.db_session() as session:
+                session.add(Consent(
+                    consent_id=consent_ids[i],
+                    client_id=client_pk,
+                    server_id=server_pk,
+                    operation_pattern=f"tools/execute/tool-{i % 50}",
+                    consent_level=ConsentLevelEnum.BASIC
+                ))
+
+        def lookup_session(_: int) -> None:
+            with database.read_session() as session:
+                session.query(Session).filter_by(session_id=random.choice(session_ids)).first()
+
+        def lookup_consent(_: int) -> None:
+            with database.read_session() as session:
+                session.query(Consent).filter_by(
+                    client_id=client_pk,
+                    server_id=server_pk,
+                    operation_pattern=f"tools/execute/tool-{random.randrange(50)}"
+                ).first()
+
+        timings = {
+            "session_insert": rows / _run_threaded(insert_session, rows, threads),
+            "consent_insert": rows / _run_threaded(insert_consent, rows, threads),
+            "session_lookup": lookups / _run_threaded(lookup_session, lookups, threads),
+            "consent_lookup": lookups / _run_threaded(lookup_consent, lookups, threads)
+        }
+
+        database.get_engine().dispose()
+        database.get_read_engine().dispose()
+
+        return {name: round(ops, 1) for name, ops in timings.items()}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def print_report(results: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Print benchmark results as a table.
+
+    Args:
+        results: Mapping of profile names to throughput figures
+    """
+    metrics = ["session_insert", "consent_insert", "session_lookup", "consent_lookup"]
+    print(f"{'metric (ops/s)':<20}" + "".join(f"{profile:>15}" for profile in results))
+    for metric in metrics:
+        print(f"{metric:<20}" + "".join(f"{results[profile][metric]:>15}" for profile in results))
+
+
+def main() -> int:
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark MCP persistence throughput on SQLite.")
+    parser.add_argument("--profile", choices=["default", "performance", "both"], default="both",
+                        help="Database profile to benchmark (default: both)")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows to insert per table")
+    parser.add_argument("--lookups", type=int, default=5000, help="Lookups per table")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent worker threads")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    profiles: List[str] = ["default", "performance"] if args.profile == "both" else [args.profile]
+    results = {
+        profile: run_benchmark(profile, args.rows, args.threads, args.lookups)
+        for profile in profiles
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark Script
+
+This script measures the cold-start cost of an MCP server application:
+
+- import time, using ``python -X importtime``, with the slowest modules by
+  cumulative time;
+- time to first served request: a fresh uvicorn process is started and the
+  health endpoint is polled until it answers.
+
+Each measurement runs in a new interpreter so nothing is cached between runs.
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --app root --runs 5
+    python benchmark_startup.py --top 20 --json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Keep benchmark runs from writing log files into the source tree
+BENCHMARK_ENV = {**os.environ, "LOG_FILE": os.devnull}
+
+# Application targets: (working directory, module, health path)
+APPS = {
+    "services": (REPO_ROOT / "services" / "mcp-server" / "src", "app", "/debug/health"),
+    "root": (REPO_ROOT, "mcp_server", "/debug/health"),
+    "enhanced": (REPO_ROOT, "enhanced_mcp_server", "/debug/health")
+}
+
+
+def measure_import_time(cwd: Path, module: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        cwd: Working directory of the interpreter
+        module: Module to import
+
+    Returns:
+        Tuple[float, List[Tuple[str, float]]]: Total import time of the module in
+        seconds and the cumulative time of every imported module in seconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True, env={**BENCHMARK_ENV, "STARTUP_PREWARM": "false"}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    # Lines look like "import time:  <self us> | <cumulative us> | <indented module name>"
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(cumulative) / 1e6))
+
+    total = next((seconds for name, seconds in modules if name == module), 0.0)
+    return total, modules
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_request(cwd: Path, module: str, health_path: str, timeout: float) -> float:
+    """
+    Start the application under uvicorn and wait for the first successful request.
+
+    Args:
+        cwd: Working directory of the server process
+        module: Module defining ``app``
+        health_path: Path polled until it returns 200
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        float: Seconds from process start to the first 200 response
+    """
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{health_path}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--port", str(port), "--log-level", "warning"],
+        cwd=cwd, env=BENCHMARK_ENV, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited early:\n{process.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.01)
+        raise RuntimeError(f"No response from {url} within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run_benchmark(app_name: str, runs: int, top: int, timeout: float) -> Dict[str, Any]:
+    """
+    Benchmark the startup of one application.
+
+    Args:
+        app_name: Application target name (see APPS)
+        runs: Number of runs per measurement; medians are reported
+        top: Number of slowest modules to report
+        timeout: Maximum time to wait for the first request in seconds
+
+    Returns:
+        Dict[str, Any]: Median import time, median time to first request and the slowest modules
+    """
+    cwd, module, health_path = APPS[app_name]
+
+    import_times = []
+    slowest: Dict[str, float] = {}
+    for _ in range(runs):
+        total, modules = measure_import_time(cwd, module)
+        import_times.append(total)
+        for name, seconds in modules:
+            slowest[name] = max(seconds, slowest.get(name, 0.0))
+
+    first_request_times = [measure_first_request(cwd, module, health_path, timeout) for _ in range(runs)]
+
+    return {
+        "app": app_name,
+        "import_seconds": round(statistics.median(import_times), 4),
+        "first_request_seconds": round(statistics.median(first_request_times), 4),
+        "slowest_imports": [
+            {"module": name, "cumulative_seconds": round(seconds, 4)}
+            for name, seconds in sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:top]
+        ]
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """
+    Print benchmark results.
+
+    Args:
+        result: Result of run_benchmark
+    """
+    print(f"app:                   {result['app']}")
+    print(f"import time:           {result['import_seconds'] * 1000:.1f} ms")
+    print(f"time to first request: {result['first_request_seconds'] * 1000:.1f} ms")
+    print()
+    print(f"{'module':<50}{'cumulative (ms)':>16}")
+    for entry in result["slowest_imports"]:
+        print(f"{entry['module']:<50}{entry['cumulative_seconds'] * 1000:>16.1f}")
+
+
+def main() -> int:
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark MCP server import time and time to first request.")
+    parser.add_argument("--app", choices=sorted(APPS), default="services",
+                        help="Application to benchmark (default: services)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement; medians are reported")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the first request")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.app, args.runs, args.top, args.timeout)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,6 +23,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 try:
     from core.quality.enforcer import QualityEnforcer
+    from core.quality.components.inventory import get_changed_files
+    from core.quality.components.tool_daemons import enable_daemons
     from core.config.settings import get_config
     HAS_QUALITY_ENFORCER = True
 except ImportError:
@@ -183,7 +185,9 @@ class CodeStandardsEnforcer:
                           tools: Optional[List[str]] = None,
                           include_dirs: Optional[List[str]] = None,
                           exclude_dirs: Optional[List[str]] = None,
-                          report_file: Optional[str] = None) -> Dict[str, Any]:
+                          report_file: Optional[str] = None,
+                          incremental: bool = False,
+                          changed_since: Optional[str] = None) -> Dict[str, Any]:
         """
         Check code quality.
         
@@ -193,6 +197,8 @@ class CodeStandardsEnforcer:
             include_dirs: Optional list of directories to include.
             exclude_dirs: Optional list of directories to exclude.
             report_file: Optional path to the report file.
+            incremental: Whether to reuse cached results for unchanged files.
+            changed_since: Optional git revision; only check the files changed since it.
             
         Returns:
             Dictionary with the check results.
@@ -200,7 +206,8 @@ class CodeStandardsEnforcer:
         if self.enforcer:
             try:
                 logger.info("Using QualityEnforcer for code quality checks")
-                return self._check_with_enforcer(categories, tools, include_dirs, exclude_dirs, report_file)
+                return self._check_with_enforcer(categories, tools, include_dirs, exclude_dirs, report_file,
+                                                 incremental, changed_since)
             except Exception as e:
                 logger.error(f"Error using QualityEnforcer: {e}")
                 logger.info("Falling back to shell script for code quality checks")
@@ -213,7 +220,9 @@ class CodeStandardsEnforcer:
                             tools: Optional[List[str]] = None,
                             include_dirs: Optional[List[str]] = None,
                             exclude_dirs: Optional[List[str]] = None,
-                            report_file: Optional[str] = None) -> Dict[str, Any]:
+                            report_file: Optional[str] = None,
+                            incremental: bool = False,
+                            changed_since: Optional[str] = None) -> Dict[str, Any]:
         """
         Check code quality using the QualityEnforcer.
         
@@ -223,13 +232,20 @@ class CodeStandardsEnforcer:
             include_dirs: Optional list of directories to include.
             exclude_dirs: Optional list of directories to exclude.
             report_file: Optional path to the report file.
+            incremental: Whether to reuse cached results for unchanged files.
+            changed_since: Optional git revision; only check the files changed since it.
             
         Returns:
             Dictionary with the check results.
         """
         # Get files to check
         files_to_check = []
-        if categories:
+        if changed_since:
+            # Files changed since the revision, checked incrementally
+            files_to_check = get_changed_files(changed_since)
+            incremental = True
+            logger.info(f"{len(files_to_check)} files changed since {changed_since}")
+        elif categories:
             for category in categories:
                 files_to_check.extend(self._get_files_by_category(category, include_dirs, exclude_dirs))
         else:
@@ -252,7 +268,10 @@ class CodeStandardsEnforcer:
         
         # Run checks
         results = []
-        if tools:
+        if changed_since and not files_to_check:
+            # Nothing changed; an empty file list would check the whole project
+            pass
+        elif tools:
             for tool in tools:
                 if tool == "black":
                     results.extend(self.enforcer.run_check("black", files_to_check))
@@ -268,20 +287,11 @@ class CodeStandardsEnforcer:
                     logger.warning(f"Unknown tool: {tool}")
         else:
             # Run all checks
-            results = self.enforcer.run_all_checks(files_to_check)
+            results = self.enforcer.run_all_checks(files_to_check, incremental=incremental)
         
         # Generate report
         # Convert QualityCheckResult objects to dictionaries with serializable values
-        serializable_results = []
-        for result in results:
-            result_dict = {}
-            for key, value in result.__dict__.items():
-                # Convert enum values to strings
-                if hasattr(value, 'value'):
-                    result_dict[key] = value.value
-                else:
-                    result_dict[key] = value
-            serializable_results.append(result_dict)
+        serializable_results = [result.to_dict() for result in results]
             
         report = {
             "timestamp": datetime.utcnow().isoformat(),
@@ -614,6 +624,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--include-dirs", type=str, help="Comma-separated list of directories to include")
     parser.add_argument("--exclude-dirs", type=str, help="Comma-separated list of directories to exclude")
     parser.add_argument("--report", type=str, help="Path to the report file")
+    parser.add_argument("--daemons", action="store_true",
+                        help="Run black, flake8, mypy and pylint in persistent daemons")
+    
+    # Options for check only
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse cached results for files that did not change")
+    parser.add_argument("--changed-since", type=str, metavar="REV",
+                        help="Only check files changed since a git revision (implies --incremental)")
     
     # Options for fix only
     parser.add_argument("--interactive", action="store_true", help="Use interactive mode for fixes")
@@ -653,6 +671,9 @@ def main() -> int:
     include_dirs = args.include_dirs.split(",") if args.include_dirs else None
     exclude_dirs = args.exclude_dirs.split(",") if args.exclude_dirs else None
     
+    if args.daemons and HAS_QUALITY_ENFORCER:
+        enable_daemons()
+    
     # Create enforcer
     enforcer = CodeStandardsEnforcer()
     
@@ -664,7 +685,9 @@ def main() -> int:
             tools=tools,
             include_dirs=include_dirs,
             exclude_dirs=exclude_dirs,
-            report_file=args.report
+            report_file=args.report,
+            incremental=args.incremental,
+            changed_since=args.changed_since
         )
         
         # Print summary
@@ -1,20 +1,24 @@
+import json
 import logging
 import time
 import platform
 import os
 from typing import Optional
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-import requests
 
 # Import dependency injection container
 from di.containers import Container
 from services.prompt_processor import PromptProcessor
 from services.example_service import ExampleService
+from services.prewarm import Prewarmer
+from services.progress_pipeline import close_progress_pipelines
+from services.tracing import configure_tracing, new_trace_id
 
-# Create and configure the DI container
+# Create the DI container; providers are instantiated on first use or by the pre-warm hook
 container = Container()
-container.init_resources()
 
 # Get logger from container
 logger = container.logger()
@@ -26,9 +30,43 @@ app = FastAPI(title="MINTYcoder MCP Server")
 # Register container with FastAPI
 app.container = container
 
+# Span timings for host, server, client and providers (no-op unless enabled)
+tracer = configure_tracing(container.config().get("tracing", {}))
+
+@app.middleware("http")
+async def trace_http_requests(request: Request, call_next):
+    """Time each HTTP request as a span and return its trace ID."""
+    if not tracer.enabled:
+        return await call_next(request)
+    
+    trace_id = request.headers.get("x-trace-id") or new_trace_id()
+    with tracer.span("http.request", trace_id=trace_id):
+        response = await call_next(request)
+    response.headers["X-Trace-Id"] = trace_id
+    return response
+
+# First-use initialization deferred from import time, run in the background after startup
+startup_config = container.config().get("startup", {})
+prewarmer = Prewarmer(logger, delay=startup_config.get("prewarm_delay", 0.0))
+prewarmer.add_imports("services.llm_client", "services.llm_scheduler", "services.response_cache")
+prewarmer.add("async_llm_client", container.async_llm_client)
+prewarmer.add("llm_scheduler", container.llm_scheduler)
+prewarmer.add("llm_response_cache", container.llm_response_cache)
+prewarmer.add("prompt_processor", container.prompt_processor)
+prewarmer.add("example_service", container.example_service)
+
+@app.on_event("startup")
+async def start_prewarm():
+    """Initialize container resources and start pre-warming without delaying startup."""
+    container.init_resources()
+    if startup_config.get("prewarm", True):
+        prewarmer.start()
+
 # Define request and response data models
 class InferRequest(BaseModel):
     prompt: str
+    stream: bool = False
+    priority: str = "interactive"
 
 class InferResponse(BaseModel):
     answer: str
@@ -40,28 +78,84 @@ def get_prompt_processor() -> PromptProcessor:
 
 # Dependency to get the LLM client
 def get_llm_client():
-    return container.llm_client()
+    return container.async_llm_client()
+
+# Dependency to get the LLM request scheduler
+def get_llm_scheduler():
+    return container.llm_scheduler()
+
+# Dependency to get the LLM response cache (None when disabled)
+def get_response_cache():
+    return container.llm_response_cache()
 
 # Dependency to get the example service
 def get_example_service() -> ExampleService:
     return container.example_service()
 
+def _sse_event(data: dict, event: Optional[str] = None) -> str:
+    """Format a server-sent event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+async def _stream_answer(llm_scheduler, model: str, llm_query: str, client_id: str, priority: str,
+                         response_cache=None):
+    """Relay LLM tokens to the client as server-sent events."""
+    try:
+        key = response_cache.make_key(model, llm_query) if response_cache else None
+        cached = response_cache.get(key) if response_cache else None
+        if cached is not None:
+            yield _sse_event({"token": cached})
+        else:
+            tokens = []
+            async for token in llm_scheduler.stream(llm_query, model=model, client_id=client_id, priority=priority):
+                tokens.append(token)
+                yield _sse_event({"token": token})
+            if response_cache:
+                response_cache.put(key, "".join(tokens).strip(), model)
+        yield _sse_event({}, event="done")
+    except Exception as e:
+        logger.error(f"LLM inference error: {str(e)}")
+        yield _sse_event({"error": f"LLM inference error: {str(e)}"}, event="error")
+
 @app.post("/mcp/infer", response_model=InferResponse)
-def mcp_infer(
+async def mcp_infer(
     request: InferRequest,
+    http_request: Request,
     prompt_processor: PromptProcessor = Depends(get_prompt_processor),
-    llm_client = Depends(get_llm_client)
+    llm_client = Depends(get_llm_client),
+    llm_scheduler = Depends(get_llm_scheduler),
+    response_cache = Depends(get_response_cache)
 ):
     """
     Main inference endpoint: takes a prompt and either handles it via tools or LLM.
+    
+    With ``stream`` set, the LLM answer is returned as server-sent events: one
+    ``data: {"token": ...}`` event per fragment, followed by ``event: done``.
+    Streamed and non-streamed requests go through the LLM scheduler;
+    ``priority`` selects the "interactive" (default) or "batch" class.
     """
+    if request.priority not in ("interactive", "batch"):
+        raise HTTPException(status_code=422, detail=f"Unknown priority class: {request.priority}")
+    
     user_prompt = request.prompt
-    llm_query, tool_output = prompt_processor.process(user_prompt)
+    # Prompt processing may run a shell command, so keep it off the event loop
+    llm_query, tool_output = await run_in_threadpool(prompt_processor.process, user_prompt)
     
     if llm_query is not None:
-        # Query the LLM using the injected LLM client
+        client_id = http_request.client.host if http_request.client else "anonymous"
+        if request.stream:
+            return StreamingResponse(
+                _stream_answer(llm_scheduler, llm_client.model, llm_query, client_id, request.priority, response_cache),
+                media_type="text/event-stream"
+            )
+        
+        # Query the LLM through the scheduler; identical prompts are served from the cache
+        generate = lambda: llm_scheduler.submit(llm_query, client_id=client_id, priority=request.priority)
         try:
-            answer_text = llm_client.generate(llm_query)
+            if response_cache:
+                answer_text = await response_cache.get_or_generate(llm_client.model, llm_query, generate)
+            else:
+                answer_text = await generate()
             return {"answer": answer_text}
         except Exception as e:
             logger.error(f"LLM inference error: {str(e)}")
@@ -72,20 +166,68 @@ def mcp_infer(
         logger.info(f"Returning shell command output, length: {len(tool_output or '')}")
         return {"answer": "Command executed.", "tool_output": tool_output}
 
+@app.on_event("shutdown")
+async def close_llm_client():
+    """Stop the LLM scheduler and release pooled LLM server connections."""
+    await container.llm_scheduler().close()
+    await container.async_llm_client().aclose()
+
+@app.on_event("shutdown")
+async def close_progress_delivery():
+    """Deliver progress notifications still queued by the MCP host and servers."""
+    await run_in_threadpool(close_progress_pipelines)
+
 # Add debugging endpoints
 @app.get("/debug/health")
 def health_check():
     """
     Health check endpoint to verify the server is running
     """
-    return {"status": "healthy", "timestamp": time.time()}
+    return {"status": "healthy", "timestamp": time.time(), "prewarm": prewarmer.status["state"]}
+
+@app.get("/debug/startup")
+def startup_status():
+    """
+    Debug endpoint reporting the state and step durations of the pre-warm hook
+    """
+    return prewarmer.get_status()
 
 @app.get("/debug/llm-server-status")
 async def check_llm_connection(llm_client = Depends(get_llm_client)):
     """
     Debug endpoint to check connection to LLM Server
     """
-    return llm_client.check_connection()
+    return await llm_client.check_connection()
+
+@app.get("/debug/llm-scheduler-stats")
+def llm_scheduler_stats(llm_scheduler = Depends(get_llm_scheduler)):
+    """
+    Debug endpoint reporting LLM scheduler queue depths and batching counters
+    """
+    return llm_scheduler.get_stats()
+
+@app.get("/debug/llm-cache-stats")
+def llm_cache_stats(response_cache = Depends(get_response_cache)):
+    """
+    Debug endpoint reporting LLM response cache hit rates
+    """
+    if response_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **response_cache.get_stats()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Span duration histograms in the Prometheus text exposition format
+    """
+    return PlainTextResponse(tracer.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/debug/traces")
+def recent_traces(trace_id: Optional[str] = None):
+    """
+    Debug endpoint listing recently recorded spans, optionally for one trace
+    """
+    return {"enabled": tracer.enabled, "spans": tracer.recent_spans(trace_id)}
 
 @app.get("/debug/system-info")
 def system_info():
@@ -124,7 +266,50 @@ def example_process(data: str, example_service: ExampleService = Depends(get_exa
     """
     return {"result": example_service.process_data(data)}
 
-if __name__ == "__main__":
+def serve():
+    """
+    Run the server under uvicorn.
+    
+    With ``server.workers`` greater than 1 uvicorn starts that many worker
+    processes, each importing this module. Host state is then shared through
+    the configured state store; for the shared_memory backend a state server
+    is started here, before the workers, unless an address is configured.
+    """
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    
+    config = container.config()
+    server_config = config.get("server", {})
+    state_config = config.get("state", {})
+    host = server_config.get("host", "0.0.0.0")
+    port = server_config.get("port", 8000)
+    workers = server_config.get("workers", 1)
+    
+    state_server = None
+    if workers > 1:
+        backend = state_config.get("backend", "memory")
+        if backend == "memory":
+            logger.warning(
+                "Running %d workers with the memory state backend; sessions and subscriptions "
+                "are not shared between workers (set STATE_BACKEND to sqlite or shared_memory)",
+                workers
+            )
+        elif backend == "shared_memory" and not state_config.get("shared_memory_address"):
+            from services.state_store import start_state_server
+            
+            # Workers read the state server's address from the environment
+            state_server, authkey = start_state_server(authkey=os.environ.get("STATE_SHARED_MEMORY_AUTHKEY"))
+            state_host, state_port = state_server.address
+            os.environ["STATE_SHARED_MEMORY_ADDRESS"] = f"{state_host}:{state_port}"
+            os.environ["STATE_SHARED_MEMORY_AUTHKEY"] = authkey
+            logger.info(f"Started state server on {state_host}:{state_port}")
+        
+        logger.info(f"Starting {workers} workers on {host}:{port}")
+        uvicorn.run("app:app", host=host, port=port, workers=workers)
+    else:
+        uvicorn.run(app, host=host, port=port)
+    
+    if state_server is not None:
+        state_server.shutdown()
+
+if __name__ == "__main__":
+    serve()
\ No newline at end of file
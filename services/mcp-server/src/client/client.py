@@ -22,6 +22,8 @@ from .error_handler import (
     ErrorCode, ErrorCategory, create_error_response, validate_request
 )
 
+from services.tracing import get_tracer, inject_trace_id, traced
+
 from .interfaces import IClient, IToolProxy, IResourceSubscriber, ICapabilityNegotiator
 from .tool_proxy import ToolProxyManager
 from .resource_subscriber import ResourceSubscriberManager
@@ -63,6 +65,9 @@ class MCPClient(IClient):
         self.logger = logger
         self.config = config
         
+        # Span timings (no-op unless tracing is enabled)
+        self.tracer = get_tracer()
+        
         # Initialize client ID
         self.client_id = config.get("mcp", {}).get("client_id", f"client-{uuid.uuid4()}")
         
@@ -300,6 +305,7 @@ class MCPClient(IClient):
         
         return notification
     
+    @traced("client.send_request")
     def send_request_to_server(self, server_id: str, method: str, params: Dict[str, Any], request_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Send a request to a server using the SDK's transport mechanisms.
@@ -335,7 +341,8 @@ class MCPClient(IClient):
         
         # Create the JSON-RPC request
         try:
-            request = self.create_jsonrpc_request(method, params, request_id)
+            with self.tracer.span("client.serialization"):
+                request = inject_trace_id(self.create_jsonrpc_request(method, params, request_id))
         except ValidationError as e:
             # Add server_id to the error data
             e.data["server_id"] = server_id
@@ -366,7 +373,8 @@ class MCPClient(IClient):
                         data={"server_id": server_id, "method": method, "request_id": request.get("id")}
                     )
                 
-                validation_result = JsonRpc.validate_response(response)
+                with self.tracer.span("client.validation"):
+                    validation_result = JsonRpc.validate_response(response)
                 if not validation_result["valid"]:
                     error_details = validation_result.get("errors", ["Unknown validation error"])
                     self.logger.error(f"Invalid JSON-RPC response: {error_details}")
@@ -13,13 +13,11 @@ from .providers import (
     LLMClientProvider,
     ToolProvider,
     ResourceProvider,
-    MCPComponentProvider
+    MCPComponentProvider,
+    StateStoreProvider
 )
 from services.prompt_processor import PromptProcessor
 from services.example_service import ExampleService
-from host.host import MCPHost
-from client.client import MCPClient
-from server.server import MCPServer
 
 
 class Container(containers.DeclarativeContainer):
@@ -61,11 +59,37 @@ class Container(containers.DeclarativeContainer):
         logger=logger
     )
     
+    async_llm_client = providers.Singleton(
+        LLMClientProvider.get_async_client,
+        config=config,
+        logger=logger
+    )
+    
+    llm_scheduler = providers.Singleton(
+        LLMClientProvider.get_scheduler,
+        config=config,
+        logger=logger,
+        client=async_llm_client
+    )
+    
+    llm_response_cache = providers.Singleton(
+        LLMClientProvider.get_response_cache,
+        config=config,
+        logger=logger
+    )
+    
+    # Host state shared between worker processes
+    state_store = providers.Singleton(
+        StateStoreProvider.get_state_store,
+        config=config
+    )
+    
     # MCP Components
     mcp_host = providers.Singleton(
         MCPComponentProvider.get_host,
         logger=logger,
-        config=config
+        config=config,
+        state_store=state_store
     )
     
     mcp_client = providers.Singleton(
@@ -80,7 +104,8 @@ class Container(containers.DeclarativeContainer):
         server_id=config.provided.mcp.server_id,
         config=config,
         logger=logger,
-        host=mcp_host
+        host=mcp_host,
+        state_store=state_store
     )
     
     # Services
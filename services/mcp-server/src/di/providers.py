@@ -10,9 +10,10 @@ import os
 import uuid
 from typing import Dict, Any, Optional
 
-import requests
 from dependency_injector.providers import Factory, Singleton, Configuration
 
+from services.logging_pipeline import JsonFormatter, SamplingFilter, attach_async_handlers
+
 
 class ConfigProvider:
     """Provider for configuration settings."""
@@ -31,20 +32,83 @@ class ConfigProvider:
                 'port': os.environ.get('LLM_SERVER_PORT', '11434'),
                 'model': os.environ.get('LLM_MODEL', 'deepseek-coder:6.7b'),
                 'timeout': int(os.environ.get('LLM_TIMEOUT', '120')),
+                'connect_timeout': float(os.environ.get('LLM_CONNECT_TIMEOUT', '5')),
+                'max_connections': int(os.environ.get('LLM_MAX_CONNECTIONS', '20')),
+                'max_concurrency_per_model': int(os.environ.get('LLM_MAX_CONCURRENCY_PER_MODEL', '2')),
+            },
+            'llm_cache': {
+                'enabled': os.environ.get('LLM_CACHE_ENABLED', 'true').lower() == 'true',
+                'max_entries': int(os.environ.get('LLM_CACHE_MAX_ENTRIES', '1000')),
+                'ttl': int(os.environ.get('LLM_CACHE_TTL', '3600')),
+                'path': os.environ.get('LLM_CACHE_PATH') or None,
+            },
+            'llm_scheduler': {
+                'batch_window': float(os.environ.get('LLM_BATCH_WINDOW_MS', '10')) / 1000,
+                'max_batch_size': int(os.environ.get('LLM_MAX_BATCH_SIZE', '8')),
+                'short_prompt_chars': int(os.environ.get('LLM_SHORT_PROMPT_CHARS', '512')),
             },
             'logging': {
                 'level': os.environ.get('LOG_LEVEL', 'INFO'),
                 'file': os.environ.get('LOG_FILE', 'mcp_debug.log'),
+                'format': os.environ.get('LOG_FORMAT', 'text'),
+                'async': os.environ.get('LOG_ASYNC', 'true').lower() == 'true',
+                'queue_size': int(os.environ.get('LOG_QUEUE_SIZE', '10000')),
+                'info_sample_rate': float(os.environ.get('LOG_INFO_SAMPLE_RATE', '1.0')),
             },
             'server': {
                 'host': os.environ.get('SERVER_HOST', '0.0.0.0'),
                 'port': int(os.environ.get('SERVER_PORT', '8000')),
+                'workers': int(os.environ.get('SERVER_WORKERS', '1')),
+            },
+            'state': {
+                'backend': os.environ.get('STATE_BACKEND', 'memory'),
+                'sqlite_path': os.environ.get('STATE_SQLITE_PATH', 'mcp_state.db'),
+                'shared_memory_address': os.environ.get('STATE_SHARED_MEMORY_ADDRESS'),
+                'generation_check_interval': float(os.environ.get('STATE_GENERATION_CHECK_INTERVAL', '1.0')),
             },
             'mcp': {
                 'server_id': os.environ.get('MCP_SERVER_ID', 'default'),
                 'host_enabled': os.environ.get('MCP_HOST_ENABLED', 'true').lower() == 'true',
                 'client_enabled': os.environ.get('MCP_CLIENT_ENABLED', 'true').lower() == 'true',
                 'server_enabled': os.environ.get('MCP_SERVER_ENABLED', 'true').lower() == 'true',
+            },
+            'startup': {
+                'prewarm': os.environ.get('STARTUP_PREWARM', 'true').lower() == 'true',
+                'prewarm_delay': float(os.environ.get('STARTUP_PREWARM_DELAY', '0')),
+            },
+            'tracing': {
+                'enabled': os.environ.get('TRACING_ENABLED', 'false').lower() == 'true',
+            },
+            'progress': {
+                'async_delivery': os.environ.get('PROGRESS_ASYNC_DELIVERY', 'true').lower() == 'true',
+                'max_updates_per_second': float(os.environ.get('PROGRESS_MAX_UPDATES_PER_SECOND', '5')),
+                'max_queue_per_client': int(os.environ.get('PROGRESS_MAX_QUEUE_PER_CLIENT', '100')),
+            },
+            'tool_execution': {
+                'max_workers': int(os.environ.get('TOOL_MAX_WORKERS', '2')),
+                'max_queue_per_client': int(os.environ.get('TOOL_MAX_QUEUE_PER_CLIENT', '16')),
+                'queue_timeout': float(os.environ.get('TOOL_QUEUE_TIMEOUT', '300')),
+                'limits': {
+                    'cpu_seconds': int(os.environ.get('TOOL_JOB_CPU_SECONDS', '60')),
+                    'memory_mb': int(os.environ.get('TOOL_JOB_MEMORY_MB', '1024')),
+                    'max_file_size_mb': int(os.environ.get('TOOL_JOB_MAX_FILE_SIZE_MB', '256')),
+                    'cpu_quota': float(os.environ.get('TOOL_JOB_CPU_QUOTA', '0')) or None,
+                    'cgroup_root': os.environ.get('TOOL_JOB_CGROUP_ROOT') or None,
+                },
+            },
+            'database': {
+                'type': os.environ.get('DB_TYPE', 'sqlite'),
+                'path': os.environ.get('DB_PATH', 'mcp_data.db'),
+                'profile': os.environ.get('DB_PROFILE', 'default'),
+            },
+            'resources': {
+                'file_base_path': os.environ.get('RESOURCE_BASE_PATH') or None,
+                'cache': {
+                    'max_size': int(os.environ.get('RESOURCE_CACHE_MAX_SIZE', '100')),
+                    'ttl': int(os.environ.get('RESOURCE_CACHE_TTL', '300')),
+                    'persistent': os.environ.get('RESOURCE_CACHE_PERSISTENT', 'false').lower() == 'true',
+                    'persistent_ttl': int(os.environ.get('RESOURCE_CACHE_PERSISTENT_TTL', '86400')),
+                },
             }
         }
 
@@ -57,6 +121,9 @@ class LoggingProvider:
         """
         Configure and return a logger.
         
+        Unless ``logging.async`` is disabled, the file and console handlers are
+        run on a background listener thread (see services.logging_pipeline).
+        
         Args:
             name: Logger name
             config: Logging configuration
@@ -64,28 +131,48 @@ class LoggingProvider:
         Returns:
             logging.Logger: Configured logger
         """
-        log_level = getattr(logging, config['logging']['level'])
-        log_file = config['logging']['file']
+        logging_config = config['logging']
+        log_level = getattr(logging, logging_config['level'])
+        log_file = logging_config['file']
         
         logger = logging.getLogger(name)
         logger.setLevel(log_level)
         
-        # Clear existing handlers to avoid duplicates
+        # Clear existing handlers and sampling filters to avoid duplicates
         if logger.handlers:
             logger.handlers.clear()
+        for existing in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+            logger.removeFilter(existing)
             
         # Add handlers
         file_handler = logging.FileHandler(log_file)
         console_handler = logging.StreamHandler()
         
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        if logging_config.get('format', 'text') == 'json':
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        sample_rate = logging_config.get('info_sample_rate', 1.0)
+        sampling_filter = SamplingFilter(sample_rate) if sample_rate < 1.0 else None
+        
+        if logging_config.get('async', True):
+            # Handlers run on a listener thread; request threads only enqueue
+            attach_async_handlers(
+                logger,
+                [file_handler, console_handler],
+                queue_size=logging_config.get('queue_size', 10000),
+                sampling_filter=sampling_filter
+            )
+        else:
+            if sampling_filter is not None:
+                logger.addFilter(sampling_filter)
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
         
         return logger
 
@@ -112,6 +199,83 @@ class LLMClientProvider:
             timeout=config['llm_server']['timeout'],
             logger=logger
         )
+    
+    @staticmethod
+    def get_async_client(config: Dict[str, Any], logger: logging.Logger):
+        """
+        Create and return an async, pooled LLM client.
+        
+        Args:
+            config: Configuration dictionary
+            logger: Logger instance
+            
+        Returns:
+            AsyncLLMClient: Non-blocking client for interacting with the LLM server
+        """
+        from services.llm_client import AsyncLLMClient
+        
+        llm_config = config['llm_server']
+        return AsyncLLMClient(
+            host=llm_config['host'],
+            port=llm_config['port'],
+            model=llm_config['model'],
+            timeout=llm_config['timeout'],
+            logger=logger,
+            max_connections=llm_config.get('max_connections', 20),
+            # Generations go through the LLM scheduler, which enforces max_concurrency_per_model
+            max_concurrency_per_model=None,
+            connect_timeout=llm_config.get('connect_timeout', 5.0)
+        )
+    
+    @staticmethod
+    def get_scheduler(config: Dict[str, Any], logger: logging.Logger, client):
+        """
+        Create and return the LLM request scheduler.
+        
+        Args:
+            config: Configuration dictionary
+            logger: Logger instance
+            client: Async LLM client used as the scheduler backend
+            
+        Returns:
+            LLMScheduler: Scheduler queueing requests in front of the client
+        """
+        from services.llm_scheduler import LLMScheduler
+        
+        scheduler_config = config.get('llm_scheduler', {})
+        return LLMScheduler(
+            backend=client,
+            logger=logger,
+            max_concurrency_per_model=config['llm_server'].get('max_concurrency_per_model', 2),
+            batch_window=scheduler_config.get('batch_window', 0.01),
+            max_batch_size=scheduler_config.get('max_batch_size', 8),
+            short_prompt_chars=scheduler_config.get('short_prompt_chars', 512)
+        )
+    
+    @staticmethod
+    def get_response_cache(config: Dict[str, Any], logger: logging.Logger):
+        """
+        Create and return the LLM response cache.
+        
+        Args:
+            config: Configuration dictionary
+            logger: Logger instance
+            
+        Returns:
+            Optional[ResponseCache]: Response cache, or None if caching is disabled
+        """
+        from services.response_cache import ResponseCache
+        
+        cache_config = config.get('llm_cache', {})
+        if not cache_config.get('enabled', True):
+            return None
+        
+        return ResponseCache(
+            logger=logger,
+            max_entries=cache_config.get('max_entries', 1000),
+            ttl=cache_config.get('ttl', 3600),
+            persistent_path=cache_config.get('path')
+        )
 
 
 class LLMClient:
@@ -157,6 +321,8 @@ class LLMClient:
         """
         self.logger.info(f"Querying {self.model} with prompt length: {len(prompt)}")
         
+        import requests
+        
         payload = {"model": self.model, "prompt": prompt}
         
         try:
@@ -180,6 +346,8 @@ class LLMClient:
         Returns:
             Dict[str, Any]: Connection status information
         """
+        import requests
+        
         try:
             response = requests.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
@@ -216,9 +384,27 @@ class ResourceProvider:
         from server.resources import FileResourceProvider
         
         # Get base path from config or use default
-        base_path = config.get('resources', {}).get('file_base_path', None)
+        resources_config = config.get('resources', {})
+        base_path = resources_config.get('file_base_path', None)
+        cache_config = resources_config.get('cache', {})
         
-        return FileResourceProvider(base_path=base_path)
+        if cache_config.get('persistent', False):
+            # The Resource table is the second cache tier; share it across replicas
+            from persistence import init_db
+            
+            try:
+                init_db(config)
+            except Exception as e:
+                logger.warning(f"Persistent resource cache disabled: {str(e)}")
+                cache_config = dict(cache_config, persistent=False)
+        
+        return FileResourceProvider(
+            base_path=base_path,
+            config={
+                'server_id': config.get('mcp', {}).get('server_id', 'default'),
+                'cache': cache_config
+            }
+        )
 
 
 class ToolProvider:
@@ -236,17 +422,37 @@ class ToolProvider:
         return execute_shell_command
 
 
+class StateStoreProvider:
+    """Provider for the shared state store."""
+    
+    @staticmethod
+    def get_state_store(config: Dict[str, Any]):
+        """
+        Create and return the state store holding host state shared between workers.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            StateStore: State store selected by ``state.backend``
+        """
+        from services.state_store import create_state_store
+        
+        return create_state_store(config.get('state', {}))
+
+
 class MCPComponentProvider:
     """Provider for MCP components."""
     
     @staticmethod
-    def get_host(config: Dict[str, Any], logger: logging.Logger):
+    def get_host(config: Dict[str, Any], logger: logging.Logger, state_store=None):
         """
         Create and return an MCP Host component using SDK factory methods.
         
         Args:
             config: Configuration dictionary
             logger: Logger instance
+            state_store: Optional state store for sessions, consents and subscriptions
             
         Returns:
             MCPHost: Host component for MCP
@@ -295,7 +501,8 @@ class MCPComponentProvider:
             mcp_host=mcp_host,
             auth_provider=auth_provider,
             context_manager=context_manager,
-            consent_manager=consent_manager
+            consent_manager=consent_manager,
+            state_store=state_store
         )
     
     @staticmethod
@@ -350,7 +557,7 @@ class MCPComponentProvider:
         return client
     
     @staticmethod
-    def get_server(server_id: str, config: Dict[str, Any], logger: logging.Logger, host=None):
+    def get_server(server_id: str, config: Dict[str, Any], logger: logging.Logger, host=None, state_store=None):
         """
         Create and return an MCP Server component using SDK factory methods.
         
@@ -359,6 +566,7 @@ class MCPComponentProvider:
             config: Configuration dictionary
             logger: Logger instance
             host: Optional MCPHost instance to register with
+            state_store: Optional state store used to invalidate tool metadata across workers
             
         Returns:
             MCPServer: Server component for MCP
@@ -377,7 +585,8 @@ class MCPComponentProvider:
             server_id=server_id,
             logger=logger,
             config=config,
-            mcp_server=mcp_server
+            mcp_server=mcp_server,
+            state_store=state_store
         )
         
         # Register tools
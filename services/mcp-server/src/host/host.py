@@ -15,6 +15,10 @@ from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 from enum import Enum
 from mcp import Host, Client, Server, Consent, Context, Authentication, JsonRpc
 
+from services.progress_pipeline import ProgressPipeline
+from services.state_store import create_state_store
+from services.tracing import get_tracer, traced_request
+
 class ConsentLevel(Enum):
     """
     Consent levels for operations.
@@ -74,7 +78,7 @@ class MCPHost:
     """
     def __init__(self, logger: logging.Logger, config: Dict[str, Any],
                  mcp_host=None, auth_provider=None, context_manager=None, consent_manager=None,
-                 authorization_provider=None):
+                 authorization_provider=None, state_store=None):
         """
         Initialize the MCP Host.
         
@@ -85,6 +89,8 @@ class MCPHost:
             auth_provider: Optional pre-initialized Authentication provider
             context_manager: Optional pre-initialized Context manager
             consent_manager: Optional pre-initialized Consent manager
+            state_store: Optional state store holding sessions, consents and subscriptions;
+                created from the "state" configuration if not given
         """
         self.logger = logger
         self.config = config
@@ -106,9 +112,14 @@ class MCPHost:
         self.servers = {}
         self.clients = {}
         self.contexts = {}
-        self.consent_registry = {}
+        # Sessions, consents and subscriptions live in the state store so that
+        # several worker processes can share them. Values read from it are
+        # copies and must be assigned back after modification.
+        self.state_store = state_store if state_store is not None else create_state_store(config.get("state", {}))
+        self.consent_registry = self.state_store.namespace("consents")
+        self.subscription_registry = self.state_store.namespace("subscriptions")
         # Enhanced session management
-        self.user_sessions = {}
+        self.user_sessions = self.state_store.namespace("sessions")
         self.event_subscribers = {}
         self.token_expiration = auth_config.get("token_expiration", 3600)  # Default: 1 hour
         self.session_cleanup_interval = auth_config.get("session_cleanup_interval", 300)  # Default: 5 minutes
@@ -126,6 +137,21 @@ class MCPHost:
         self.batch_processing_enabled = True
         self.progress_enabled = True  # Enable progress reporting by default
         
+        # Span timings (no-op unless tracing is enabled)
+        self.tracer = get_tracer()
+        
+        # Progress notifications are coalesced per operation, rate-limited and
+        # delivered asynchronously from a bounded queue per client
+        progress_config = config.get("progress", {})
+        self.progress_pipeline = None
+        if progress_config.get("async_delivery", True):
+            self.progress_pipeline = ProgressPipeline(
+                self._deliver_progress_notification,
+                logger,
+                max_updates_per_second=progress_config.get("max_updates_per_second", 5.0),
+                max_queue_per_client=progress_config.get("max_queue_per_client", 100)
+            )
+        
         # Map operations to required permissions
         self.operation_permissions = {
             "capabilities/list": Permission.READ,
@@ -148,6 +174,16 @@ class MCPHost:
         self.logger.info(f"Authorization provider initialized with role-based access control")
         self.logger.info(f"Authentication provider initialized with token expiration: {self.token_expiration}s")
         
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Shut the host down, delivering pending progress notifications.
+        
+        Args:
+            timeout: Maximum time to wait for pending progress notifications in seconds
+        """
+        if self.progress_pipeline is not None:
+            self.progress_pipeline.close(timeout)
+        
     # ===== Server Management =====
     
     def register_server(self, server_id: str, server_info: Dict[str, Any], server_instance=None) -> bool:
@@ -412,7 +448,7 @@ class MCPHost:
         # Clean up client resources
         if client_id in self.contexts:
             # Unsubscribe from all subscriptions
-            for subscription_id in self.contexts[client_id]["subscriptions"]:
+            for subscription_id in list(self.contexts[client_id]["subscriptions"]):
                 self._remove_subscription(client_id, subscription_id)
                 
             # Remove client context
@@ -453,6 +489,7 @@ class MCPHost:
         
     # ===== Request Routing =====
     
+    @traced_request("host.route_request")
     def route_request(self, server_id: str, request: Dict[str, Any], client_id: Optional[str] = None,
                      auth_token: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -468,7 +505,8 @@ class MCPHost:
             Optional[Dict[str, Any]]: JSON-RPC response from the server or None if routing failed
         """
         # Validate the incoming request before routing
-        validation_result = JsonRpc.validate_request(request)
+        with self.tracer.span("host.validation"):
+            validation_result = JsonRpc.validate_request(request)
         if not validation_result["valid"]:
             error_details = validation_result.get("errors", ["Unknown validation error"])
             self.logger.error(f"Invalid JSON-RPC request received for routing: {error_details}")
@@ -514,7 +552,9 @@ class MCPHost:
                 session_id = self.contexts[client_id]["active_session"]
                 
                 # Validate the session with the token
-                if not self.validate_session(session_id, auth_token):
+                with self.tracer.span("host.auth"):
+                    session_valid = self.validate_session(session_id, auth_token)
+                if not session_valid:
                     self.logger.warning(f"Authentication failed for client {client_id}, method: {method}")
                     return JsonRpc.create_error_response(
                         request.get("id"),
@@ -523,10 +563,12 @@ class MCPHost:
                         "Invalid or expired authentication token"
                     )
                     
-                self.logger.debug(f"Request authenticated for client {client_id}, session {session_id}")
+                self.logger.debug("Request authenticated for client %s, session %s", client_id, session_id)
                 
                 # Authorize the request based on user role and required permissions
-                if not self._authorize_operation(session_id, method):
+                with self.tracer.span("host.auth"):
+                    authorized = self._authorize_operation(session_id, method)
+                if not authorized:
                     self.logger.warning(f"Authorization failed for client {client_id}, method: {method}")
                     
                     # Log the authorization violation
@@ -539,7 +581,7 @@ class MCPHost:
                         f"User does not have permission to perform operation: {method}"
                     )
                     
-                self.logger.debug(f"Request authorized for client {client_id}, method: {method}")
+                self.logger.debug("Request authorized for client %s, method: %s", client_id, method)
             else:
                 # If no active session but authentication is required
                 required_level = self._get_required_consent_level(method)
@@ -552,8 +594,10 @@ class MCPHost:
                         f"Operation {method} requires authentication"
                     )
             
-        self.logger.info(f"Routing request to server: {server_id}, method: {method}" +
-                        (f" for client {client_id}" if client_id else ""))
+        if client_id:
+            self.logger.info("Routing request to server: %s, method: %s for client %s", server_id, method, client_id)
+        else:
+            self.logger.info("Routing request to server: %s, method: %s", server_id, method)
         
         # Enhanced consent verification in the request processing pipeline
         if client_id is not None:
@@ -561,7 +605,9 @@ class MCPHost:
             required_level = self._get_required_consent_level(method)
             
             # Check if the client has sufficient consent
-            if not self._check_operation_consent(client_id, server_id, method):
+            with self.tracer.span("host.consent"):
+                consent_granted = self._check_operation_consent(client_id, server_id, method)
+            if not consent_granted:
                 self.logger.warning(f"Operation not authorized: {method} for client {client_id}, required consent level: {required_level.name}")
                 
                 # Create detailed error response using MCP SDK
@@ -583,7 +629,7 @@ class MCPHost:
                 self.contexts[client_id]["server_connections"].add(server_id)
                 
             # Log successful consent verification
-            self.logger.debug(f"Consent verified for client {client_id} on server {server_id} for operation {method}")
+            self.logger.debug("Consent verified for client %s on server %s for operation %s", client_id, server_id, method)
         try:
             # Add authentication and authorization information to client context if available
             client_context = None
@@ -606,31 +652,34 @@ class MCPHost:
                         required_permission = self._get_required_permission(method)
                         client_context["authorized"] = self._has_permission(session_id, required_permission)
                         
-            # Use MCP SDK to route the request with enhanced context
-            # Pass authentication context to the SDK if supported
-            if hasattr(self.mcp_host, "route_authenticated_request") and client_context and client_context.get("authenticated"):
-                response = self.mcp_host.route_authenticated_request(server_id, request, client_context)
-            else:
-                response = self.mcp_host.route_request(server_id, request, client_id)
-            
-            # If SDK routing is not available, fall back to direct method call
-            if response is None and server_instance is not None:
-                # Create a progress callback if the server supports progress reporting
-                progress_callback = None
-                if server_info.get("capabilities", {}).get("progress", False) and client_id:
-                    def progress_callback_fn(operation_id: str, percent_complete: int, status_message: str):
-                        self.route_progress_notification(server_id, client_id, operation_id, percent_complete, status_message)
-                    progress_callback = progress_callback_fn
-                
-                # Pass client context and progress callback to server if available
-                if client_context:
-                    response = server_instance.handle_jsonrpc_request(request, client_context, progress_callback)
+            with self.tracer.span("host.dispatch"):
+                # Use MCP SDK to route the request with enhanced context
+                # Pass authentication context to the SDK if supported
+                if hasattr(self.mcp_host, "route_authenticated_request") and client_context and client_context.get("authenticated"):
+                    response = self.mcp_host.route_authenticated_request(server_id, request, client_context)
                 else:
-                    response = server_instance.handle_jsonrpc_request(request, None, progress_callback)
+                    response = self.mcp_host.route_request(server_id, request, client_id)
+            
+                # If SDK routing is not available, fall back to direct method call
+                if response is None and server_instance is not None:
+                    # Create a progress callback if the server supports progress reporting
+                    progress_callback = None
+                    if server_info.get("capabilities", {}).get("progress", False) and client_id:
+                        def progress_callback_fn(operation_id: str, percent_complete: int, status_message: str):
+                            self.route_progress_notification(server_id, client_id, operation_id, percent_complete, status_message)
+                        progress_callback = progress_callback_fn
+                
+                    # Pass client context and progress callback to server if available
+                    if client_context:
+                        response = server_instance.handle_jsonrpc_request(request, client_context, progress_callback)
+                    else:
+                        response = server_instance.handle_jsonrpc_request(request, None, progress_callback)
+            
             
             # Validate the response before returning it
             if response is not None:
-                response_validation = JsonRpc.validate_response(response)
+                with self.tracer.span("host.validation"):
+                    response_validation = JsonRpc.validate_response(response)
                 if not response_validation["valid"]:
                     error_details = response_validation.get("errors", ["Unknown validation error"])
                     self.logger.error(f"Invalid JSON-RPC response received from server {server_id}: {error_details}")
@@ -648,6 +697,11 @@ class MCPHost:
                 subscription_id = response["result"].get("subscription_id")
                 if subscription_id:
                     self._add_subscription(client_id, subscription_id, server_id)
+            elif client_id is not None and method.startswith("resources/unsubscribe") and response and response.get("result"):
+                unsubscribe_params = request.get("params", {})
+                subscription_id = unsubscribe_params.get("subscription_id") or unsubscribe_params.get("callback_id")
+                if subscription_id:
+                    self._remove_subscription(client_id, subscription_id)
                     
             return response
         except Exception as e:
@@ -984,6 +1038,7 @@ class MCPHost:
         """
         if client_id in self.contexts:
             self.contexts[client_id]["subscriptions"].add(subscription_id)
+        self.subscription_registry[subscription_id] = {"client_id": client_id, "server_id": server_id}
             
     def _remove_subscription(self, client_id: str, subscription_id: str) -> None:
         """
@@ -995,6 +1050,7 @@ class MCPHost:
         """
         if client_id in self.contexts and subscription_id in self.contexts[client_id]["subscriptions"]:
             self.contexts[client_id]["subscriptions"].remove(subscription_id)
+        self.subscription_registry.pop(subscription_id, None)
             
     # ===== Consent Management =====
     
@@ -1106,13 +1162,13 @@ class MCPHost:
         Returns:
             bool: True if the client has consent
         """
-        self.logger.debug(f"Checking consent for client {client_id} on server {server_id} for operation {operation}")
+        self.logger.debug("Checking consent for client %s on server %s for operation %s", client_id, server_id, operation)
         
         # Always use MCP SDK consent manager for protocol compliance
         if hasattr(self.consent_manager, "check_consent"):
             result = self.consent_manager.check_consent(client_id, server_id, operation)
             if result:
-                self.logger.debug(f"Consent granted for client {client_id} on server {server_id} for operation {operation}")
+                self.logger.debug("Consent granted for client %s on server %s for operation %s", client_id, server_id, operation)
             else:
                 self.logger.warning(f"Consent denied for client {client_id} on server {server_id} for operation {operation}")
             return result
@@ -1151,7 +1207,8 @@ class MCPHost:
                 if consent["consent_level"].value >= required_level.value:
                     # Update last used timestamp
                     consent["last_used"] = current_time
-                    self.logger.debug(f"Consent {consent_id} granted for operation {operation} with level {consent['consent_level'].name}")
+                    self.consent_registry[consent_id] = consent
+                    self.logger.debug("Consent %s granted for operation %s with level %s", consent_id, operation, consent['consent_level'].name)
                     return True
                 else:
                     self.logger.warning(f"Insufficient consent level for operation {operation}: " +
@@ -1164,7 +1221,7 @@ class MCPHost:
             
             # Check if the default level is sufficient
             if default_level.value >= required_level.value:
-                self.logger.debug(f"Default consent level {default_level.name} is sufficient for operation {operation}")
+                self.logger.debug("Default consent level %s is sufficient for operation %s", default_level.name, operation)
                 return True
             else:
                 self.logger.warning(f"Default consent level {default_level.name} is insufficient for operation {operation}, required {required_level.name}")
@@ -1385,8 +1442,9 @@ class MCPHost:
         # Optionally extend session expiration on activity
         if "expiration" in session:
             session["expiration"] = time.time() + self.token_expiration
+        self.user_sessions[session_id] = session
             
-        self.logger.debug(f"Session {session_id} validated successfully")
+        self.logger.debug("Session %s validated successfully", session_id)
         return True
         
     def end_session(self, session_id: str, token: Optional[str] = None) -> bool:
@@ -1489,7 +1547,7 @@ class MCPHost:
         
         # Log the permission check for audit trail
         username = self.user_sessions[session_id].get("username", "unknown")
-        self.logger.debug(f"Permission check for {permission} on session {session_id} (user {username}): {has_permission}")
+        self.logger.debug("Permission check for %s on session %s (user %s): %s", permission, session_id, username, has_permission)
         
         return has_permission
         
@@ -1605,11 +1663,13 @@ class MCPHost:
             self.logger.warning("Admin token verification not fully implemented in fallback mode")
             
         # Grant the permission
-        if permission not in self.user_sessions[session_id]["permissions"]:
-            self.user_sessions[session_id]["permissions"].append(permission)
+        session = self.user_sessions[session_id]
+        if permission not in session["permissions"]:
+            session["permissions"].append(permission)
+            self.user_sessions[session_id] = session
             
             # Log the permission grant for audit trail
-            username = self.user_sessions[session_id].get("username", "unknown")
+            username = session.get("username", "unknown")
             self.logger.info(f"Permission {permission} granted to session {session_id} (user {username})")
             
             # Publish event for permission granting
@@ -1663,11 +1723,13 @@ class MCPHost:
             self.logger.warning("Admin token verification not fully implemented in fallback mode")
             
         # Revoke the permission
-        if permission in self.user_sessions[session_id]["permissions"]:
-            self.user_sessions[session_id]["permissions"].remove(permission)
+        session = self.user_sessions[session_id]
+        if permission in session["permissions"]:
+            session["permissions"].remove(permission)
+            self.user_sessions[session_id] = session
             
             # Log the permission revocation for audit trail
-            username = self.user_sessions[session_id].get("username", "unknown")
+            username = session.get("username", "unknown")
             self.logger.info(f"Permission {permission} revoked from session {session_id} (user {username})")
             
             # Publish event for permission revoking
@@ -2020,11 +2082,13 @@ class MCPHost:
             return False
             
         # Assign the role
-        old_role = self.user_sessions[session_id].get("role", Role.USER.name)
-        self.user_sessions[session_id]["role"] = role.name
+        session = self.user_sessions[session_id]
+        old_role = session.get("role", Role.USER.name)
+        session["role"] = role.name
+        self.user_sessions[session_id] = session
         
         # Log the role assignment for audit trail
-        username = self.user_sessions[session_id].get("username", "unknown")
+        username = session.get("username", "unknown")
         self.logger.info(f"Role changed for user {username}: {old_role} -> {role.name}")
         
         # Publish event for role assignment
@@ -2051,10 +2115,10 @@ class MCPHost:
             status_message: Status message describing current progress
             
         Returns:
-            bool: True if the notification was routed successfully
+            bool: True if the notification was routed (or queued for delivery) successfully
         """
-        self.logger.debug(f"Routing progress notification from server {server_id} to client {client_id}: " +
-                         f"Operation {operation_id} - {percent_complete}% - {status_message}")
+        self.logger.debug("Routing progress notification from server %s to client %s: Operation %s - %s%% - %s",
+                          server_id, client_id, operation_id, percent_complete, status_message)
         
         # Check if progress reporting is enabled
         if not self.progress_enabled:
@@ -2072,7 +2136,37 @@ class MCPHost:
         if client_instance is None:
             self.logger.warning(f"Cannot route progress notification: no client instance for {client_id}")
             return False
+        
+        if not hasattr(client_instance, "handle_progress_notification"):
+            self.logger.warning(f"Client {client_id} does not support progress notifications")
+            return False
+        
+        if self.progress_pipeline is not None:
+            # Queue the update; the reporting tool does not wait for delivery
+            return self.progress_pipeline.submit(client_id, (server_id, operation_id), percent_complete, status_message)
+        
+        return self._deliver_progress_notification(client_id, (server_id, operation_id), percent_complete, status_message)
+    
+    def _deliver_progress_notification(self, client_id: str, operation_key: Tuple[str, str],
+                                       percent_complete: int, status_message: str) -> bool:
+        """
+        Deliver a progress notification to a client.
+        
+        Args:
+            client_id: Target client ID
+            operation_key: Tuple of (source server ID, operation ID)
+            percent_complete: Percentage of completion (0-100)
+            status_message: Status message describing current progress
             
+        Returns:
+            bool: True if the notification was delivered successfully
+        """
+        server_id, operation_id = operation_key
+        client_instance = self.clients.get(client_id, {}).get("instance")
+        if client_instance is None:
+            # The client disconnected while the update was queued
+            return False
+        
         try:
             # Create a JSON-RPC notification for progress
             progress_notification = JsonRpc.create_notification(
@@ -2087,13 +2181,9 @@ class MCPHost:
             )
             
             # Route the notification to the client
-            if hasattr(client_instance, "handle_progress_notification"):
-                client_instance.handle_progress_notification(progress_notification)
-            else:
-                self.logger.warning(f"Client {client_id} does not support progress notifications")
-                return False
+            client_instance.handle_progress_notification(progress_notification)
                 
-            self.logger.debug(f"Successfully routed progress notification to client {client_id}")
+            self.logger.debug("Successfully routed progress notification to client %s", client_id)
             return True
         except Exception as e:
             self.logger.error(f"Error routing progress notification: {str(e)}")
@@ -834,7 +834,8 @@ class JsonRpcError:
             
         return error
 
-def tool(name: str = None, description: str = None, inputSchema: Dict[str, Any] = None, dangerous: bool = False):
+def tool(name: str = None, description: str = None, inputSchema: Dict[str, Any] = None, dangerous: bool = False,
+         readOnly: bool = True):
     """
     Decorator for MCP tools.
     
@@ -843,6 +844,7 @@ def tool(name: str = None, description: str = None, inputSchema: Dict[str, Any]
         description: Tool description
         inputSchema: JSON Schema for tool inputs
         dangerous: Whether the tool is dangerous
+        readOnly: Whether the tool only reads state
         
     Returns:
         Callable: Decorated function
@@ -852,7 +854,8 @@ def tool(name: str = None, description: str = None, inputSchema: Dict[str, Any]
             "name": name or func.__name__,
             "description": description or func.__doc__ or "",
             "inputSchema": inputSchema or {},
-            "dangerous": dangerous
+            "dangerous": dangerous,
+            "readOnly": readOnly
         }
         return func
     return decorator
\ No newline at end of file
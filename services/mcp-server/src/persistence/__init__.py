@@ -5,13 +5,20 @@ This module provides database integration for all state data in the MCP componen
 ensuring data persistence across system restarts and failures.
 """
 
-from .database import init_db, get_db_session, get_engine
+from .database import (
+    init_db, get_db_session, get_engine, get_read_session, get_read_engine,
+    db_session, read_session
+)
 from .models import Base, Server, Client, Tool, Resource, Subscription, Session, Consent
 
 __all__ = [
     'init_db',
     'get_db_session',
     'get_engine',
+    'get_read_session',
+    'get_read_engine',
+    'db_session',
+    'read_session',
     'Base',
     'Server',
     'Client',
@@ -4,6 +4,11 @@ Database connection and session management for MCP persistence.
 This module provides functions to initialize the database, create sessions,
 and manage database connections. It supports multiple database backends
 (SQLite for development, PostgreSQL for production).
+
+Reads and writes can be split across two engines: writes always go through
+the primary engine, while read-only sessions use a separate pool (a
+read-only SQLite connection pool or a PostgreSQL read replica). When no
+read pool is configured, read sessions fall back to the primary engine.
 """
 
 import os
@@ -11,7 +16,7 @@ import logging
 from contextlib import contextmanager
 from typing import Dict, Any, Generator, Optional
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
@@ -20,59 +25,96 @@ from .models import Base
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global engine instance
+# Global engine instances
 _engine = None
 _SessionLocal = None
+_read_engine = None
+_ReadSessionLocal = None
+
+# SQLite pragmas applied by the "performance" profile. Negative cache_size
+# values are in KiB, so -65536 is a 64 MB page cache per connection.
+SQLITE_PERFORMANCE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,  # 256 MB
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000
+}
+
+# Pragmas that only make sense on the writer connection
+_SQLITE_WRITER_ONLY_PRAGMAS = {"journal_mode", "synchronous"}
 
 
 def init_db(config: Dict[str, Any]) -> Engine:
     """
     Initialize the database connection.
     
+    For SQLite, setting ``database.profile`` to ``"performance"`` enables WAL
+    mode, ``synchronous=NORMAL``, memory-mapped I/O and a larger page cache,
+    routes all writes through a single writer connection and opens a
+    separate read-only connection pool for reads.
+    
     Args:
         config: Database configuration dictionary
         
     Returns:
         Engine: SQLAlchemy engine instance
     """
-    global _engine, _SessionLocal
+    global _engine, _SessionLocal, _read_engine, _ReadSessionLocal
     
     db_config = config.get("database", {})
     db_type = db_config.get("type", "sqlite").lower()
+    profile = db_config.get("profile", "default").lower()
     
     # Create database URL based on configuration
     if db_type == "sqlite":
         db_path = db_config.get("path", "mcp_data.db")
         db_url = f"sqlite:///{db_path}"
-        logger.info(f"Using SQLite database at {db_path}")
+        logger.info(f"Using SQLite database at {db_path} ({profile} profile)")
     elif db_type == "postgresql":
-        host = db_config.get("host", "localhost")
-        port = db_config.get("port", 5432)
-        user = db_config.get("user", "postgres")
-        password = db_config.get("password", "postgres")
-        database = db_config.get("database", "mcp")
-        db_url = f"postgresql://{user}:{password}@{host}:{port}/{database}"
-        logger.info(f"Using PostgreSQL database at {host}:{port}/{database}")
+        db_url = _build_postgresql_url(db_config)
+        logger.info(f"Using PostgreSQL database at {db_config.get('host', 'localhost')}:"
+                    f"{db_config.get('port', 5432)}/{db_config.get('database', 'mcp')}")
     else:
         raise ValueError(f"Unsupported database type: {db_type}")
     
+    if profile not in ("default", "performance"):
+        raise ValueError(f"Unsupported database profile: {profile}")
+    
     # Configure engine with appropriate settings
     connect_args = {}
+    pool_size = db_config.get("pool_size", 5)
+    max_overflow = db_config.get("max_overflow", 10)
     if db_type == "sqlite":
         connect_args["check_same_thread"] = False
+        # Size of the per-connection prepared statement cache kept by sqlite3
+        connect_args["cached_statements"] = db_config.get("statement_cache_size", 256)
+        if profile == "performance":
+            # SQLite allows a single writer at a time, so hand out exactly one
+            # connection for writes and let callers queue on the pool instead
+            # of contending on the database lock.
+            pool_size = 1
+            max_overflow = 0
     
     # Create engine with connection pooling
     _engine = create_engine(
         db_url,
-        pool_size=db_config.get("pool_size", 5),
-        max_overflow=db_config.get("max_overflow", 10),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
         pool_timeout=db_config.get("pool_timeout", 30),
         pool_recycle=db_config.get("pool_recycle", 1800),  # Recycle connections after 30 minutes
         connect_args=connect_args,
         echo=db_config.get("echo", False),  # Set to True for SQL query logging
-        poolclass=QueuePool
+        poolclass=QueuePool,
+        query_cache_size=db_config.get("query_cache_size", 500)
     )
     
+    if db_type == "sqlite" and profile == "performance":
+        pragmas = dict(SQLITE_PERFORMANCE_PRAGMAS)
+        pragmas.update(db_config.get("pragmas", {}))
+        _register_sqlite_pragmas(_engine, pragmas)
+    
     # Create session factory
     _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
     
@@ -81,9 +123,121 @@ def init_db(config: Dict[str, Any]) -> Engine:
         logger.info("Creating database tables if they don't exist")
         Base.metadata.create_all(_engine)
     
+    # Create the read pool once the schema exists
+    _read_engine = _create_read_engine(db_type, profile, db_config)
+    if _read_engine is not None:
+        _ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_read_engine)
+    else:
+        _ReadSessionLocal = _SessionLocal
+    
     return _engine
 
 
+def _build_postgresql_url(db_config: Dict[str, Any]) -> str:
+    """
+    Build a PostgreSQL connection URL from configuration.
+    
+    Args:
+        db_config: PostgreSQL connection settings
+        
+    Returns:
+        str: SQLAlchemy database URL
+    """
+    host = db_config.get("host", "localhost")
+    port = db_config.get("port", 5432)
+    user = db_config.get("user", "postgres")
+    password = db_config.get("password", "postgres")
+    database = db_config.get("database", "mcp")
+    return f"postgresql://{user}:{password}@{host}:{port}/{database}"
+
+
+def _register_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """
+    Apply PRAGMA statements to every new connection of an SQLite engine.
+    
+    Args:
+        engine: SQLAlchemy engine to configure
+        pragmas: Mapping of pragma names to values
+    """
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _create_read_engine(db_type: str, profile: str, db_config: Dict[str, Any]) -> Optional[Engine]:
+    """
+    Create the engine used for read-only sessions.
+    
+    Args:
+        db_type: Database backend type
+        profile: Database tuning profile
+        db_config: Database configuration dictionary
+        
+    Returns:
+        Optional[Engine]: Read engine, or None if reads should use the primary engine
+    """
+    if db_type == "sqlite":
+        db_path = db_config.get("path", "mcp_data.db")
+        if profile != "performance" or db_path == ":memory:":
+            return None
+        
+        # Open the database file read-only; WAL lets these connections read
+        # concurrently with the single writer.
+        read_url = f"sqlite:///file:{db_path}?mode=ro&uri=true"
+        read_engine = create_engine(
+            read_url,
+            pool_size=db_config.get("read_pool_size", 5),
+            max_overflow=db_config.get("read_max_overflow", 10),
+            pool_timeout=db_config.get("pool_timeout", 30),
+            pool_recycle=db_config.get("pool_recycle", 1800),
+            connect_args={
+                "check_same_thread": False,
+                "cached_statements": db_config.get("statement_cache_size", 256)
+            },
+            echo=db_config.get("echo", False),
+            poolclass=QueuePool,
+            query_cache_size=db_config.get("query_cache_size", 500)
+        )
+        
+        pragmas = {
+            name: value for name, value in SQLITE_PERFORMANCE_PRAGMAS.items()
+            if name not in _SQLITE_WRITER_ONLY_PRAGMAS
+        }
+        pragmas.update({
+            name: value for name, value in db_config.get("pragmas", {}).items()
+            if name not in _SQLITE_WRITER_ONLY_PRAGMAS
+        })
+        pragmas["query_only"] = "ON"
+        _register_sqlite_pragmas(read_engine, pragmas)
+        
+        logger.info(f"Using read-only SQLite connection pool for {db_path}")
+        return read_engine
+    
+    replica_config = db_config.get("read_replica")
+    if db_type == "postgresql" and replica_config:
+        # Unspecified replica settings inherit from the primary
+        merged_config = dict(db_config)
+        merged_config.update(replica_config)
+        logger.info(f"Using PostgreSQL read replica at {merged_config.get('host', 'localhost')}:"
+                    f"{merged_config.get('port', 5432)}")
+        return create_engine(
+            _build_postgresql_url(merged_config),
+            pool_size=merged_config.get("read_pool_size", merged_config.get("pool_size", 5)),
+            max_overflow=merged_config.get("read_max_overflow", merged_config.get("max_overflow", 10)),
+            pool_timeout=merged_config.get("pool_timeout", 30),
+            pool_recycle=merged_config.get("pool_recycle", 1800),
+            echo=merged_config.get("echo", False),
+            poolclass=QueuePool
+        )
+    
+    return None
+
+
 def get_engine() -> Engine:
     """
     Get the SQLAlchemy engine instance.
@@ -116,6 +270,40 @@ def get_db_session() -> Session:
     return _SessionLocal()
 
 
+def get_read_engine() -> Engine:
+    """
+    Get the SQLAlchemy engine used for read-only sessions.
+    
+    Returns:
+        Engine: Read engine, or the primary engine if no read pool is configured
+    
+    Raises:
+        RuntimeError: If the database has not been initialized
+    """
+    if _engine is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _read_engine if _read_engine is not None else _engine
+
+
+def get_read_session() -> Session:
+    """
+    Get a new read-only database session.
+    
+    Sessions returned here must not be used for writes; on the SQLite
+    performance profile and on PostgreSQL read replicas they are bound to a
+    separate read-only connection pool.
+    
+    Returns:
+        Session: SQLAlchemy session
+    
+    Raises:
+        RuntimeError: If the database has not been initialized
+    """
+    if _ReadSessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    return _ReadSessionLocal()
+
+
 @contextmanager
 def db_session() -> Generator[Session, None, None]:
     """
@@ -138,4 +326,23 @@ def db_session() -> Generator[Session, None, None]:
         logger.error(f"Database session error: {str(e)}")
         raise
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+@contextmanager
+def read_session() -> Generator[Session, None, None]:
+    """
+    Context manager for read-only database sessions.
+    
+    Yields:
+        Session: SQLAlchemy session bound to the read pool
+    
+    Example:
+        with read_session() as session:
+            consent = session.query(Consent).filter_by(consent_id=consent_id).first()
+    """
+    session = get_read_session()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -131,7 +131,8 @@ class Tool(Base):
     description = Column(String(1024), nullable=True)
     input_schema = Column(JSON, nullable=False, default=dict)
     dangerous = Column(Boolean, default=False)
-    metadata = Column(JSON, nullable=False, default=dict)
+    # "metadata" is reserved on declarative classes, so map it under another attribute name
+    metadata_ = Column("metadata", JSON, nullable=False, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -151,7 +152,7 @@ class Tool(Base):
             "description": self.description,
             "input_schema": self.input_schema,
             "dangerous": self.dangerous,
-            "metadata": self.metadata,
+            "metadata": self.metadata_,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
@@ -165,7 +166,7 @@ class Tool(Base):
             description=data.get("description"),
             input_schema=data.get("input_schema", {}),
             dangerous=data.get("dangerous", False),
-            metadata=data.get("metadata", {})
+            metadata_=data.get("metadata", {})
         )
 
 
@@ -177,7 +178,8 @@ class Resource(Base):
     server_id = Column(Integer, ForeignKey("servers.id", ondelete="CASCADE"), nullable=False)
     uri = Column(String(1024), nullable=False, index=True)
     provider = Column(String(255), nullable=False)
-    metadata = Column(JSON, nullable=False, default=dict)
+    # "metadata" is reserved on declarative classes, so map it under another attribute name
+    metadata_ = Column("metadata", JSON, nullable=False, default=dict)
     cache_key = Column(String(255), nullable=True, index=True)
     cache_expiry = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -201,7 +203,7 @@ class Resource(Base):
         return {
             "uri": self.uri,
             "provider": self.provider,
-            "metadata": self.metadata,
+            "metadata": self.metadata_,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
@@ -213,7 +215,7 @@ class Resource(Base):
             server_id=server_id,
             uri=data.get("uri"),
             provider=data.get("provider"),
-            metadata=data.get("metadata", {})
+            metadata_=data.get("metadata", {})
         )
 
 
@@ -0,0 +1,197 @@
+"""
+Execution scheduler for dangerous MCP tools.
+
+Tools marked ``dangerous`` (e.g. shell command execution) spawn processes on
+the server. This module bounds how many of them run at once: each execution
+needs one of a fixed number of worker slots, waiting executions are queued per
+client and granted round-robin across clients, and every job is started with
+per-job CPU/memory limits. While an execution waits, its queue position is
+reported through the server's progress mechanism.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Optional
+
+
+class ToolQueueFullError(Exception):
+    """Raised when a client already has the maximum number of queued executions."""
+    pass
+
+
+class ToolQueueTimeoutError(Exception):
+    """Raised when an execution does not get a worker slot within the queue timeout."""
+    pass
+
+
+class ToolExecutionScheduler:
+    """Bounded worker pool with per-client queues for dangerous tool executions."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_workers: int = 2,
+        max_queue_per_client: int = 16,
+        queue_timeout: Optional[float] = 300.0,
+        job_limits: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the execution scheduler.
+
+        Args:
+            logger: Logger instance
+            max_workers: Number of dangerous executions allowed to run at once
+            max_queue_per_client: Maximum number of waiting executions per client
+            queue_timeout: Maximum time in seconds to wait for a worker slot (None waits forever)
+            job_limits: Resource limits applied to each job (see ``server/tools/shell/limits.py``)
+        """
+        self.logger = logger
+        self.max_workers = max_workers
+        self.max_queue_per_client = max_queue_per_client
+        self.queue_timeout = queue_timeout
+        self.job_limits = job_limits or {}
+
+        # client_id -> deque of tickets; dict order is the round-robin rotation
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()
+        self._active = 0
+        self._condition = threading.Condition()
+
+        self.stats = {
+            "executed": 0,
+            "queued": 0,
+            "rejected": 0,
+            "timed_out": 0
+        }
+
+    def run(
+        self,
+        func: Callable[[], Any],
+        client_id: Optional[str] = None,
+        operation_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[str, int, str], None]] = None
+    ) -> Any:
+        """
+        Run ``func`` once a worker slot is free.
+
+        Blocks the calling thread while queued. Queue position changes are
+        reported as progress notifications with 0% completion.
+
+        Args:
+            func: Function performing the tool execution
+            client_id: ID of the requesting client, used for per-client queues
+            operation_id: Operation ID used in progress notifications
+            progress_callback: Callback receiving (operation_id, percent_complete, status_message)
+
+        Returns:
+            Any: Result of ``func``
+
+        Raises:
+            ToolQueueFullError: If the client's queue is full
+            ToolQueueTimeoutError: If no slot became free within the queue timeout
+        """
+        client_id = client_id or "anonymous"
+        ticket = object()
+        deadline = time.monotonic() + self.queue_timeout if self.queue_timeout is not None else None
+
+        with self._condition:
+            queue = self._queues.setdefault(client_id, deque())
+            if len(queue) >= self.max_queue_per_client:
+                self.stats["rejected"] += 1
+                raise ToolQueueFullError(
+                    f"Client {client_id} already has {len(queue)} queued dangerous tool executions"
+                )
+            queue.append(ticket)
+            # Let waiting executions recompute (and re-report) their positions
+            self._condition.notify_all()
+
+            reported_position = None
+            queued = False
+            while not (self._active < self.max_workers and self._is_next(ticket)):
+                if not queued:
+                    queued = True
+                    self.stats["queued"] += 1
+                position = self._position(ticket)
+                if position != reported_position and progress_callback and operation_id:
+                    reported_position = position
+                    # Do not hold the lock while notifying the client
+                    self._condition.release()
+                    try:
+                        progress_callback(operation_id, 0, f"Queued for execution: position {position}")
+                    finally:
+                        self._condition.acquire()
+                    continue
+
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    self._dequeue(client_id, ticket)
+                    self._condition.notify_all()
+                    self.stats["timed_out"] += 1
+                    raise ToolQueueTimeoutError(f"No execution slot became free within {self.queue_timeout}s")
+                self._condition.wait(timeout=remaining)
+
+            self._dequeue(client_id, ticket)
+            # Serve the other clients before this one again
+            if client_id in self._queues:
+                self._queues.move_to_end(client_id)
+            self._active += 1
+
+        try:
+            self.stats["executed"] += 1
+            return func()
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dict[str, Any]: Counters, running executions and queue depth per client
+        """
+        with self._condition:
+            stats = dict(self.stats)
+            stats["running"] = self._active
+            stats["waiting"] = {client_id: len(queue) for client_id, queue in self._queues.items()}
+        return stats
+
+    def _is_next(self, ticket: object) -> bool:
+        """Check whether the ticket is the next one to be granted. The caller must hold the lock."""
+        for queue in self._queues.values():
+            if queue:
+                return queue[0] is ticket
+        return False
+
+    def _position(self, ticket: object) -> int:
+        """
+        Compute the 1-based position of a ticket in round-robin grant order.
+
+        The caller must hold the lock.
+        """
+        queues = [list(queue) for queue in self._queues.values() if queue]
+        position = 0
+        depth = 0
+        while queues:
+            for queue in queues:
+                if depth < len(queue):
+                    position += 1
+                    if queue[depth] is ticket:
+                        return position
+            depth += 1
+            queues = [queue for queue in queues if depth < len(queue)]
+        return position
+
+    def _dequeue(self, client_id: str, ticket: object) -> None:
+        """Remove a ticket from its client queue. The caller must hold the lock."""
+        queue = self._queues.get(client_id)
+        if queue is None:
+            return
+        try:
+            queue.remove(ticket)
+        except ValueError:
+            pass
+        if not queue:
+            del self._queues[client_id]
@@ -5,6 +5,7 @@ This package contains resource providers for the MCP Server.
 Resources are exposed via the resource:// URI scheme.
 """
 
+from .cache import TieredResourceCache
 from .file_resource import FileResourceProvider
 
-__all__ = ["FileResourceProvider"]
\ No newline at end of file
+__all__ = ["FileResourceProvider", "TieredResourceCache"]
\ No newline at end of file
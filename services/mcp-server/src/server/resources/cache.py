@@ -0,0 +1,261 @@
+"""
+Tiered Resource Cache for MCP Server.
+
+This module implements a two-tier cache for resource read results:
+
+1. An in-memory LRU keyed by resource URI (first tier)
+2. The database-backed ``Resource`` table (second tier), using the
+   ``content``, ``cache_key`` and ``cache_expiry`` columns
+
+Persisted payloads carry a content hash (``cache_key``) that detects corrupt
+rows and unchanged rewrites. All entries are validated against a cheap source
+validator (for files: size and modification time) so that stale entries are
+never served. Because the second tier lives in the database, hot resources survive
+server restarts and are shared between server replicas using the same database.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("mcp_server.resources.cache")
+
+
+class TieredResourceCache:
+    """
+    Two-tier cache for encoded resource read results.
+
+    The memory tier is bounded by entry count and per-entry size and expires
+    entries after ``ttl`` seconds. The persistent tier is optional and only
+    used when the persistence layer has been initialized.
+    """
+
+    def __init__(self, server_id: str, provider: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the tiered resource cache.
+
+        Args:
+            server_id: ID of the server owning the cached resources
+            provider: Name of the resource provider (e.g. "file")
+            config: Cache configuration dictionary with optional keys
+                ``max_size``, ``ttl``, ``max_size_per_resource``,
+                ``persistent`` and ``persistent_ttl``
+        """
+        config = config or {}
+        self.server_id = server_id
+        self.provider = provider
+        self.max_entries = config.get("max_size", 100)
+        self.ttl = config.get("ttl", 300)
+        self.max_entry_size = config.get("max_size_per_resource", 10 * 1024 * 1024)
+        self.persistent = config.get("persistent", False)
+        self.persistent_ttl = config.get("persistent_ttl", 24 * 3600)
+
+        # uri -> {"validator", "data", "expires"}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._server_pk: Optional[int] = None
+
+        self.stats = {
+            "memory_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def compute_cache_key(payload: bytes) -> str:
+        """
+        Compute the content-hash key for an encoded payload.
+
+        Args:
+            payload: Encoded resource payload
+
+        Returns:
+            str: Hex-encoded SHA-256 digest
+        """
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, uri: str, validator: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a resource in the memory tier, then the persistent tier.
+
+        Args:
+            uri: Resource URI
+            validator: Current source validator; entries with a different
+                validator are treated as stale
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached read result, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is not None:
+                if entry["validator"] == validator and entry["expires"] > now:
+                    self._entries.move_to_end(uri)
+                    self.stats["memory_hits"] += 1
+                    return entry["data"]
+                self._entries.pop(uri)
+
+        if self.persistent:
+            data = self._load_persistent(uri, validator)
+            if data is not None:
+                self._put_memory(uri, validator, data)
+                with self._lock:
+                    self.stats["persistent_hits"] += 1
+                return data
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, uri: str, validator: str, data: Dict[str, Any],
+            content_type: str = "application/json") -> Optional[str]:
+        """
+        Store a read result in both tiers.
+
+        Args:
+            uri: Resource URI
+            validator: Source validator the result was produced for
+            data: Read result to cache
+            content_type: MIME type recorded for the persisted payload
+
+        Returns:
+            Optional[str]: Content-hash cache key, or None if the result was too large to cache
+        """
+        payload = json.dumps(data).encode("utf-8")
+        if len(payload) > self.max_entry_size:
+            logger.debug(f"Resource too large to cache: {uri} ({len(payload)} bytes)")
+            return None
+
+        cache_key = self.compute_cache_key(payload)
+        self._put_memory(uri, validator, data)
+
+        if self.persistent:
+            self._store_persistent(uri, validator, cache_key, payload, content_type)
+
+        return cache_key
+
+    def invalidate(self, uri: str) -> None:
+        """
+        Drop a resource from the memory tier.
+
+        The persistent entry is left in place; it is revalidated against the
+        source validator on its next lookup.
+
+        Args:
+            uri: Resource URI
+        """
+        with self._lock:
+            self._entries.pop(uri, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters and memory tier occupancy
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        return stats
+
+    def _put_memory(self, uri: str, validator: str, data: Dict[str, Any]) -> None:
+        """Insert an entry into the memory tier, evicting the least recently used entries."""
+        with self._lock:
+            self._entries.pop(uri, None)
+
+            while self._entries and len(self._entries) >= self.max_entries:
+                oldest_uri, _ = self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+                logger.debug(f"Evicted least recently used cache entry: {oldest_uri}")
+
+            self._entries[uri] = {
+                "validator": validator,
+                "data": data,
+                "expires": time.time() + self.ttl
+            }
+
+    def _get_server_pk(self, session) -> int:
+        """Get or create the primary key of the owning Server row."""
+        from persistence.models import Server
+
+        if self._server_pk is None:
+            server = session.query(Server).filter_by(server_id=self.server_id).first()
+            if server is None:
+                server = Server(server_id=self.server_id, capabilities={})
+                session.add(server)
+                session.flush()
+            self._server_pk = server.id
+        return self._server_pk
+
+    def _load_persistent(self, uri: str, validator: str) -> Optional[Dict[str, Any]]:
+        """Load a still-valid entry from the Resource table."""
+        try:
+            from persistence.database import read_session
+            from persistence.models import Resource, Server
+
+            with read_session() as session:
+                row = (
+                    session.query(Resource)
+                    .join(Server, Resource.server_id == Server.id)
+                    .filter(Server.server_id == self.server_id, Resource.uri == uri)
+                    .first()
+                )
+                if row is None or row.content is None or row.cache_key is None:
+                    return None
+                if row.cache_expiry is not None and row.cache_expiry < datetime.utcnow():
+                    return None
+                if (row.metadata_ or {}).get("validator") != validator:
+                    return None
+                if self.compute_cache_key(row.content) != row.cache_key:
+                    logger.warning(f"Discarding corrupt persistent cache entry for: {uri}")
+                    return None
+                return json.loads(row.content.decode("utf-8"))
+        except RuntimeError:
+            # Persistence layer not initialized; run memory-only
+            return None
+        except Exception as e:
+            logger.warning(f"Persistent resource cache lookup failed for {uri}: {str(e)}")
+            return None
+
+    def _store_persistent(self, uri: str, validator: str, cache_key: str,
+                          payload: bytes, content_type: str) -> None:
+        """Write an entry to the Resource table."""
+        try:
+            from persistence.database import db_session
+            from persistence.models import Resource
+
+            with db_session() as session:
+                server_pk = self._get_server_pk(session)
+                row = session.query(Resource).filter_by(server_id=server_pk, uri=uri).first()
+                if row is None:
+                    row = Resource(server_id=server_pk, uri=uri, provider=self.provider, metadata_={})
+                    session.add(row)
+
+                if row.cache_key == cache_key and (row.metadata_ or {}).get("validator") == validator:
+                    # Same payload already persisted; only extend its lifetime
+                    row.cache_expiry = datetime.utcnow() + timedelta(seconds=self.persistent_ttl)
+                    return
+
+                metadata = dict(row.metadata_ or {})
+                metadata["validator"] = validator
+                row.metadata_ = metadata
+                row.content = payload
+                row.content_type = content_type
+                row.cache_key = cache_key
+                row.cache_expiry = datetime.utcnow() + timedelta(seconds=self.persistent_ttl)
+        except RuntimeError:
+            # Persistence layer not initialized; run memory-only
+            pass
+        except Exception as e:
+            # Another replica may have inserted the same row concurrently; the
+            # next miss will simply rewrite it.
+            self._server_pk = None
+            logger.warning(f"Persistent resource cache write failed for {uri}: {str(e)}")
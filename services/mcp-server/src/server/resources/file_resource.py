@@ -16,6 +16,8 @@ from pathlib import Path
 from datetime import datetime
 from mimetypes import guess_type
 
+from .cache import TieredResourceCache
+
 logger = logging.getLogger("mcp_server.resources.file")
 
 class FileResourceProvider:
@@ -26,26 +28,36 @@ class FileResourceProvider:
     It supports listing, reading, and subscribing to file resources.
     """
     
-    def __init__(self, base_path: str = None, config: Dict[str, Any] = None):
+    def __init__(self, base_path: str = None, config: Dict[str, Any] = None,
+                 resource_cache: Optional[TieredResourceCache] = None):
         """
         Initialize the file resource provider.
         
         Args:
             base_path: Base path for file resources. If None, the current working directory is used.
             config: Configuration dictionary for the resource provider
+            resource_cache: Optional shared tiered cache. If None, a cache is built from the
+                "cache" configuration (memory-only unless "persistent" is set).
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
         self.subscribers = {}
         
         # Initialize cache
-        self.cache = {}
         self.config = config or {}
-        self.cache_config = self.config.get("cache", {
+        self.cache_config = {
             "enabled": True,
             "max_size": 100,  # Maximum number of resources to cache
             "ttl": 300,  # Time to live in seconds (5 minutes)
-            "max_size_per_resource": 10 * 1024 * 1024  # 10 MB max size per resource
-        })
+            "max_size_per_resource": 10 * 1024 * 1024,  # 10 MB max size per resource
+            "persistent": False,  # Use the database Resource table as a second tier
+            "persistent_ttl": 24 * 3600  # Time to live of persisted entries in seconds
+        }
+        self.cache_config.update(self.config.get("cache", {}))
+        self.cache = resource_cache or TieredResourceCache(
+            server_id=self.config.get("server_id", "default"),
+            provider="file",
+            config=self.cache_config
+        )
         
         # Initialize streaming settings
         self.streaming_config = self.config.get("streaming", {
@@ -141,23 +153,6 @@ class FileResourceProvider:
                     "error": f"Invalid URI scheme: {uri}"
                 }
                 
-            # Check cache first if enabled and not bypassing
-            if self.cache_config["enabled"] and not bypass_cache and uri in self.cache:
-                cache_entry = self.cache[uri]
-                current_time = time.time()
-                
-                # Check if cache entry is still valid
-                if current_time - cache_entry["timestamp"] < self.cache_config["ttl"]:
-                    logger.debug(f"Cache hit for resource: {uri}")
-                    
-                    # Update access timestamp
-                    cache_entry["timestamp"] = current_time
-                    return cache_entry["data"]
-                else:
-                    # Remove expired entry
-                    del self.cache[uri]
-                    logger.debug(f"Removed expired cache entry for: {uri}")
-                
             path = uri[len("resource://file/"):]
             target_path = self.base_path / path
             
@@ -172,6 +167,17 @@ class FileResourceProvider:
                     "success": False,
                     "error": f"Cannot read directory as file: {uri}"
                 }
+            
+            # Size and mtime identify the file version, so stale entries are never served
+            stat = target_path.stat()
+            validator = f"{stat.st_size}:{stat.st_mtime_ns}"
+            
+            # Check cache first if enabled and not bypassing
+            if self.cache_config["enabled"] and not bypass_cache:
+                cached = self.cache.get(uri, validator)
+                if cached is not None:
+                    logger.debug(f"Cache hit for resource: {uri}")
+                    return cached
                 
             content = target_path.read_text(errors="replace")
             result = {
@@ -181,14 +187,14 @@ class FileResourceProvider:
                     "uri": uri,
                     "type": "file",
                     "name": target_path.name,
-                    "size": target_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(target_path.stat().st_mtime).isoformat()
+                    "size": stat.st_size,
+                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
                 }
             }
             
             # Cache the result if caching is enabled
             if self.cache_config["enabled"] and not bypass_cache:
-                self._cache_resource(uri, result)
+                self.cache.put(uri, validator, result)
                 
             return result
         except Exception as e:
@@ -595,40 +601,6 @@ class FileResourceProvider:
                 "error": f"Error closing stream: {str(e)}"
             }
             
-    def _cache_resource(self, uri: str, data: Dict[str, Any]) -> None:
-        """
-        Cache a resource for future access.
-        
-        Args:
-            uri: Resource URI
-            data: Resource data to cache
-        """
-        if not self.cache_config["enabled"]:
-            return
-            
-        # Skip caching if the resource is too large
-        content_size = len(data.get("content", "")) if isinstance(data.get("content"), str) else 0
-        if content_size > self.cache_config["max_size_per_resource"]:
-            logger.debug(f"Resource too large to cache: {uri} ({content_size} bytes)")
-            return
-            
-        # Evict oldest entries if cache is full
-        if len(self.cache) >= self.cache_config["max_size"]:
-            # Sort by timestamp (oldest first)
-            sorted_cache = sorted(self.cache.items(), key=lambda x: x[1]["timestamp"])
-            # Remove oldest entry
-            oldest_uri = sorted_cache[0][0]
-            del self.cache[oldest_uri]
-            logger.debug(f"Evicted oldest cache entry: {oldest_uri}")
-            
-        # Add to cache with current timestamp
-        self.cache[uri] = {
-            "data": data,
-            "timestamp": time.time(),
-            "size": content_size
-        }
-        logger.debug(f"Cached resource: {uri} ({content_size} bytes)")
-        
     def _parse_range(self, range_spec: str, content_length: int) -> tuple:
         """
         Parse a range specification string.
@@ -14,6 +14,12 @@ import time
 from typing import Dict, Any, List, Optional, Callable, Union
 from mcp import tool, JsonRpc, Server as MCPServerSDK
 
+from services.progress_pipeline import ProgressPipeline
+from services.state_store import create_state_store
+from services.tracing import get_tracer, traced_request
+
+from .execution import ToolExecutionScheduler
+
 class MCPServer:
     """
     MCP Server implementation using the MCP SDK.
@@ -28,7 +34,8 @@ class MCPServer:
     implementations for backward compatibility.
     """
     
-    def __init__(self, server_id: str, logger: logging.Logger, config: Dict[str, Any], mcp_server=None):
+    def __init__(self, server_id: str, logger: logging.Logger, config: Dict[str, Any], mcp_server=None,
+                 state_store=None):
         """
         Initialize the MCP Server using the MCP SDK.
         
@@ -37,6 +44,8 @@ class MCPServer:
             logger: Logger instance
             config: Configuration dictionary
             mcp_server: Optional pre-initialized MCP SDK Server instance
+            state_store: Optional state store shared with other workers; created from
+                the "state" configuration if not given
         """
         self.server_id = server_id
         self.logger = logger
@@ -69,10 +78,43 @@ class MCPServer:
             "max_size_per_resource": 10 * 1024 * 1024  # 10 MB max size per resource
         })
         
+        # Tool metadata responses are cached per worker and dropped when the
+        # "tool_metadata" generation of the shared state store changes
+        self.state_store = state_store if state_store is not None else create_state_store(config.get("state", {}))
+        self.generation_check_interval = config.get("state", {}).get("generation_check_interval", 1.0)
+        self._tool_metadata_cache = {}
+        self._tool_metadata_generation = self.state_store.get_generation("tool_metadata")
+        self._tool_metadata_checked_at = time.monotonic()
+        
         # Initialize consent tracking
         self.consent_violations = []
         self.max_violations_history = config.get("consent", {}).get("max_violations_history", 100)
         
+        # Span timings (no-op unless tracing is enabled)
+        self.tracer = get_tracer()
+        
+        # Progress reports are coalesced per operation, rate-limited and emitted
+        # from a background thread so reporting tools never wait on delivery
+        progress_config = config.get("progress", {})
+        self.progress_pipeline = None
+        if progress_config.get("async_delivery", True):
+            self.progress_pipeline = ProgressPipeline(
+                self._emit_progress,
+                logger,
+                max_updates_per_second=progress_config.get("max_updates_per_second", 5.0),
+                max_queue_per_client=progress_config.get("max_queue_per_client", 100)
+            )
+        
+        # Initialize the execution scheduler for dangerous tools
+        execution_config = config.get("tool_execution", {})
+        self.tool_scheduler = ToolExecutionScheduler(
+            logger,
+            max_workers=execution_config.get("max_workers", 2),
+            max_queue_per_client=execution_config.get("max_queue_per_client", 16),
+            queue_timeout=execution_config.get("queue_timeout", 300.0),
+            job_limits=execution_config.get("limits", {})
+        )
+        
         # Validate capabilities against MCP specification
         self._validate_capabilities()
         
@@ -81,12 +123,25 @@ class MCPServer:
         
         self.logger.info(f"MCP Server '{server_id}' initialized with consent management")
         
-    def register_tool(self, tool_func: Callable) -> bool:
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Shut the server down, delivering pending progress notifications.
+        
+        Args:
+            timeout: Maximum time to wait for pending progress notifications in seconds
+        """
+        if self.progress_pipeline is not None:
+            self.progress_pipeline.close(timeout)
+        
+    def register_tool(self, tool_func: Callable, runtime: bool = False) -> bool:
         """
         Register a new tool with this Server using the MCP SDK.
         
         Args:
             tool_func: Function decorated with @tool() that implements the tool
+            runtime: Whether the tool is registered while serving requests, in which
+                case the cached tool metadata of all other workers is dropped too.
+                Tools registered at startup are registered by every worker.
             
         Returns:
             bool: True if registration was successful
@@ -109,8 +164,41 @@ class MCPServer:
             "function": tool_func,
             "metadata": metadata
         }
+        if runtime:
+            self.invalidate_tool_metadata()
+        else:
+            self._tool_metadata_cache.clear()
         return True
         
+    def invalidate_tool_metadata(self) -> None:
+        """
+        Drop cached tool metadata in this and all other worker processes.
+        
+        Other workers notice the change within ``state.generation_check_interval`` seconds.
+        """
+        self._tool_metadata_cache.clear()
+        self._tool_metadata_generation = self.state_store.bump_generation("tool_metadata")
+        self._tool_metadata_checked_at = time.monotonic()
+        
+    def _get_cached_tool_metadata(self, key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached tool metadata response, dropping the cache if another worker invalidated it.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[Dict[str, Any]]: The cached response, or None
+        """
+        now = time.monotonic()
+        if now - self._tool_metadata_checked_at >= self.generation_check_interval:
+            self._tool_metadata_checked_at = now
+            generation = self.state_store.get_generation("tool_metadata")
+            if generation != self._tool_metadata_generation:
+                self._tool_metadata_cache.clear()
+                self._tool_metadata_generation = generation
+        return self._tool_metadata_cache.get(key)
+        
     def register_resource_provider(self, provider_name: str, provider_instance: Any) -> bool:
         """
         Register a new resource provider with this Server using the MCP SDK.
@@ -132,6 +220,7 @@ class MCPServer:
         self.resource_providers[provider_name] = provider_instance
         return True
         
+    @traced_request("server.handle_jsonrpc_request")
     def handle_jsonrpc_request(self, request: Dict[str, Any],
                                client_context: Optional[Dict[str, Any]] = None,
                                progress_callback: Optional[Callable[[str, int, str], None]] = None) -> Dict[str, Any]:
@@ -146,7 +235,8 @@ class MCPServer:
             Dict[str, Any]: JSON-RPC 2.0 response object
         """
         # Comprehensive validation of the incoming request using the SDK
-        validation_result = JsonRpc.validate_request(request)
+        with self.tracer.span("server.validation"):
+            validation_result = JsonRpc.validate_request(request)
         if not validation_result["valid"]:
             error_details = validation_result.get("errors", ["Unknown validation error"])
             self.logger.error(f"Invalid JSON-RPC request received: {error_details}")
@@ -175,7 +265,8 @@ class MCPServer:
                 
                 # Verify consent using SDK if available
                 if hasattr(self.mcp_server, "verify_consent"):
-                    consent_result = self.mcp_server.verify_consent(client_id, method, required_level)
+                    with self.tracer.span("server.consent"):
+                        consent_result = self.mcp_server.verify_consent(client_id, method, required_level)
                     if not consent_result["verified"]:
                         self.logger.warning(f"Consent verification failed for client {client_id}, method {method}: {consent_result.get('reason')}")
                         return JsonRpc.create_error_response(
@@ -186,7 +277,7 @@ class MCPServer:
                         )
                 else:
                     # Log that we're relying on host for consent verification
-                    self.logger.debug(f"Relying on host for consent verification for client {client_id}, method {method}")
+                    self.logger.debug("Relying on host for consent verification for client %s, method %s", client_id, method)
                 
                 # Verify authorization if client is authenticated
                 if client_context.get("authenticated", False):
@@ -206,73 +297,75 @@ class MCPServer:
                             f"User {username} with role {role} is not authorized to perform operation: {method}"
                         )
                     
-                    self.logger.debug(f"Request authorized for user {client_context.get('username', 'unknown')}, method: {method}")
+                    self.logger.debug("Request authorized for user %s, method: %s", client_context.get('username', 'unknown'), method)
         
         # Handle method calls
         try:
-            # Use the SDK server to handle the request if available
-            if hasattr(self.mcp_server, "handle_request"):
-                return self.mcp_server.handle_request(request, client_context)
-            
-            # Fall back to our custom implementation
-            if method == "capabilities/list":
-                result = self._handle_capabilities_list()
-            elif method == "capabilities/negotiate":
-                result = self._handle_capabilities_negotiate(params)
-            elif method == "tools/list":
-                result = self._handle_tools_list()
-            elif method == "tools/get":
-                result = self._handle_tools_get(params)
-            elif method == "tools/execute":
-                # Additional consent check for dangerous tools
-                if client_context and "name" in params:
-                    tool_name = params["name"]
-                    if tool_name in self.tools and self.tools[tool_name]["metadata"].get("dangerous", False):
-                        client_id = client_context.get("client_id")
-                        if client_id and not self._verify_elevated_consent(client_id, f"tools/execute/{tool_name}"):
-                            self.logger.warning(f"Elevated consent required for dangerous tool {tool_name}")
-                            return JsonRpc.create_error_response(
-                                request_id,
-                                -32000,
-                                "Elevated consent required",
-                                f"Tool '{tool_name}' is marked as dangerous and requires ELEVATED consent"
-                            )
+            with self.tracer.span("server.dispatch"):
+                # Use the SDK server to handle the request if available
+                if hasattr(self.mcp_server, "handle_request"):
+                    return self.mcp_server.handle_request(request, client_context)
+            
+                # Fall back to our custom implementation
+                if method == "capabilities/list":
+                    result = self._handle_capabilities_list()
+                elif method == "capabilities/negotiate":
+                    result = self._handle_capabilities_negotiate(params)
+                elif method == "tools/list":
+                    result = self._handle_tools_list()
+                elif method == "tools/get":
+                    result = self._handle_tools_get(params)
+                elif method == "tools/execute":
+                    # Additional consent check for dangerous tools
+                    if client_context and "name" in params:
+                        tool_name = params["name"]
+                        if tool_name in self.tools and self.tools[tool_name]["metadata"].get("dangerous", False):
+                            client_id = client_context.get("client_id")
+                            if client_id and not self._verify_elevated_consent(client_id, f"tools/execute/{tool_name}"):
+                                self.logger.warning(f"Elevated consent required for dangerous tool {tool_name}")
+                                return JsonRpc.create_error_response(
+                                    request_id,
+                                    -32000,
+                                    "Elevated consent required",
+                                    f"Tool '{tool_name}' is marked as dangerous and requires ELEVATED consent"
+                                )
                 
-                # Create a tool-specific progress callback if a general callback is provided
-                tool_progress_callback = None
-                if progress_callback and "name" in params:
-                    tool_name = params["name"]
-                    operation_id = f"tool_execute_{tool_name}_{str(uuid.uuid4())[:8]}"
+                    # Create a tool-specific progress callback if a general callback is provided
+                    tool_progress_callback = None
+                    if progress_callback and "name" in params:
+                        tool_name = params["name"]
+                        operation_id = f"tool_execute_{tool_name}_{str(uuid.uuid4())[:8]}"
                     
-                    def tool_specific_callback(percent_complete: int, status_message: str):
-                        progress_callback(operation_id, percent_complete, status_message)
+                        def tool_specific_callback(percent_complete: int, status_message: str):
+                            progress_callback(operation_id, percent_complete, status_message)
                     
-                    tool_progress_callback = tool_specific_callback
+                        tool_progress_callback = tool_specific_callback
                 
-                result = self._handle_tools_execute(
-                    params,
-                    client_context.get("client_id") if client_context else None,
-                    tool_progress_callback
-                )
-            elif method == "resources/list":
-                result = self._handle_resources_list(params)
-            elif method == "resources/read":
-                result = self._handle_resources_read(params, client_context.get("client_id") if client_context else None)
-            elif method == "resources/subscribe":
-                result = self._handle_resources_subscribe(params, client_context.get("client_id") if client_context else None)
-            elif method == "resources/unsubscribe":
-                result = self._handle_resources_unsubscribe(params, client_context.get("client_id") if client_context else None)
-            else:
-                self.logger.error(f"Method not found: {method}")
-                return JsonRpc.create_error_response(
-                    request_id, -32601, "Method not found", f"Method '{method}' not found"
-                )
+                    result = self._handle_tools_execute(
+                        params,
+                        client_context.get("client_id") if client_context else None,
+                        tool_progress_callback
+                    )
+                elif method == "resources/list":
+                    result = self._handle_resources_list(params)
+                elif method == "resources/read":
+                    result = self._handle_resources_read(params, client_context.get("client_id") if client_context else None)
+                elif method == "resources/subscribe":
+                    result = self._handle_resources_subscribe(params, client_context.get("client_id") if client_context else None)
+                elif method == "resources/unsubscribe":
+                    result = self._handle_resources_unsubscribe(params, client_context.get("client_id") if client_context else None)
+                else:
+                    self.logger.error(f"Method not found: {method}")
+                    return JsonRpc.create_error_response(
+                        request_id, -32601, "Method not found", f"Method '{method}' not found"
+                    )
                 
             # Create a successful response using the SDK
-            response = JsonRpc.create_response(request_id, result)
-            
-            # Validate the outgoing response
-            response_validation = JsonRpc.validate_response(response)
+            with self.tracer.span("server.serialization"):
+                response = JsonRpc.create_response(request_id, result)
+                
+                # Validate the outgoing response
+                response_validation = JsonRpc.validate_response(response)
             if not response_validation["valid"]:
                 error_details = response_validation.get("errors", ["Unknown validation error"])
                 self.logger.error(f"Generated invalid JSON-RPC response: {error_details}")
@@ -282,7 +375,8 @@ class MCPServer:
                 
             # Log successful operation with consent level if client context is provided
             if client_context and client_context.get("client_id"):
-                self.logger.info(f"Successfully executed {method} for client {client_context.get('client_id')} with {self._get_required_consent_level(method)} consent")
+                self.logger.info("Successfully executed %s for client %s with %s consent",
+                                 method, client_context.get('client_id'), self._get_required_consent_level(method))
                 
             return response
         except Exception as e:
@@ -380,25 +474,31 @@ class MCPServer:
         Returns:
             Dict[str, Any]: List of available tools
         """
+        cached = self._get_cached_tool_metadata("tools/list")
+        if cached is not None:
+            return {"tools": list(cached["tools"])}
+        
         # Use the SDK server to list tools if available
         if hasattr(self.mcp_server, "list_tools"):
-            return {
+            result = {
                 "tools": self.mcp_server.list_tools()
             }
-        
-        # Fall back to our custom implementation
-        tool_list = []
-        for name, tool_info in self.tools.items():
-            metadata = tool_info["metadata"]
-            tool_list.append({
-                "name": name,
-                "description": metadata.get("description", ""),
-                "dangerous": metadata.get("dangerous", False)
-            })
+        else:
+            # Fall back to our custom implementation
+            tool_list = []
+            for name, tool_info in self.tools.items():
+                metadata = tool_info["metadata"]
+                tool_list.append({
+                    "name": name,
+                    "description": metadata.get("description", ""),
+                    "dangerous": metadata.get("dangerous", False)
+                })
+            result = {
+                "tools": tool_list
+            }
             
-        return {
-            "tools": tool_list
-        }
+        self._tool_metadata_cache["tools/list"] = result
+        return {"tools": list(result["tools"])}
         
     def _handle_tools_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -418,23 +518,32 @@ class MCPServer:
             
         tool_name = params["name"]
         
+        cached = self._get_cached_tool_metadata(("tools/get", tool_name))
+        if cached is not None:
+            return dict(cached)
+        
         # Use the SDK server to get tool details if available
         if hasattr(self.mcp_server, "get_tool"):
-            return self.mcp_server.get_tool(tool_name)
-        
-        # Fall back to our custom implementation
-        if tool_name not in self.tools:
-            raise ValueError(f"Unknown tool: {tool_name}")
+            result = self.mcp_server.get_tool(tool_name)
+        else:
+            # Fall back to our custom implementation
+            if tool_name not in self.tools:
+                raise ValueError(f"Unknown tool: {tool_name}")
+                
+            tool_info = self.tools[tool_name]
+            metadata = tool_info["metadata"]
             
-        tool_info = self.tools[tool_name]
-        metadata = tool_info["metadata"]
-        
-        return {
-            "name": tool_name,
-            "description": metadata.get("description", ""),
-            "inputSchema": metadata.get("inputSchema", {}),
-            "dangerous": metadata.get("dangerous", False)
-        }
+            result = {
+                "name": tool_name,
+                "description": metadata.get("description", ""),
+                "inputSchema": metadata.get("inputSchema", {}),
+                "dangerous": metadata.get("dangerous", False)
+            }
+            
+        if isinstance(result, dict):
+            self._tool_metadata_cache[("tools/get", tool_name)] = result
+            return dict(result)
+        return result
         
     def _handle_tools_execute(self, params: Dict[str, Any], client_id: Optional[str] = None,
                              progress_callback: Optional[Callable[[int, str], None]] = None) -> Dict[str, Any]:
@@ -443,7 +552,8 @@ class MCPServer:
         
         Args:
             params: Method parameters
-            client_id: Optional client ID for consent tracking
+            client_id: Optional client ID for consent tracking and per-client queuing
+            progress_callback: Optional callback receiving (percent_complete, status_message)
             
         Returns:
             Dict[str, Any]: Tool execution result
@@ -470,9 +580,10 @@ class MCPServer:
             if is_dangerous:
                 self.logger.warning(f"Executing dangerous tool: {tool_name}" +
                                   (f" for client {client_id}" if client_id else ""))
+            elif client_id:
+                self.logger.info("Executing tool: %s for client %s", tool_name, client_id)
             else:
-                self.logger.info(f"Executing tool: {tool_name}" +
-                               (f" for client {client_id}" if client_id else ""))
+                self.logger.info("Executing tool: %s", tool_name)
         
         # Use the SDK server to execute the tool if available
         if hasattr(self.mcp_server, "execute_tool"):
@@ -497,20 +608,45 @@ class MCPServer:
             
             # Log the execution with consent level
             consent_level = "ELEVATED" if is_dangerous else "BASIC"
-            self.logger.info(f"Executing tool {tool_name} with {consent_level} consent" +
-                           (f" for client {client_id}" if client_id else ""))
+            if client_id:
+                self.logger.info("Executing tool %s with %s consent for client %s", tool_name, consent_level, client_id)
+            else:
+                self.logger.info("Executing tool %s with %s consent", tool_name, consent_level)
+            
+            call_args = dict(arguments)
             
             # Execute the tool with progress reporting if supported
             if hasattr(tool_func, "_supports_progress") and tool_func._supports_progress and progress_callback:
                 # Pass progress callback to the tool function
-                result = tool_func(progress_callback=progress_callback, **arguments)
+                call_args["progress_callback"] = progress_callback
+            
+            if is_dangerous:
+                # Dangerous tools run in a bounded worker slot with per-job resource limits
+                if hasattr(tool_func, "_supports_resource_limits") and tool_func._supports_resource_limits:
+                    # Server-side limits always override anything the client sent
+                    call_args["resource_limits"] = self.tool_scheduler.job_limits
+                
+                operation_id = f"tool_execute_{tool_name}_{str(uuid.uuid4())[:8]}"
+                if progress_callback:
+                    def queue_progress(_operation_id: str, percent_complete: int, status_message: str):
+                        progress_callback(percent_complete, status_message)
+                else:
+                    queue_progress = self.report_progress
+                
+                result = self.tool_scheduler.run(
+                    lambda: tool_func(**call_args),
+                    client_id=client_id,
+                    operation_id=operation_id,
+                    progress_callback=queue_progress
+                )
             else:
-                # Execute without progress reporting
-                result = tool_func(**arguments)
+                result = tool_func(**call_args)
             
             # Log successful execution
-            self.logger.info(f"Successfully executed tool {tool_name}" +
-                           (f" for client {client_id}" if client_id else ""))
+            if client_id:
+                self.logger.info("Successfully executed tool %s for client %s", tool_name, client_id)
+            else:
+                self.logger.info("Successfully executed tool %s", tool_name)
             
             return result
         except Exception as e:
@@ -547,7 +683,8 @@ class MCPServer:
             raise ValueError(f"Unknown resource provider: {provider}")
             
         provider_instance = self.resource_providers[provider]
-        return provider_instance.list_resources(path)
+        with self.tracer.span("server.provider_io"):
+            return provider_instance.list_resources(path)
         
     def _handle_resources_read(self, params: Dict[str, Any], client_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -581,9 +718,11 @@ class MCPServer:
         bypass_cache = params.get("bypass_cache", False)
         
         # Log the resource access with consent level
-        self.logger.info(f"Accessing resource: {uri} with READ_ONLY consent" +
-                       (f" for client {client_id}" if client_id else "") +
-                       (f" (streaming)" if stream_mode else ""))
+        streaming = " (streaming)" if stream_mode else ""
+        if client_id:
+            self.logger.info("Accessing resource: %s with READ_ONLY consent for client %s%s", uri, client_id, streaming)
+        else:
+            self.logger.info("Accessing resource: %s with READ_ONLY consent%s", uri, streaming)
         
         # Use the SDK server to read resources if available
         if hasattr(self.mcp_server, "read_resource"):
@@ -613,8 +752,10 @@ class MCPServer:
                 self.logger.warning(f"Elevated consent required for sensitive resource: {uri}")
                 raise ValueError(f"Resource '{uri}' is sensitive and requires ELEVATED consent")
                 
-            self.logger.info(f"Accessing sensitive resource: {uri} with ELEVATED consent" +
-                           (f" for client {client_id}" if client_id else ""))
+            if client_id:
+                self.logger.info("Accessing sensitive resource: %s with ELEVATED consent for client %s", uri, client_id)
+            else:
+                self.logger.info("Accessing sensitive resource: %s with ELEVATED consent", uri)
         
         # Check cache first if not bypassing
         if not bypass_cache and not stream_mode and uri in self.resource_cache:
@@ -623,7 +764,7 @@ class MCPServer:
             
             # Check if cache entry is still valid
             if current_time - cache_entry["timestamp"] < self.cache_config["ttl"]:
-                self.logger.debug(f"Cache hit for resource: {uri}")
+                self.logger.debug("Cache hit for resource: %s", uri)
                 
                 # If range is specified, extract the requested range
                 if range_spec:
@@ -641,20 +782,25 @@ class MCPServer:
         
         # Access the resource with streaming support if requested
         if hasattr(provider_instance, "read_resource_stream") and stream_mode:
-            result = provider_instance.read_resource_stream(uri, range_spec)
+            with self.tracer.span("server.provider_io"):
+                result = provider_instance.read_resource_stream(uri, range_spec)
         elif hasattr(provider_instance, "read_resource_range") and range_spec:
-            result = provider_instance.read_resource_range(uri, range_spec)
+            with self.tracer.span("server.provider_io"):
+                result = provider_instance.read_resource_range(uri, range_spec)
         else:
             # Fall back to standard read
-            result = provider_instance.read_resource(uri)
+            with self.tracer.span("server.provider_io"):
+                result = provider_instance.read_resource(uri)
             
             # Cache the result if successful and not streaming
             if not stream_mode and result.get("success", False) and not bypass_cache:
                 self._cache_resource(uri, result)
         
         # Log successful access
-        self.logger.info(f"Successfully accessed resource: {uri}" +
-                       (f" for client {client_id}" if client_id else ""))
+        if client_id:
+            self.logger.info("Successfully accessed resource: %s for client %s", uri, client_id)
+        else:
+            self.logger.info("Successfully accessed resource: %s", uri)
         
         return result
         
@@ -998,7 +1144,27 @@ class MCPServer:
         """
         Report progress for a long-running operation.
         
+        Updates are queued and emitted asynchronously; frequent updates for the
+        same operation are coalesced so that only the latest one is emitted.
+        
+        Args:
+            operation_id: Unique identifier for the operation
+            percent_complete: Percentage of completion (0-100)
+            status_message: Status message describing current progress
+            
+        Returns:
+            bool: True if progress was reported (or queued) successfully
+        """
+        if self.progress_pipeline is not None:
+            return self.progress_pipeline.submit(self.server_id, operation_id, percent_complete, status_message)
+        return self._emit_progress(self.server_id, operation_id, percent_complete, status_message)
+    
+    def _emit_progress(self, _server_id: str, operation_id: str, percent_complete: int, status_message: str) -> bool:
+        """
+        Emit a progress notification.
+        
         Args:
+            _server_id: Queue key used by the progress pipeline (this server's ID)
             operation_id: Unique identifier for the operation
             percent_complete: Percentage of completion (0-100)
             status_message: Status message describing current progress
@@ -1006,7 +1172,7 @@ class MCPServer:
         Returns:
             bool: True if progress was reported successfully
         """
-        self.logger.debug(f"Reporting progress for operation {operation_id}: {percent_complete}% - {status_message}")
+        self.logger.debug("Reporting progress for operation %s: %s%% - %s", operation_id, percent_complete, status_message)
         
         # Use the SDK to report progress if available
         if hasattr(self.mcp_server, "report_progress"):
@@ -1021,7 +1187,7 @@ class MCPServer:
         }
         
         # Log the progress
-        self.logger.info(f"Operation {operation_id} progress: {percent_complete}% - {status_message}")
+        self.logger.info("Operation %s progress: %s%% - %s", operation_id, percent_complete, status_message)
         
         return True
         for capability in self.capabilities:
@@ -1,8 +1,10 @@
-import subprocess
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Callable, Optional
 from mcp import tool
 
+from .streaming import DEFAULT_MAX_OUTPUT_BYTES, run_command
+
 logger = logging.getLogger("mcp_server.tools.shell")
 
 @tool(
@@ -19,6 +21,11 @@ logger = logging.getLogger("mcp_server.tools.shell")
                 "type": "integer",
                 "description": "Maximum execution time in seconds",
                 "default": 60
+            },
+            "max_output_bytes": {
+                "type": "integer",
+                "description": "Maximum number of output bytes retained; further output is discarded",
+                "default": DEFAULT_MAX_OUTPUT_BYTES
             }
         },
         "required": ["command"]
@@ -26,13 +33,27 @@ logger = logging.getLogger("mcp_server.tools.shell")
     dangerous=True,
     readOnly=False
 )
-def execute_shell_command(command: str, timeout: int = 60) -> Dict[str, Any]:
+def execute_shell_command(command: str, timeout: int = 60,
+                          max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+                          progress_callback: Optional[Callable[[int, str], None]] = None,
+                          resource_limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Execute a shell command and return the result
     
+    The command runs asynchronously with stdout and stderr read incrementally.
+    When a progress callback is supplied, each output chunk is sent as a
+    progress notification ("[stdout] ..." / "[stderr] ..."). Output beyond
+    ``max_output_bytes`` is discarded as it arrives, and the whole process
+    group is killed on timeout.
+    
     Args:
         command: The shell command to execute
         timeout: Maximum execution time in seconds
+        max_output_bytes: Maximum number of output bytes retained
+        progress_callback: Optional callback receiving (percent_complete, status_message);
+            MCPServer binds it to the operation ID of the tools/execute request
+        resource_limits: Optional per-job CPU/memory limits, supplied by the server's
+            execution scheduler (never by the client)
         
     Returns:
         Dict[str, Any]: A dictionary containing success status and output/error
@@ -42,23 +63,56 @@ def execute_shell_command(command: str, timeout: int = 60) -> Dict[str, Any]:
             "success": False,
             "error": "No command provided."
         }
+    
+    start_time = time.monotonic()
+    
+    def on_output(stream: str, text: str) -> None:
+        # Without a known total, report elapsed time against the timeout
+        percent_complete = min(99, int((time.monotonic() - start_time) * 100 / max(timeout, 1)))
+        progress_callback(percent_complete, f"[{stream}] {text}")
         
     try:
         logger.info(f"Executing shell command: {command}")
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True, timeout=timeout)
+        result = run_command(
+            command,
+            timeout=timeout,
+            max_output_bytes=max_output_bytes,
+            on_output=on_output if progress_callback else None,
+            resource_limits=resource_limits
+        )
+        
+        if progress_callback:
+            progress_callback(100, f"Command finished with exit code {result['exit_code']}")
+        
+        if result["timed_out"]:
+            logger.error(f"Shell command timed out after {timeout} seconds: {command}")
+            return {
+                "success": False,
+                "error": f"Command timed out after {timeout} seconds"
+            }
+            
+        if result["exit_code"] != 0:
+            logger.error(f"Shell command failed with exit code {result['exit_code']}: {command}")
+            return {
+                "success": False,
+                "error": f"Command failed: {result['stderr'][:200]}"
+            }
+            
         return {
             "success": True,
-            "output": result.stdout[:1000]  # return tool output (truncated if long)
-        }
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Shell command failed: {e}")
-        return {
-            "success": False,
-            "error": f"Command failed: {e.stderr[:200]}"
+            "output": result["stdout"][:1000],  # return tool output (truncated if long)
+            "output_bytes": result["stdout_bytes"],
+            "truncated": result["truncated"] or len(result["stdout"]) > 1000
         }
     except Exception as e:
         logger.error(f"Shell command execution error: {str(e)}")
         return {
             "success": False,
             "error": f"Execution error: {str(e)}"
-        }
\ No newline at end of file
+        }
+
+
+# Output chunks are reported through the server's progress callback, and the
+# server's execution scheduler supplies per-job resource limits
+execute_shell_command._supports_progress = True
+execute_shell_command._supports_resource_limits = True
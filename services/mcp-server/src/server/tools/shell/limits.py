@@ -0,0 +1,138 @@
+"""
+Per-job resource limits for MCP Server shell tools.
+
+Limits are given as a dictionary with the optional keys:
+
+- ``cpu_seconds``: CPU time limit (RLIMIT_CPU)
+- ``memory_mb``: Address space limit in megabytes (RLIMIT_AS)
+- ``max_processes``: Process count limit for the job's user (RLIMIT_NPROC)
+- ``max_file_size_mb``: Largest file the job may write (RLIMIT_FSIZE)
+- ``cpu_quota``: Fraction of one CPU the job may use (cgroup ``cpu.max`` only)
+- ``cgroup_root``: Delegated, writable cgroup v2 directory. When set, each job
+  runs in its own child cgroup with ``memory.max``, ``cpu.max`` and
+  ``pids.max`` applied, which also covers processes the job spawns.
+
+rlimits are applied in the child between fork and exec. cgroups are used only
+where a writable cgroup v2 hierarchy is available; otherwise they are skipped.
+"""
+
+import logging
+import os
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger("mcp_server.tools.shell")
+
+_MB = 1024 * 1024
+
+
+def build_preexec_fn(limits: Optional[Dict[str, Any]], cgroup_path: Optional[str] = None) -> Optional[Callable[[], None]]:
+    """
+    Build a function that applies the limits inside the child process.
+
+    Args:
+        limits: Resource limits dictionary
+        cgroup_path: Optional cgroup directory the child should join
+
+    Returns:
+        Optional[Callable[[], None]]: Function for ``preexec_fn``, or None if there is nothing to apply
+    """
+    if not limits and not cgroup_path:
+        return None
+
+    rlimits = []
+    if resource is not None and limits:
+        if limits.get("cpu_seconds"):
+            seconds = int(limits["cpu_seconds"])
+            rlimits.append((resource.RLIMIT_CPU, (seconds, seconds + 1)))
+        if limits.get("memory_mb"):
+            size = int(limits["memory_mb"]) * _MB
+            rlimits.append((resource.RLIMIT_AS, (size, size)))
+        if limits.get("max_processes") and hasattr(resource, "RLIMIT_NPROC"):
+            count = int(limits["max_processes"])
+            rlimits.append((resource.RLIMIT_NPROC, (count, count)))
+        if limits.get("max_file_size_mb"):
+            size = int(limits["max_file_size_mb"]) * _MB
+            rlimits.append((resource.RLIMIT_FSIZE, (size, size)))
+
+    if not rlimits and not cgroup_path:
+        return None
+
+    def apply_limits() -> None:
+        # Runs in the child between fork and exec: no logging, no allocation-heavy work
+        if cgroup_path:
+            with open(os.path.join(cgroup_path, "cgroup.procs"), "w") as f:
+                f.write("0")
+        for limit, values in rlimits:
+            soft, hard = values
+            current_soft, current_hard = resource.getrlimit(limit)
+            if current_hard != resource.RLIM_INFINITY:
+                # Never try to raise a limit above the inherited hard limit
+                hard = min(hard, current_hard)
+                soft = min(soft, hard)
+            resource.setrlimit(limit, (soft, hard))
+
+    return apply_limits
+
+
+class JobCgroup:
+    """
+    Context manager creating a cgroup v2 child group for one job.
+
+    If ``cgroup_root`` is not configured or not writable, ``path`` is None and
+    the job runs with rlimits only.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Any]]):
+        """
+        Initialize the job cgroup.
+
+        Args:
+            limits: Resource limits dictionary
+        """
+        self.limits = limits or {}
+        self.path: Optional[str] = None
+
+    def __enter__(self) -> "JobCgroup":
+        root = self.limits.get("cgroup_root")
+        if not root:
+            return self
+
+        path = os.path.join(root, f"mcp-job-{uuid.uuid4().hex[:12]}")
+        try:
+            os.mkdir(path)
+            if self.limits.get("memory_mb"):
+                self._write(path, "memory.max", str(int(self.limits["memory_mb"]) * _MB))
+            if self.limits.get("cpu_quota"):
+                # Fraction of one CPU, e.g. 0.5
+                period = 100000
+                self._write(path, "cpu.max", f"{int(float(self.limits['cpu_quota']) * period)} {period}")
+            if self.limits.get("max_processes"):
+                self._write(path, "pids.max", str(int(self.limits["max_processes"])))
+            self.path = path
+        except OSError as e:
+            logger.warning(f"cgroup limits unavailable under {root}, using rlimits only: {str(e)}")
+            self._remove(path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.path:
+            self._remove(self.path)
+            self.path = None
+
+    @staticmethod
+    def _write(path: str, name: str, value: str) -> None:
+        with open(os.path.join(path, name), "w") as f:
+            f.write(value)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
@@ -0,0 +1,211 @@
+"""
+Streaming subprocess execution for MCP Server shell tools.
+
+This module runs shell commands asynchronously and reads stdout and stderr
+incrementally instead of buffering the whole output. Output is forwarded to
+an optional callback chunk by chunk, only the first ``max_output_bytes`` are
+retained, and the whole process group is killed on timeout or cancellation.
+"""
+
+import asyncio
+import codecs
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .limits import JobCgroup, build_preexec_fn
+
+logger = logging.getLogger("mcp_server.tools.shell")
+
+# Default number of output bytes retained across stdout and stderr
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Size of a single read from a pipe
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class _OutputBudget:
+    """Byte budget shared by the stdout and stderr readers."""
+
+    def __init__(self, max_bytes: int):
+        self.remaining = max_bytes
+        self.truncated = False
+
+    def take(self, data: bytes) -> bytes:
+        """Return the part of ``data`` that still fits into the budget."""
+        if self.remaining <= 0:
+            self.truncated = True
+            return b""
+        if len(data) > self.remaining:
+            self.truncated = True
+            data = data[:self.remaining]
+        self.remaining -= len(data)
+        return data
+
+
+async def _read_stream(stream: asyncio.StreamReader, name: str, budget: _OutputBudget,
+                       chunk_size: int, on_output: Optional[Callable[[str, str], None]],
+                       counters: Dict[str, int], kept: list) -> None:
+    """
+    Read a pipe until EOF, appending what fits into the budget to ``kept``.
+
+    Data beyond the budget is still read (so the child never blocks on a full
+    pipe) but immediately discarded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    while True:
+        data = await stream.read(chunk_size)
+        if not data:
+            break
+        counters[name] += len(data)
+
+        data = budget.take(data)
+        if not data:
+            continue
+
+        text = decoder.decode(data)
+        kept.append(text)
+        if on_output and text:
+            try:
+                on_output(name, text)
+            except Exception as e:
+                logger.warning(f"Output callback failed: {str(e)}")
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        kept.append(tail)
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill the process and everything it spawned."""
+    if process.returncode is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def run_command_streaming(
+    command: str,
+    timeout: float = 60,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_output: Optional[Callable[[str, str], None]] = None,
+    cwd: Optional[str] = None,
+    resource_limits: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run a shell command, streaming its output.
+
+    Args:
+        command: The shell command to execute
+        timeout: Maximum execution time in seconds
+        max_output_bytes: Maximum number of output bytes retained across stdout and stderr
+        chunk_size: Size of a single read from a pipe
+        on_output: Callback called with ("stdout" | "stderr", text) for each retained chunk
+        cwd: Working directory of the command
+        resource_limits: Optional per-job CPU/memory limits (see ``limits.py``)
+
+    Returns:
+        Dict[str, Any]: Exit code, retained stdout/stderr (partial on timeout),
+        total byte counts and whether the output was truncated or the command timed out
+
+    Raises:
+        asyncio.CancelledError: If the caller is cancelled; the process group is killed first
+    """
+    with JobCgroup(resource_limits) as cgroup:
+        return await _run_in_session(command, timeout, max_output_bytes, chunk_size, on_output, cwd,
+                                     build_preexec_fn(resource_limits, cgroup.path))
+
+
+async def _run_in_session(command: str, timeout: float, max_output_bytes: int, chunk_size: int,
+                          on_output: Optional[Callable[[str, str], None]], cwd: Optional[str],
+                          preexec_fn: Optional[Callable[[], None]]) -> Dict[str, Any]:
+    """Run the command in its own session and collect its bounded output."""
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        preexec_fn=preexec_fn,
+        # Own process group, so the shell and all its children can be killed together
+        start_new_session=True
+    )
+
+    budget = _OutputBudget(max_output_bytes)
+    counters = {"stdout": 0, "stderr": 0}
+    output = {"stdout": [], "stderr": []}
+    readers = asyncio.gather(
+        _read_stream(process.stdout, "stdout", budget, chunk_size, on_output, counters, output["stdout"]),
+        _read_stream(process.stderr, "stderr", budget, chunk_size, on_output, counters, output["stderr"])
+    )
+
+    timed_out = False
+    start_time = time.monotonic()
+    try:
+        await asyncio.wait_for(readers, timeout=timeout)
+        remaining = max(0.0, timeout - (time.monotonic() - start_time))
+        await asyncio.wait_for(process.wait(), timeout=remaining)
+    except asyncio.TimeoutError:
+        timed_out = True
+        logger.warning(f"Shell command timed out after {timeout}s, killing process group {process.pid}")
+        _kill_process_group(process)
+        await process.wait()
+    except asyncio.CancelledError:
+        logger.warning(f"Shell command cancelled, killing process group {process.pid}")
+        _kill_process_group(process)
+        await process.wait()
+        raise
+
+    return {
+        "exit_code": process.returncode,
+        "stdout": "".join(output["stdout"]),
+        "stderr": "".join(output["stderr"]),
+        "stdout_bytes": counters["stdout"],
+        "stderr_bytes": counters["stderr"],
+        "truncated": budget.truncated,
+        "timed_out": timed_out
+    }
+
+
+def run_command(command: str, **kwargs) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around ``run_command_streaming``.
+
+    If the calling thread already runs an event loop, the command is executed
+    on a helper thread with its own loop.
+
+    Args:
+        command: The shell command to execute
+        **kwargs: Arguments passed to ``run_command_streaming``
+
+    Returns:
+        Dict[str, Any]: See ``run_command_streaming``
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_command_streaming(command, **kwargs))
+
+    outcome: Dict[str, Any] = {}
+
+    def runner():
+        try:
+            outcome["result"] = asyncio.run(run_command_streaming(command, **kwargs))
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=runner, name="shell-command", daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -2,9 +2,47 @@
 Services module for MCP Server.
 
 This module contains service classes that implement the business logic of the application.
+
+Exports are resolved on first access so that importing one service (e.g.
+``services.tracing``) does not import the others and their dependencies.
 """
 
-from .prompt_processor import PromptProcessor
-from .example_service import ExampleService
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'PromptProcessor': 'prompt_processor',
+    'ExampleService': 'example_service',
+    'AsyncLLMClient': 'llm_client',
+    'LLMTimeoutError': 'llm_client',
+    'LLMScheduler': 'llm_scheduler',
+    'JsonFormatter': 'logging_pipeline',
+    'SamplingFilter': 'logging_pipeline',
+    'stop_async_logging': 'logging_pipeline',
+    'Prewarmer': 'prewarm',
+    'ProgressPipeline': 'progress_pipeline',
+    'close_progress_pipelines': 'progress_pipeline',
+    'ResponseCache': 'response_cache',
+    'StateStore': 'state_store',
+    'MemoryStateStore': 'state_store',
+    'SQLiteStateStore': 'state_store',
+    'SharedMemoryStateStore': 'state_store',
+    'create_state_store': 'state_store',
+    'start_state_server': 'state_store',
+    'Tracer': 'tracing',
+    'get_tracer': 'tracing'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['PromptProcessor', 'ExampleService']
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
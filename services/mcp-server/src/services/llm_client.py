@@ -0,0 +1,229 @@
+"""
+Async LLM Client for MCP Server.
+
+This module provides an asynchronous client for the Ollama-compatible LLM
+server. All requests share one pooled HTTP connection (keep-alive), the number
+of in-flight generations per model can be bounded, and responses can be
+consumed as a token stream. Unlike the blocking ``LLMClient``, a slow generation never
+holds the event loop.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from .tracing import get_tracer
+
+
+class LLMTimeoutError(Exception):
+    """Raised when a generation does not start or finish within its timeout."""
+    pass
+
+
+class AsyncLLMClient:
+    """Asynchronous, pooled client for interacting with the LLM server."""
+
+    def __init__(
+        self,
+        host: str,
+        port: str,
+        model: str,
+        timeout: int,
+        logger: logging.Logger,
+        max_connections: int = 20,
+        max_concurrency_per_model: Optional[int] = 2,
+        model_concurrency: Optional[Dict[str, int]] = None,
+        connect_timeout: float = 5.0,
+        queue_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the async LLM client.
+
+        Args:
+            host: LLM server host
+            port: LLM server port
+            model: Default model name to use
+            timeout: Read timeout in seconds (maximum silence between streamed chunks)
+            logger: Logger instance
+            max_connections: Size of the shared HTTP connection pool
+            max_concurrency_per_model: Default number of concurrent generations per model.
+                None leaves generations unbounded, e.g. when an ``LLMScheduler`` limits them.
+            model_concurrency: Per-model overrides of the concurrency limit
+            connect_timeout: Connection timeout in seconds
+            queue_timeout: Maximum time in seconds to wait for a free model slot (None waits forever)
+        """
+        self.host = host
+        self.port = port
+        self.model = model
+        self.timeout = timeout
+        self.logger = logger
+        self.base_url = f"http://{host}:{port}"
+        self.max_connections = max_connections
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.model_concurrency = model_concurrency or {}
+        self.connect_timeout = connect_timeout
+        self.queue_timeout = queue_timeout
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._model_slots: Dict[str, Optional[asyncio.Semaphore]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    def _get_model_slots(self, model: str) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency limiter for a model, or None if it is unbounded."""
+        if model not in self._model_slots:
+            limit = self.model_concurrency.get(model, self.max_concurrency_per_model)
+            self._model_slots[model] = asyncio.Semaphore(limit) if limit else None
+        return self._model_slots[model]
+
+    async def _acquire_slot(self, model: str) -> Optional[asyncio.Semaphore]:
+        """
+        Wait for a free generation slot for a model.
+
+        Raises:
+            LLMTimeoutError: If no slot becomes free within the queue timeout
+        """
+        slots = self._get_model_slots(model)
+        if slots is None:
+            return None
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise LLMTimeoutError(f"Timed out waiting for a free {model} slot after {self.queue_timeout}s")
+        return slots
+
+    async def generate(self, prompt: str, model: Optional[str] = None,
+                       options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate a complete response from the LLM.
+
+        Args:
+            prompt: Input prompt
+            model: Model name; defaults to the configured model
+            options: Optional generation parameters passed to the LLM server
+
+        Returns:
+            str: Generated response
+
+        Raises:
+            LLMTimeoutError: If the request times out
+            Exception: If the request fails
+        """
+        model = model or self.model
+        self.logger.info(f"Querying {model} with prompt length: {len(prompt)}")
+
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        if options:
+            payload["options"] = options
+
+        slots = await self._acquire_slot(model)
+        try:
+            with get_tracer().span("provider_io.llm"):
+                response = await self._get_client().post("/api/generate", json=payload)
+            response.raise_for_status()
+            answer_text = response.json().get("response", "").strip()
+            self.logger.info(f"Got response from LLM, length: {len(answer_text)}")
+            return answer_text
+        except httpx.TimeoutException as e:
+            self.logger.error(f"LLM inference timed out: {str(e)}")
+            raise LLMTimeoutError(f"LLM request timed out: {str(e)}") from e
+        except Exception as e:
+            self.logger.error(f"LLM inference error: {str(e)}")
+            raise
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def stream(self, prompt: str, model: Optional[str] = None,
+                     options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Generate a response from the LLM as a stream of tokens.
+
+        The model slot is held until the stream is exhausted or closed.
+
+        Args:
+            prompt: Input prompt
+            model: Model name; defaults to the configured model
+            options: Optional generation parameters passed to the LLM server
+
+        Yields:
+            str: Response fragments in generation order
+
+        Raises:
+            LLMTimeoutError: If the request times out
+            Exception: If the request fails
+        """
+        model = model or self.model
+        self.logger.info(f"Streaming from {model} with prompt length: {len(prompt)}")
+
+        payload = {"model": model, "prompt": prompt, "stream": True}
+        if options:
+            payload["options"] = options
+
+        slots = await self._acquire_slot(model)
+        try:
+            async with self._get_client().stream("POST", "/api/generate", json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise RuntimeError(chunk["error"])
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+        except httpx.TimeoutException as e:
+            self.logger.error(f"LLM stream timed out: {str(e)}")
+            raise LLMTimeoutError(f"LLM request timed out: {str(e)}") from e
+        except Exception as e:
+            self.logger.error(f"LLM streaming error: {str(e)}")
+            raise
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def check_connection(self) -> Dict[str, Any]:
+        """
+        Check connection to the LLM server.
+
+        Returns:
+            Dict[str, Any]: Connection status information
+        """
+        try:
+            response = await self._get_client().get("/api/tags", timeout=5)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+            return {
+                "status": "connected",
+                "api_status": response.status_code,
+                "models_available": models
+            }
+        except Exception as e:
+            self.logger.error(f"LLM Server connection check failed: {str(e)}")
+            return {
+                "status": "error",
+                "error_type": type(e).__name__,
+                "error_details": str(e)
+            }
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,381 @@
+"""
+LLM Request Scheduler for MCP Server.
+
+This module queues LLM generation requests in front of the backend client:
+
+- Each model has its own concurrency limit, so a burst never puts more
+  generations on the LLM server than it can run.
+- Requests belong to a priority class. Interactive requests are always
+  dispatched before batch requests, so bulk analysis cannot starve users.
+- Within a class, clients are served round-robin, so one client submitting
+  many prompts cannot monopolize a model.
+- Identical requests (same model, prompt and options) that are queued or
+  running at the same time share one generation.
+- Short prompts arriving within a small time window are micro-batched into a
+  single backend call when the backend provides ``generate_batch``.
+- Streamed generations wait in the same queues and hold their model slot
+  until the caller has consumed or closed the stream.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+PRIORITY_CLASSES = (PRIORITY_INTERACTIVE, PRIORITY_BATCH)
+
+
+class _Job:
+    """A queued generation and the callers waiting for its result."""
+
+    __slots__ = ("key", "model", "prompt", "options", "priority", "client_id", "waiters", "stream")
+
+    def __init__(self, key: str, model: str, prompt: str, options: Optional[Dict[str, Any]],
+                 priority: str, client_id: str, stream: bool = False):
+        self.key = key
+        self.model = model
+        self.prompt = prompt
+        self.options = options
+        self.priority = priority
+        self.client_id = client_id
+        self.waiters: List[asyncio.Future] = []
+        # Streamed jobs are handed their model slot instead of being run by the scheduler
+        self.stream = stream
+
+
+class LLMScheduler:
+    """Priority-aware, fair scheduler for LLM generation requests."""
+
+    def __init__(
+        self,
+        backend: Any,
+        logger: logging.Logger,
+        max_concurrency_per_model: int = 2,
+        model_concurrency: Optional[Dict[str, int]] = None,
+        batch_window: float = 0.01,
+        max_batch_size: int = 8,
+        short_prompt_chars: int = 512
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            backend: LLM client providing ``async generate(prompt, model=None, options=None)``
+                and optionally ``async generate_batch(prompts, model=None)``
+            logger: Logger instance
+            max_concurrency_per_model: Default number of concurrent backend calls per model
+            model_concurrency: Per-model overrides of the concurrency limit
+            batch_window: Time in seconds to wait for more short prompts before dispatching a batch
+            max_batch_size: Maximum number of prompts in one micro-batch
+            short_prompt_chars: Prompts up to this length are eligible for micro-batching
+        """
+        self.backend = backend
+        self.logger = logger
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.model_concurrency = model_concurrency or {}
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.short_prompt_chars = short_prompt_chars
+        self.supports_batching = callable(getattr(backend, "generate_batch", None))
+
+        # model -> priority -> client_id -> deque of jobs (OrderedDict gives round-robin order)
+        self._queues: Dict[str, Dict[str, "OrderedDict[str, Deque[_Job]]"]] = {}
+        self._jobs: Dict[str, _Job] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._dispatchers: Dict[str, asyncio.Task] = {}
+        self._running: set = set()
+        self._stream_ids = itertools.count()
+
+        self.stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "dispatched": 0,
+            "batches": 0,
+            "batched_prompts": 0,
+            "errors": 0
+        }
+
+    async def submit(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        client_id: str = "default",
+        priority: str = PRIORITY_INTERACTIVE,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Queue a generation and wait for its result.
+
+        Args:
+            prompt: Input prompt
+            model: Model name; defaults to the backend's configured model
+            client_id: ID of the requesting client, used for fairness
+            priority: Priority class ("interactive" or "batch")
+            options: Optional generation parameters
+
+        Returns:
+            str: Generated response
+
+        Raises:
+            ValueError: If the priority class is unknown
+            Exception: If the backend call fails
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        model = model or getattr(self.backend, "model", "default")
+        key = json.dumps([model, prompt, options or {}], sort_keys=True)
+        future = asyncio.get_running_loop().create_future()
+        self.stats["submitted"] += 1
+
+        job = self._jobs.get(key)
+        if job is not None:
+            # An identical request is already queued or running; share its result
+            job.waiters.append(future)
+            self.stats["coalesced"] += 1
+            if priority == PRIORITY_INTERACTIVE and job.priority != PRIORITY_INTERACTIVE:
+                self._promote(job)
+        else:
+            job = _Job(key, model, prompt, options, priority, client_id)
+            job.waiters.append(future)
+            self._jobs[key] = job
+            self._enqueue(job)
+
+        return await asyncio.shield(future)
+
+    async def stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        client_id: str = "default",
+        priority: str = PRIORITY_INTERACTIVE,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Queue a streamed generation and yield its tokens once it is dispatched.
+
+        Streamed generations are never coalesced or micro-batched. The model
+        slot is held until the stream is exhausted or closed.
+
+        Args:
+            prompt: Input prompt
+            model: Model name; defaults to the backend's configured model
+            client_id: ID of the requesting client, used for fairness
+            priority: Priority class ("interactive" or "batch")
+            options: Optional generation parameters
+
+        Yields:
+            str: Response fragments in generation order
+
+        Raises:
+            ValueError: If the priority class is unknown
+            Exception: If the backend call fails
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        model = model or getattr(self.backend, "model", "default")
+        admitted = asyncio.get_running_loop().create_future()
+        self.stats["submitted"] += 1
+
+        job = _Job(f"stream-{next(self._stream_ids)}", model, prompt, options, priority, client_id, stream=True)
+        job.waiters.append(admitted)
+        self._jobs[job.key] = job
+        self._enqueue(job)
+
+        try:
+            slots = await admitted
+        except asyncio.CancelledError:
+            if admitted.done() and not admitted.cancelled():
+                # Dispatched just before the caller went away
+                admitted.result().release()
+            else:
+                self._remove(job)
+            raise
+
+        try:
+            async for token in self.backend.stream(prompt, model=model, options=options):
+                yield token
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.error(f"LLM stream for {model} failed: {str(e)}")
+            raise
+        finally:
+            slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dict[str, Any]: Counters and current queue depth per model and priority class
+        """
+        stats = dict(self.stats)
+        stats["queued"] = {
+            model: {
+                priority: sum(len(jobs) for jobs in clients.values())
+                for priority, clients in queues.items()
+            }
+            for model, queues in self._queues.items()
+        }
+        stats["running"] = len(self._running)
+        return stats
+
+    async def close(self) -> None:
+        """Stop the dispatchers and fail all queued requests."""
+        for task in self._dispatchers.values():
+            task.cancel()
+        await asyncio.gather(*self._dispatchers.values(), return_exceptions=True)
+        self._dispatchers.clear()
+
+        for job in list(self._jobs.values()):
+            self._resolve(job, error=RuntimeError("LLM scheduler closed"))
+        self._queues.clear()
+
+    def _enqueue(self, job: _Job) -> None:
+        """Add a job to its model queue and make sure the model has a dispatcher."""
+        queues = self._queues.setdefault(
+            job.model, {priority: OrderedDict() for priority in PRIORITY_CLASSES}
+        )
+        queues[job.priority].setdefault(job.client_id, deque()).append(job)
+
+        if job.model not in self._wakeups:
+            self._wakeups[job.model] = asyncio.Event()
+            limit = self.model_concurrency.get(job.model, self.max_concurrency_per_model)
+            self._slots[job.model] = asyncio.Semaphore(limit)
+
+        dispatcher = self._dispatchers.get(job.model)
+        if dispatcher is None or dispatcher.done():
+            self._dispatchers[job.model] = asyncio.create_task(self._dispatch(job.model))
+        self._wakeups[job.model].set()
+
+    def _remove(self, job: _Job) -> None:
+        """Drop a queued job whose callers are gone."""
+        self._jobs.pop(job.key, None)
+        clients = self._queues.get(job.model, {}).get(job.priority, {})
+        jobs = clients.get(job.client_id)
+        if jobs is not None and job in jobs:
+            jobs.remove(job)
+            if not jobs:
+                del clients[job.client_id]
+
+    def _promote(self, job: _Job) -> None:
+        """Move a queued batch job to the interactive class."""
+        clients = self._queues.get(job.model, {}).get(job.priority, {})
+        jobs = clients.get(job.client_id)
+        if jobs is None or job not in jobs:
+            # Already running
+            return
+        jobs.remove(job)
+        if not jobs:
+            del clients[job.client_id]
+        job.priority = PRIORITY_INTERACTIVE
+        self._queues[job.model][PRIORITY_INTERACTIVE].setdefault(job.client_id, deque()).append(job)
+
+    def _next_job(self, model: str, priority: Optional[str] = None,
+                  short_only: bool = False) -> Optional[_Job]:
+        """
+        Take the next job for a model.
+
+        Higher priority classes are served first; within a class the client
+        at the head of the rotation is served and moved to the back.
+        """
+        queues = self._queues.get(model, {})
+        for priority_class in ([priority] if priority else PRIORITY_CLASSES):
+            clients = queues.get(priority_class)
+            if not clients:
+                continue
+            for client_id in list(clients):
+                jobs = clients[client_id]
+                if short_only and not self._is_batchable(jobs[0]):
+                    continue
+                job = jobs.popleft()
+                if jobs:
+                    clients.move_to_end(client_id)
+                else:
+                    del clients[client_id]
+                return job
+        return None
+
+    def _is_batchable(self, job: _Job) -> bool:
+        """Check whether a job may be merged into a micro-batch."""
+        return not job.stream and not job.options and len(job.prompt) <= self.short_prompt_chars
+
+    async def _dispatch(self, model: str) -> None:
+        """Dispatch queued jobs for one model as slots become free."""
+        wakeup = self._wakeups[model]
+        slots = self._slots[model]
+
+        while True:
+            await slots.acquire()
+            job = self._next_job(model)
+            while job is None:
+                wakeup.clear()
+                await wakeup.wait()
+                job = self._next_job(model)
+
+            if job.stream:
+                # The caller runs the stream and releases the slot when done
+                self.stats["dispatched"] += 1
+                self._jobs.pop(job.key, None)
+                admitted = job.waiters[0]
+                if admitted.done():
+                    slots.release()
+                else:
+                    admitted.set_result(slots)
+                continue
+
+            batch = [job]
+            if self.supports_batching and self.max_batch_size > 1 and self._is_batchable(job):
+                if self.batch_window > 0:
+                    await asyncio.sleep(self.batch_window)
+                while len(batch) < self.max_batch_size:
+                    extra = self._next_job(model, priority=job.priority, short_only=True)
+                    if extra is None:
+                        break
+                    batch.append(extra)
+
+            task = asyncio.create_task(self._run(model, batch, slots))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, model: str, batch: List[_Job], slots: asyncio.Semaphore) -> None:
+        """Run one backend call for a job or micro-batch and deliver the results."""
+        self.stats["dispatched"] += len(batch)
+        try:
+            if len(batch) > 1:
+                self.stats["batches"] += 1
+                self.stats["batched_prompts"] += len(batch)
+                results = await self.backend.generate_batch([job.prompt for job in batch], model=model)
+                for job, result in zip(batch, results):
+                    self._resolve(job, result=result)
+            else:
+                job = batch[0]
+                result = await self.backend.generate(job.prompt, model=model, options=job.options)
+                self._resolve(job, result=result)
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.logger.error(f"LLM request for {model} failed: {str(e)}")
+            for job in batch:
+                self._resolve(job, error=e)
+        finally:
+            slots.release()
+
+    def _resolve(self, job: _Job, result: Optional[str] = None,
+                 error: Optional[BaseException] = None) -> None:
+        """Deliver a result or error to every caller waiting on a job."""
+        self._jobs.pop(job.key, None)
+        for waiter in job.waiters:
+            if waiter.done():
+                continue
+            if error is not None:
+                waiter.set_exception(error)
+                # Callers that gave up waiting must not trigger "exception never retrieved"
+                waiter.exception()
+            else:
+                waiter.set_result(result)
@@ -0,0 +1,213 @@
+"""
+Non-blocking logging pipeline for MCP Server.
+
+Request threads put log records on a bounded in-memory queue and a
+``QueueListener`` thread writes them to the file and console handlers, so
+logging never waits on I/O. Message arguments are merged on the listener
+thread (deferred formatting) unless one of them could change in the meantime.
+High-volume records at INFO and below can be sampled per message template,
+and ``JsonFormatter`` renders records as one JSON object per line.
+
+Formatting is only deferred for messages logged with ``%``-style arguments,
+e.g. ``logger.info("Accessing resource: %s", uri)``; f-strings are always
+built by the caller, even when the level is disabled.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+# Argument types that cannot change between logging and formatting
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample"}
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread."""
+
+    def __init__(self, log_queue: queue.Queue):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Queue read by the listener thread
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue.
+
+        The stock implementation formats the message on the calling thread.
+        Here the record is passed on as-is; only mutable arguments are merged
+        into the message right away so that the logged values are preserved.
+
+        Args:
+            record: The log record
+
+        Returns:
+            logging.LogRecord: The record to enqueue
+        """
+        if record.args and not _args_immutable(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue without blocking, dropping it if the queue is full.
+
+        Args:
+            record: The log record
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in every N records at or below a level, counted per message template."""
+
+    def __init__(self, sample_rate: float, max_level: int = logging.INFO, max_templates: int = 10000):
+        """
+        Initialize the filter.
+
+        Args:
+            sample_rate: Fraction of records kept (1.0 keeps all, 0 drops all)
+            max_level: Highest level that is sampled; records above it are always kept
+            max_templates: Number of message templates tracked before the counts are reset
+        """
+        super().__init__()
+        self.every = max(1, round(1.0 / sample_rate)) if sample_rate > 0 else 0
+        self.max_level = max_level
+        self.max_templates = max_templates
+        self._counts: Dict[Any, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is logged.
+
+        Records logged with ``extra={"sample": False}`` are always kept.
+
+        Args:
+            record: The log record
+
+        Returns:
+            bool: True if the record is kept
+        """
+        if record.levelno > self.max_level or self.every == 1 or getattr(record, "sample", True) is False:
+            return True
+        if self.every == 0:
+            return False
+        # Counts are approximate under concurrency, which is fine for sampling
+        count = self._counts.get(record.msg, 0)
+        if count == 0 and len(self._counts) >= self.max_templates:
+            self._counts.clear()
+        self._counts[record.msg] = count + 1
+        return count % self.every == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+
+        Args:
+            record: The log record
+
+        Returns:
+            str: JSON object with time, level, logger, message and extra fields
+        """
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def attach_async_handlers(logger: logging.Logger, handlers: List[logging.Handler],
+                          queue_size: int = 10000,
+                          sampling_filter: Optional[SamplingFilter] = None) -> DeferredQueueHandler:
+    """
+    Route a logger's records through a queue to handlers run on a background thread.
+
+    A listener previously attached to the same logger is stopped and its
+    handlers are closed.
+
+    Args:
+        logger: The logger
+        handlers: Handlers written by the listener thread
+        queue_size: Maximum number of queued records; further records are dropped
+        sampling_filter: Optional filter applied on the calling thread before enqueueing
+
+    Returns:
+        DeferredQueueHandler: The handler added to the logger
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = DeferredQueueHandler(log_queue)
+    if sampling_filter is not None:
+        queue_handler.addFilter(sampling_filter)
+    listener = _QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    with _listeners_lock:
+        previous = _listeners.pop(logger.name, None)
+        _listeners[logger.name] = listener
+    if previous is not None:
+        _stop_listener(previous)
+
+    listener.start()
+    logger.addHandler(queue_handler)
+    return queue_handler
+
+
+def stop_async_logging() -> None:
+    """Write all queued records and stop the listener threads."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        _stop_listener(listener)
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _args_immutable(args: Any) -> bool:
+    values = args.values() if isinstance(args, dict) else args
+    return all(type(value) in _IMMUTABLE_TYPES for value in values)
+
+
+atexit.register(stop_async_logging)
@@ -0,0 +1,104 @@
+"""
+Background pre-warming for MCP Server.
+
+A cold start pays for module imports and first-use initialization (connection
+pools, caches, SDK objects) on the first request. ``Prewarmer`` runs these
+steps in the background once the application has started, so the server
+accepts connections right away and later requests find the work done.
+
+Blocking steps (typically imports) run on a worker thread. Non-blocking steps
+run on the event loop, which keeps the creation of non-thread-safe singletons
+on the same thread as request handling.
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Prewarmer:
+    """Runs registered warm-up steps in the background after startup."""
+
+    def __init__(self, logger: logging.Logger, delay: float = 0.0):
+        """
+        Initialize the pre-warmer.
+
+        Args:
+            logger: Logger instance
+            delay: Seconds to wait after startup before the first step
+        """
+        self.logger = logger
+        self.delay = delay
+        self._steps: List[Tuple[str, Callable[[], Any], bool]] = []
+        self._task: Optional[asyncio.Task] = None
+        self.status: Dict[str, Any] = {"state": "pending", "steps": {}}
+
+    def add(self, name: str, func: Callable[[], Any], blocking: bool = False) -> None:
+        """
+        Register a warm-up step.
+
+        Args:
+            name: Step name reported in the status
+            func: Function performing the step
+            blocking: Whether the step blocks and must run on a worker thread
+        """
+        self._steps.append((name, func, blocking))
+
+    def add_imports(self, *module_names: str) -> None:
+        """
+        Register modules to be imported on a worker thread.
+
+        Args:
+            module_names: Fully qualified module names
+        """
+        for module_name in module_names:
+            self.add(f"import {module_name}", lambda name=module_name: importlib.import_module(name), blocking=True)
+
+    def start(self) -> asyncio.Task:
+        """
+        Start running the steps in the background.
+
+        Must be called from the event loop, e.g. in a startup handler; it
+        returns immediately.
+
+        Returns:
+            asyncio.Task: The task running the steps
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the pre-warm status.
+
+        Returns:
+            Dict[str, Any]: Overall state ("pending", "running" or "done") and per-step durations or errors
+        """
+        return {"state": self.status["state"], "steps": dict(self.status["steps"])}
+
+    async def _run(self) -> None:
+        """Run all steps in registration order, logging failures without raising."""
+        # Yield first so that startup completes and the server starts accepting connections
+        await asyncio.sleep(self.delay)
+        self.status["state"] = "running"
+        started = time.perf_counter()
+
+        for name, func, blocking in self._steps:
+            step_started = time.perf_counter()
+            try:
+                if blocking:
+                    await asyncio.to_thread(func)
+                else:
+                    func()
+                self.status["steps"][name] = {"duration": round(time.perf_counter() - step_started, 4)}
+            except Exception as e:
+                self.logger.warning(f"Pre-warm step '{name}' failed: {str(e)}")
+                self.status["steps"][name] = {"error": str(e)}
+            # Let pending requests run between steps
+            await asyncio.sleep(0)
+
+        self.status["state"] = "done"
+        self.logger.info("Pre-warm completed in %.3fs", time.perf_counter() - started)
@@ -0,0 +1,320 @@
+"""
+Progress notification pipeline for MCP Server.
+
+Tools may report progress far more often than clients need it. This module
+decouples the reporting thread from delivery: updates are put on a bounded
+queue per client and delivered by a background thread. Updates for the same
+operation are coalesced (the latest one wins) and rate-limited to at most
+``max_updates_per_second`` per operation. Final updates (100%) are never
+coalesced away or delayed.
+
+Updates carrying command output (``[stdout] ...`` or ``[stderr] ...``, as sent
+by the shell tool) are never replaced. Pending output of an operation is
+concatenated instead, so streamed output is delivered completely; only the
+plain status updates between output chunks are coalesced.
+
+Pipelines still open at shutdown are closed by close_progress_pipelines,
+which the application's shutdown hook and ``atexit`` call, so final updates
+queued on the delivery thread are not lost.
+"""
+
+import atexit
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Prefix of status messages carrying a chunk of command output
+OUTPUT_PREFIX_PATTERN = re.compile(r"\[(stdout|stderr)\] ")
+
+# Pipelines that have not been closed yet
+_open_pipelines: "weakref.WeakSet[ProgressPipeline]" = weakref.WeakSet()
+_open_pipelines_lock = threading.Lock()
+
+
+class _PendingUpdate:
+    """An update waiting for delivery; output updates keep their text per stream."""
+
+    __slots__ = ("percent_complete", "status_message", "segments")
+
+    def __init__(self, percent_complete: int, status_message: str):
+        self.percent_complete = percent_complete
+        self.status_message = status_message
+        match = OUTPUT_PREFIX_PATTERN.match(status_message)
+        # [stream, text] pairs of output updates, None for plain status updates
+        self.segments: Optional[List[List[str]]] = (
+            [[match.group(1), status_message[match.end():]]] if match else None
+        )
+
+    @property
+    def is_final(self) -> bool:
+        return self.percent_complete >= 100
+
+    def append_output(self, update: "_PendingUpdate") -> None:
+        """Append the output of a later update."""
+        self.percent_complete = update.percent_complete
+        for stream, text in update.segments:
+            if self.segments[-1][0] == stream:
+                self.segments[-1][1] += text
+            else:
+                self.segments.append([stream, text])
+
+    def render(self) -> str:
+        """Status message of the update, with the output of all merged updates."""
+        if self.segments is None:
+            return self.status_message
+        parts = []
+        for stream, text in self.segments:
+            if parts and not parts[-1].endswith("\n"):
+                parts.append("\n")
+            parts.append(f"[{stream}] {text}")
+        return "".join(parts)
+
+
+class ProgressPipeline:
+    """Coalescing, rate-limited, asynchronous delivery of progress updates."""
+
+    def __init__(
+        self,
+        deliver: Callable[[Hashable, Hashable, int, str], Any],
+        logger: logging.Logger,
+        max_updates_per_second: float = 5.0,
+        max_queue_per_client: int = 100
+    ):
+        """
+        Initialize the progress pipeline.
+
+        Args:
+            deliver: Function called on the delivery thread with
+                (client_key, operation_key, percent_complete, status_message)
+            logger: Logger instance
+            max_updates_per_second: Maximum number of updates delivered per operation and second
+                (0 disables rate limiting; updates are still coalesced)
+            max_queue_per_client: Maximum number of pending updates per client. When full, the
+                oldest pending non-final update of that client is dropped.
+        """
+        self.deliver = deliver
+        self.logger = logger
+        self.min_interval = 1.0 / max_updates_per_second if max_updates_per_second > 0 else 0.0
+        self.max_queue_per_client = max_queue_per_client
+
+        # client_key -> OrderedDict(operation_key -> [_PendingUpdate, ...]), oldest first
+        self._pending: "OrderedDict[Hashable, OrderedDict]" = OrderedDict()
+        # (client_key, operation_key) -> earliest time of the next delivery
+        self._next_allowed: Dict[Tuple[Hashable, Hashable], float] = {}
+        self._delivering = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "submitted": 0,
+            "delivered": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "failed": 0
+        }
+        
+        with _open_pipelines_lock:
+            _open_pipelines.add(self)
+
+    def submit(self, client_key: Hashable, operation_key: Hashable,
+               percent_complete: int, status_message: str) -> bool:
+        """
+        Queue a progress update without blocking on delivery.
+
+        Args:
+            client_key: Key of the receiving client (one queue per client)
+            operation_key: Key of the operation the update belongs to
+            percent_complete: Percentage of completion (0-100)
+            status_message: Status message describing current progress
+
+        Returns:
+            bool: True if the update was queued, False if the pipeline is closed
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            self._ensure_thread()
+            self.stats["submitted"] += 1
+
+            queue = self._pending.setdefault(client_key, OrderedDict())
+            update = _PendingUpdate(percent_complete, status_message)
+            if operation_key in queue:
+                self._coalesce(queue[operation_key], update)
+            else:
+                if len(queue) >= self.max_queue_per_client:
+                    self._drop_oldest(queue)
+                queue[operation_key] = [update]
+
+            self._condition.notify()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all pending updates have been delivered.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            bool: True if the queues are empty
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self._pending or self._delivering:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Deliver what is pending and stop the delivery thread.
+
+        Args:
+            timeout: Maximum time to wait for pending updates in seconds
+        """
+        with _open_pipelines_lock:
+            _open_pipelines.discard(self)
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pipeline statistics.
+
+        Returns:
+            Dict[str, Any]: Counters and the number of pending updates per client
+        """
+        with self._condition:
+            stats = dict(self.stats)
+            stats["pending"] = {str(client_key): len(queue) for client_key, queue in self._pending.items()}
+        return stats
+
+    def _ensure_thread(self) -> None:
+        """Start the delivery thread on first use. The caller must hold the lock."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="progress-pipeline", daemon=True)
+            self._thread.start()
+
+    def _coalesce(self, updates: List[_PendingUpdate], update: _PendingUpdate) -> None:
+        """
+        Add an update to the pending updates of its operation. The caller must hold the lock.
+
+        Pending plain updates are superseded by the new one, except final
+        updates; output is appended to pending output.
+        """
+        kept = [pending for pending in updates if pending.segments is not None or pending.is_final]
+        self.stats["coalesced"] += len(updates) - len(kept)
+        if update.segments is None and not update.is_final and any(pending.is_final for pending in kept):
+            # Never let a non-final update replace a pending final one
+            self.stats["coalesced"] += 1
+        elif update.segments is not None and kept and kept[-1].segments is not None:
+            kept[-1].append_output(update)
+            self.stats["coalesced"] += 1
+        else:
+            kept.append(update)
+        updates[:] = kept
+
+    def _drop_oldest(self, queue: "OrderedDict") -> None:
+        """Drop the oldest pending non-final update of a full client queue, preferring plain updates."""
+        for carries_output in (False, True):
+            for operation_key, updates in queue.items():
+                if not any(update.is_final for update in updates) and \
+                        any(update.segments is not None for update in updates) == carries_output:
+                    del queue[operation_key]
+                    self.stats["dropped"] += 1
+                    return
+        # Only final updates are pending; drop the oldest one rather than grow without bound
+        queue.popitem(last=False)
+        self.stats["dropped"] += 1
+
+    def _next_ready(self, now: float) -> Tuple[Optional[tuple], Optional[float]]:
+        """
+        Take the next update that may be delivered now, serving clients round-robin.
+
+        The caller must hold the lock.
+
+        Returns:
+            Tuple[Optional[tuple], Optional[float]]: The update (or None) and, if
+            nothing is ready, the earliest time something becomes ready
+        """
+        earliest = None
+        for client_key, queue in self._pending.items():
+            for operation_key, updates in queue.items():
+                ready_at = self._next_allowed.get((client_key, operation_key), 0.0)
+                # Output pending before a final update is not delayed either
+                if ready_at <= now or any(update.is_final for update in updates):
+                    update = updates.pop(0)
+                    if not updates:
+                        del queue[operation_key]
+                    if not queue:
+                        del self._pending[client_key]
+                    else:
+                        # Serve the other clients before this one again
+                        self._pending.move_to_end(client_key)
+                    if update.is_final:
+                        self._next_allowed.pop((client_key, operation_key), None)
+                    else:
+                        self._next_allowed[(client_key, operation_key)] = now + self.min_interval
+                    return (client_key, operation_key, update.percent_complete, update.render()), None
+                earliest = ready_at if earliest is None else min(earliest, ready_at)
+        return None, earliest
+
+    def _run(self) -> None:
+        """Deliver queued updates until the pipeline is closed."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and not self._pending:
+                        return
+                    update, ready_at = self._next_ready(time.monotonic())
+                    if update is not None:
+                        self._delivering += 1
+                        break
+                    timeout = max(0.0, ready_at - time.monotonic()) if ready_at is not None else None
+                    self._condition.wait(timeout=timeout)
+
+            try:
+                self.deliver(*update)
+                self.stats["delivered"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                self.logger.error(f"Error delivering progress update for operation {update[1]}: {str(e)}")
+            finally:
+                with self._condition:
+                    self._delivering -= 1
+                    self._prune_rate_limits()
+                    self._condition.notify_all()
+
+    def _prune_rate_limits(self) -> None:
+        """Forget rate-limit state of idle operations. The caller must hold the lock."""
+        if len(self._next_allowed) > 1024:
+            now = time.monotonic()
+            for key in [key for key, ready_at in self._next_allowed.items() if ready_at <= now]:
+                del self._next_allowed[key]
+
+
+def close_progress_pipelines(timeout: Optional[float] = 5.0) -> None:
+    """
+    Close all open pipelines, delivering what is pending.
+
+    Args:
+        timeout: Maximum time to wait for the pending updates of each pipeline in seconds
+    """
+    with _open_pipelines_lock:
+        pipelines = list(_open_pipelines)
+    for pipeline in pipelines:
+        pipeline.close(timeout)
+
+
+atexit.register(close_progress_pipelines)
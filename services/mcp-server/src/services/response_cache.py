@@ -0,0 +1,293 @@
+"""
+LLM Response Cache for MCP Server.
+
+This module caches complete LLM answers keyed by (model, normalized prompt,
+generation parameters). The in-memory tier is an LRU bounded by entry count
+and TTL; an optional SQLite file provides a persistent backing store shared
+across restarts. Concurrent identical prompts are coalesced so only one
+upstream generation runs, and hit-rate metrics are exposed via ``get_stats``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class ResponseCache:
+    """Bounded, optionally persistent cache for LLM responses."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_entries: int = 1000,
+        ttl: int = 3600,
+        persistent_path: Optional[str] = None,
+        persistent_max_entries: int = 10000
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            logger: Logger instance
+            max_entries: Maximum number of responses kept in memory
+            ttl: Time to live of a response in seconds
+            persistent_path: Path of the SQLite backing store. If None, the cache is memory-only.
+            persistent_max_entries: Maximum number of responses kept in the backing store
+        """
+        self.logger = logger
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.persistent_path = persistent_path
+        self.persistent_max_entries = persistent_max_entries
+
+        # key -> (response, created_at)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Number of callers awaiting each in-flight generation
+        self._waiters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._puts_since_prune = 0
+
+        self.stats = {
+            "hits": 0,
+            "persistent_hits": 0,
+            "coalesced": 0,
+            "misses": 0,
+            "errors": 0
+        }
+
+        if persistent_path:
+            self._open_store(persistent_path)
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """
+        Normalize a prompt so that insignificant whitespace differences share a key.
+
+        Args:
+            prompt: Raw prompt text
+
+        Returns:
+            str: Prompt with runs of whitespace collapsed and ends stripped
+        """
+        return " ".join(prompt.split())
+
+    @classmethod
+    def make_key(cls, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            params: Generation parameters that affect the answer
+
+        Returns:
+            str: Hex-encoded SHA-256 digest of the request
+        """
+        material = json.dumps([model, cls.normalize_prompt(prompt), params or {}], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response in memory, then in the persistent store.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Optional[str]: Cached response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[0]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE key = ? AND created_at > ?",
+                    (key, now - self.ttl)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0], row[1])
+                    self.stats["persistent_hits"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """
+        Store a response in memory and in the persistent store.
+
+        Args:
+            key: Cache key from ``make_key``
+            response: Complete LLM response
+            model: Model name recorded alongside persisted responses
+        """
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, response, created_at)
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_responses (key, model, response, created_at) VALUES (?, ?, ?, ?)",
+                        (key, model, response, created_at)
+                    )
+                    self._puts_since_prune += 1
+                    if self._puts_since_prune >= 100:
+                        self._prune_store(created_at)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Failed to persist LLM response: {str(e)}")
+
+    async def get_or_generate(
+        self,
+        model: str,
+        prompt: str,
+        generate: Callable[[], Awaitable[str]],
+        params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Return a cached response or generate it, coalescing identical concurrent requests.
+
+        The generation runs as a task of its own that every caller awaits, so
+        a cancelled caller (e.g. a disconnected HTTP client) does not fail the
+        others; it is only cancelled when no caller is waiting for it anymore.
+        Failed generations are not cached; the error is raised to every waiting caller.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            generate: Coroutine factory performing the upstream generation
+            params: Generation parameters that affect the answer
+
+        Returns:
+            str: LLM response
+        """
+        key = self.make_key(model, prompt, params)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            with self._lock:
+                # The lookup above counted a miss; this request is served by the running generation
+                self.stats["misses"] -= 1
+                self.stats["coalesced"] += 1
+        else:
+            task = asyncio.get_running_loop().create_task(self._generate(key, model, generate))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._generation_done(key, done))
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not task.done():
+                    # Every caller is gone; stop the upstream request
+                    task.cancel()
+
+    async def _generate(self, key: str, model: str, generate: Callable[[], Awaitable[str]]) -> str:
+        """Run one upstream generation and cache its response."""
+        try:
+            response = await generate()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        self.put(key, response, model)
+        return response
+
+    def _generation_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished generation."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case nobody was waiting anymore
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit, miss and coalescing counters, hit rate and occupancy
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        stats["inflight"] = len(self._inflight)
+        served = stats["hits"] + stats["persistent_hits"] + stats["coalesced"]
+        total = served + stats["misses"]
+        stats["hit_rate"] = round(served / total, 4) if total else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached responses, including the persistent store."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the persistent store."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        """Insert into the memory tier, evicting least recently used entries. The caller must hold the lock."""
+        self._entries[key] = (response, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _open_store(self, path: str) -> None:
+        """Open (and create if needed) the SQLite backing store."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_created_at ON llm_responses (created_at)")
+        self._db.commit()
+        self.logger.info(f"LLM response cache backed by {path}")
+
+    def _prune_store(self, now: float) -> None:
+        """Drop expired and surplus rows from the backing store. The caller must hold the lock."""
+        self._db.execute("DELETE FROM llm_responses WHERE created_at <= ?", (now - self.ttl,))
+        self._db.execute(
+            "DELETE FROM llm_responses WHERE key IN ("
+            "SELECT key FROM llm_responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.persistent_max_entries,)
+        )
+        self._puts_since_prune = 0
@@ -0,0 +1,339 @@
+"""
+Shared state stores for MCP Server.
+
+Host state (sessions, consents, subscriptions) is kept in named namespaces of
+a state store. Each namespace behaves like a dict. The default in-memory store
+is local to the process; the SQLite and shared-memory stores let several
+worker processes see the same state:
+
+- ``memory``: plain dicts, no sharing (single process).
+- ``sqlite``: a SQLite database in WAL mode shared by all processes on the
+  host that open the same file.
+- ``shared_memory``: dicts held in memory by a state server process started
+  before the workers (see ``start_state_server``) and accessed through
+  ``multiprocessing`` manager proxies.
+
+Values are stored as copies. Changes to a value read from a shared namespace
+must be written back by assigning it to its key again.
+
+Stores also keep generation counters, which processes use to invalidate local
+caches (e.g. tool metadata) when another process changes the underlying data.
+"""
+
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from multiprocessing.managers import AcquirerProxy, BaseManager, DictProxy
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class StateStore:
+    """Base class of state stores."""
+
+    def namespace(self, name: str) -> MutableMapping:
+        """
+        Get a namespace of the store.
+
+        Args:
+            name: Namespace name, e.g. "sessions"
+
+        Returns:
+            MutableMapping: Dict-like view of the namespace
+        """
+        raise NotImplementedError
+
+    def get_generation(self, name: str) -> int:
+        """
+        Get the current value of a generation counter.
+
+        Args:
+            name: Counter name, e.g. "tool_metadata"
+
+        Returns:
+            int: Counter value (0 if never bumped)
+        """
+        raise NotImplementedError
+
+    def bump_generation(self, name: str) -> int:
+        """
+        Increment a generation counter, invalidating caches keyed on it in all processes.
+
+        Args:
+            name: Counter name
+
+        Returns:
+            int: New counter value
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class MemoryStateStore(StateStore):
+    """Process-local store backed by plain dicts."""
+
+    def __init__(self):
+        """Initialize the store."""
+        self._namespaces: Dict[str, Dict[str, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def namespace(self, name: str) -> MutableMapping:
+        return self._namespaces.setdefault(name, {})
+
+    def get_generation(self, name: str) -> int:
+        return self._generations.get(name, 0)
+
+    def bump_generation(self, name: str) -> int:
+        with self._lock:
+            self._generations[name] = self._generations.get(name, 0) + 1
+            return self._generations[name]
+
+
+class _SQLiteNamespace(MutableMapping):
+    """Dict-like view of one namespace of a SQLiteStateStore."""
+
+    def __init__(self, store: "SQLiteStateStore", name: str):
+        self._store = store
+        self._name = name
+
+    def __getitem__(self, key: str) -> Any:
+        row = self._store._connection().execute(
+            "SELECT value FROM state WHERE namespace = ? AND key = ?", (self._name, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store._connection().execute(
+            "INSERT OR REPLACE INTO state (namespace, key, value) VALUES (?, ?, ?)",
+            (self._name, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+
+    def __delitem__(self, key: str) -> None:
+        cursor = self._store._connection().execute(
+            "DELETE FROM state WHERE namespace = ? AND key = ?", (self._name, key)
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return self._store._connection().execute(
+            "SELECT 1 FROM state WHERE namespace = ? AND key = ?", (self._name, key)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate over a snapshot so that callers may delete while iterating
+        return iter(list(self.keys()))
+
+    def __len__(self) -> int:
+        return self._store._connection().execute(
+            "SELECT COUNT(*) FROM state WHERE namespace = ?", (self._name,)
+        ).fetchone()[0]
+
+    def keys(self) -> List[str]:
+        return [row[0] for row in self._store._connection().execute(
+            "SELECT key FROM state WHERE namespace = ?", (self._name,)
+        )]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, pickle.loads(value)) for key, value in self._store._connection().execute(
+            "SELECT key, value FROM state WHERE namespace = ?", (self._name,)
+        )]
+
+    def values(self) -> List[Any]:
+        return [value for _, value in self.items()]
+
+
+class SQLiteStateStore(StateStore):
+    """Store backed by a SQLite database shared by all processes that open it."""
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            path: Path of the database file
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS state "
+            "(namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS generations (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the calling thread, reconnecting after a fork."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            # Autocommit; every statement is its own transaction
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def namespace(self, name: str) -> MutableMapping:
+        return _SQLiteNamespace(self, name)
+
+    def get_generation(self, name: str) -> int:
+        row = self._connection().execute("SELECT value FROM generations WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def bump_generation(self, name: str) -> int:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT INTO generations (name, value) VALUES (?, 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+                (name,)
+            )
+            value = connection.execute("SELECT value FROM generations WHERE name = ?", (name,)).fetchone()[0]
+            connection.execute("COMMIT")
+            return value
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+# State held by the state server process
+_server_namespaces: Dict[str, Dict[str, Any]] = {}
+_server_lock = threading.Lock()
+
+
+def _get_server_namespace(name: str) -> Dict[str, Any]:
+    return _server_namespaces.setdefault(name, {})
+
+
+def _get_server_lock() -> threading.Lock:
+    return _server_lock
+
+
+class _StateManager(BaseManager):
+    """Manager exposing the namespaces of the state server."""
+
+
+_StateManager.register("namespace", callable=_get_server_namespace, proxytype=DictProxy)
+_StateManager.register("lock", callable=_get_server_lock, proxytype=AcquirerProxy)
+
+# Namespace of the state server holding the generation counters
+_GENERATIONS = "__generations__"
+
+
+class SharedMemoryStateStore(StateStore):
+    """Store whose namespaces live in the memory of a state server process."""
+
+    def __init__(self, address: Tuple[str, int], authkey: str):
+        """
+        Connect to a running state server.
+
+        Args:
+            address: (host, port) of the state server
+            authkey: Authentication key of the state server
+        """
+        self._manager = _StateManager(address=address, authkey=authkey.encode())
+        self._manager.connect()
+        self._namespaces: Dict[str, DictProxy] = {}
+        self._generations = self._manager.namespace(_GENERATIONS)
+        self._lock = self._manager.lock()
+
+    def namespace(self, name: str) -> MutableMapping:
+        if name not in self._namespaces:
+            self._namespaces[name] = self._manager.namespace(name)
+        return self._namespaces[name]
+
+    def get_generation(self, name: str) -> int:
+        return self._generations.get(name, 0)
+
+    def bump_generation(self, name: str) -> int:
+        with self._lock:
+            value = self._generations.get(name, 0) + 1
+            self._generations[name] = value
+            return value
+
+
+def start_state_server(address: Tuple[str, int] = ("127.0.0.1", 0),
+                       authkey: Optional[str] = None) -> Tuple[BaseManager, str]:
+    """
+    Start a state server process for the shared-memory store.
+
+    Call this in the parent process before the workers are started and pass
+    the server's address and key to them. The server stops when the returned
+    manager is shut down or garbage collected.
+
+    Args:
+        address: (host, port) to listen on; port 0 picks a free port
+        authkey: Authentication key (generated if not given)
+
+    Returns:
+        Tuple[BaseManager, str]: The running manager (its ``address`` attribute
+        holds the bound address) and the authentication key
+    """
+    authkey = authkey or secrets.token_hex(16)
+    manager = _StateManager(address=address, authkey=authkey.encode())
+    manager.start()
+    return manager, authkey
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Parse a "host:port" address.
+
+    Args:
+        address: Address string
+
+    Returns:
+        Tuple[str, int]: (host, port)
+    """
+    host, _, port = address.rpartition(":")
+    return host, int(port)
+
+
+def create_state_store(config: Dict[str, Any]) -> StateStore:
+    """
+    Create the state store selected by the configuration.
+
+    Args:
+        config: State configuration with the keys ``backend`` ("memory",
+            "sqlite" or "shared_memory"), ``sqlite_path``,
+            ``shared_memory_address`` and optionally ``shared_memory_authkey``.
+            The key is otherwise read from ``STATE_SHARED_MEMORY_AUTHKEY``; it is
+            kept out of the configuration, which debug endpoints expose.
+
+    Returns:
+        StateStore: The state store
+
+    Raises:
+        ValueError: If the backend is unknown or its settings are missing
+    """
+    backend = config.get("backend", "memory")
+    if backend == "memory":
+        return MemoryStateStore()
+    if backend == "sqlite":
+        return SQLiteStateStore(config.get("sqlite_path", "mcp_state.db"))
+    if backend == "shared_memory":
+        address = config.get("shared_memory_address")
+        authkey = config.get("shared_memory_authkey") or os.environ.get("STATE_SHARED_MEMORY_AUTHKEY")
+        if not address or not authkey:
+            raise ValueError("The shared_memory state backend requires shared_memory_address and STATE_SHARED_MEMORY_AUTHKEY")
+        return SharedMemoryStateStore(parse_address(address), authkey)
+    raise ValueError(f"Unknown state backend: {backend}")
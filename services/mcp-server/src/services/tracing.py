@@ -0,0 +1,346 @@
+"""
+Request tracing and span timing for MCP Server.
+
+Spans time the stages of a request (validation, auth, consent, dispatch,
+provider I/O, serialization). Their durations are aggregated into histograms
+that can be exported in the Prometheus text exposition format. A trace ID is
+kept in a context variable for the current request and propagated between
+components in the JSON-RPC ``params._meta.trace_id`` field.
+
+Tracing is disabled by default. When disabled, ``span`` returns a shared
+no-op context manager and nothing is recorded or propagated, so the cost is a
+single attribute check per span.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# JSON-RPC params key carrying tracing metadata
+META_KEY = "_meta"
+
+_current_trace_id: contextvars.ContextVar = contextvars.ContextVar("mcp_trace_id", default=None)
+
+
+class _NoopSpan:
+    """Span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Histogram:
+    """Cumulative duration histogram of one span name."""
+
+    __slots__ = ("counts", "total", "count", "errors")
+
+    def __init__(self, bucket_count: int):
+        self.counts = [0] * bucket_count
+        self.total = 0.0
+        self.count = 0
+        self.errors = 0
+
+
+class _Span:
+    """Span timing one stage of a request."""
+
+    __slots__ = ("tracer", "name", "start", "token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: Optional[str]):
+        self.tracer = tracer
+        self.name = name
+        self.token = _current_trace_id.set(trace_id) if trace_id is not None else None
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        duration = time.perf_counter() - self.start
+        self.tracer.record(self.name, duration, error=exc_type is not None)
+        if self.token is not None:
+            _current_trace_id.reset(self.token)
+        return False
+
+
+class Tracer:
+    """Collects span durations into histograms and keeps recent spans."""
+
+    def __init__(self, enabled: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS,
+                 max_recent_spans: int = 1000):
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Whether spans are recorded
+            buckets: Histogram bucket upper bounds in seconds
+            max_recent_spans: Number of recent spans kept for debugging
+        """
+        self.enabled = enabled
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[str, _Histogram] = {}
+        self._recent = deque(maxlen=max_recent_spans)
+        self._lock = threading.Lock()
+
+    def span(self, name: str, trace_id: Optional[str] = None):
+        """
+        Time a stage of the current request.
+
+        Args:
+            name: Span name, e.g. "host.validation"
+            trace_id: Optional trace ID to make current for the duration of the span
+
+        Returns:
+            A context manager timing the enclosed block
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, trace_id)
+
+    def request_span(self, name: str, request: Any):
+        """
+        Time the handling of a JSON-RPC request, continuing its trace.
+
+        The trace ID is taken from the request's ``params._meta.trace_id``, the
+        current context, or newly generated, in that order.
+
+        Args:
+            name: Span name, e.g. "server.handle_jsonrpc_request"
+            request: The JSON-RPC request
+
+        Returns:
+            A context manager timing the enclosed block
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, extract_trace_id(request) or current_trace_id() or new_trace_id())
+
+    def record(self, name: str, duration: float, error: bool = False) -> None:
+        """
+        Record a span duration.
+
+        Args:
+            name: Span name
+            duration: Duration in seconds
+            error: Whether the span ended with an exception
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    histogram.counts[index] += 1
+                    break
+            histogram.total += duration
+            histogram.count += 1
+            if error:
+                histogram.errors += 1
+            self._recent.append((_current_trace_id.get(), name, duration, error))
+
+    def recent_spans(self, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get recently recorded spans.
+
+        Args:
+            trace_id: If given, only spans of this trace are returned
+
+        Returns:
+            List[Dict[str, Any]]: Spans, oldest first
+        """
+        with self._lock:
+            spans = list(self._recent)
+        return [
+            {"trace_id": span_trace_id, "span": name, "duration": duration, "error": error}
+            for span_trace_id, name, duration, error in spans
+            if trace_id is None or span_trace_id == trace_id
+        ]
+
+    def render_prometheus(self) -> str:
+        """
+        Render the span histograms in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text
+        """
+        lines = [
+            "# HELP mcp_span_duration_seconds Duration of request processing stages.",
+            "# TYPE mcp_span_duration_seconds histogram"
+        ]
+        errors = [
+            "# HELP mcp_span_errors_total Spans that ended with an exception.",
+            "# TYPE mcp_span_errors_total counter"
+        ]
+        with self._lock:
+            for name in sorted(self._histograms):
+                histogram = self._histograms[name]
+                label = _escape_label(name)
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'mcp_span_duration_seconds_bucket{{span="{label}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'mcp_span_duration_seconds_bucket{{span="{label}",le="+Inf"}} {histogram.count}')
+                lines.append(f'mcp_span_duration_seconds_sum{{span="{label}"}} {histogram.total:.9f}')
+                lines.append(f'mcp_span_duration_seconds_count{{span="{label}"}} {histogram.count}')
+                errors.append(f'mcp_span_errors_total{{span="{label}"}} {histogram.errors}')
+        return "\n".join(lines + errors) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._lock:
+            self._histograms.clear()
+            self._recent.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer.
+
+    Returns:
+        Tracer: The tracer shared by host, server and client
+    """
+    return _tracer
+
+
+def configure_tracing(config: Dict[str, Any]) -> Tracer:
+    """
+    Configure the process-wide tracer.
+
+    Args:
+        config: Tracing configuration with the optional keys ``enabled`` and ``buckets``
+
+    Returns:
+        Tracer: The configured tracer
+    """
+    if config.get("buckets"):
+        _tracer.buckets = tuple(sorted(config["buckets"]))
+        _tracer.reset()
+    _tracer.enabled = bool(config.get("enabled", False))
+    return _tracer
+
+
+def new_trace_id() -> str:
+    """Generate a new trace ID."""
+    return uuid.uuid4().hex
+
+
+def current_trace_id() -> Optional[str]:
+    """Get the trace ID of the current request, if any."""
+    return _current_trace_id.get()
+
+
+def extract_trace_id(request: Any) -> Optional[str]:
+    """
+    Get the trace ID from a JSON-RPC request's ``params._meta``.
+
+    Args:
+        request: The JSON-RPC request
+
+    Returns:
+        Optional[str]: The trace ID, or None if the request carries none
+    """
+    if not isinstance(request, dict):
+        return None
+    params = request.get("params")
+    if not isinstance(params, dict):
+        return None
+    meta = params.get(META_KEY)
+    if not isinstance(meta, dict):
+        return None
+    trace_id = meta.get("trace_id")
+    return trace_id if isinstance(trace_id, str) else None
+
+
+def inject_trace_id(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the current trace ID to a JSON-RPC request's ``params._meta``.
+
+    Does nothing while tracing is disabled.
+
+    Args:
+        request: The JSON-RPC request (its params are replaced by a copy)
+
+    Returns:
+        Dict[str, Any]: The request
+    """
+    if not _tracer.enabled:
+        return request
+    params = request.get("params", {})
+    if isinstance(params, dict):
+        # Copy rather than modify the caller's params
+        meta = params.get(META_KEY)
+        meta = dict(meta) if isinstance(meta, dict) else {}
+        meta.setdefault("trace_id", current_trace_id() or new_trace_id())
+        request["params"] = {**params, META_KEY: meta}
+    return request
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator timing every call of a function as a span.
+
+    If no trace is current, the call starts a new one.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(_tracer, name, None if current_trace_id() else new_trace_id()):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_request(name: str, request_arg: str = "request") -> Callable:
+    """
+    Decorator timing every call of a JSON-RPC handler as a span, continuing the request's trace.
+
+    Args:
+        name: Span name
+        request_arg: Name of the parameter holding the JSON-RPC request
+
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        index = list(inspect.signature(func).parameters).index(request_arg)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            request = kwargs[request_arg] if request_arg in kwargs else (args[index] if index < len(args) else None)
+            with _tracer.request_span(name, request):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
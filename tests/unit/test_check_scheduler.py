@@ -0,0 +1,140 @@
+"""
+Unit tests for the CheckScheduler class.
+"""
+
+import os
+import threading
+import time
+import unittest
+
+from core.quality.components.base import QualityCheck, QualityCheckResult, QualityCheckSeverity
+from core.quality.components.scheduler import CheckScheduler
+
+
+class FakeCheck(QualityCheck):
+    """Check that records when it runs and returns one result."""
+
+    def __init__(self, check_id, delay=0.0, depends_on=None, fail=False, log=None, subprocess=True):
+        self._id = check_id
+        self._delay = delay
+        self._depends_on = depends_on or []
+        self._fail = fail
+        self._log = log if log is not None else []
+        self._subprocess = subprocess
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def name(self):
+        return self._id
+
+    @property
+    def description(self):
+        return "Fake check"
+
+    @property
+    def depends_on(self):
+        return self._depends_on
+
+    @property
+    def uses_subprocess(self):
+        return self._subprocess
+
+    def run(self, file_paths=None, **kwargs):
+        self._log.append(("start", self._id))
+        time.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("tool crashed")
+        self._log.append(("end", self._id))
+        return [QualityCheckResult(
+            check_id=self._id,
+            severity=QualityCheckSeverity.INFO,
+            message=f"pid {os.getpid()}",
+            file_path=file_paths[0] if file_paths else None
+        )]
+
+
+class TestCheckScheduler(unittest.TestCase):
+    """Test cases for the CheckScheduler class."""
+
+    def test_independent_checks_run_concurrently(self):
+        """Test that independent checks overlap and results stream in completion order."""
+        checks = [("Test", FakeCheck("slow", delay=0.3)), ("Test", FakeCheck("fast", delay=0.1)),
+                  ("Test", FakeCheck("other", delay=0.3))]
+
+        started = time.perf_counter()
+        finished = [check.id for check, _ in CheckScheduler(max_workers=3).run(checks, ["a.py"])]
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(finished[0], "fast")
+        self.assertEqual(sorted(finished), ["fast", "other", "slow"])
+
+    def test_worker_limit(self):
+        """Test that no more than max_workers checks run at once."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        class CountingCheck(FakeCheck):
+            def run(self, file_paths=None, **kwargs):
+                with lock:
+                    running.append(self.id)
+                    peak.append(len(running))
+                time.sleep(0.05)
+                with lock:
+                    running.remove(self.id)
+                return []
+
+        checks = [("Test", CountingCheck(f"check{i}")) for i in range(6)]
+        list(CheckScheduler(max_workers=2).run(checks))
+
+        self.assertEqual(max(peak), 2)
+
+    def test_dependencies_are_respected(self):
+        """Test that a check starts only after the checks it depends on have finished."""
+        log = []
+        checks = [
+            ("Test", FakeCheck("report", depends_on=["lint", "unknown"], log=log)),
+            ("Test", FakeCheck("lint", delay=0.1, log=log))
+        ]
+
+        list(CheckScheduler(max_workers=2).run(checks))
+
+        self.assertLess(log.index(("end", "lint")), log.index(("start", "report")))
+
+    def test_circular_dependencies(self):
+        """Test that circular dependencies are rejected before any check runs."""
+        log = []
+        checks = [("Test", FakeCheck("a", depends_on=["b"], log=log)),
+                  ("Test", FakeCheck("b", depends_on=["a"], log=log))]
+
+        with self.assertRaises(ValueError):
+            list(CheckScheduler().run(checks))
+        self.assertEqual(log, [])
+
+    def test_failing_check(self):
+        """Test that a failing check yields an error result."""
+        checks = [("Test Component", FakeCheck("broken", fail=True))]
+
+        (check, results), = CheckScheduler().run(checks)
+
+        self.assertEqual(results[0].severity, QualityCheckSeverity.ERROR)
+        self.assertEqual(results[0].source, "Test Component")
+        self.assertIn("tool crashed", results[0].message)
+
+    def test_in_python_checks_use_processes(self):
+        """Test that in-Python checks run in worker processes and external tool checks do not."""
+        checks = [("Test", FakeCheck("python", subprocess=False)), ("Test", FakeCheck("tool"))]
+
+        results = {check.id: results for check, results in CheckScheduler(use_processes=True).run(checks, ["a.py"])}
+
+        self.assertNotEqual(results["python"][0].message, f"pid {os.getpid()}")
+        self.assertEqual(results["tool"][0].message, f"pid {os.getpid()}")
+        self.assertEqual(results["python"][0].file_path, "a.py")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for the FileInventory class.
+"""
+
+import os
+import pickle
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from core.quality.components.base import QualityCheck
+from core.quality.components.inventory import FileInventory
+from core.quality.components.scheduler import CheckScheduler
+
+
+class InventoryCheck(QualityCheck):
+    """Check that records the Python files it was given."""
+
+    def __init__(self, check_id):
+        self._id = check_id
+        self.seen = None
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def name(self):
+        return self._id
+
+    @property
+    def description(self):
+        return "Inventory check"
+
+    @property
+    def uses_subprocess(self):
+        return True
+
+    def run(self, file_paths=None, **kwargs):
+        self.seen = kwargs["inventory"].get_files("python")
+        return []
+
+
+class TestFileInventory(unittest.TestCase):
+    """Test cases for the FileInventory class."""
+
+    def setUp(self):
+        """Create a project tree with ignored directories."""
+        self.root = tempfile.mkdtemp()
+        for path in ["main.py", "pkg/module.py", "pkg/README.md", "scripts/run.sh", "web/app.js",
+                     ".git/hooks/hook.py", "venv/lib/site.py", "backup_20250408/old.py",
+                     "pkg/__pycache__/module.cpython-311.pyc", "build/generated.py"]:
+            full_path = os.path.join(self.root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write("# content\n")
+
+    def tearDown(self):
+        """Remove the project tree."""
+        shutil.rmtree(self.root)
+
+    def relative(self, paths):
+        """Make paths relative to the project root."""
+        return sorted(os.path.relpath(path, self.root) for path in paths)
+
+    def test_walk_skips_ignored_directories(self):
+        """Test that ignored directories are pruned and files are classified by language."""
+        inventory = FileInventory(self.root, ignore=["build"])
+
+        self.assertEqual(self.relative(inventory.get_files()),
+                         ["main.py", "pkg/README.md", "pkg/module.py", "scripts/run.sh", "web/app.js"])
+        self.assertEqual(self.relative(inventory.get_files("python")), ["main.py", "pkg/module.py"])
+        self.assertEqual(self.relative(inventory.get_files("shell", "javascript")), ["scripts/run.sh", "web/app.js"])
+        self.assertEqual(self.relative(inventory.get_code_directories()), [".", "pkg", "web"])
+
+    def test_files_are_listed_once(self):
+        """Test that the tree is walked only once however many views are requested."""
+        inventory = FileInventory(self.root)
+        with patch("core.quality.components.inventory.os.walk", wraps=os.walk) as walk:
+            inventory.get_files("python")
+            inventory.get_files("shell")
+            inventory.get_files()
+
+        self.assertEqual(walk.call_count, 1)
+
+    def test_git_ls_files(self):
+        """Test that the inventory can be built from git ls-files, honoring .gitignore."""
+        shutil.rmtree(os.path.join(self.root, ".git"))
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        with open(os.path.join(self.root, ".gitignore"), "w") as f:
+            f.write("build/\n")
+
+        inventory = FileInventory(self.root, use_git=True)
+
+        self.assertEqual(self.relative(inventory.get_files("python")), ["main.py", "pkg/module.py"])
+        self.assertIn(".gitignore", self.relative(inventory.get_files()))
+
+    def test_pickle(self):
+        """Test that a scanned inventory can be sent to worker processes."""
+        inventory = pickle.loads(pickle.dumps(FileInventory(self.root).scan()))
+
+        self.assertEqual(self.relative(inventory.get_files("python")),
+                         ["build/generated.py", "main.py", "pkg/module.py"])
+
+    def test_scheduler_shares_inventory(self):
+        """Test that all checks of a run share a single inventory."""
+        checks = [InventoryCheck("first"), InventoryCheck("second")]
+        inventory = FileInventory(self.root)
+
+        with patch("core.quality.components.scheduler.FileInventory.from_config", return_value=inventory):
+            with patch("core.quality.components.inventory.os.walk", wraps=os.walk) as walk:
+                list(CheckScheduler().run([("Test", check) for check in checks]))
+
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(checks[0].seen, checks[1].seen)
+        self.assertEqual(len(checks[0].seen), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
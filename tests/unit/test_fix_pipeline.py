@@ -0,0 +1,159 @@
+"""
+Unit tests for the batched fix pipeline.
+"""
+
+import ast
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.fix_pipeline import FixPipeline, apply_text_fixes
+
+SOURCE = '''import os
+
+
+def first(a):
+    return a
+
+
+class Second:
+    def method(self, b):
+        return b
+'''
+
+
+def missing_docstring(file_path, line, kind="function/method"):
+    """Create a result for a missing docstring, worded like the docstrings check."""
+    return QualityCheckResult(
+        check_id="docstrings",
+        severity=QualityCheckSeverity.WARNING,
+        message="Missing module docstring" if kind == "module" else f"Missing docstring for {kind} name",
+        file_path=file_path,
+        line_number=line
+    )
+
+
+class TestApplyTextFixes(unittest.TestCase):
+    """Test cases for apply_text_fixes."""
+
+    def setUp(self):
+        """Create a module without docstrings."""
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "module.py")
+        with open(self.path, "w") as f:
+            f.write(SOURCE)
+
+    def tearDown(self):
+        """Remove the module."""
+        shutil.rmtree(self.root)
+
+    def test_all_docstrings_in_one_write(self):
+        """Test that several docstrings are inserted at the right places."""
+        results = [
+            missing_docstring(self.path, 1, "module"),
+            missing_docstring(self.path, 4),
+            missing_docstring(self.path, 8, "class"),
+            missing_docstring(self.path, 9)
+        ]
+
+        fixed, unfixed = apply_text_fixes(self.path, results)
+
+        self.assertEqual(len(fixed), 4)
+        self.assertEqual(unfixed, [])
+        with open(self.path) as f:
+            tree = ast.parse(f.read())
+        # The module docstring is now tree.body[0]
+        first, second = tree.body[2], tree.body[3]
+        self.assertIsNotNone(ast.get_docstring(tree))
+        self.assertTrue(ast.get_docstring(first).startswith("first function."))
+        self.assertTrue(ast.get_docstring(second).startswith("Second class."))
+        self.assertTrue(ast.get_docstring(second.body[1]).startswith("method function."))
+
+    def test_conflicting_edits_are_left_unfixed(self):
+        """Test that a second edit at the same place is not applied."""
+        results = [missing_docstring(self.path, 4), missing_docstring(self.path, 4)]
+
+        fixed, unfixed = apply_text_fixes(self.path, results)
+
+        self.assertEqual((len(fixed), len(unfixed)), (1, 1))
+        with open(self.path) as f:
+            self.assertEqual(f.read().count('"""'), 2)
+
+
+class TestFixPipeline(unittest.TestCase):
+    """Test cases for the FixPipeline class."""
+
+    def setUp(self):
+        """Create two modules."""
+        self.root = tempfile.mkdtemp()
+        self.paths = []
+        for name in ("a.py", "b.py"):
+            path = os.path.join(self.root, name)
+            with open(path, "w") as f:
+                f.write("x = 1\n")
+            self.paths.append(path)
+        self.check_calls = []
+
+    def tearDown(self):
+        """Remove the modules."""
+        shutil.rmtree(self.root)
+
+    def style_issue(self, file_path, message="Formatting issue"):
+        """Create a result fixed by the stub style fixer."""
+        return QualityCheckResult(check_id="black", severity=QualityCheckSeverity.WARNING,
+                                  message=message, file_path=file_path)
+
+    def make_pipeline(self, new_issues):
+        """Create a pipeline whose style fixer rewrites files and whose re-check reports new_issues."""
+        def apply_fixes(component_name, results):
+            for file_path in {result.file_path for result in results}:
+                with open(file_path, "w") as f:
+                    f.write("x = 2\n")
+            return list(results), []
+
+        def run_checks(component_name, file_paths):
+            self.check_calls.append((component_name, sorted(file_paths)))
+            return [issue for issue in new_issues if issue.file_path in file_paths]
+
+        return FixPipeline(apply_fixes, run_checks, lambda check_id: "code_style", max_workers=2)
+
+    def test_changed_files_are_checked_once(self):
+        """Test that all changed files are re-checked in one call per component."""
+        results = [self.style_issue(path) for path in self.paths]
+
+        fixed, unfixed = self.make_pipeline([]).run(results)
+
+        self.assertEqual(fixed, results)
+        self.assertEqual(unfixed, [])
+        self.assertEqual(self.check_calls, [("code_style", sorted(self.paths))])
+
+    def test_file_with_new_issues_is_restored(self):
+        """Test that only the file whose fixes introduced an issue is rolled back."""
+        results = [self.style_issue(path) for path in self.paths]
+        pipeline = self.make_pipeline([self.style_issue(self.paths[0], "New issue")])
+
+        fixed, unfixed = pipeline.run(results)
+
+        self.assertEqual(fixed, [results[1]])
+        self.assertEqual(unfixed, [results[0]])
+        contents = []
+        for path in self.paths:
+            with open(path) as f:
+                contents.append(f.read())
+        self.assertEqual(contents, ["x = 1\n", "x = 2\n"])
+
+    def test_unchanged_files_keep_their_issues(self):
+        """Test that fixes reported for a file left unchanged count as unfixed."""
+        result = self.style_issue(self.paths[0])
+        pipeline = FixPipeline(lambda name, results: (list(results), []), lambda name, paths: [],
+                               lambda check_id: "code_style")
+
+        fixed, unfixed = pipeline.run([result])
+
+        self.assertEqual((fixed, unfixed), ([], [result]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the JSON-RPC HTTP endpoint of the standalone MCP server.
+
+These tests exercise the ``/jsonrpc`` handler of jsonrpc_transport through
+enhanced_mcp_server and verify single requests, batch arrays, notifications,
+gzip in both directions, the decompressed size limit and NDJSON streaming of
+batch results.
+"""
+
+import gzip
+import json
+import os
+import sys
+import unittest
+
+from fastapi.testclient import TestClient
+
+# Add the repository root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import enhanced_mcp_server
+import jsonrpc_transport
+
+
+class TestJsonRpcEndpoint(unittest.TestCase):
+    """Test cases for the /jsonrpc endpoint."""
+
+    def setUp(self):
+        """Create a test client."""
+        self.client = TestClient(enhanced_mcp_server.app)
+
+    def _request(self, method, params=None, request_id="1"):
+        return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+
+    def test_single_request(self):
+        """Test that a single request object gets a single response object."""
+        response = self.client.post("/jsonrpc", json=self._request("tools/list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], "1")
+        self.assertIn("shell_command", response.json()["result"]["tools"])
+
+    def test_batch(self):
+        """Test that a batch gets one response per request, notifications excluded."""
+        batch = [
+            self._request("tools/list", request_id="a"),
+            self._request("tools/get", {"name": "missing"}, request_id="b"),
+            {"jsonrpc": "2.0", "method": "tools/list"},
+            {"jsonrpc": "1.0", "id": "c", "method": "tools/list"},
+        ]
+        response = self.client.post("/jsonrpc", json=batch)
+        responses = {item["id"]: item for item in response.json()}
+
+        self.assertEqual(set(responses), {"a", "b", "c"})
+        self.assertIn("result", responses["a"])
+        self.assertEqual(responses["b"]["error"]["code"], -32602)
+        self.assertEqual(responses["c"]["error"]["code"], -32600)
+
+    def test_invalid_batches(self):
+        """Test parse errors, empty batches and notification-only batches."""
+        parse_error = self.client.post("/jsonrpc", content=b"{not json", headers={"Content-Type": "application/json"})
+        empty = self.client.post("/jsonrpc", json=[])
+        notifications = self.client.post("/jsonrpc", json=[{"jsonrpc": "2.0", "method": "tools/list"}])
+
+        self.assertEqual(parse_error.json()["error"]["code"], -32700)
+        self.assertEqual(empty.json()["error"]["code"], -32600)
+        self.assertEqual(notifications.status_code, 204)
+
+    def test_single_notification(self):
+        """Test that a lone notification gets no response body."""
+        response = self.client.post("/jsonrpc", json={"jsonrpc": "2.0", "method": "tools/list"})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.content, b"")
+
+    def test_gzip(self):
+        """Test gzip-encoded requests and gzip-compressed responses."""
+        batch = [self._request("tools/get", {"name": "code_analyzer"}, request_id=str(i)) for i in range(10)]
+        response = self.client.post(
+            "/jsonrpc",
+            content=gzip.compress(json.dumps(batch).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip", "Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual([item["id"] for item in response.json()], [str(i) for i in range(10)])
+
+    def test_gzip_size_limit(self):
+        """Test that a request inflating beyond the body limit is rejected."""
+        request = json.dumps(self._request("tools/list", {"padding": " " * 4096})).encode()
+        headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        original_limit = jsonrpc_transport.JSONRPC_MAX_BODY_BYTES
+        jsonrpc_transport.JSONRPC_MAX_BODY_BYTES = 1024
+        try:
+            response = self.client.post("/jsonrpc", content=gzip.compress(request), headers=headers)
+            truncated = self.client.post("/jsonrpc", content=gzip.compress(b"{}")[:-4], headers=headers)
+        finally:
+            jsonrpc_transport.JSONRPC_MAX_BODY_BYTES = original_limit
+
+        self.assertEqual(response.json()["error"]["code"], -32700)
+        self.assertIn("limit", response.json()["error"]["data"])
+        self.assertEqual(truncated.json()["error"]["code"], -32700)
+
+    def test_ndjson_streaming(self):
+        """Test that batch results can be streamed as NDJSON."""
+        batch = [self._request("resources/list", request_id=str(i)) for i in range(3)]
+        response = self.client.post("/jsonrpc", json=batch, headers={"Accept": "application/x-ndjson"})
+        lines = [json.loads(line) for line in response.text.splitlines()]
+
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(sorted(item["id"] for item in lines), ["0", "1", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit tests for the LibreChat adapter's manifest endpoint.
+
+These tests replace the MCP SDK client with a stub and verify ETag
+revalidation, caching of the manifest until the tool list changes and
+explicit invalidation.
+"""
+
+import os
+import sys
+import types
+import unittest
+
+from fastapi.testclient import TestClient
+
+# Add the repository root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class StubMCPClient:
+    """MCP SDK client serving a fixed tool list and counting detail lookups."""
+
+    def __init__(self, server_url=None):
+        self.tools = ["shell_command", "code_analyzer"]
+        self.detail_calls = []
+
+    async def list_tools(self):
+        return list(self.tools)
+
+    async def get_tool_details(self, tool_name):
+        self.detail_calls.append(tool_name)
+        return {"name": tool_name, "description": f"The {tool_name} tool"}
+
+
+# The adapter imports the MCP SDK at module level; it is not installed for the unit tests
+if "mcp_sdk" not in sys.modules:
+    sys.modules["mcp_sdk"] = types.SimpleNamespace(MCPClient=StubMCPClient, Tool=object, Resource=object)
+
+import librechat_mcp_adapter
+
+
+class TestManifestEndpoint(unittest.TestCase):
+    """Test cases for GET /api/manifest and POST /api/manifest/invalidate."""
+
+    def setUp(self):
+        """Use a fresh stub client and an empty manifest cache."""
+        self.mcp_client = StubMCPClient()
+        self.original_client = librechat_mcp_adapter.mcp_client
+        self.original_interval = librechat_mcp_adapter.MANIFEST_RECHECK_INTERVAL
+        librechat_mcp_adapter.mcp_client = self.mcp_client
+        # Re-check the tool list on every request
+        librechat_mcp_adapter.MANIFEST_RECHECK_INTERVAL = 0
+        librechat_mcp_adapter.invalidate_manifest()
+        librechat_mcp_adapter._manifest_lock = None
+        self.client = TestClient(librechat_mcp_adapter.app)
+
+    def tearDown(self):
+        """Restore the module state."""
+        librechat_mcp_adapter.mcp_client = self.original_client
+        librechat_mcp_adapter.MANIFEST_RECHECK_INTERVAL = self.original_interval
+        librechat_mcp_adapter.invalidate_manifest()
+
+    def test_not_modified(self):
+        """Test that a matching If-None-Match gets an empty 304."""
+        response = self.client.get("/api/manifest")
+        etag = response.headers["etag"]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([tool["name"] for tool in response.json()["tools"]], ["shell_command", "code_analyzer"])
+
+        revalidated = self.client.get("/api/manifest", headers={"If-None-Match": etag})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+        self.assertEqual(revalidated.headers["etag"], etag)
+
+        other = self.client.get("/api/manifest", headers={"If-None-Match": '"other"'})
+        self.assertEqual(other.status_code, 200)
+
+    def test_manifest_is_rebuilt_when_the_tool_list_changes(self):
+        """Test that tool details are only fetched again for a different tool list."""
+        first = self.client.get("/api/manifest")
+        self.client.get("/api/manifest")
+        self.assertEqual(len(self.mcp_client.detail_calls), 2)
+
+        # The same tools in another order have the same fingerprint
+        self.mcp_client.tools.reverse()
+        self.assertEqual(self.client.get("/api/manifest").headers["etag"], first.headers["etag"])
+        self.assertEqual(len(self.mcp_client.detail_calls), 2)
+
+        self.mcp_client.tools.append("file_browser")
+        changed = self.client.get("/api/manifest")
+
+        self.assertEqual(len(self.mcp_client.detail_calls), 5)
+        self.assertNotEqual(changed.headers["etag"], first.headers["etag"])
+        self.assertIn("file_browser", [tool["name"] for tool in changed.json()["tools"]])
+
+    def test_invalidate_forces_a_rebuild(self):
+        """Test that invalidating the manifest fetches the tool details again."""
+        self.client.get("/api/manifest")
+
+        response = self.client.post("/api/manifest/invalidate")
+        self.assertEqual(response.json(), {"success": True})
+        self.client.get("/api/manifest")
+
+        self.assertEqual(len(self.mcp_client.detail_calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the LineIndex class.
+"""
+
+import ast
+import unittest
+
+from core.quality.components.line_index import LineIndex
+from core.quality.components.parsed_modules import ParsedModule
+
+SOURCE = '''def greet(name: str) -> str:
+    """Say hello."""
+    return ("Grüße, "
+            + name)
+
+
+GREETING = greet("wörld")
+'''
+
+
+class TestLineIndex(unittest.TestCase):
+    """Test cases for the LineIndex class."""
+
+    def setUp(self):
+        """Index the example source."""
+        self.lines = LineIndex(SOURCE)
+
+    def test_line_numbers(self):
+        """Test that offsets map to the same lines as counting newlines."""
+        for offset in range(len(SOURCE)):
+            self.assertEqual(self.lines.line_number(offset), SOURCE[:offset].count("\n") + 1)
+
+        self.assertEqual(self.lines.position(SOURCE.index("return")), (3, 4))
+        self.assertEqual(self.lines.line_count, len(SOURCE.splitlines()))
+
+    def test_lines_and_offsets(self):
+        """Test that lines and offsets can be looked up by line number."""
+        self.assertEqual(self.lines.get_line(2), '    """Say hello."""')
+        self.assertEqual(self.lines.get_line(5), "")
+        self.assertEqual(self.lines.offset(3, 4), SOURCE.index("return"))
+        with self.assertRaises(IndexError):
+            self.lines.get_line(20)
+
+    def test_node_source(self):
+        """Test that node sources match ast.get_source_segment, including non-ASCII lines."""
+        tree = ast.parse(SOURCE)
+        for node in ast.walk(tree):
+            if getattr(node, "end_lineno", None) is not None:
+                self.assertEqual(self.lines.get_node_source(node), ast.get_source_segment(SOURCE, node))
+
+        self.assertIsNone(self.lines.get_node_source(tree))
+
+    def test_parsed_module(self):
+        """Test that parsed modules slice node sources through their line index."""
+        module = ParsedModule.parse(SOURCE)
+        _, assignment = module.assignments[0]
+
+        self.assertEqual(module.get_source(assignment.value), 'greet("wörld")')
+        self.assertIs(module.lines, module.lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
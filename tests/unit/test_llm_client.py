@@ -0,0 +1,188 @@
+"""
+Unit tests for the async LLM client.
+
+These tests run the client against a local stand-in for the Ollama
+``/api/generate`` endpoint and verify complete and streamed generation,
+the optional per-model concurrency limit and timeouts.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.llm_client import AsyncLLMClient, LLMTimeoutError
+
+
+class StandInLLMHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Ollama generate API."""
+
+    tokens = ["Hello", ", ", "world", "!"]
+    delay = 0.0
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            time.sleep(cls.delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            if payload.get("stream"):
+                self.end_headers()
+                for token in cls.tokens:
+                    self.wfile.write((json.dumps({"response": token, "done": False}) + "\n").encode())
+                    self.wfile.flush()
+                self.wfile.write((json.dumps({"response": "", "done": True}) + "\n").encode())
+            else:
+                body = json.dumps({"response": "".join(cls.tokens), "done": True}).encode()
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (e.g. on timeout)
+            pass
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncLLMClient(unittest.TestCase):
+    """Test cases for AsyncLLMClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stand-in LLM server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInLLMHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stand-in LLM server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Reset the stand-in server state."""
+        StandInLLMHandler.delay = 0.0
+        StandInLLMHandler.max_active = 0
+
+    def _client(self, **kwargs):
+        options = {"timeout": 5, "max_concurrency_per_model": 2}
+        options.update(kwargs)
+        return AsyncLLMClient(
+            host="127.0.0.1",
+            port=str(self.server.server_address[1]),
+            model="test-model",
+            logger=logging.getLogger("test_llm_client"),
+            **options
+        )
+
+    def test_generate(self):
+        """Test a complete, non-streamed generation."""
+        async def run():
+            client = self._client()
+            try:
+                return await client.generate("Say hello")
+            finally:
+                await client.aclose()
+
+        self.assertEqual(asyncio.run(run()), "Hello, world!")
+
+    def test_stream(self):
+        """Test that tokens are yielded as they are generated."""
+        async def run():
+            client = self._client()
+            try:
+                return [token async for token in client.stream("Say hello")]
+            finally:
+                await client.aclose()
+
+        self.assertEqual(asyncio.run(run()), StandInLLMHandler.tokens)
+
+    def test_concurrency_limit_per_model(self):
+        """Test that no more than the configured generations run at once."""
+        StandInLLMHandler.delay = 0.1
+
+        async def run():
+            client = self._client(max_concurrency_per_model=2)
+            try:
+                await asyncio.gather(*(client.generate(f"prompt {i}") for i in range(6)))
+            finally:
+                await client.aclose()
+
+        asyncio.run(run())
+        self.assertEqual(StandInLLMHandler.max_active, 2)
+
+    def test_unbounded_concurrency(self):
+        """Test that no limit is applied when the scheduler is in charge of it."""
+        StandInLLMHandler.delay = 0.1
+
+        async def run():
+            client = self._client(max_concurrency_per_model=None)
+            try:
+                await asyncio.gather(*(client.generate(f"prompt {i}") for i in range(4)))
+            finally:
+                await client.aclose()
+
+        asyncio.run(run())
+        self.assertGreaterEqual(StandInLLMHandler.max_active, 4)
+
+    def test_timeout(self):
+        """Test that a stalled generation raises LLMTimeoutError."""
+        StandInLLMHandler.delay = 0.5
+
+        async def run():
+            client = self._client(timeout=0.1)
+            try:
+                await client.generate("Say hello")
+            finally:
+                await client.aclose()
+
+        with self.assertRaises(LLMTimeoutError):
+            asyncio.run(run())
+
+    def test_event_loop_not_blocked(self):
+        """Test that other tasks keep running during a slow generation."""
+        StandInLLMHandler.delay = 0.3
+
+        async def run():
+            client = self._client()
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            try:
+                await client.generate("Say hello")
+            finally:
+                task.cancel()
+                await client.aclose()
+            return ticks
+
+        self.assertGreater(asyncio.run(run()), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
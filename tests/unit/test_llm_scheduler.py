@@ -0,0 +1,220 @@
+"""
+Unit tests for the LLM request scheduler.
+
+These tests run the scheduler against a stub backend and verify per-model
+concurrency limits, priority classes, fairness across clients, coalescing
+of identical requests, micro-batching and streamed generations.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.llm_scheduler import LLMScheduler
+
+
+class StubBackend:
+    """Stub LLM backend recording the order and concurrency of calls."""
+
+    model = "stub-model"
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, prompt, model=None, options=None):
+        self.calls.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if prompt == "fail":
+                raise RuntimeError("backend failure")
+            return f"answer to {prompt}"
+        finally:
+            self.active -= 1
+
+    async def stream(self, prompt, model=None, options=None):
+        self.calls.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for token in ("answer ", "to ", prompt):
+                await asyncio.sleep(self.delay / 3)
+                yield token
+        finally:
+            self.active -= 1
+
+
+class BatchingStubBackend(StubBackend):
+    """Stub backend that also accepts micro-batches."""
+
+    def __init__(self, delay=0.02):
+        super().__init__(delay)
+        self.batches = []
+
+    async def generate_batch(self, prompts, model=None):
+        self.batches.append(list(prompts))
+        await asyncio.sleep(self.delay)
+        return [f"answer to {prompt}" for prompt in prompts]
+
+
+class TestLLMScheduler(unittest.TestCase):
+    """Test cases for LLMScheduler."""
+
+    def setUp(self):
+        """Set up a logger."""
+        self.logger = logging.getLogger("test_llm_scheduler")
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_concurrency_limit_per_model(self):
+        """Test that no more than the configured calls run at once."""
+        backend = StubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=2)
+            results = await asyncio.gather(*(scheduler.submit(f"p{i}") for i in range(6)))
+            await scheduler.close()
+            return results
+
+        self.assertEqual(self._run(run()), [f"answer to p{i}" for i in range(6)])
+        self.assertEqual(backend.max_active, 2)
+
+    def test_interactive_before_batch(self):
+        """Test that queued interactive requests are dispatched before batch requests."""
+        backend = StubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1)
+            batch = [asyncio.create_task(scheduler.submit(f"bulk{i}", priority="batch")) for i in range(3)]
+            await asyncio.sleep(0)
+            interactive = asyncio.create_task(scheduler.submit("user", priority="interactive"))
+            await asyncio.gather(*batch, interactive)
+            await scheduler.close()
+
+        self._run(run())
+        # bulk0 was already running; the interactive request overtakes the rest
+        self.assertEqual(backend.calls[:2], ["bulk0", "user"])
+
+    def test_round_robin_across_clients(self):
+        """Test that one client cannot monopolize a model."""
+        backend = StubBackend(delay=0.005)
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1)
+            tasks = [asyncio.create_task(scheduler.submit(f"a{i}", client_id="a")) for i in range(4)]
+            tasks += [asyncio.create_task(scheduler.submit(f"b{i}", client_id="b")) for i in range(2)]
+            await asyncio.gather(*tasks)
+            await scheduler.close()
+
+        self._run(run())
+        self.assertEqual(backend.calls, ["a0", "b0", "a1", "b1", "a2", "a3"])
+
+    def test_identical_requests_are_coalesced(self):
+        """Test that identical concurrent requests share one backend call."""
+        backend = StubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger)
+            results = await asyncio.gather(*(scheduler.submit("same") for _ in range(4)))
+            stats = scheduler.get_stats()
+            await scheduler.close()
+            return results, stats
+
+        results, stats = self._run(run())
+        self.assertEqual(results, ["answer to same"] * 4)
+        self.assertEqual(backend.calls, ["same"])
+        self.assertEqual(stats["coalesced"], 3)
+
+    def test_short_prompts_are_micro_batched(self):
+        """Test that short prompts within the batch window share one backend call."""
+        backend = BatchingStubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1,
+                                     batch_window=0.01, max_batch_size=4)
+            results = await asyncio.gather(*(scheduler.submit(f"q{i}") for i in range(4)))
+            await scheduler.close()
+            return results
+
+        self.assertEqual(self._run(run()), [f"answer to q{i}" for i in range(4)])
+        self.assertEqual(backend.batches, [["q0", "q1", "q2", "q3"]])
+        self.assertEqual(backend.calls, [])
+
+    def test_errors_are_delivered(self):
+        """Test that backend failures reach the caller and do not stall the queue."""
+        backend = StubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1)
+            results = await asyncio.gather(scheduler.submit("fail"), scheduler.submit("ok"),
+                                           return_exceptions=True)
+            await scheduler.close()
+            return results
+
+        failure, success = self._run(run())
+        self.assertIsInstance(failure, RuntimeError)
+        self.assertEqual(success, "answer to ok")
+
+    def test_streams_share_the_queues(self):
+        """Test that streamed generations are limited and prioritized like other requests."""
+        backend = StubBackend()
+
+        async def consume(scheduler, prompt, priority="interactive"):
+            return "".join([token async for token in scheduler.stream(prompt, priority=priority)])
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1)
+            batch = [asyncio.create_task(consume(scheduler, f"bulk{i}", "batch")) for i in range(3)]
+            await asyncio.sleep(0)
+            interactive = asyncio.create_task(scheduler.submit("user"))
+            results = await asyncio.gather(*batch, interactive)
+            await scheduler.close()
+            return results
+
+        results = self._run(run())
+        self.assertEqual(results, ["answer to bulk0", "answer to bulk1", "answer to bulk2", "answer to user"])
+        self.assertEqual(backend.calls[:2], ["bulk0", "user"])
+        self.assertEqual(backend.max_active, 1)
+
+    def test_closed_stream_releases_its_slot(self):
+        """Test that abandoning a stream, queued or running, frees the model slot."""
+        backend = StubBackend()
+
+        async def run():
+            scheduler = LLMScheduler(backend, self.logger, max_concurrency_per_model=1)
+            running = scheduler.stream("first")
+            await running.__anext__()
+            queued = asyncio.create_task(scheduler.stream("second").__anext__())
+            await asyncio.sleep(0)
+            queued.cancel()
+            await running.aclose()
+            result = await asyncio.wait_for(scheduler.submit("third"), timeout=1)
+            stats = scheduler.get_stats()
+            await scheduler.close()
+            return result, stats
+
+        result, stats = self._run(run())
+        self.assertEqual(result, "answer to third")
+        self.assertEqual(backend.calls, ["first", "third"])
+        self.assertEqual(stats["queued"]["stub-model"], {"interactive": 0, "batch": 0})
+
+    def test_unknown_priority(self):
+        """Test that an unknown priority class is rejected."""
+        scheduler = LLMScheduler(StubBackend(), self.logger)
+
+        with self.assertRaises(ValueError):
+            self._run(scheduler.submit("prompt", priority="urgent"))
+
+
+if __name__ == "__main__":
+    unittest.main()
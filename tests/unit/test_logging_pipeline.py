@@ -0,0 +1,122 @@
+"""
+Unit tests for the non-blocking logging pipeline.
+
+These tests verify deferred formatting, sampling of INFO records, the JSON
+formatter, queue overflow and LoggingProvider.get_logger writing through a
+background listener thread.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.logging_pipeline import DeferredQueueHandler, JsonFormatter, SamplingFilter, stop_async_logging
+
+
+def make_record(msg, args=(), level=logging.INFO, **extra):
+    """Create a log record."""
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestDeferredQueueHandler(unittest.TestCase):
+    """Test cases for DeferredQueueHandler."""
+
+    def test_immutable_arguments_are_formatted_later(self):
+        """Test that records with immutable arguments are enqueued unformatted."""
+        handler = DeferredQueueHandler(queue.Queue())
+        handler.handle(make_record("Accessing resource: %s (%d)", ("res://a", 1)))
+        record = handler.queue.get_nowait()
+
+        self.assertEqual(record.msg, "Accessing resource: %s (%d)")
+        self.assertEqual(record.getMessage(), "Accessing resource: res://a (1)")
+
+    def test_mutable_arguments_are_formatted_now(self):
+        """Test that mutable arguments are merged before they can change."""
+        handler = DeferredQueueHandler(queue.Queue())
+        keys = ["a"]
+        handler.handle(make_record("Keys: %s", (keys,)))
+        keys.append("b")
+
+        self.assertEqual(handler.queue.get_nowait().getMessage(), "Keys: ['a']")
+
+    def test_full_queue_drops_records(self):
+        """Test that a full queue drops records instead of blocking."""
+        handler = DeferredQueueHandler(queue.Queue(maxsize=1))
+        handler.handle(make_record("first"))
+        handler.handle(make_record("second"))
+
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(handler.queue.get_nowait().msg, "first")
+
+
+class TestSamplingFilter(unittest.TestCase):
+    """Test cases for SamplingFilter."""
+
+    def test_samples_per_template(self):
+        """Test that one in N INFO records of each template is kept."""
+        sampling = SamplingFilter(0.25)
+        kept = [sampling.filter(make_record("Routing %s", (str(i),))) for i in range(8)]
+        other = sampling.filter(make_record("Other %s", ("x",)))
+
+        self.assertEqual(kept, [True, False, False, False, True, False, False, False])
+        self.assertTrue(other)
+
+    def test_warnings_and_opt_out_are_kept(self):
+        """Test that records above INFO and records with sample=False are never dropped."""
+        sampling = SamplingFilter(0)
+
+        self.assertFalse(sampling.filter(make_record("info")))
+        self.assertTrue(sampling.filter(make_record("warning", level=logging.WARNING)))
+        self.assertTrue(sampling.filter(make_record("audit", sample=False)))
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test cases for JsonFormatter."""
+
+    def test_format(self):
+        """Test that records are rendered as JSON objects including extra fields."""
+        line = JsonFormatter().format(make_record("Accessing %s", ("res://a",), client_id="c1"))
+        entry = json.loads(line)
+
+        self.assertEqual(entry["message"], "Accessing res://a")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["client_id"], "c1")
+        self.assertNotIn("args", entry)
+
+
+class TestLoggingProvider(unittest.TestCase):
+    """Test cases for LoggingProvider.get_logger with the async pipeline."""
+
+    def test_get_logger_writes_through_listener(self):
+        """Test that records reach the log file once the listener is stopped."""
+        from di.providers import LoggingProvider
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = os.path.join(tmpdir, "mcp.log")
+            config = {"logging": {"level": "INFO", "file": log_file, "format": "json", "async": True}}
+            logger = LoggingProvider.get_logger("test_logging_pipeline", config)
+            logger.propagate = False
+
+            self.assertIsInstance(logger.handlers[0], DeferredQueueHandler)
+            logger.debug("Not logged %s", "at INFO")
+            logger.info("Accessing resource: %s", "res://a")
+            stop_async_logging()
+            logger.handlers.clear()
+
+            with open(log_file) as f:
+                entries = [json.loads(line) for line in f]
+
+        self.assertEqual([entry["message"] for entry in entries], ["Accessing resource: res://a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+Unit tests for the ParsedModule class and the parsed module cache.
+"""
+
+import ast
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from core.quality.components.documentation import DocstringCheck
+from core.quality.components.documentation_coverage import EnhancedDocumentationCoverageCheck
+from core.quality.components.parsed_modules import ModuleCache, ParsedModule, get_naming_style
+
+SOURCE = textwrap.dedent('''
+    """Module docstring."""
+
+    import os
+    from typing import List
+
+    MAX_SIZE = 10
+
+
+    class Parser:
+        """Parser docstring."""
+
+        def parse(self, text):
+            """Parse text."""
+            def helper(value):
+                return value or None
+            if text and self:
+                return helper(text)
+            return None
+
+        def _private(self):
+            pass
+
+
+    async def fetchData(url: str) -> str:
+        try:
+            return url
+        except ValueError:
+            pass
+        except TypeError:
+            pass
+        return ""
+
+
+    handler = lambda value: value
+''')
+
+
+class TestParsedModule(unittest.TestCase):
+    """Test cases for the ParsedModule class."""
+
+    def setUp(self):
+        """Parse the example module."""
+        self.module = ParsedModule.parse(SOURCE)
+        self.definitions = {definition.qualname: definition for definition in self.module.definitions}
+
+    def test_definitions(self):
+        """Test that classes, methods and functions are collected in source order."""
+        self.assertEqual(list(self.definitions),
+                         ["Parser", "Parser.parse", "Parser.parse.helper", "Parser._private", "fetchData"])
+        self.assertEqual([definition.kind for definition in self.module.definitions],
+                         ["class", "method", "function", "method", "function"])
+        self.assertEqual(self.definitions["Parser.parse"].parent_class, "Parser")
+        self.assertIsNone(self.definitions["Parser.parse.helper"].parent_class)
+        self.assertEqual(self.module.docstring, "Module docstring.")
+        self.assertIsNone(self.definitions["fetchData"].docstring)
+        self.assertTrue(self.definitions["Parser._private"].is_private)
+
+    def test_parent_links(self):
+        """Test that every node knows its parent."""
+        helper = self.definitions["Parser.parse.helper"].node
+        parse = self.definitions["Parser.parse"].node
+
+        self.assertIs(self.module.get_parent(helper), parse)
+        self.assertIsNone(self.module.get_parent(self.module.tree))
+        self.assertEqual(self.module.get_enclosing_class(parse).name, "Parser")
+        self.assertIsNone(self.module.get_enclosing_class(helper))
+        # Load/Store contexts are shared singletons and have no single parent
+        nodes = [node for node in ast.walk(self.module.tree) if not isinstance(node, ast.expr_context)]
+        self.assertTrue(all(node in self.module.parents for node in nodes[1:]))
+
+    def test_complexity(self):
+        """Test that complexity includes nested functions and except handlers."""
+        self.assertEqual(self.definitions["Parser.parse.helper"].complexity, 2)
+        self.assertEqual(self.definitions["Parser.parse"].complexity, 4)
+        self.assertEqual(self.definitions["fetchData"].complexity, 3)
+        self.assertEqual(self.module.complexity, 6)
+        self.assertEqual(self.module.cognitive_complexity, 4)
+        self.assertTrue(self.definitions["Parser.parse"].returns_value)
+        self.assertFalse(self.definitions["Parser._private"].returns_value)
+
+    def test_naming_facts(self):
+        """Test that naming styles, imports and assignments are collected."""
+        self.assertEqual(self.definitions["fetchData"].naming_style, "camelCase")
+        self.assertEqual(self.definitions["Parser"].naming_style, "PascalCase")
+        self.assertEqual(get_naming_style("__init__"), "snake_case")
+        self.assertEqual(get_naming_style("MAX_SIZE"), "UPPER_CASE")
+        self.assertEqual(len(self.module.imports), 2)
+        self.assertEqual([name for name, _ in self.module.assignments], ["MAX_SIZE", "handler"])
+
+
+class TestModuleCache(unittest.TestCase):
+    """Test cases for the ModuleCache class and the checks using it."""
+
+    def setUp(self):
+        """Write the example module to a file."""
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "example.py")
+        with open(self.path, "w") as f:
+            f.write(SOURCE)
+
+    def tearDown(self):
+        """Remove the file."""
+        shutil.rmtree(self.root)
+
+    def test_files_are_parsed_once(self):
+        """Test that a file is parsed again only after it changed."""
+        cache = ModuleCache()
+        module = cache.get(self.path)
+
+        self.assertIs(cache.get(self.path), module)
+
+        with open(self.path, "a") as f:
+            f.write("\nEXTRA = 1\n")
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+
+        self.assertIsNot(cache.get(self.path), module)
+
+    def test_least_recently_used_modules_are_dropped(self):
+        """Test that the cache keeps at most max_modules modules."""
+        other = os.path.join(self.root, "other.py")
+        with open(other, "w") as f:
+            f.write("VALUE = 1\n")
+        cache = ModuleCache(max_modules=1)
+        module = cache.get(self.path)
+        cache.get(other)
+
+        self.assertIsNot(cache.get(self.path), module)
+
+    def test_docstring_check(self):
+        """Test that the docstring check reports undocumented public definitions."""
+        results = DocstringCheck().run([self.path])
+
+        self.assertEqual([(result.message, result.line_number) for result in results],
+                         [("Missing docstring for function/method helper", 15),
+                          ("Missing docstring for function/method fetchData", 25)])
+
+    def test_documentation_coverage(self):
+        """Test the coverage metrics of a module with lambdas and nested functions."""
+        metrics = EnhancedDocumentationCoverageCheck()._analyze_file(self.path)
+
+        self.assertEqual(metrics["total_classes"], 1)
+        self.assertEqual(metrics["total_functions"], 4)
+        self.assertEqual(metrics["documented_functions"], 1)
+        self.assertEqual(metrics["undocumented_functions"], ["helper", "Parser._private", "fetchData"])
+        self.assertEqual(metrics["undocumented_returns"], ["Parser.parse"])
+
+
+if __name__ == "__main__":
+    unittest.main()
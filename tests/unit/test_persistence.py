@@ -0,0 +1,90 @@
+"""
+Unit tests for the MCP persistence layer.
+
+These tests verify database initialization, the SQLite performance profile
+and the separation between the writer engine and the read-only pool.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from persistence import database
+from persistence.models import Client, Session
+
+
+class TestSQLitePerformanceProfile(unittest.TestCase):
+    """Test cases for the SQLite performance profile."""
+    
+    def setUp(self):
+        """Set up a temporary database file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "test.db")
+        
+    def tearDown(self):
+        """Dispose engines and remove the temporary database."""
+        database.get_read_engine().dispose()
+        database.get_engine().dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def _init(self, profile):
+        database.init_db({"database": {"type": "sqlite", "path": self.db_path, "profile": profile}})
+        
+    def test_default_profile_shares_engine(self):
+        """Test that the default profile reads through the primary engine."""
+        self._init("default")
+        self.assertIs(database.get_read_engine(), database.get_engine())
+        
+    def test_performance_profile_pragmas(self):
+        """Test that the performance profile enables WAL and a single writer."""
+        self._init("performance")
+        
+        with database.db_session() as session:
+            self.assertEqual(session.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(session.execute(text("PRAGMA synchronous")).scalar(), 1)  # NORMAL
+            
+        self.assertEqual(database.get_engine().pool.size(), 1)
+        self.assertIsNot(database.get_read_engine(), database.get_engine())
+        
+    def test_read_session_sees_writes_and_rejects_writes(self):
+        """Test that the read pool observes committed writes but cannot write."""
+        self._init("performance")
+        
+        with database.db_session() as session:
+            client = Client(client_id="client-1")
+            session.add(client)
+            session.flush()
+            session.add(Session(
+                session_id="session-1",
+                client_id=client.id,
+                username="tester",
+                token="token",
+                expiration=datetime.utcnow() + timedelta(hours=1)
+            ))
+            
+        with database.read_session() as session:
+            stored = session.query(Session).filter_by(session_id="session-1").one()
+            self.assertEqual(stored.username, "tester")
+            
+            session.add(Client(client_id="client-2"))
+            with self.assertRaises(OperationalError):
+                session.commit()
+                
+    def test_unknown_profile_rejected(self):
+        """Test that an unknown profile name raises ValueError."""
+        with self.assertRaises(ValueError):
+            self._init("turbo")
+        self._init("default")
+
+
+if __name__ == '__main__':
+    unittest.main()
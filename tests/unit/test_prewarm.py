@@ -0,0 +1,103 @@
+"""
+Unit tests for the background pre-warm hook.
+
+These tests verify that Prewarmer runs its steps after startup without
+blocking the event loop, records failures without raising, and that the
+FastAPI application reports the pre-warm state.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.prewarm import Prewarmer
+
+
+class TestPrewarmer(unittest.TestCase):
+    """Test cases for Prewarmer."""
+
+    def setUp(self):
+        """Set up a logger."""
+        self.logger = logging.getLogger("test_prewarm")
+
+    def test_steps_run_in_background(self):
+        """Test that start returns immediately and blocking steps run off the event loop."""
+        threads = {}
+
+        def blocking_step():
+            time.sleep(0.1)
+            threads["blocking"] = threading.get_ident()
+
+        def loop_step():
+            threads["loop"] = threading.get_ident()
+
+        prewarmer = Prewarmer(self.logger)
+        prewarmer.add("blocking", blocking_step, blocking=True)
+        prewarmer.add("loop", loop_step)
+        prewarmer.add_imports("json")
+
+        async def run():
+            started = time.perf_counter()
+            task = prewarmer.start()
+            elapsed = time.perf_counter() - started
+            await task
+            return elapsed
+
+        elapsed = asyncio.run(run())
+        status = prewarmer.get_status()
+
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(status["state"], "done")
+        self.assertEqual(list(status["steps"]), ["blocking", "loop", "import json"])
+        self.assertEqual(threads["loop"], threading.get_ident())
+        self.assertNotEqual(threads["blocking"], threading.get_ident())
+
+    def test_failed_step_is_recorded(self):
+        """Test that a failing step does not stop the remaining steps."""
+        def failing_step():
+            raise RuntimeError("unavailable")
+
+        prewarmer = Prewarmer(self.logger)
+        prewarmer.add("failing", failing_step)
+        prewarmer.add_imports("json")
+
+        async def run():
+            await prewarmer.start()
+
+        asyncio.run(run())
+        steps = prewarmer.get_status()["steps"]
+
+        self.assertEqual(steps["failing"], {"error": "unavailable"})
+        self.assertIn("duration", steps["import json"])
+
+
+class TestAppStartup(unittest.TestCase):
+    """Test cases for pre-warming in the FastAPI application."""
+
+    def test_startup_prewarms_services(self):
+        """Test that the pre-warm hook runs on startup and is reported by the debug endpoint."""
+        from fastapi.testclient import TestClient
+        os.environ.setdefault("LOG_FILE", os.devnull)
+        import app as app_module
+
+        with TestClient(app_module.app) as client:
+            deadline = time.monotonic() + 10
+            status = client.get("/debug/startup").json()
+            while status["state"] != "done" and time.monotonic() < deadline:
+                time.sleep(0.05)
+                status = client.get("/debug/startup").json()
+
+            self.assertEqual(status["state"], "done")
+            self.assertIn("prompt_processor", status["steps"])
+            self.assertEqual(client.get("/debug/health").json()["prewarm"], "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Unit tests for the progress notification pipeline.
+
+These tests verify asynchronous delivery, per-operation coalescing and rate
+limiting, final updates, bounded per-client queues, and routing through
+MCPHost.route_progress_notification.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.progress_pipeline import ProgressPipeline, close_progress_pipelines
+
+
+class RecordingSink:
+    """Delivery function recording updates, optionally blocking until released."""
+
+    def __init__(self):
+        self.updates = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, client_key, operation_key, percent_complete, status_message):
+        self.release.wait()
+        self.updates.append((client_key, operation_key, percent_complete, status_message))
+
+
+class TestProgressPipeline(unittest.TestCase):
+    """Test cases for ProgressPipeline."""
+
+    def setUp(self):
+        """Set up a logger and a recording sink."""
+        self.logger = logging.getLogger("test_progress_pipeline")
+        self.sink = RecordingSink()
+
+    def test_updates_are_delivered_asynchronously(self):
+        """Test that submit does not wait for a slow delivery."""
+        pipeline = ProgressPipeline(self.sink, self.logger)
+        self.sink.release.clear()
+
+        start = time.monotonic()
+        self.assertTrue(pipeline.submit("client", "op", 10, "working"))
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        self.sink.release.set()
+        self.assertTrue(pipeline.flush(timeout=5))
+        self.assertEqual(self.sink.updates, [("client", "op", 10, "working")])
+        pipeline.close()
+
+    def test_coalescing_keeps_latest_and_final(self):
+        """Test that a burst of updates is reduced to few deliveries ending with the final one."""
+        pipeline = ProgressPipeline(self.sink, self.logger, max_updates_per_second=10)
+
+        for percent in range(101):
+            pipeline.submit("client", "op", percent, f"{percent}%")
+        self.assertTrue(pipeline.flush(timeout=5))
+        pipeline.close()
+
+        percents = [update[2] for update in self.sink.updates]
+        self.assertLess(len(percents), 10)
+        self.assertEqual(percents[-1], 100)
+        self.assertEqual(percents, sorted(percents))
+        self.assertGreater(pipeline.get_stats()["coalesced"], 90)
+
+    def test_rate_limit_per_operation(self):
+        """Test that updates of one operation are spaced by the minimum interval."""
+        times = []
+        pipeline = ProgressPipeline(lambda *update: times.append(time.monotonic()), self.logger,
+                                    max_updates_per_second=20)
+
+        for percent in range(1, 4):
+            pipeline.submit("client", "op", percent, "working")
+            time.sleep(0.06)
+        self.assertTrue(pipeline.flush(timeout=5))
+        pipeline.close()
+
+        self.assertEqual(len(times), 3)
+        self.assertTrue(all(later - earlier >= 0.045 for earlier, later in zip(times, times[1:])))
+
+    def test_output_is_concatenated(self):
+        """Test that streamed output is never coalesced away, even behind a final update."""
+        pipeline = ProgressPipeline(self.sink, self.logger, max_updates_per_second=1)
+
+        pipeline.submit("client", "op", 1, "[stdout] first\n")
+        time.sleep(0.05)
+        for index in range(50):
+            pipeline.submit("client", "op", 2, f"[stdout] line {index}\n")
+            pipeline.submit("client", "op", 2, "working")
+        pipeline.submit("client", "op", 3, "[stderr] warning")
+        pipeline.submit("client", "op", 3, "[stdout] last\n")
+        pipeline.submit("client", "op", 100, "Command finished with exit code 0")
+        self.assertTrue(pipeline.flush(timeout=5))
+        pipeline.close()
+
+        messages = [update[3] for update in self.sink.updates]
+        self.assertEqual(messages[-1], "Command finished with exit code 0")
+        expected = "".join(f"line {index}\n" for index in range(50))
+        self.assertEqual(messages[:-1], [
+            "[stdout] first\n",
+            f"[stdout] {expected}[stderr] warning\n[stdout] last\n"
+        ])
+
+    def test_shutdown_delivers_pending_updates(self):
+        """Test that closing the open pipelines delivers updates queued behind a slow delivery."""
+        pipeline = ProgressPipeline(self.sink, self.logger)
+        self.sink.release.clear()
+        pipeline.submit("client", "op", 10, "working")
+        time.sleep(0.05)
+        pipeline.submit("client", "op", 100, "done")
+
+        threading.Timer(0.1, self.sink.release.set).start()
+        close_progress_pipelines()
+
+        self.assertEqual([update[2] for update in self.sink.updates], [10, 100])
+        self.assertFalse(pipeline.submit("client", "op", 100, "again"))
+
+    def test_bounded_queue_per_client(self):
+        """Test that a full client queue drops the oldest non-final update."""
+        pipeline = ProgressPipeline(self.sink, self.logger, max_queue_per_client=2)
+        self.sink.release.clear()
+        pipeline.submit("client", "blocker", 1, "busy")
+        time.sleep(0.05)
+
+        pipeline.submit("client", "op1", 100, "done")
+        pipeline.submit("client", "op2", 50, "half")
+        pipeline.submit("client", "op3", 10, "started")
+        self.sink.release.set()
+        self.assertTrue(pipeline.flush(timeout=5))
+        pipeline.close()
+
+        delivered = [update[1] for update in self.sink.updates]
+        self.assertEqual(delivered, ["blocker", "op1", "op3"])
+        self.assertEqual(pipeline.get_stats()["dropped"], 1)
+
+
+class TestHostProgressRouting(unittest.TestCase):
+    """Test cases for progress routing through MCPHost."""
+
+    def test_route_progress_notification(self):
+        """Test that routed notifications are coalesced and reach the client."""
+        from host.host import MCPHost
+
+        class Client:
+            def __init__(self):
+                self.notifications = []
+
+            def handle_progress_notification(self, notification):
+                self.notifications.append(notification)
+
+        host = MCPHost(logging.getLogger("test_progress_pipeline"), {"progress": {"max_updates_per_second": 10}})
+        client = Client()
+        host.clients["client"] = {"instance": client}
+
+        for percent in range(101):
+            self.assertTrue(host.route_progress_notification("server", "client", "op", percent, "working"))
+        host.shutdown()
+
+        self.assertLess(len(client.notifications), 10)
+        last = client.notifications[-1]
+        params = last["params"] if isinstance(last, dict) else last.params
+        self.assertEqual(params["percent_complete"], 100)
+        self.assertEqual(params["server_id"], "server")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the tiered resource cache.
+
+These tests verify the in-memory LRU tier, validator-based invalidation and
+the database-backed second tier shared between cache instances.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from persistence import database
+from persistence.models import Resource
+from server.resources import FileResourceProvider, TieredResourceCache
+
+
+class TestTieredResourceCache(unittest.TestCase):
+    """Test cases for the in-memory tier."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TieredResourceCache("server", "file", {"max_size": 2})
+        cache.put("resource://file/a", "v1", {"content": "a"})
+        cache.put("resource://file/b", "v1", {"content": "b"})
+
+        # Touch "a" so that "b" becomes the least recently used entry
+        self.assertIsNotNone(cache.get("resource://file/a", "v1"))
+        cache.put("resource://file/c", "v1", {"content": "c"})
+
+        self.assertIsNone(cache.get("resource://file/b", "v1"))
+        self.assertEqual(cache.get("resource://file/a", "v1"), {"content": "a"})
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_validator_mismatch_is_a_miss(self):
+        """Test that entries for another source version are not served."""
+        cache = TieredResourceCache("server", "file")
+        cache.put("resource://file/a", "v1", {"content": "old"})
+
+        self.assertIsNone(cache.get("resource://file/a", "v2"))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_cache_key_is_a_content_hash(self):
+        """Test that identical payloads get the same content-hash key."""
+        cache = TieredResourceCache("server", "file")
+        key_a = cache.put("resource://file/a", "v1", {"content": "same"})
+        key_b = cache.put("resource://file/b", "v1", {"content": "same"})
+
+        self.assertEqual(key_a, key_b)
+        self.assertEqual(cache.get_stats()["entries"], 2)
+
+    def test_oversized_payload_not_cached(self):
+        """Test that payloads above the per-resource limit are skipped."""
+        cache = TieredResourceCache("server", "file", {"max_size_per_resource": 10})
+
+        self.assertIsNone(cache.put("resource://file/a", "v1", {"content": "x" * 100}))
+        self.assertIsNone(cache.get("resource://file/a", "v1"))
+
+
+class TestPersistentResourceCache(unittest.TestCase):
+    """Test cases for the database-backed tier."""
+
+    def setUp(self):
+        """Set up a temporary database and resource directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        database.init_db({"database": {"type": "sqlite", "path": os.path.join(self.temp_dir, "cache.db")}})
+        self.files_dir = os.path.join(self.temp_dir, "files")
+        os.makedirs(self.files_dir)
+        with open(os.path.join(self.files_dir, "hot.txt"), "w") as f:
+            f.write("hot content")
+
+    def tearDown(self):
+        """Dispose engines and remove temporary files."""
+        database.get_read_engine().dispose()
+        database.get_engine().dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _provider(self):
+        return FileResourceProvider(
+            base_path=self.files_dir,
+            config={"server_id": "replica", "cache": {"persistent": True}}
+        )
+
+    def test_entry_survives_new_instance(self):
+        """Test that a second provider is served from the Resource table."""
+        first = self._provider()
+        result = first.read_resource("resource://file/hot.txt")
+        self.assertTrue(result["success"])
+
+        with database.db_session() as session:
+            row = session.query(Resource).filter_by(uri="resource://file/hot.txt").one()
+            self.assertEqual(row.cache_key, TieredResourceCache.compute_cache_key(row.content))
+            self.assertEqual(row.provider, "file")
+
+        second = self._provider()
+        self.assertEqual(second.read_resource("resource://file/hot.txt"), result)
+        self.assertEqual(second.cache.get_stats()["persistent_hits"], 1)
+
+    def test_modified_file_is_reread(self):
+        """Test that a persisted entry is not served after the file changes."""
+        self._provider().read_resource("resource://file/hot.txt")
+
+        path = os.path.join(self.files_dir, "hot.txt")
+        with open(path, "w") as f:
+            f.write("new content, different size")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = self._provider()
+        result = second.read_resource("resource://file/hot.txt")
+        self.assertEqual(result["content"], "new content, different size")
+        self.assertEqual(second.cache.get_stats()["persistent_hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
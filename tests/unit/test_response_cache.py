@@ -0,0 +1,159 @@
+"""
+Unit tests for the LLM response cache.
+
+These tests verify key normalization, LRU and TTL bounds, the persistent
+backing store, coalescing of concurrent identical prompts and hit-rate metrics.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+
+    def setUp(self):
+        """Set up a logger and a temporary directory."""
+        self.logger = logging.getLogger("test_response_cache")
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_normalizes_whitespace(self):
+        """Test that whitespace-only prompt differences share a key."""
+        key_a = ResponseCache.make_key("model", "  Explain\n\n  this   code ")
+        key_b = ResponseCache.make_key("model", "Explain this code")
+
+        self.assertEqual(key_a, key_b)
+        self.assertNotEqual(key_a, ResponseCache.make_key("other-model", "Explain this code"))
+        self.assertNotEqual(key_a, ResponseCache.make_key("model", "Explain this code", {"temperature": 0.2}))
+
+    def test_lru_and_ttl_bounds(self):
+        """Test that the memory tier is bounded by size and TTL."""
+        cache = ResponseCache(self.logger, max_entries=2, ttl=60)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "A")
+
+        cache.ttl = 0
+        self.assertIsNone(cache.get("a"))
+
+    def test_persistent_store_survives_restart(self):
+        """Test that responses are reloaded from the SQLite backing store."""
+        path = os.path.join(self.temp_dir, "responses.db")
+        first = ResponseCache(self.logger, persistent_path=path)
+        first.put("key", "answer", "model")
+        first.close()
+
+        second = ResponseCache(self.logger, persistent_path=path)
+        self.assertEqual(second.get("key"), "answer")
+        self.assertEqual(second.get_stats()["persistent_hits"], 1)
+        second.close()
+
+    def test_concurrent_identical_prompts_are_coalesced(self):
+        """Test that only one upstream call runs for identical concurrent prompts."""
+        cache = ResponseCache(self.logger)
+        calls = []
+
+        async def generate():
+            calls.append(time.time())
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run():
+            return await asyncio.gather(*(
+                cache.get_or_generate("model", "same prompt", generate) for _ in range(5)
+            ))
+
+        self.assertEqual(asyncio.run(run()), ["answer"] * 5)
+        self.assertEqual(len(calls), 1)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["coalesced"], 4)
+        self.assertEqual(stats["hit_rate"], 0.8)
+
+    def test_cancelled_caller_does_not_fail_the_others(self):
+        """Test that cancelling the first caller leaves coalesced callers served."""
+        cache = ResponseCache(self.logger)
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def run():
+            leader = asyncio.ensure_future(cache.get_or_generate("model", "prompt", generate))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(cache.get_or_generate("model", "prompt", generate)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            answers = await asyncio.gather(*followers)
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return answers
+
+        self.assertEqual(asyncio.run(run()), ["answer", "answer"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get(cache.make_key("model", "prompt")), "answer")
+
+    def test_generation_is_cancelled_without_callers(self):
+        """Test that the upstream request stops when every caller is cancelled."""
+        cache = ResponseCache(self.logger)
+        cancelled = []
+
+        async def generate():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return "answer"
+
+        async def run():
+            caller = asyncio.ensure_future(cache.get_or_generate("model", "prompt", generate))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        self.assertEqual(cancelled, [1])
+        self.assertEqual(cache.get_stats()["inflight"], 0)
+
+    def test_errors_are_not_cached(self):
+        """Test that a failed generation is retried on the next request."""
+        cache = ResponseCache(self.logger)
+        attempts = []
+
+        async def generate():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("upstream failure")
+            return "answer"
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(cache.get_or_generate("model", "prompt", generate))
+        self.assertEqual(asyncio.run(cache.get_or_generate("model", "prompt", generate)), "answer")
+        self.assertEqual(cache.get_stats()["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
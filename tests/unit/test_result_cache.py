@@ -0,0 +1,190 @@
+"""
+Unit tests for the ResultCache class.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from core.quality.components.base import QualityCheck, QualityCheckResult, QualityCheckSeverity
+from core.quality.components.inventory import FileInventory, get_changed_files
+from core.quality.components.result_cache import ResultCache
+from core.quality.components.scheduler import CheckScheduler
+
+
+class PerFileCheck(QualityCheck):
+    """Check that reports one result per Python file and records the files it ran on."""
+
+    def __init__(self, scope="file", fail=False):
+        self._scope = scope
+        self.fail = fail
+        self.runs = []
+
+    @property
+    def id(self):
+        return "per_file"
+
+    @property
+    def name(self):
+        return "Per File"
+
+    @property
+    def description(self):
+        return "Per-file check"
+
+    @property
+    def uses_subprocess(self):
+        return True
+
+    @property
+    def languages(self):
+        return ("python",)
+
+    @property
+    def cache_scope(self):
+        return self._scope
+
+    def run(self, file_paths=None, **kwargs):
+        file_paths = file_paths or kwargs["inventory"].get_files("python")
+        self.runs.append(sorted(os.path.basename(path) for path in file_paths))
+        if self.fail:
+            raise RuntimeError("tool crashed")
+        return [QualityCheckResult(
+            check_id=self.id,
+            severity=QualityCheckSeverity.WARNING,
+            message=f"Issue in {os.path.basename(path)}",
+            file_path=path
+        ) for path in file_paths]
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the ResultCache class."""
+
+    def setUp(self):
+        """Create a project with two modules, one importing the other."""
+        self.cwd = os.getcwd()
+        self.root = tempfile.mkdtemp()
+        os.chdir(self.root)
+        os.makedirs("pkg")
+        self.write("pkg/__init__.py", "")
+        self.write("pkg/util.py", "VALUE = 1\n")
+        self.write("pkg/main.py", "from pkg.util import VALUE\n")
+
+    def tearDown(self):
+        """Remove the project."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.root)
+
+    def write(self, path, content):
+        """Write a file of the project."""
+        with open(path, "w") as f:
+            f.write(content)
+
+    def run_check(self, check, file_paths=None):
+        """Run a check incrementally and return the messages of its results."""
+        cache = ResultCache()
+        try:
+            (_, results), = CheckScheduler(cache=cache).run([("Test", check)], file_paths,
+                                                            inventory=FileInventory("."))
+        finally:
+            cache.close()
+        return sorted(result.message for result in results)
+
+    def test_unchanged_files_are_not_checked_again(self):
+        """Test that a second run reuses the cached results without running the check."""
+        check = PerFileCheck()
+        first = self.run_check(check)
+        second = self.run_check(check)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(check.runs), 1)
+
+    def test_changed_file_is_checked_again(self):
+        """Test that only the changed file is checked again."""
+        check = PerFileCheck()
+        self.run_check(check)
+        self.write("pkg/util.py", "VALUE = 2\n")
+
+        self.assertEqual(len(self.run_check(check)), 3)
+        self.assertEqual(check.runs[-1], ["util.py"])
+
+    def test_imports_scope_follows_dependencies(self):
+        """Test that a changed module invalidates the modules importing it."""
+        check = PerFileCheck(scope="imports")
+        self.run_check(check)
+        self.write("pkg/util.py", "VALUE = 2\n")
+        self.run_check(check)
+
+        self.assertEqual(check.runs[-1], ["main.py", "util.py"])
+
+    def test_imports_scope_follows_indirect_dependencies(self):
+        """Test that a changed module invalidates the modules importing it through other modules."""
+        self.write("pkg/app.py", "from pkg import main\n")
+        check = PerFileCheck(scope="imports")
+        self.run_check(check)
+        self.write("pkg/util.py", "VALUE = 2\n")
+        self.run_check(check)
+
+        self.assertEqual(check.runs[-1], ["app.py", "main.py", "util.py"])
+
+    def test_explicit_file_paths(self):
+        """Test that only the given files are looked up."""
+        check = PerFileCheck()
+        self.run_check(check)
+
+        self.assertEqual(self.run_check(check, ["pkg/main.py", "README.md"]), ["Issue in main.py"])
+        self.assertEqual(len(check.runs), 1)
+
+    def test_failed_runs_are_not_cached(self):
+        """Test that the results of a failing run are not stored."""
+        self.run_check(PerFileCheck(fail=True))
+        check = PerFileCheck()
+        self.run_check(check)
+
+        self.assertEqual(len(check.runs), 1)
+
+
+class TestGetChangedFiles(unittest.TestCase):
+    """Test cases for get_changed_files."""
+
+    def setUp(self):
+        """Create a git repository with one commit."""
+        self.root = tempfile.mkdtemp()
+        self.git("init", "-q")
+        for name in ["a.py", "b.py"]:
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write("# content\n")
+        self.git("add", ".")
+        self.git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+
+    def tearDown(self):
+        """Remove the repository."""
+        shutil.rmtree(self.root)
+
+    def git(self, *args):
+        """Run a git command in the repository."""
+        subprocess.run(["git", *args], cwd=self.root, check=True)
+
+    def test_modified_and_untracked_files(self):
+        """Test that modified and untracked files are listed and deleted files are not."""
+        with open(os.path.join(self.root, "a.py"), "a") as f:
+            f.write("# changed\n")
+        with open(os.path.join(self.root, "c.py"), "w") as f:
+            f.write("# new\n")
+        os.remove(os.path.join(self.root, "b.py"))
+
+        files = get_changed_files("HEAD", self.root)
+
+        self.assertEqual([os.path.relpath(path, self.root) for path in files], ["a.py", "c.py"])
+
+    def test_unknown_revision(self):
+        """Test that an unknown revision raises a ValueError."""
+        with self.assertRaises(ValueError):
+            get_changed_files("no-such-revision", self.root)
+
+
+if __name__ == "__main__":
+    unittest.main()
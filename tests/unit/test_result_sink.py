@@ -0,0 +1,115 @@
+"""
+Unit tests for compact results and the streaming result sink.
+"""
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.result_sink import ResultSink, read_results, write_report
+from core.quality.enforcer import QualityEnforcer
+
+
+def make_result(line, severity=QualityCheckSeverity.WARNING):
+    """Create a result with strings built at runtime, as tools produce them."""
+    return QualityCheckResult(
+        check_id="".join(["py", "lint"]),
+        severity=severity,
+        message=f"Issue on line {line}",
+        file_path="/".join(["core", "module.py"]),
+        line_number=line,
+        details={"message_id": "W0611"}
+    )
+
+
+class TestQualityCheckResult(unittest.TestCase):
+    """Test cases for the compact QualityCheckResult."""
+
+    def test_results_are_compact(self):
+        """Test that results have no instance dictionary and share repeated strings."""
+        first, second = make_result(1), make_result(2)
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertIs(first.check_id, second.check_id)
+        self.assertIs(first.file_path, second.file_path)
+
+    def test_round_trips(self):
+        """Test that results survive serialization and pickling."""
+        result = make_result(3, QualityCheckSeverity.ERROR)
+
+        self.assertEqual(QualityCheckResult.from_dict(json.loads(json.dumps(result.to_dict()))), result)
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+
+class TestResultSink(unittest.TestCase):
+    """Test cases for the ResultSink class and the report writer."""
+
+    def setUp(self):
+        """Create a directory for the output."""
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "results.jsonl")
+
+    def tearDown(self):
+        """Remove the directory."""
+        shutil.rmtree(self.root)
+
+    def test_results_are_streamed(self):
+        """Test that written results are counted and read back in order."""
+        with ResultSink(self.path) as sink:
+            sink.write_all(make_result(line) for line in range(3))
+            sink.write(make_result(3, QualityCheckSeverity.INFO))
+
+        self.assertEqual(sink.total, 4)
+        self.assertEqual(sink.severity_counts[QualityCheckSeverity.WARNING], 3)
+        self.assertEqual(sink.check_counts["pylint"], 4)
+        self.assertEqual([result.line_number for result in read_results(self.path)], [0, 1, 2, 3])
+
+    def test_failed_run_keeps_previous_results(self):
+        """Test that an interrupted run does not replace the previous file."""
+        with ResultSink(self.path) as sink:
+            sink.write(make_result(1))
+
+        with self.assertRaises(RuntimeError):
+            with ResultSink(self.path) as sink:
+                sink.write(make_result(2))
+                raise RuntimeError("check crashed")
+
+        self.assertEqual([result.line_number for result in read_results(self.path)], [1])
+        self.assertEqual(os.listdir(self.root), ["results.jsonl"])
+
+    def test_report(self):
+        """Test that the streamed report is valid JSON with a summary."""
+        report_path = os.path.join(self.root, "report.json")
+        results = [make_result(1), make_result(2, QualityCheckSeverity.INFO)]
+
+        summary = write_report(report_path, iter(results))
+
+        with open(report_path) as f:
+            report = json.load(f)
+        self.assertEqual([QualityCheckResult.from_dict(data) for data in report["results"]], results)
+        self.assertEqual(report["summary"], {"total_checks": 2, "passed": 1, "failed": 1})
+        self.assertEqual(summary["by_severity"]["warning"], 1)
+
+        write_report(report_path, [])
+        with open(report_path) as f:
+            self.assertEqual(json.load(f)["results"], [])
+
+    def test_enforcer_streams_checks(self):
+        """Test that the enforcer writes the results of each check as it finishes."""
+        enforcer = QualityEnforcer()
+        finished = [("pylint", [make_result(1), make_result(2)]), ("black", [])]
+
+        with patch.object(enforcer, "iter_all_checks", return_value=iter(finished)):
+            sink = enforcer.stream_all_checks(sink=ResultSink(self.path))
+
+        self.assertEqual(sink.total, 2)
+        self.assertEqual(len(list(read_results(sink.path))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the standalone MCP client (mcp_client.py).
+
+These tests run the sync and async clients against a local stand-in for the
+MCP server's ``/jsonrpc`` endpoint and verify connection reuse and batched
+JSON-RPC calls.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the repository root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mcp_client import AsyncMCPClient, MCPClient
+
+
+class StandInMCPHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive stand-in for the MCP server's JSON-RPC endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    connections = 0
+    posts = 0
+
+    def setup(self):
+        super().setup()
+        with type(self).lock:
+            type(self).connections += 1
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with type(self).lock:
+            type(self).posts += 1
+
+        if isinstance(payload, list):
+            # Answer in reverse order; clients must match responses by ID
+            body = [self._answer(request) for request in reversed(payload)]
+        else:
+            body = self._answer(payload)
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _answer(self, request):
+        if request["method"] == "tools/list":
+            result = {"tools": ["alpha", "beta"]}
+        elif request["method"] == "tools/get":
+            result = {"name": request["params"]["name"]}
+        else:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRootMCPClient(unittest.TestCase):
+    """Test cases for MCPClient and AsyncMCPClient."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stand-in MCP server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInMCPHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stand-in MCP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Reset the request counters."""
+        StandInMCPHandler.connections = 0
+        StandInMCPHandler.posts = 0
+
+    def test_connection_reuse(self):
+        """Test that sequential calls share one keep-alive connection."""
+        with MCPClient(self.url) as client:
+            for _ in range(5):
+                self.assertEqual(client.list_tools(), ["alpha", "beta"])
+
+        self.assertEqual(StandInMCPHandler.connections, 1)
+
+    def test_batch_in_one_post(self):
+        """Test that batched calls are sent in one POST and returned in order."""
+        with MCPClient(self.url) as client:
+            responses = client.send_batch([("tools/list", {}), ("tools/get", {"name": "beta"}), ("unknown", {})])
+            details = client.get_tools_details(["alpha", "beta"])
+
+        self.assertEqual(StandInMCPHandler.posts, 2)
+        self.assertEqual(responses[0]["result"]["tools"], ["alpha", "beta"])
+        self.assertEqual(responses[1]["result"]["name"], "beta")
+        self.assertEqual(responses[2]["error"]["code"], -32601)
+        self.assertEqual(details, [{"name": "alpha"}, {"name": "beta"}])
+
+    def test_async_client(self):
+        """Test the async variant, including batching and connection reuse."""
+        async def run():
+            async with AsyncMCPClient(self.url) as client:
+                tools = await client.list_tools()
+                detail = await client.get_tool_details("alpha")
+                details = await client.get_tools_details(tools)
+            return tools, detail, details
+
+        tools, detail, details = asyncio.run(run())
+
+        self.assertEqual(tools, ["alpha", "beta"])
+        self.assertEqual(detail, {"name": "alpha"})
+        self.assertEqual(details, [{"name": "alpha"}, {"name": "beta"}])
+        self.assertEqual(StandInMCPHandler.posts, 3)
+        self.assertEqual(StandInMCPHandler.connections, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
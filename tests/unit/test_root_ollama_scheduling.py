@@ -0,0 +1,136 @@
+"""
+Unit tests for Ollama request scheduling in the root MCP server.
+
+These tests replace the MCP SDK and the Ollama API client with stubs and
+verify that generations are queued in the LLM scheduler: interactive
+requests go before batch ones, clients are served round-robin and identical
+prompts share one generation.
+"""
+
+import asyncio
+import os
+import sys
+import types
+import unittest
+import unittest.mock
+
+# Add the repository root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _stub_sdk():
+    """Create an MCP SDK module providing what the root server uses at import time."""
+    class Tool:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+        def handler(self, func):
+            return func
+
+    class Resource:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    class MCPServer:
+        def __init__(self, **kwargs):
+            pass
+
+        def create_fastapi_app(self):
+            from fastapi import FastAPI
+            return FastAPI()
+
+        def register_tool(self, tool):
+            pass
+
+        def register_resource(self, resource):
+            pass
+
+    return types.SimpleNamespace(MCPServer=MCPServer, Tool=Tool, Resource=Resource, Capability=object)
+
+
+# The root server imports the MCP SDK at module level; it is not installed for the unit tests
+with unittest.mock.patch.dict(sys.modules, {"mcp_sdk": _stub_sdk()}):
+    import mcp_server
+
+
+class StubResponse:
+    """Ollama API response echoing the prompt."""
+
+    def __init__(self, prompt):
+        self.prompt = prompt
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"response": f"answer to {self.prompt}"}
+
+
+class StubOllamaClient:
+    """Ollama API client recording prompts and holding them until released."""
+
+    def __init__(self):
+        self.prompts = []
+        self.released = asyncio.Event()
+
+    async def post(self, path, json):
+        self.prompts.append(json["prompt"])
+        await self.released.wait()
+        return StubResponse(json["prompt"])
+
+
+class TestOllamaScheduling(unittest.TestCase):
+    """Test cases for call_ollama_api."""
+
+    def run_calls(self, calls):
+        """Issue (client, prompt, priority) calls with one model slot and return the upstream prompts and results."""
+        ollama_client = StubOllamaClient()
+
+        async def call(client_id, prompt, priority):
+            mcp_server._request_client.set(client_id)
+            return await mcp_server.call_ollama_api("model", prompt, priority)
+
+        async def scenario():
+            tasks = [asyncio.create_task(call(*args)) for args in calls]
+            await asyncio.sleep(0.05)
+            ollama_client.released.set()
+            results = await asyncio.gather(*tasks)
+            await mcp_server._ollama_scheduler.close()
+            return results
+
+        with unittest.mock.patch.multiple(
+            mcp_server,
+            _ollama_scheduler=None,
+            OLLAMA_MAX_CONCURRENCY_PER_MODEL=1,
+            _get_ollama_cache=lambda: None,
+            _get_ollama_client=lambda: ollama_client
+        ):
+            results = asyncio.run(scenario())
+        return ollama_client.prompts, results
+
+    def test_priority_and_fairness(self):
+        """Test that interactive clients are served round-robin before batch requests."""
+        prompts, results = self.run_calls([
+            ("a", "a1", "interactive"),
+            ("a", "a2", "interactive"),
+            ("c", "c1", "batch"),
+            ("a", "a3", "interactive"),
+            ("b", "b1", "interactive")
+        ])
+
+        self.assertEqual(prompts, ["a1", "b1", "a2", "a3", "c1"])
+        self.assertEqual(results[4], "answer to b1")
+
+    def test_identical_prompts_share_a_generation(self):
+        """Test that concurrent identical prompts of different clients reach Ollama once."""
+        prompts, results = self.run_calls([
+            ("a", "same", "interactive"),
+            ("b", "same", "interactive")
+        ])
+
+        self.assertEqual(prompts, ["same"])
+        self.assertEqual(results, ["answer to same", "answer to same"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Unit tests for sharded execution of external tools.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from core.quality.components import scheduler, sharding
+from core.quality.components.base import QualityCheckResult, QualityCheckSeverity
+from core.quality.components.sharding import (
+    RuntimeHistory,
+    ShardedToolRunner,
+    merge_results,
+    split_into_shards
+)
+
+
+class TestSplitIntoShards(unittest.TestCase):
+    """Test cases for split_into_shards."""
+
+    def test_shards_are_balanced(self):
+        """Test that the heaviest files are spread over the shards."""
+        weights = {"a.py": 8, "b.py": 1, "c.py": 4, "d.py": 4, "e.py": 1, "f.py": 6}
+
+        shards = split_into_shards(list(weights), 3, weights)
+
+        self.assertEqual(sorted(sum(weights[path] for path in shard) for shard in shards), [8, 8, 8])
+        self.assertEqual(sorted(path for shard in shards for path in shard), sorted(weights))
+        # Files keep their order within a shard
+        self.assertTrue(all(shard == sorted(shard) for shard in shards))
+
+    def test_small_inputs(self):
+        """Test that there are never more shards than files."""
+        self.assertEqual(split_into_shards([], 4, {}), [])
+        self.assertEqual(split_into_shards(["a.py", "b.py"], 4, {"a.py": 1, "b.py": 1}), [["a.py"], ["b.py"]])
+
+
+class TestShardedToolRunner(unittest.TestCase):
+    """Test cases for the ShardedToolRunner class."""
+
+    def setUp(self):
+        """Create a project with files of different sizes."""
+        self.cwd = os.getcwd()
+        self.root = tempfile.mkdtemp()
+        os.chdir(self.root)
+        self.files = []
+        for index in range(8):
+            path = f"module_{index}.py"
+            with open(path, "w") as f:
+                f.write("x = 1\n" * (index + 1))
+            self.files.append(path)
+
+    def tearDown(self):
+        """Remove the project."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.root)
+
+    def test_plan_limits_shard_count_and_size(self):
+        """Test that shards hold enough files and stay below the argument limit."""
+        self.assertEqual(len(ShardedToolRunner(max_shards=4, min_files_per_shard=3).plan("flake8", self.files)), 3)
+        self.assertEqual(len(ShardedToolRunner(max_shards=1).plan("flake8", self.files)), 1)
+
+        shards = ShardedToolRunner(max_shards=1, max_arg_bytes=24).plan("flake8", self.files)
+
+        self.assertEqual(len(shards), 4)
+        self.assertEqual([path for shard in shards for path in shard], self.files)
+
+    def test_history_balances_shards(self):
+        """Test that a file known to be slow gets a shard of its own."""
+        history = RuntimeHistory(os.path.join(self.root, "runtimes.json"))
+        for path in self.files[1:]:
+            history.record("pylint", [path], 0.1)
+        history.record("pylint", ["module_0.py"], 10.0)
+        history.save()
+        runner = ShardedToolRunner(max_shards=2, min_files_per_shard=1,
+                                   history=RuntimeHistory(os.path.join(self.root, "runtimes.json")))
+
+        shards = runner.plan("pylint", self.files)
+
+        self.assertIn(["module_0.py"], shards)
+
+    def test_run_merges_shard_output(self):
+        """Test that every file is passed to exactly one invocation."""
+        runner = ShardedToolRunner(max_shards=4, min_files_per_shard=2)
+
+        processes = runner.run("echo", ["checked"], self.files)
+
+        self.assertEqual(len(processes), 4)
+        arguments = [process.stdout.split() for process in processes]
+        self.assertTrue(all(args[0] == "checked" for args in arguments))
+        self.assertEqual(sorted(path for args in arguments for path in args[1:]), sorted(self.files))
+        self.assertIsNotNone(runner.history.get("echo", "module_7.py"))
+
+    def test_shards_share_the_process_budget(self):
+        """Test that concurrent runs never start more tool processes than the worker limit."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_run_tool(tool, args):
+            with lock:
+                running.append(tool)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(tool)
+            return subprocess.CompletedProcess([tool, *args], 0, "", "")
+
+        runner = ShardedToolRunner(max_shards=4, min_files_per_shard=1)
+        with mock.patch.object(scheduler, "_process_budget", threading.BoundedSemaphore(2)), \
+                mock.patch.object(sharding, "run_tool", side_effect=fake_run_tool):
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                runs = list(executor.map(lambda tool: runner.run(tool, [], self.files), ["black", "flake8", "pylint"]))
+
+        self.assertEqual([len(processes) for processes in runs], [4, 4, 4])
+        self.assertEqual(max(peak), 2)
+
+
+class TestShardedChecks(unittest.TestCase):
+    """Test cases for checks running their tool through the sharded runner."""
+
+    def run_check(self, check, file_paths, fake_run_tool):
+        """Run a check with two-way sharding and a fake tool, returning its results and invocations."""
+        calls = []
+
+        def run_tool(tool, args):
+            calls.append((tool, list(args)))
+            return fake_run_tool(tool, args)
+
+        runner = ShardedToolRunner(max_shards=2, min_files_per_shard=1)
+        with mock.patch.object(sharding, "_runner", runner), \
+                mock.patch.object(sharding, "run_tool", side_effect=run_tool):
+            return check.run(file_paths), calls
+
+    def test_isort(self):
+        """Test that isort runs on shards and reports the unsorted files of every shard."""
+        from core.quality.components.code_style import IsortCheck
+
+        def fake_run_tool(tool, args):
+            stderr = "".join(f"ERROR: {path} Imports are incorrectly sorted and/or formatted.\n"
+                             for path in args if path.startswith("bad"))
+            return subprocess.CompletedProcess([tool, *args], 1 if stderr else 0, "-import os\n", stderr)
+
+        results, calls = self.run_check(IsortCheck(), ["bad_a.py", "good.py", "bad_b.py", "other.py"], fake_run_tool)
+
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(all(args[:2] == ["--check-only", "--diff"] for _, args in calls))
+        self.assertEqual(sorted(result.file_path for result in results), ["bad_a.py", "bad_b.py"])
+
+    def test_shellcheck(self):
+        """Test that shellcheck runs on shards and its gcc-format output is parsed."""
+        from core.quality.components.static_analysis import ShellcheckCheck
+
+        def fake_run_tool(tool, args):
+            stdout = "".join(f"{path}:3:5: warning: Double quote to prevent globbing. [SC2086]\n"
+                             for path in args[1:])
+            return subprocess.CompletedProcess([tool, *args], 1, stdout, "")
+
+        results, calls = self.run_check(ShellcheckCheck(), ["a.sh", "b.sh"], fake_run_tool)
+
+        self.assertEqual([args[0] for _, args in calls], ["--format=gcc", "--format=gcc"])
+        self.assertEqual(sorted(result.file_path for result in results), ["a.sh", "b.sh"])
+        self.assertEqual(results[0].line_number, 3)
+        self.assertEqual(results[0].details, {"sc_code": "2086"})
+
+
+class TestMergeResults(unittest.TestCase):
+    """Test cases for merge_results."""
+
+    def test_duplicates_are_dropped(self):
+        """Test that an issue reported by two shards is kept once."""
+        def result(line):
+            return QualityCheckResult(check_id="pylint", severity=QualityCheckSeverity.WARNING,
+                                      message="Unused import", file_path="a.py", line_number=line)
+
+        merged = merge_results([[result(1), result(2)], [result(1)]])
+
+        self.assertEqual([item.line_number for item in merged], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for streaming shell command execution.
+
+These tests verify incremental output delivery, the output byte cap,
+process group termination on timeout and cancellation, and progress
+notifications from execute_shell_command.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from server.tools import execute_shell_command
+from server.tools.shell.streaming import run_command, run_command_streaming
+
+
+class TestStreamingExecution(unittest.TestCase):
+    """Test cases for run_command_streaming."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _wait_for_file(self, path, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open(path) as f:
+            return int(f.read().strip())
+
+    def _process_alive(self, pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        # A zombie reparented to init is as good as dead
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().split()[2] != "Z"
+        except FileNotFoundError:
+            return False
+
+    def test_streams_stdout_and_stderr(self):
+        """Test that output chunks are delivered per stream."""
+        chunks = []
+        result = run_command("echo out; echo err >&2", on_output=lambda stream, text: chunks.append((stream, text)))
+
+        self.assertEqual(result["exit_code"], 0)
+        self.assertEqual(result["stdout"], "out\n")
+        self.assertEqual(result["stderr"], "err\n")
+        self.assertIn(("stdout", "out\n"), chunks)
+        self.assertIn(("stderr", "err\n"), chunks)
+
+    def test_output_cap(self):
+        """Test that output beyond the cap is counted but not retained."""
+        result = run_command("head -c 5000000 /dev/zero | tr '\\0' 'x'", max_output_bytes=1000)
+
+        self.assertEqual(len(result["stdout"]), 1000)
+        self.assertEqual(result["stdout_bytes"], 5000000)
+        self.assertTrue(result["truncated"])
+
+    def test_timeout_kills_process_group(self):
+        """Test that background children are killed on timeout."""
+        pid_file = os.path.join(self.temp_dir, "child.pid")
+        result = run_command(f"sleep 30 & echo $! > {pid_file}; echo started; wait", timeout=1)
+
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(result["stdout"], "started\n")
+        child_pid = self._wait_for_file(pid_file)
+        time.sleep(0.1)
+        self.assertFalse(self._process_alive(child_pid))
+
+    def test_cancellation_kills_process_group(self):
+        """Test that cancelling the caller kills the command."""
+        pid_file = os.path.join(self.temp_dir, "child.pid")
+
+        async def run():
+            task = asyncio.create_task(run_command_streaming(f"sleep 30 & echo $! > {pid_file}; wait"))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        child_pid = self._wait_for_file(pid_file)
+        time.sleep(0.1)
+        self.assertFalse(self._process_alive(child_pid))
+
+
+class TestExecuteShellCommand(unittest.TestCase):
+    """Test cases for the execute_shell_command tool."""
+
+    def test_progress_notifications(self):
+        """Test that output chunks are reported through the progress callback."""
+        notifications = []
+        result = execute_shell_command("echo hello", progress_callback=lambda *args: notifications.append(args))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["output"], "hello\n")
+        self.assertTrue(execute_shell_command._supports_progress)
+        self.assertIn("[stdout] hello\n", [message for _, message in notifications])
+        self.assertEqual(notifications[-1][0], 100)
+
+    def test_failure_and_timeout(self):
+        """Test that failing and timed-out commands are reported as errors."""
+        self.assertFalse(execute_shell_command("echo boom >&2; exit 3")["success"])
+        result = execute_shell_command("sleep 5", timeout=1)
+        self.assertFalse(result["success"])
+        self.assertIn("timed out", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for file snapshots.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.quality.components.snapshots import SnapshotStore
+from core.quality.components.verification import FixVerification
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Test cases for the SnapshotStore class."""
+
+    def setUp(self):
+        """Create a project with a snapshot directory."""
+        self.root = tempfile.mkdtemp()
+        self.snapshot_root = os.path.join(self.root, "snapshots")
+        self.path = self.write("module.py", "x = 1\n")
+
+    def tearDown(self):
+        """Remove the project."""
+        shutil.rmtree(self.root)
+
+    def write(self, name, content):
+        """Write a file of the project."""
+        path = os.path.join(self.root, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def read(self, path):
+        """Read a file of the project."""
+        with open(path) as f:
+            return f.read()
+
+    def assert_restores(self, store, kind):
+        """Snapshot the module, change it in place and restore it."""
+        os.chmod(self.path, 0o640)
+        snapshot = store.snapshot(self.path)
+        self.assertEqual(snapshot.kind, kind)
+
+        with open(self.path, "w") as f:
+            f.write("x = 2\n")
+        store.restore(snapshot)
+
+        self.assertEqual(self.read(self.path), "x = 1\n")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+        self.assertFalse(os.path.exists(snapshot.snapshot_path))
+
+    def test_hard_link_snapshot(self):
+        """Test that a linked snapshot survives fixers writing in place."""
+        store = SnapshotStore(self.snapshot_root, reflinks=False)
+        inode = os.stat(self.path).st_ino
+
+        self.assert_restores(store, "link")
+        # The restored file is the original file
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+
+    def test_reflink_snapshot(self):
+        """Test a copy-on-write snapshot, where the filesystem supports them."""
+        store = SnapshotStore(self.snapshot_root)
+        if not store._reflink(self.path, os.path.join(store.directory, "probe")):
+            self.skipTest("Reflinks are not supported here")
+
+        self.assert_restores(store, "reflink")
+
+    def test_blob_snapshots_are_shared(self):
+        """Test that identical files are stored once in the blob store."""
+        store = SnapshotStore(self.snapshot_root, reflinks=False, hard_links=False)
+        other_path = self.write("other.py", "x = 1\n")
+        snapshot = store.snapshot(self.path)
+        other = store.snapshot(other_path)
+
+        self.assertEqual(snapshot.snapshot_path, other.snapshot_path)
+        self.assertEqual(len(os.listdir(store._blob_directory)), 1)
+
+        for path in (self.path, other_path):
+            with open(path, "w") as f:
+                f.write("x = 2\n")
+        store.restore(snapshot)
+        store.restore(other)
+
+        self.assertEqual([self.read(self.path), self.read(other_path)], ["x = 1\n", "x = 1\n"])
+        self.assertEqual(os.listdir(store._blob_directory), [])
+
+    def test_cleanup(self):
+        """Test that closed stores and stores of dead processes are removed."""
+        store = SnapshotStore(self.snapshot_root, reflinks=False)
+        store.snapshot(self.path)
+        stale = os.path.join(self.snapshot_root, "run-999999999-abc")
+        os.mkdir(stale)
+
+        store.close()
+        SnapshotStore(self.snapshot_root).close()
+
+        self.assertEqual(os.listdir(self.snapshot_root), [])
+        self.assertEqual(self.read(self.path), "x = 1\n")
+
+    def test_fix_verification_uses_store(self):
+        """Test that backups are restored through the store and cleaned up."""
+        verification = FixVerification(SnapshotStore(self.snapshot_root, reflinks=False))
+
+        self.assertTrue(verification.backup_file(self.path))
+        self.write("module.py", "x = 2\n")
+        self.assertTrue(verification.restore_file(self.path))
+        self.assertTrue(verification.backup_file(self.path))
+        verification.cleanup_backups()
+
+        self.assertEqual(self.read(self.path), "x = 1\n")
+        self.assertEqual(verification.backup_files, {})
+        self.assertEqual(os.listdir(verification.store.directory), ["blobs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Unit tests for the shared state stores.
+
+These tests verify that the SQLite and shared-memory stores share namespaces
+and generation counters between instances, that host sessions are visible to
+another MCPHost using the same store, and that cached tool metadata is
+invalidated across servers.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.state_store import (
+    MemoryStateStore, SQLiteStateStore, SharedMemoryStateStore, create_state_store, start_state_server
+)
+
+
+class TestSQLiteStateStore(unittest.TestCase):
+    """Test cases for SQLiteStateStore."""
+
+    def setUp(self):
+        """Create two stores on the same database."""
+        self.tmpdir = tempfile.mkdtemp()
+        path = os.path.join(self.tmpdir, "state.db")
+        self.first = SQLiteStateStore(path)
+        self.second = SQLiteStateStore(path)
+
+    def tearDown(self):
+        """Close the stores and remove the database."""
+        self.first.close()
+        self.second.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_namespaces_are_shared(self):
+        """Test that values written through one store are visible through the other."""
+        sessions = self.first.namespace("sessions")
+        sessions["s1"] = {"username": "alice", "permissions": ["basic"]}
+        other = self.second.namespace("sessions")
+
+        self.assertIn("s1", other)
+        self.assertEqual(other["s1"]["username"], "alice")
+        self.assertEqual(len(other), 1)
+        self.assertEqual(len(self.second.namespace("consents")), 0)
+
+        for key in other:
+            del other[key]
+        self.assertNotIn("s1", sessions)
+        with self.assertRaises(KeyError):
+            del sessions["s1"]
+
+    def test_generations(self):
+        """Test that generation counters are shared and incremented atomically."""
+        self.assertEqual(self.second.get_generation("tool_metadata"), 0)
+        self.assertEqual(self.first.bump_generation("tool_metadata"), 1)
+        self.assertEqual(self.second.bump_generation("tool_metadata"), 2)
+        self.assertEqual(self.first.get_generation("tool_metadata"), 2)
+
+
+class TestSharedMemoryStateStore(unittest.TestCase):
+    """Test cases for SharedMemoryStateStore."""
+
+    def setUp(self):
+        """Start a state server."""
+        self.manager, self.authkey = start_state_server()
+
+    def tearDown(self):
+        """Stop the state server."""
+        self.manager.shutdown()
+
+    def test_clients_share_state(self):
+        """Test that two clients of the state server see the same namespaces and generations."""
+        host, port = self.manager.address
+        config = {"backend": "shared_memory", "shared_memory_address": f"{host}:{port}",
+                  "shared_memory_authkey": self.authkey}
+        first = create_state_store(config)
+        second = create_state_store(config)
+
+        self.assertIsInstance(first, SharedMemoryStateStore)
+        first.namespace("sessions")["s1"] = {"username": "alice"}
+        self.assertEqual(second.namespace("sessions")["s1"], {"username": "alice"})
+
+        first.bump_generation("tool_metadata")
+        self.assertEqual(second.bump_generation("tool_metadata"), 2)
+
+    def test_authkey_from_environment(self):
+        """Test that the key is read from the environment rather than the configuration."""
+        host, port = self.manager.address
+        config = {"backend": "shared_memory", "shared_memory_address": f"{host}:{port}"}
+        with unittest.mock.patch.dict(os.environ, {"STATE_SHARED_MEMORY_AUTHKEY": self.authkey}):
+            store = create_state_store(config)
+        store.namespace("sessions")["s1"] = {"username": "alice"}
+
+        self.assertNotIn("shared_memory_authkey", config)
+        self.assertEqual(store.namespace("sessions")["s1"], {"username": "alice"})
+
+    def test_missing_settings(self):
+        """Test that the shared-memory backend requires an address and key."""
+        with self.assertRaises(ValueError):
+            create_state_store({"backend": "shared_memory"})
+        with self.assertRaises(ValueError):
+            create_state_store({"backend": "unknown"})
+        self.assertIsInstance(create_state_store({}), MemoryStateStore)
+
+
+class TestSharedHostState(unittest.TestCase):
+    """Test cases for MCPHost and MCPServer sharing a state store."""
+
+    def setUp(self):
+        """Create a shared SQLite database."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "state.db")
+        self.logger = logging.getLogger("test_state_store")
+        self.stores = []
+
+    def tearDown(self):
+        """Close the stores and remove the database."""
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def make_store(self):
+        """Create a store on the shared database, as another worker would."""
+        store = SQLiteStateStore(self.path)
+        self.stores.append(store)
+        return store
+
+    def test_sessions_are_shared_between_hosts(self):
+        """Test that a session created by one host is valid in another."""
+        from host.host import MCPHost
+
+        first = MCPHost(logger=self.logger, config={}, state_store=self.make_store())
+        second = MCPHost(logger=self.logger, config={}, state_store=self.make_store())
+
+        session = first.authenticate_user("alice", {"password": "secret"})
+        self.assertTrue(second.validate_session(session["session_id"], session["token"]))
+
+        self.assertTrue(second.grant_permission(session["session_id"], "tools:execute"))
+        self.assertIn("tools:execute", first.user_sessions[session["session_id"]]["permissions"])
+
+    def test_tool_metadata_invalidated_across_servers(self):
+        """Test that invalidating tool metadata in one server drops the cache of another."""
+        from server.server import MCPServer
+
+        config = {"state": {"generation_check_interval": 0}}
+        first = MCPServer("server-1", self.logger, config, state_store=self.make_store())
+        second = MCPServer("server-2", self.logger, config, state_store=self.make_store())
+
+        before = second._handle_tools_list()["tools"]
+        second.tools["added"] = {"function": None, "metadata": {"description": "Added tool"}}
+
+        # Still served from the cache until another worker invalidates it
+        self.assertEqual(second._handle_tools_list()["tools"], before)
+        first.invalidate_tool_metadata()
+        names = [tool["name"] for tool in second._handle_tools_list()["tools"]]
+        self.assertIn("added", names)
+
+    def test_startup_registration_keeps_other_caches(self):
+        """Test that only tools registered at runtime invalidate other workers."""
+        from server.server import MCPServer
+
+        def make_tool(name):
+            def tool_func():
+                return None
+            tool_func._mcp_tool_metadata = {"name": name, "description": f"The {name} tool"}
+            return tool_func
+
+        config = {"state": {"generation_check_interval": 0}}
+        first = MCPServer("server-1", self.logger, config, state_store=self.make_store())
+        second = MCPServer("server-2", self.logger, config, state_store=self.make_store())
+        second._handle_tools_list()
+
+        first.register_tool(make_tool("startup"))
+        self.assertEqual(second.state_store.get_generation("tool_metadata"), 0)
+        self.assertIn("startup", [tool["name"] for tool in first._handle_tools_list()["tools"]])
+
+        first.register_tool(make_tool("runtime"), runtime=True)
+        self.assertEqual(second.state_store.get_generation("tool_metadata"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit tests for the persistent tool daemons.
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from core.quality.components import tool_daemons
+from core.quality.components.tool_daemons import ToolDaemonClient, UnsupportedArguments, run_tool
+
+HAS_BLACK = importlib.util.find_spec("black") is not None
+HAS_FLAKE8 = importlib.util.find_spec("flake8") is not None
+
+
+class ToolDaemonTestCase(unittest.TestCase):
+    """Base class running each test in an empty project directory."""
+
+    def setUp(self):
+        """Create the project directory."""
+        self.cwd = os.getcwd()
+        self.root = tempfile.mkdtemp()
+        os.chdir(self.root)
+
+    def tearDown(self):
+        """Remove the project directory."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.root)
+
+    def write(self, path, content):
+        """Write a file of the project."""
+        with open(path, "w") as f:
+            f.write(content)
+
+
+class TestRunTool(ToolDaemonTestCase):
+    """Test cases for run_tool."""
+
+    def tearDown(self):
+        """Restore the configured default."""
+        tool_daemons.enable_daemons(None)
+        super().tearDown()
+
+    def test_disabled_daemons_run_the_command(self):
+        """Test that the command line is used when daemons are disabled."""
+        tool_daemons.enable_daemons(False)
+        with mock.patch.object(tool_daemons, "_get_client") as get_client, \
+                mock.patch("subprocess.run") as run:
+            run_tool("flake8", ["a.py"])
+
+        get_client.assert_not_called()
+        run.assert_called_once_with(["flake8", "a.py"], capture_output=True, text=True)
+
+    def test_failing_daemon_falls_back_to_the_command(self):
+        """Test that the command line is used when the daemon cannot run the arguments."""
+        tool_daemons.enable_daemons(True)
+        client = mock.Mock()
+        client.run.return_value = None
+        with mock.patch.object(tool_daemons, "_get_client", return_value=client), \
+                mock.patch("subprocess.run") as run:
+            run_tool("black", ["--check", "."])
+
+        client.run.assert_called_once_with(["--check", "."])
+        run.assert_called_once_with(["black", "--check", "."], capture_output=True, text=True)
+
+
+class TestRuntimeDir(ToolDaemonTestCase):
+    """Test cases for the directory holding the sockets and key."""
+
+    def setUp(self):
+        """Put runtime directories below the project directory."""
+        super().setUp()
+        patcher = mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.root})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_private_directory_and_key(self):
+        """Test that the directory and key are created private and reused."""
+        runtime_dir = tool_daemons.get_runtime_dir()
+
+        self.assertEqual(os.path.dirname(runtime_dir), self.root)
+        self.assertEqual(os.stat(runtime_dir).st_mode & 0o777, 0o700)
+        key = tool_daemons._get_authkey(runtime_dir)
+        self.assertEqual(tool_daemons._get_authkey(runtime_dir), key)
+        self.assertEqual(tool_daemons.get_runtime_dir(), runtime_dir)
+
+    def test_planted_paths_are_refused(self):
+        """Test that a directory or key accessible by other users is not trusted."""
+        runtime_dir = tool_daemons.get_runtime_dir()
+        key_path = os.path.join(runtime_dir, "authkey")
+        self.write(key_path, "planted")
+        os.chmod(key_path, 0o644)
+
+        with self.assertRaises(PermissionError):
+            tool_daemons._get_authkey(runtime_dir)
+
+        os.chmod(runtime_dir, 0o777)
+        with self.assertRaises(PermissionError):
+            tool_daemons.get_runtime_dir()
+
+        shutil.rmtree(runtime_dir)
+        os.symlink(self.cwd, runtime_dir)
+        with self.assertRaises(PermissionError):
+            tool_daemons.get_runtime_dir()
+
+
+@unittest.skipUnless(HAS_BLACK, "black is not installed")
+class TestBlackWorker(ToolDaemonTestCase):
+    """Test cases for the in-process black worker."""
+
+    def test_output_matches_the_command_line(self):
+        """Test that the worker reports like black's command line."""
+        self.write("good.py", "VALUE = 1\n")
+        self.write("bad.py", "VALUE=1\n")
+        worker = tool_daemons._BlackWorker(self.root)
+
+        for args in (["--check", "good.py"], ["--check", "bad.py", "good.py"]):
+            expected = subprocess.run(["black", *args], capture_output=True, text=True)
+            self.assertEqual(worker.run(args), (expected.returncode, expected.stdout, expected.stderr))
+
+    def test_formatting(self):
+        """Test that files are reformatted without --check and other options are refused."""
+        self.write("bad.py", "VALUE=1\n")
+        worker = tool_daemons._BlackWorker(self.root)
+
+        returncode, _, stderr = worker.run(["bad.py"])
+
+        self.assertEqual(returncode, 0)
+        self.assertIn("reformatted bad.py", stderr)
+        with open("bad.py") as f:
+            self.assertEqual(f.read(), "VALUE = 1\n")
+        with self.assertRaises(UnsupportedArguments):
+            worker.run(["--diff", "bad.py"])
+
+
+@unittest.skipUnless(HAS_FLAKE8, "flake8 is not installed")
+class TestToolDaemonClient(ToolDaemonTestCase):
+    """Test cases for a daemon running in its own process."""
+
+    def setUp(self):
+        """Start without a daemon."""
+        super().setUp()
+        self.client = ToolDaemonClient("flake8", idle_timeout=60)
+
+    def tearDown(self):
+        """Stop the daemon."""
+        self.client.stop()
+        shutil.rmtree(self.client.runtime_dir, ignore_errors=True)
+        super().tearDown()
+
+    def test_daemon_is_reused_and_restarted_on_config_change(self):
+        """Test that results match the command line and follow configuration changes."""
+        self.write("module.py", "import os\nVALUE = '" + "x" * 90 + "'\n")
+
+        result = self.client.run(["module.py"])
+        expected = subprocess.run(["flake8", "module.py"], capture_output=True, text=True)
+        self.assertEqual((result.returncode, result.stdout), (expected.returncode, expected.stdout))
+        self.assertIn("E501", result.stdout)
+        self.assertEqual(self.client.run(["module.py"]).stdout, result.stdout)
+
+        self.write("setup.cfg", "[flake8]\nmax-line-length = 120\n")
+        result = self.client.run(["module.py"])
+
+        self.assertNotIn("E501", result.stdout)
+        self.assertIn("F401", result.stdout)
+        self.assertTrue(self.client.stop())
+        self.assertFalse(self.client.stop())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Unit tests for the dangerous tool execution scheduler.
+
+These tests verify the worker slot limit, per-client queue bounds,
+round-robin grants across clients, queue position progress reporting,
+and that per-job resource limits reach the shell command.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from server.execution import ToolExecutionScheduler, ToolQueueFullError, ToolQueueTimeoutError
+from server.server import MCPServer
+from server.tools import execute_shell_command
+
+
+class TestToolExecutionScheduler(unittest.TestCase):
+    """Test cases for ToolExecutionScheduler."""
+
+    def setUp(self):
+        """Set up a logger."""
+        self.logger = logging.getLogger("test_tool_execution")
+
+    def _start(self, scheduler, func, client_id, results=None, **kwargs):
+        def target():
+            try:
+                value = scheduler.run(func, client_id=client_id, **kwargs)
+            except Exception as e:
+                value = e
+            if results is not None:
+                results.append(value)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        return thread
+
+    def _wait_until(self, predicate, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertTrue(predicate())
+
+    def test_worker_slot_limit(self):
+        """Test that no more than max_workers executions run at once."""
+        scheduler = ToolExecutionScheduler(self.logger, max_workers=2)
+        lock = threading.Lock()
+        state = {"active": 0, "max_active": 0}
+
+        def job():
+            with lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+
+        threads = [self._start(scheduler, job, f"client{i}") for i in range(6)]
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(state["max_active"], 2)
+        self.assertEqual(scheduler.get_stats()["executed"], 6)
+
+    def test_client_queue_full(self):
+        """Test that a client cannot queue more than max_queue_per_client executions."""
+        scheduler = ToolExecutionScheduler(self.logger, max_workers=1, max_queue_per_client=1)
+        release = threading.Event()
+        running = self._start(scheduler, release.wait, "a")
+        self._wait_until(lambda: scheduler.get_stats()["running"] == 1)
+        waiting = self._start(scheduler, lambda: None, "a")
+        self._wait_until(lambda: scheduler.get_stats()["waiting"].get("a") == 1)
+
+        with self.assertRaises(ToolQueueFullError):
+            scheduler.run(lambda: None, client_id="a")
+
+        release.set()
+        running.join()
+        waiting.join()
+        self.assertEqual(scheduler.get_stats()["rejected"], 1)
+
+    def test_queue_timeout(self):
+        """Test that a queued execution gives up after the queue timeout."""
+        scheduler = ToolExecutionScheduler(self.logger, max_workers=1, queue_timeout=0.05)
+        release = threading.Event()
+        running = self._start(scheduler, release.wait, "a")
+        self._wait_until(lambda: scheduler.get_stats()["running"] == 1)
+
+        with self.assertRaises(ToolQueueTimeoutError):
+            scheduler.run(lambda: None, client_id="b")
+
+        release.set()
+        running.join()
+        self.assertEqual(scheduler.get_stats()["waiting"], {})
+        # Executions without progress reporting are counted as queued too
+        self.assertEqual(scheduler.get_stats()["queued"], 1)
+
+    def test_round_robin_and_queue_position(self):
+        """Test that clients are served in turn and queue positions are reported."""
+        scheduler = ToolExecutionScheduler(self.logger, max_workers=1)
+        release = threading.Event()
+        order = []
+        notifications = []
+        running = self._start(scheduler, release.wait, "a")
+        self._wait_until(lambda: scheduler.get_stats()["running"] == 1)
+
+        threads = []
+        for name, client_id in [("a1", "a"), ("a2", "a"), ("b1", "b")]:
+            threads.append(self._start(
+                scheduler, lambda name=name: order.append(name), client_id,
+                operation_id=name,
+                progress_callback=lambda *args: notifications.append(args)
+            ))
+            self._wait_until(lambda: sum(scheduler.get_stats()["waiting"].values()) == len(threads))
+        # Positions are re-reported asynchronously once b1 has been queued ahead of a2
+        self._wait_until(lambda: ("a2", 0, "Queued for execution: position 3") in notifications)
+
+        release.set()
+        for thread in [running] + threads:
+            thread.join()
+
+        self.assertEqual(order, ["a1", "b1", "a2"])
+        self.assertIn(("b1", 0, "Queued for execution: position 2"), notifications)
+        self.assertIn(("a2", 0, "Queued for execution: position 3"), notifications)
+        self.assertTrue(all(percent == 0 for _, percent, _ in notifications))
+        # Each waiting execution is counted once, whatever its positions were
+        self.assertEqual(scheduler.get_stats()["queued"], 3)
+
+
+class TestDangerousToolLimits(unittest.TestCase):
+    """Test cases for dangerous tool execution through MCPServer."""
+
+    def test_limits_reach_the_job(self):
+        """Test that the server's job limits are applied to shell commands."""
+        config = {"tool_execution": {"max_workers": 1, "limits": {"memory_mb": 256, "cpu_seconds": 7}}}
+        server = MCPServer("test-server", logging.getLogger("test_tool_execution"), config)
+        server.register_tool(execute_shell_command)
+        progress = []
+
+        result = server._handle_tools_execute(
+            {
+                "name": "execute_shell_command",
+                # Client-supplied limits must be ignored
+                "arguments": {"command": "ulimit -v; ulimit -t", "resource_limits": {}}
+            },
+            client_id="client",
+            progress_callback=lambda *args: progress.append(args)
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["output"].split(), [str(256 * 1024), "7"])
+        self.assertEqual(progress[-1][0], 100)
+        self.assertEqual(server.tool_scheduler.get_stats()["executed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for request tracing.
+
+These tests verify that disabled tracing records nothing, that span durations
+are exported as Prometheus histograms, that trace IDs are propagated through
+JSON-RPC ``params._meta``, and that MCPServer records its request stages.
+"""
+
+import logging
+import os
+import sys
+import unittest
+
+# Add the services directory to the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "services", "mcp-server", "src"))
+
+from services.tracing import (
+    Tracer, current_trace_id, extract_trace_id, get_tracer, inject_trace_id, traced, traced_request
+)
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for Tracer."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans of a disabled tracer are no-ops."""
+        tracer = Tracer()
+        with tracer.span("stage"):
+            pass
+
+        self.assertEqual(tracer.recent_spans(), [])
+        self.assertNotIn('span="stage"', tracer.render_prometheus())
+
+    def test_prometheus_histogram(self):
+        """Test that span durations are exported as cumulative histograms."""
+        tracer = Tracer(enabled=True, buckets=(0.1, 1.0))
+        tracer.record("stage", 0.05)
+        tracer.record("stage", 0.5)
+        tracer.record("stage", 5.0, error=True)
+        text = tracer.render_prometheus()
+
+        self.assertIn('mcp_span_duration_seconds_bucket{span="stage",le="0.1"} 1', text)
+        self.assertIn('mcp_span_duration_seconds_bucket{span="stage",le="1"} 2', text)
+        self.assertIn('mcp_span_duration_seconds_bucket{span="stage",le="+Inf"} 3', text)
+        self.assertIn('mcp_span_duration_seconds_count{span="stage"} 3', text)
+        self.assertIn('mcp_span_errors_total{span="stage"} 1', text)
+
+
+class TestTracePropagation(unittest.TestCase):
+    """Test cases for trace ID propagation in JSON-RPC metadata."""
+
+    def setUp(self):
+        """Enable the process-wide tracer."""
+        self.tracer = get_tracer()
+        self.tracer.reset()
+        self.tracer.enabled = True
+
+    def tearDown(self):
+        """Disable the process-wide tracer again."""
+        self.tracer.enabled = False
+        self.tracer.reset()
+
+    def test_inject_and_extract(self):
+        """Test that the current trace ID is injected without modifying the caller's params."""
+        params = {"name": "tool"}
+
+        @traced("client.call")
+        def call():
+            return current_trace_id(), inject_trace_id({"jsonrpc": "2.0", "id": 1, "method": "m", "params": params})
+
+        trace_id, request = call()
+
+        self.assertIsNotNone(trace_id)
+        self.assertEqual(extract_trace_id(request), trace_id)
+        self.assertNotIn("_meta", params)
+        self.assertIsNone(current_trace_id())
+
+    def test_traced_request_continues_trace(self):
+        """Test that a handler span continues the trace carried by the request."""
+        @traced_request("server.handle")
+        def handle(request):
+            with self.tracer.span("server.stage"):
+                return current_trace_id()
+
+        request = {"jsonrpc": "2.0", "id": 1, "method": "m", "params": {"_meta": {"trace_id": "abc"}}}
+
+        self.assertEqual(handle(request), "abc")
+        self.assertEqual([span["span"] for span in self.tracer.recent_spans("abc")], ["server.stage", "server.handle"])
+
+    def test_server_records_request_stages(self):
+        """Test that MCPServer.handle_jsonrpc_request records its stages under the request's trace."""
+        from server.server import MCPServer
+
+        server = MCPServer("test-server", logging.getLogger("test_tracing"), {})
+        request = {"jsonrpc": "2.0", "id": 1, "method": "resources/list", "params": {"_meta": {"trace_id": "t1"}}}
+        server.handle_jsonrpc_request(request)
+
+        spans = [span["span"] for span in self.tracer.recent_spans("t1")]
+        self.assertIn("server.validation", spans)
+        self.assertIn("server.dispatch", spans)
+        self.assertEqual(spans[-1], "server.handle_jsonrpc_request")
+
+
+if __name__ == "__main__":
+    unittest.main()